@@ -5,6 +5,7 @@ Tracks: Most active hours, Most active users
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
 from collections import defaultdict
 
@@ -25,12 +26,17 @@ activity_buffer = {
 
 BUFFER_SIZE_THRESHOLD = 1000  # Flush when we hit this many events
 
+# Last-seen timestamps for vote eligibility checks (never flushed to DB)
+recent_speakers = {}  # {"user_id": epoch_seconds}
+RECENT_WINDOW_SEC = 600  # Matches the 10-minute window of get_recent_active_users
+
 
 def log_activity_in_memory(user_id: str, hour: str):
     """Log activity to in-memory buffer (not database)"""
     # NOTE: user_id must be stored as a string
     activity_buffer["hourly"][hour] += 1
     activity_buffer["users"][user_id] += 1
+    recent_speakers[user_id] = time.time()
 
     # Optional: If buffer gets too big, log a warning
     total_events = sum(activity_buffer["hourly"].values())
@@ -50,6 +56,7 @@ async def flush_activity_to_db():
 
     activity_buffer["hourly"].clear()
     activity_buffer["users"].clear()
+    prune_recent_speakers()
 
     # 2. Flush to DB
     try:
@@ -91,6 +98,19 @@ async def flush_activity_to_db():
         logger.error(f"Error flushing activity: {e}", exc_info=True)
 
 
+def is_recently_active(user_id, window: int = RECENT_WINDOW_SEC) -> bool:
+    """In-memory check: has this user chatted within the last `window` seconds?"""
+    seen = recent_speakers.get(str(user_id))
+    return seen is not None and time.time() - seen < window
+
+
+def prune_recent_speakers(window: int = RECENT_WINDOW_SEC):
+    """Drop last-seen entries older than the window to bound memory."""
+    cutoff = time.time() - window
+    for uid in [uid for uid, seen in recent_speakers.items() if seen < cutoff]:
+        del recent_speakers[uid]
+
+
 # ============================================================
 # QUERY & CLEANUP FUNCTIONS (Rely on database.get_db)
 # ============================================================
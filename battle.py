@@ -21,18 +21,6 @@ BATTLE_CHANNEL_NAME = "forum"  # Only count reactions in this channel
 # DATABASE FUNCTIONS
 # ============================================================
 
-async def init_battle_db():
-    """Initialize battle stats table"""
-    async with get_db() as conn:
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS battle_stats (
-                user_id TEXT PRIMARY KEY,
-                username TEXT,
-                wins INTEGER DEFAULT 0,
-                total_reactions INTEGER DEFAULT 0
-            )
-        """)
-
 async def update_battle_stats(user_id, username, won, reaction_count):
     """Update user's battle statistics"""
     async with get_db() as conn:
@@ -1,11 +1,13 @@
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 from database import (
     is_economy_on, set_economy_status, set_yap_level, get_yap_level,
     get_top_balances, cap_all_balances, clear_user_inventory
 )
 import logging
+import triggers
+import rolequeue
 from main import remove_muzzle_role
 
 logger = logging.getLogger(__name__)
@@ -17,10 +19,12 @@ class AdminCog(commands.Cog):
         self.bot = bot
         self.cleanse_votes = {}  # {target_id: {voter_id: timestamp}}
         self._dynamic_color_commands = set()
-        self.color_refresh_loop.start()
 
-    def cog_unload(self):
-        self.color_refresh_loop.cancel()
+    async def cog_load(self):
+        # Dashboard refreshes arrive on the trigger bus instead of a 10s poll
+        triggers.bus.register("color_refresh", self.refresh_colors_if_flagged)
+        # Catch a refresh requested while the bot was offline
+        self.bot.loop.create_task(self._initial_color_refresh())
 
     async def sync_color_commands(self):
         """
@@ -56,9 +60,8 @@ class AdminCog(commands.Cog):
             self._dynamic_color_commands.add(color)
             logger.info(f"🎨 Registered new dynamic color command: .{color}")
 
-    @tasks.loop(seconds=10)
-    async def color_refresh_loop(self):
-        """Checks for the manual trigger flag 'trigger_refresh_colors' set by the dashboard."""
+    async def refresh_colors_if_flagged(self):
+        """Consumes the 'trigger_refresh_colors' flag set by the dashboard."""
         from database import get_setting, set_setting
         try:
             flag = await get_setting("trigger_refresh_colors", "0", use_cache=False)
@@ -67,11 +70,11 @@ class AdminCog(commands.Cog):
                 await set_setting("trigger_refresh_colors", "0")
                 logger.info("🎨 Color role commands refreshed via dashboard trigger.")
         except Exception as e:
-            logger.error(f"Error in color_refresh_loop: {e}")
+            logger.error(f"Error refreshing color commands: {e}")
 
-    @color_refresh_loop.before_loop
-    async def before_color_refresh(self):
+    async def _initial_color_refresh(self):
         await self.bot.wait_until_ready()
+        await self.refresh_colors_if_flagged()
 
     @commands.command(name="economy")
     @commands.has_permissions(administrator=True)
@@ -148,20 +151,17 @@ class AdminCog(commands.Cog):
         if duration_days < 1:
             dur_str = f"{duration_days * 24:.1f} hours"
 
-        # Helper to cleanse OTHER color roles
-        async def cleanse_existing_colors(target_member):
+        # Helper to swap in the new color role, cleansing OTHER color roles in the same edit
+        async def assign_exclusive_color(target_member, new_role, reason):
             all_configs = await get_color_role_configs()
             role_ids_to_check = [int(c["role_id"]) for c in all_configs if c["role_id"] and c["role_id"].isdigit()]
             
             roles_to_remove = [ctx.guild.get_role(rid) for rid in role_ids_to_check if ctx.guild.get_role(rid)]
-            active_roles_to_remove = [r for r in roles_to_remove if r in target_member.roles]
+            active_roles_to_remove = [r for r in roles_to_remove if r in target_member.roles and r != new_role]
             
+            await rolequeue.update(target_member, add=[new_role], remove=active_roles_to_remove, reason=reason)
             if active_roles_to_remove:
-                try:
-                    await target_member.remove_roles(*active_roles_to_remove, reason="New color role assignment (mutual exclusivity)")
-                    await clear_user_color_expirations(str(target_member.id))
-                except discord.Forbidden:
-                    pass
+                await clear_user_color_expirations(str(target_member.id))
 
         # ADMIN INSTANT BYPASS (Move this above self-vote check)
         if now.lower() == "now" and ctx.author.guild_permissions.administrator:
@@ -179,10 +179,7 @@ class AdminCog(commands.Cog):
                 if role in member.roles:
                     return await ctx.reply(f"❌ {member.display_name} already has the {color_name} role.", mention_author=False)
 
-                # Cleanse others first
-                await cleanse_existing_colors(member)
-
-                await member.add_roles(role, reason=f"Manual Admin assignment by {ctx.author}.")
+                await assign_exclusive_color(member, role, f"Manual Admin assignment by {ctx.author}.")
                 removal_time = time.time() + (duration_days * 86400)
                 await add_color_role_expiration(str(member.id), str(role_id), color_name, removal_time)
                 return await ctx.send(f"⚖️ **ADMIN DECREE!** {member.mention} has been manually assigned the {color_name} role for {dur_str}.")
@@ -217,10 +214,7 @@ class AdminCog(commands.Cog):
 
         if vote_count >= threshold:
             try:
-                # Cleanse others first
-                await cleanse_existing_colors(member)
-
-                await member.add_roles(role, reason=f"Reached {threshold} {color_name} votes.")
+                await assign_exclusive_color(member, role, f"Reached {threshold} {color_name} votes.")
                 removal_time = time.time() + (duration_days * 86400)
                 await add_color_role_expiration(str(member.id), str(role_id), color_name, removal_time)
                 await ctx.send(f"🎉 **PAYMENT DUE!** {member.mention} reached **{threshold} votes** and is now {color_name} for {dur_str}!")
@@ -308,10 +302,10 @@ class AdminCog(commands.Cog):
 
         try:
             if role in member.roles:
-                await member.remove_roles(role)
+                await rolequeue.remove(member, role)
                 await ctx.send(f"🗑️ **{member.display_name}** no longer has the **{role.name}** role.")
             else:
-                await member.add_roles(role)
+                await rolequeue.add(member, role)
                 await ctx.send(f"✅ **{member.display_name}** has been given the **{role.name}** role.")
         except discord.Forbidden:
             await ctx.send("❌ I don't have permission to manage this role.")
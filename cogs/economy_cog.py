@@ -11,21 +11,25 @@ import asyncio
 import random
 import time
 import economy
+import membercache
+import reaping
+import votes
+import rolequeue
 from collections import defaultdict
 from database import (
     get_balance, update_balance, atomic_purchase, get_user_inventory, 
     remove_item_from_inventory, add_active_effect, get_active_effect, 
     get_all_active_effects, set_balance, get_potential_victims, 
     get_global_cooldown, set_global_cooldown, is_economy_on, 
-    can_claim_daily, record_daily_claim, set_blood_moon, start_reaping, 
-    is_reaping_active, can_claim_shard, record_shard_claim
+    can_claim_daily, record_daily_claim, set_blood_moon,
+    can_claim_shard, record_shard_claim
 )
-from activity import get_recent_active_users
+from activity import get_recent_active_users, is_recently_active
 from exceptions import InsufficientTokens, InsufficientInventory, ActiveCurseError, ItemNotFoundError
 from items import ITEM_REGISTRY, ITEM_ALIASES
 from helpers import has_authorized_role
 import database
-import shutil
+import exports
 import os
 from main import assign_muzzle_role
 
@@ -38,7 +42,7 @@ logger = logging.getLogger(__name__)
 # ============================================================
 
 class SilencerView(discord.ui.View):
-    NUMBERS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+    NUMBERS = votes.NUMBER_EMOJIS
 
     def __init__(self, initiator, active_users, bot, cog):
         # We don't use View timeout for the vote itself anymore, we use asyncio.sleep
@@ -62,6 +66,15 @@ class SilencerView(discord.ui.View):
             embed.set_footer(text="Min 2 total votes required.")
             
             self.message = await ctx.send(embed=embed, view=self)
+
+            # Votes are tallied live from gateway reaction events
+            votes.open_ballot(
+                self.message.id,
+                self.NUMBERS[:len(self.active_users)],
+                kind="silencer",
+                exclude={self.initiator.id},
+                eligible=lambda user_id, member: is_recently_active(user_id),
+            )
             
             # Add reactions
             for i in range(len(self.active_users)):
@@ -81,6 +94,9 @@ class SilencerView(discord.ui.View):
                 except:
                     pass
                 await self.message.channel.send("❌ **THE RITUAL FAILED.** The silencer was interrupted by a void leak.")
+        finally:
+            if self.message:
+                votes.close_ballot(self.message.id)
 
     async def resolve_and_finish(self):
         try:
@@ -115,27 +131,13 @@ class SilencerView(discord.ui.View):
         if not self.active_users:
             return discord.Embed(title="🗳️ VOTE CANCELLED", description="No souls were present to be silenced.", color=discord.Color.light_grey())
 
-        try:
-            msg = await self.message.channel.fetch_message(self.message.id)
-        except discord.NotFound:
+        ballot = votes.close_ballot(self.message.id)
+        if not ballot:
             return None
-        
-        # 1. Tally all reactions
-        vote_counts = [0] * len(self.active_users)
-        recent_active = await get_recent_active_users(50)
-        active_ids = {str(u[0]) for u in recent_active} # Ensure strings
-        
-        total_valid_votes = 0
-        
-        for i in range(len(self.active_users)):
-            reaction = discord.utils.get(msg.reactions, emoji=self.NUMBERS[i])
-            if reaction:
-                async for user in reaction.users():
-                    if user.bot or user.id == self.initiator.id:
-                        continue
-                    if str(user.id) in active_ids:
-                        vote_counts[i] += 1
-                        total_valid_votes += 1
+
+        # 1. Tally recorded votes (eligibility was checked as each vote arrived)
+        vote_counts = ballot.counts()
+        total_valid_votes = ballot.total()
 
         if total_valid_votes < 2:
             return discord.Embed(
@@ -251,14 +253,18 @@ class EconomyCog(commands.Cog):
 
     @commands.command(name="backup_economy")
     @commands.has_permissions(administrator=True)
-    async def backup_economy_command(self, ctx):
-        """[ADMIN] Create a backup of the database file."""
+    async def backup_economy_command(self, ctx, mode: str = None):
+        """[ADMIN] Create a backup of the database file. Usage: .backup_economy [gz]"""
         from config import DB_FILE
+        compress = (mode or "").lower() in ("gz", "gzip")
         timestamp = time.strftime("%Y%m%d-%H%M%S")
-        backup_file = f"{DB_FILE}.{timestamp}.bak"
+        backup_file = f"{DB_FILE}.{timestamp}.bak" + (".gz" if compress else "")
         try:
-            shutil.copy2(DB_FILE, backup_file)
-            await ctx.send(f"✅ Database backed up to `{os.path.basename(backup_file)}`")
+            # Online backup in a worker thread: consistent with the WAL and never blocks the loop
+            size = await asyncio.get_running_loop().run_in_executor(
+                None, exports.backup_database, backup_file, compress
+            )
+            await ctx.send(f"✅ Database backed up to `{os.path.basename(backup_file)}` ({size / 1048576:.1f}MB)")
         except Exception as e:
             await ctx.send(f"❌ Backup failed: {e}")
 
@@ -321,49 +327,7 @@ class EconomyCog(commands.Cog):
             return await ctx.reply("🌑 **System Notice**: The spirits have locked the exchange. Economy is currently disabled.", mention_author=False)
 
         if item_name is None or (item_name.lower() == "hidden" and has_authorized_role(ctx.author)):
-            embed = discord.Embed(
-                title="🎰 APEIRON EXCHANGE",
-                description="Spend your tokens and observe the fallout.",
-                color=discord.Color.gold(),
-            )
-
-            # Sort items by cost (ascending)
-            sorted_items = sorted(ITEM_REGISTRY.items(), key=lambda x: x[1]["cost"])
-
-            # 1. Show Standard Items
-            for item, data in sorted_items:
-                if data.get('hidden'):
-                    continue
-                    
-                actual_cost = await database.get_item_price(item)
-                price = f"{actual_cost} 💎"
-                max_uses = data.get('max_uses')
-                if max_uses and max_uses > 1:
-                    price += f" ({max_uses} charges)"
-                desc = data.get('shop_desc', data.get('feedback', 'No description.'))
-                embed.add_field(
-                    name=f"{item.replace('_', ' ').title()} — {price}",
-                    value=f"*{desc}*",
-                    inline=False,
-                )
-
-            # 2. Show Hidden Items for Mods
-            if has_authorized_role(ctx.author):
-                hidden_items = [i for i in sorted_items if i[1].get('hidden')]
-                if hidden_items:
-                    embed.add_field(name="──────────────", value="**🌑 THE HIDDEN EXCHANGE**", inline=False)
-                    for item, data in hidden_items:
-                        actual_cost = await database.get_item_price(item)
-                        price = f"{actual_cost} 💎"
-                        max_uses = data.get('max_uses')
-                        if max_uses and max_uses > 1:
-                            price += f" ({max_uses} charges)"
-                        desc = data.get('shop_desc', data.get('feedback', 'No description.'))
-                        embed.add_field(
-                            name=f"👁️ {item.replace('_', ' ').title()} — {price}",
-                            value=f"*{desc}*",
-                            inline=False,
-                        )
+            embed = await economy.get_shop_embed(show_hidden=has_authorized_role(ctx.author))
 
             try:
                 await ctx.author.send(embed=embed)
@@ -456,17 +420,7 @@ class EconomyCog(commands.Cog):
         if not inventory:
             return await ctx.send(f"{ctx.author.mention}, your inventory is empty.")
 
-        msg = "🎒 **Your Inventory:**\n"
-        for item, qty in inventory.items():
-            item_display = item.replace('_', ' ').title()
-            item_data = ITEM_REGISTRY.get(item, {})
-            max_uses = item_data.get("max_uses")
-            
-            # Show usage count for items with max_uses
-            if max_uses and max_uses > 1:
-                msg += f"• **{item_display}**: {qty}/{max_uses} uses\n"
-            else:
-                msg += f"• **{item_display}**: x{qty}\n"
+        msg = "🎒 **Your Inventory:**\n" + "".join(f"{line}\n" for line in economy.format_inventory(inventory))
 
         try:
             await ctx.author.send(msg)
@@ -483,16 +437,7 @@ class EconomyCog(commands.Cog):
         if not inventory:
             return await interaction.response.send_message("🎒 Your inventory is empty.", ephemeral=True)
 
-        lines = ["🎒 **Your Inventory:**"]
-        for item, qty in inventory.items():
-            item_display = item.replace('_', ' ').title()
-            item_data = ITEM_REGISTRY.get(item, {})
-            max_uses = item_data.get("max_uses")
-            
-            if max_uses and max_uses > 1:
-                lines.append(f"• **{item_display}**: {qty}/{max_uses} uses")
-            else:
-                lines.append(f"• **{item_display}**: x{qty}")
+        lines = ["🎒 **Your Inventory:**"] + economy.format_inventory(inventory)
 
         await interaction.response.send_message("\n".join(lines), ephemeral=True)
 
@@ -660,10 +605,10 @@ class EconomyCog(commands.Cog):
             elif item_type == "event":
                 # Handle The Reaping
                 if official_name == "reaping":
-                    if await is_reaping_active():
+                    if reaping.is_active():
                         return await ctx.send("🌾 **Wait.** The harvest is already underway.")
                     
-                    await start_reaping()
+                    await reaping.start(self.bot, ctx.channel.id)
                     await remove_item_from_inventory(ctx.author.id, official_name)
                     return await ctx.send(item_info["feedback"])
                 
@@ -698,7 +643,7 @@ class EconomyCog(commands.Cog):
                             
                             # Muzzle the loser
                             try:
-                                loser_member = ctx.guild.get_member(loser_id)
+                                loser_member = await membercache.cache.get(ctx.guild, loser_id)
                                 await add_active_effect(loser_id, "muzzle", 600)
                                 if loser_member:
                                     await assign_muzzle_role(loser_member)
@@ -818,7 +763,7 @@ class EconomyCog(commands.Cog):
                     return await ctx.send(f"❌ You already have the {role.name} role!")
 
                 try:
-                    await ctx.author.add_roles(role)
+                    await rolequeue.add(ctx.author, role)
                     await remove_item_from_inventory(ctx.author.id, official_name)
                     await ctx.send(f"✅ {item_info['feedback']}")
                 except discord.Forbidden:
@@ -888,8 +833,11 @@ class EconomyCog(commands.Cog):
                 
                 # Fetch Member objects for them (excluding initiator and admins)
                 active_members = []
+                active_humans = 0
                 for uid_str, _ in active_users_data:
-                    member = ctx.guild.get_member(int(uid_str))
+                    member = await membercache.cache.get(ctx.guild, uid_str)
+                    if member and not member.bot:
+                        active_humans += 1
                     if member and not member.bot and not member.guild_permissions.administrator and member.id != ctx.author.id:
                         active_members.append(member)
                 
@@ -901,8 +849,7 @@ class EconomyCog(commands.Cog):
                     # If author is excluded from targets, we need 2 more active users.
                     # active_users_data includes author.
                     # Let's count total active users
-                    total_active = sum(1 for uid_str, _ in active_users_data if ctx.guild.get_member(int(uid_str)) and not ctx.guild.get_member(int(uid_str)).bot)
-                    if total_active < 3:
+                    if active_humans < 3:
                         return await ctx.reply("🌑 **DARKNESS IS TOO STAGNANT.** At least 3 active souls are required to initiate a silence.", mention_author=False)
 
                 if not is_admin:
@@ -15,11 +15,12 @@ import os
 from PIL import Image
 from database import (
     get_balance, update_balance, add_active_effect, is_economy_on,
-    get_user_inventory, remove_item_from_inventory, add_reaping_tithe,
-    get_reaping_state, end_reaping
+    get_user_inventory, remove_item_from_inventory
 )
 from helpers import has_authorized_role
 import economy
+import membercache
+import reaping
 import torture
 from main import assign_muzzle_role
 
@@ -541,51 +542,23 @@ class GamesCog(commands.Cog):
         self.active_bj_games = {} # user_id -> BlackjackView
 
     async def process_reaping(self, ctx):
-        """Handle Reaping lifecycle: End if expired, else tax user."""
-        state = await get_reaping_state()
-        if not state: 
+        """Tax the player if The Reaping is live. Expiry is handled by reaping's scheduled callback."""
+        if not reaping.is_active():
             return
 
-        active, pool, games_count, expires_at = state
-        now = time.time()
         user_id = ctx.author.id
+        bal = await get_balance(user_id)
+        tithe = int(bal * reaping.TITHE_RATE) if bal > 0 else 0
 
-        # 1. Check Expiration
-        if active and expires_at and now >= expires_at:
-            winner_count, payout_per_person, burned = await end_reaping()
-            
-            if winner_count > 0:
-                formatted_payout = economy.format_balance(payout_per_person)
-                formatted_burned = economy.format_balance(burned)
-                await ctx.send(
-                    f"🌾 **THE HARVEST IS COMPLETE.**\n"
-                    f"The gathered souls have been judged.\n\n"
-                    f"👥 **Participants:** {winner_count}\n"
-                    f"💰 **Payout:** {formatted_payout} each\n"
-                    f"🔥 **Burned:** {formatted_burned}"
-                )
-            else:
-                await ctx.send("🌾 **The Harvest Ends.** No souls were claimed.")
+        # Debits first, then credits the pool; None if the harvest ended meanwhile
+        recorded = await reaping.collect_tithe(user_id, tithe)
+        if recorded is None:
             return
 
-        # 2. Apply Tax if Active
-        if active:
-            # Update DB state (Game +1, Pool + tithe)
-            bal = await get_balance(user_id)
-            tithe = 0
-            if bal > 0:
-                tithe = int(bal * 0.04)
-            
-            if tithe > 0:
-                await update_balance(user_id, -tithe)
-            
-            await add_reaping_tithe(user_id, tithe)
-            
-            # Batch Announcement (Every 4 games)
-            current_games = games_count + 1
-            if current_games % 4 == 0:
-                 new_pool = pool + tithe
-                 await ctx.send(f"🌾 **Harvest:** {current_games} sacrifices made. Pool: {economy.format_balance(new_pool)}")
+        # Batch Announcement (Every 4 games)
+        current_games, pool = recorded
+        if current_games % reaping.ANNOUNCE_EVERY == 0:
+            await ctx.send(f"🌾 **Harvest:** {current_games} sacrifices made. Pool: {economy.format_balance(pool)}")
 
     async def apply_minigame_penalty(self, user_id, mention):
         """Standardized 5m UwU penalty with ward protection check."""
@@ -607,14 +580,14 @@ class GamesCog(commands.Cog):
             await remove_item_from_inventory(user_id, ward_used)
             duration = 100
             await add_active_effect(user_id, "uwu", duration)
-            member = self.bot.guilds[0].get_member(user_id) if self.bot.guilds else None
+            member = await membercache.cache.get(self.bot.guilds[0], user_id) if self.bot.guilds else None
             if member:
                 await assign_muzzle_role(member)
             return f"🛡️ **WARD SHATTERED.** {mention}'s protection absorbed most of the blast. (uwu for 1m 40s)"
         else:
             duration = 300
             await add_active_effect(user_id, "uwu", duration)
-            member = self.bot.guilds[0].get_member(user_id) if self.bot.guilds else None
+            member = await membercache.cache.get(self.bot.guilds[0], user_id) if self.bot.guilds else None
             if member:
                 await assign_muzzle_role(member)
             return f"🌸 {mention} took the full shot. **uwu for 5m** applied."
@@ -1445,7 +1418,8 @@ class GamesCog(commands.Cog):
                 
                 potential_victims = []
                 for vid in victim_ids:
-                    m = ctx.guild.get_member(int(vid))
+                    # Memory only: a REST fetch per balance holder would be far too slow here
+                    m = membercache.cache.peek(ctx.guild, vid)
                     if not m: continue
                     if m.bot or m.guild_permissions.administrator: continue
                     potential_victims.append(m)
@@ -1625,7 +1599,7 @@ class GamesCog(commands.Cog):
 
         if challenger_id:
             # EXECUTE FADE
-            challenger = ctx.guild.get_member(challenger_id)
+            challenger = await membercache.cache.get(ctx.guild, challenger_id)
             if not challenger:
                 del self.active_fades[str(challenger_id)]
                 return await ctx.reply("❌ Wtf", mention_author=False)
@@ -17,9 +17,15 @@ from discord.ext import commands, tasks
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from database import get_db, get_setting, set_setting
+from migrations import HOF_DAY
+import exports
+import msgcache
 
 logger = logging.getLogger(__name__)
 
+HOF_PERIODS = {"all": None, "week": 7, "month": 30}  # leaderboard window in days
+HOF_WINDOW_DAYS = 31  # hof_author_daily buckets older than this are pruned
+
 # ─────────────────────────────────────────────────────────────
 # DATABASE HELPERS
 # ─────────────────────────────────────────────────────────────
@@ -93,9 +99,44 @@ async def _get_entry(msg_id: int):
             return await cur.fetchone()
 
 
+async def _bump_author(conn, author_id: str, created_at: float, inductions: int, stars: int):
+    """Add an entry's contribution (or remove it, with negative counts) to the author aggregates."""
+    if not inductions and not stars:
+        return
+    for table, key_cols, key in (
+        ("hof_author_stats", "author_id", (author_id,)),
+        ("hof_author_daily", "day, author_id", (int(created_at // HOF_DAY), author_id)),
+    ):
+        marks = ", ".join("?" * len(key))
+        await conn.execute(
+            f"INSERT INTO {table} ({key_cols}, inductions, stars) VALUES ({marks}, ?, ?) "
+            f"ON CONFLICT({key_cols}) DO UPDATE SET inductions = inductions + excluded.inductions, "
+            f"stars = stars + excluded.stars",
+            (*key, inductions, stars),
+        )
+        await conn.execute(
+            f"DELETE FROM {table} WHERE ({key_cols}) = ({marks}) AND inductions <= 0",
+            key,
+        )
+
+
 async def _upsert_entry(orig_msg_id, orig_ch_id, author_id, hof_msg_id,
                         star_count, content, image_url, jump_url, voice_url=None, trigger_emoji=None):
+    """Insert/update an entry and move its stars in hof_author_stats in the same transaction."""
     async with get_db() as conn:
+        # Take the write lock before reading, so concurrent upserts of one entry can't apply the same delta twice
+        await conn.execute("BEGIN IMMEDIATE")
+        async with conn.execute(
+            "SELECT author_id, hof_message_id, star_count, created_at FROM hof_entries WHERE orig_message_id = ?",
+            (str(orig_msg_id),)
+        ) as cur:
+            old = await cur.fetchone()
+        # Only inducted entries count; author and created_at never change once the row exists
+        owner, created_at = (old[0], old[3]) if old else (str(author_id), time.time())
+        was = (1, old[2] or 0) if old and old[1] else (0, 0)
+        now = (1, star_count or 0) if hof_msg_id else (0, 0)
+        await _bump_author(conn, owner, created_at, now[0] - was[0], now[1] - was[1])
+
         await conn.execute(
             """
             INSERT INTO hof_entries
@@ -112,10 +153,28 @@ async def _upsert_entry(orig_msg_id, orig_ch_id, author_id, hof_msg_id,
             """,
             (str(orig_msg_id), str(orig_ch_id), str(author_id),
              str(hof_msg_id) if hof_msg_id else None,
-             star_count, content, image_url, jump_url, voice_url, trigger_emoji, time.time())
+             star_count, content, image_url, jump_url, voice_url, trigger_emoji, created_at)
         )
 
 
+async def _top_authors(limit: int, days: int = None) -> list:
+    """[(author_id, stars)] from the aggregates; `days` limits it to entries from the last N days."""
+    async with get_db() as conn:
+        if days is None:
+            query, params = (
+                "SELECT author_id, stars FROM hof_author_stats ORDER BY stars DESC, author_id LIMIT ?",
+                (limit,),
+            )
+        else:
+            query, params = (
+                "SELECT author_id, SUM(stars) AS total FROM hof_author_daily WHERE day > ? "
+                "GROUP BY author_id HAVING SUM(inductions) > 0 ORDER BY total DESC, author_id LIMIT ?",
+                (int(time.time() // HOF_DAY) - days, limit),
+            )
+        async with conn.execute(query, params) as cur:
+            return await cur.fetchall()
+
+
 # ─────────────────────────────────────────────────────────────
 # EMBED BUILDER
 # ─────────────────────────────────────────────────────────────
@@ -186,8 +245,7 @@ async def _build_hof_data(
     reply_text = ""
     if message.reference and message.reference.message_id:
         try:
-            # Try to fetch from cache first if possible, but fetch is safer
-            ref_msg = await message.channel.fetch_message(message.reference.message_id)
+            ref_msg = await msgcache.cache.get_reference(message)
             snippet = ref_msg.content[:150] + ("..." if len(ref_msg.content) > 150 else "")
             reply_text = f"⤷ *Replying to {ref_msg.author.mention}:* {snippet}\n\n"
         except Exception:
@@ -244,7 +302,8 @@ async def _post_or_update_hof(
     hof_msg = None
     if entry and entry[3]:
         try:
-            hof_msg = await hof_ch.fetch_message(int(entry[3]))
+            # Only edited and reacted to, never read, so no fetch is needed
+            hof_msg = hof_ch.get_partial_message(int(entry[3]))
             await hof_msg.edit(content=content, embed=embed)
         except discord.NotFound:
             hof_msg = None
@@ -338,6 +397,11 @@ class HofCog(commands.Cog):
                 "DELETE FROM hof_entries WHERE hof_message_id IS NULL AND created_at < ?",
                 (thirty_days_ago,)
             )
+            # Daily author buckets only feed the week/month leaderboards
+            await conn.execute(
+                "DELETE FROM hof_author_daily WHERE day < ?",
+                (int(time.time() // HOF_DAY) - HOF_WINDOW_DAYS,)
+            )
             await conn.commit()
         # Prune reaction locks — if dict gets large, clear it entirely
         if len(self.locks) > 500:
@@ -404,7 +468,7 @@ class HofCog(commands.Cog):
                     return
 
             try:
-                message = await channel.fetch_message(payload.message_id)
+                message = await msgcache.cache.get(channel, payload.message_id)
             except Exception as e:
                 logger.info(f"🔍 HOF: Could not fetch message {payload.message_id}: {e}")
                 return
@@ -456,7 +520,7 @@ class HofCog(commands.Cog):
                     hof_ch = guild.get_channel(int(s["channel_id"]))
                     if hof_ch:
                         try:
-                            await (await hof_ch.fetch_message(int(entry[3]))).delete()
+                            await hof_ch.get_partial_message(int(entry[3])).delete()
                         except discord.NotFound:
                             pass
                     await _upsert_entry(
@@ -655,7 +719,7 @@ class HofCog(commands.Cog):
             hof_ch = interaction.guild.get_channel(int(s["channel_id"]))
             if hof_ch:
                 try:
-                    await (await hof_ch.fetch_message(int(entry[3]))).delete()
+                    await hof_ch.get_partial_message(int(entry[3])).delete()
                 except discord.NotFound:
                     pass
             await _upsert_entry(int(msg_id), entry[1], entry[2], None, entry[4], entry[5], entry[6], entry[7], voice_url=entry[8] if len(entry) > 8 else None)
@@ -677,23 +741,15 @@ class HofCog(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @hall_group.command(name="leaderboard", description="Top users by cumulative Hall of Fame reactions")
-    @app_commands.describe(limit="How many users to show (default 15)")
-    async def slash_leaderboard(self, interaction: discord.Interaction, limit: int = 15):
+    @app_commands.describe(limit="How many users to show (default 15)", period="All time, or entries from the last 7/30 days")
+    @app_commands.choices(period=[
+        app_commands.Choice(name="All time", value="all"),
+        app_commands.Choice(name="This week", value="week"),
+        app_commands.Choice(name="This month", value="month"),
+    ])
+    async def slash_leaderboard(self, interaction: discord.Interaction, limit: int = 15, period: str = "all"):
         limit = max(1, min(limit, 25))
-
-        async with get_db() as conn:
-            async with conn.execute(
-                """
-                SELECT author_id, SUM(star_count) as total
-                FROM hof_entries
-                WHERE hof_message_id IS NOT NULL
-                GROUP BY author_id
-                ORDER BY total DESC
-                LIMIT ?
-                """,
-                (limit,)
-            ) as cur:
-                rows = await cur.fetchall()
+        rows = await _top_authors(limit, HOF_PERIODS.get(period))
 
         if not rows:
             return await interaction.response.send_message(
@@ -709,7 +765,7 @@ class HofCog(commands.Cog):
             lines.append(f"{prefix}  **{name}** — {total:,} reactions")
 
         embed = discord.Embed(
-            title="🏆 Hall of Fame Leaderboard",
+            title="🏆 Hall of Fame Leaderboard" + {"week": " — This Week", "month": " — This Month"}.get(period, ""),
             description="\n".join(lines),
             color=0xFFD700,
         )
@@ -717,62 +773,55 @@ class HofCog(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     @hall_group.command(name="export", description="Export the Hall of Fame as a CSV file")
+    @app_commands.describe(compress="gzip the CSV (for very large halls)")
     @app_commands.default_permissions(administrator=True)
-    async def slash_export(self, interaction: discord.Interaction):
+    async def slash_export(self, interaction: discord.Interaction, compress: bool = False):
         """Generate a CSV of every HOF entry — author, content, reactions, media URL, jump link."""
-        import csv
-        import io
-        from datetime import datetime, timezone
+        from datetime import timezone
 
         await interaction.response.defer(ephemeral=True)
+        guild = interaction.guild
+        count = 0
 
-        async with get_db() as conn:
-            async with conn.execute(
+        async def rows():
+            nonlocal count
+            async for msg_id, author_id, star_count, content, image_url, jump_url, created_at in exports.iter_rows(
                 """
-                SELECT e.orig_message_id, e.author_id, e.star_count,
-                       e.content, e.image_url, e.jump_url, e.created_at
-                FROM hof_entries e
-                WHERE e.hof_message_id IS NOT NULL
-                ORDER BY e.star_count DESC
+                SELECT orig_message_id, author_id, star_count, content, image_url, jump_url, created_at
+                FROM hof_entries
+                WHERE hof_message_id IS NOT NULL
+                ORDER BY star_count DESC
                 """
-            ) as cur:
-                rows = await cur.fetchall()
-
-        if not rows:
-            return await interaction.followup.send("❌ No Hall of Fame entries to export.", ephemeral=True)
-
-        # Resolve display names
-        output = io.StringIO()
-        writer = csv.writer(output, quoting=csv.QUOTE_ALL)
-        writer.writerow([
-            "rank", "author", "author_id", "reactions",
-            "message", "media_url", "jump_url", "date_added"
-        ])
+            ):
+                count += 1
+                member = guild.get_member(int(author_id))
+                yield [
+                    count,
+                    member.display_name if member else f"User {author_id}",
+                    author_id,
+                    star_count,
+                    (content or "").replace("\n", " "),
+                    image_url or "",
+                    jump_url or "",
+                    datetime.fromtimestamp(created_at, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC") if created_at else "",
+                ]
+
+        header = ["rank", "author", "author_id", "reactions", "message", "media_url", "jump_url", "date_added"]
+        # Spooled to a temp file so a large hall never sits in RAM twice
+        fp, _ = await exports.spool(exports.maybe_gzip(exports.csv_stream(header, rows()), compress))
+        try:
+            if not count:
+                return await interaction.followup.send("❌ No Hall of Fame entries to export.", ephemeral=True)
+
+            filename = f"hall_of_fame_{guild.name.replace(' ', '_')}.csv" + (".gz" if compress else "")
+            await interaction.followup.send(
+                f"📥 **Hall of Fame Export** — {count} entries",
+                file=discord.File(fp=fp, filename=filename),
+                ephemeral=True,
+            )
+        finally:
+            fp.close()
 
-        for rank, (msg_id, author_id, star_count, content, image_url, jump_url, created_at) in enumerate(rows, 1):
-            member = interaction.guild.get_member(int(author_id))
-            author_name = member.display_name if member else f"User {author_id}"
-            date_str = datetime.fromtimestamp(created_at, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC") if created_at else ""
-            writer.writerow([
-                rank,
-                author_name,
-                author_id,
-                star_count,
-                (content or "").replace("\n", " "),
-                image_url or "",
-                jump_url or "",
-                date_str,
-            ])
-
-        output.seek(0)
-        filename = f"hall_of_fame_{interaction.guild.name.replace(' ', '_')}.csv"
-        file = discord.File(fp=io.BytesIO(output.getvalue().encode("utf-8")), filename=filename)
-
-        await interaction.followup.send(
-            f"📥 **Hall of Fame Export** — {len(rows)} entries",
-            file=file,
-            ephemeral=True,
-        )
     @hall_group.command(name="random", description="Show a random entry from the Hall of Fame")
     async def slash_random(self, interaction: discord.Interaction):
         async with get_db() as conn:
@@ -891,17 +940,19 @@ class HofCog(commands.Cog):
         target = user or interaction.user
         async with get_db() as conn:
             async with conn.execute(
-                """
-                SELECT COUNT(*), SUM(star_count) 
-                FROM hof_entries 
-                WHERE author_id = ? AND hof_message_id IS NOT NULL
-                """,
+                "SELECT inductions, stars FROM hof_author_stats WHERE author_id = ?",
                 (str(target.id),)
             ) as cur:
                 row = await cur.fetchone()
-        
+            async with conn.execute(
+                "SELECT SUM(stars) FROM hof_author_daily WHERE author_id = ? AND day > ?",
+                (str(target.id), int(time.time() // HOF_DAY) - HOF_PERIODS["month"])
+            ) as cur:
+                month = await cur.fetchone()
+
         count = row[0] if row else 0
-        stars = row[1] if row and row[1] else 0
+        stars = row[1] if row else 0
+        month_stars = month[0] if month and month[0] else 0
         
         embed = discord.Embed(
             title=f"📊 HOF Stats: {target.display_name}",
@@ -909,6 +960,7 @@ class HofCog(commands.Cog):
         )
         embed.add_field(name="🏛️ Inductions", value=f"`{count}`", inline=True)
         embed.add_field(name="✨ Total Reactions", value=f"`{stars}`", inline=True)
+        embed.add_field(name="📅 Last 30 Days", value=f"`{month_stars}`", inline=True)
         embed.set_thumbnail(url=target.display_avatar.url)
         
         await interaction.response.send_message(embed=embed)
@@ -934,7 +986,7 @@ class HofCog(commands.Cog):
             channel = interaction.guild.get_channel(channel_id)
             if not channel:
                 channel = await interaction.guild.fetch_channel(channel_id)
-            message = await channel.fetch_message(message_id)
+            message = await msgcache.cache.get(channel, message_id)
         except Exception as e:
             logger.error(f"❌ HOF Sync fetch failed: {e}", exc_info=True)
             return await interaction.response.send_message(f"❌ Error fetching message: {e}", ephemeral=True)
@@ -1005,7 +1057,8 @@ async def _force_post_to_hof(bot, guild, message, emoji_counts, s, trigger_emoji
     hof_msg = None
     if entry and entry[3]:
         try:
-            hof_msg = await hof_ch.fetch_message(int(entry[3]))
+            # Only edited and reacted to, never read, so no fetch is needed
+            hof_msg = hof_ch.get_partial_message(int(entry[3]))
             await hof_msg.edit(content=content, embed=embed)
         except discord.NotFound:
             hof_msg = None
@@ -1069,7 +1122,7 @@ async def trash_from_hof_context_menu(interaction: discord.Interaction, message:
         hof_ch = interaction.guild.get_channel(int(s["channel_id"]))
         if hof_ch:
             try:
-                await (await hof_ch.fetch_message(int(entry[3]))).delete()
+                await hof_ch.get_partial_message(int(entry[3])).delete()
             except discord.NotFound:
                 pass
         await _upsert_entry(message.id, entry[1], entry[2], None, entry[4], entry[5], entry[6], entry[7], voice_url=entry[8] if len(entry) > 8 else None)
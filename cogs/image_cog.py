@@ -4,11 +4,14 @@ import io
 import time
 import asyncio
 import logging
-from api import google_generate_image
+import imagegen
+from exceptions import ImageQueueFull
 from database import get_balance, update_balance, is_economy_on, get_channel_assigns
 
 logger = logging.getLogger(__name__)
 
+POSITION_REFRESH = 5  # seconds between queue-position edits while waiting
+
 class ImageCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -38,6 +41,12 @@ class ImageCog(commands.Cog):
         except Exception as e:
             logger.error(f"Failed to send detailed error report: {e}")
 
+    @staticmethod
+    def _status_text(prompt, position):
+        if position > 1:
+            return f"🌑 **Queued {prompt}...** (#{position} in line)"
+        return f"🌑 **Generating {prompt}...**"
+
     @commands.command(name="img")
     @commands.cooldown(1, 15, commands.BucketType.user)
     async def img_command(self, ctx, *, prompt: str = None):
@@ -56,18 +65,32 @@ class ImageCog(commands.Cog):
             bal = await get_balance(user_id)
             if bal < cost:
                 return await ctx.reply(f"❌ (Cost: {cost})", mention_author=False)
-            
-            # Deduct cost
+
+        # 2. Queue the job (cached prompts come back already finished)
+        try:
+            job = imagegen.service.submit(user_id, prompt)
+        except ImageQueueFull as e:
+            return await ctx.reply(f"🌑 **The portal is crowded.** {e} Try again shortly.", mention_author=False)
+
+        if not ctx.author.guild_permissions.administrator:
             await update_balance(user_id, -cost)
 
-        # 2. Status message
-        status_msg = await ctx.send(f"🌑 **Generating {prompt}...**")
-        
-        # 3. Get Image Bytes
+        # 3. Status message, kept up to date with the queue position
+        position = imagegen.service.position(job)
+        status_msg = await ctx.send(self._status_text(prompt, position))
+
+        # 4. Get Image Bytes
         try:
-            await asyncio.sleep(2.5) # Optics: The spirits need a moment
-            image_bytes, error_msg = await google_generate_image(prompt)
-            
+            while not job.future.done():
+                try:
+                    await asyncio.wait_for(asyncio.shield(job.future), POSITION_REFRESH)
+                except asyncio.TimeoutError:
+                    new_position = imagegen.service.position(job)
+                    if new_position != position:
+                        position = new_position
+                        await status_msg.edit(content=self._status_text(prompt, position))
+            image_bytes, error_msg = job.future.result()
+
             if not image_bytes:
                 # Refund on failure
                 if not ctx.author.guild_permissions.administrator:
@@ -75,7 +98,7 @@ class ImageCog(commands.Cog):
                 await status_msg.edit(content=f"❌ **Error**: {error_msg or 'Try again later.'} (Refunded)")
                 return
 
-            # 4. Prepare File & Embed
+            # 5. Prepare File & Embed
             file = discord.File(io.BytesIO(image_bytes), filename="vision.png")
             embed = discord.Embed(
                 description=f"**Vision**: {prompt}",
@@ -84,7 +107,7 @@ class ImageCog(commands.Cog):
             embed.set_image(url="attachment://vision.png")
             embed.set_footer(text=f"Requested by {ctx.author.display_name}")
             
-            # 5. Edit Original Message with Attachment
+            # 6. Edit Original Message with Attachment
             await status_msg.edit(content=f"🌑 **Finished {prompt}:**", embed=embed, attachments=[file])
 
         except Exception as e:
@@ -18,6 +18,12 @@ from database import (
     get_user_rank, get_rank_card_prefs, set_rank_card_prefs,
 )
 import rank_card as rc
+import membercache
+import rolequeue
+import rewardsync
+import triggers
+import ranks
+from httpclient import client as http_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +42,11 @@ class LevelingCog(commands.Cog):
             "last_refresh": 0
         }
 
+        self._reward_fingerprint = None
+
+        # Dashboard-triggered reconciles arrive on the trigger bus
+        triggers.bus.register("reward_reconcile", self._on_reconcile_requested)
+
         self.bot.loop.create_task(self.initialize_settings())
 
     async def initialize_settings(self):
@@ -90,9 +101,39 @@ class LevelingCog(commands.Cog):
             self.cache["rewards"] = await get_reward_roles()
             self.cache["last_refresh"] = time.time()
             logger.debug("Leveling Cache Refreshed.")
+            await self._reconcile_if_rewards_changed()
         except Exception as e:
             logger.error(f"Failed to refresh leveling cache: {e}")
 
+    def _compute_reward_fingerprint(self):
+        settings = self.cache["settings"]
+        curve = tuple(settings.get(k) for k in ("c3", "c2", "c1", "rounding", "reward_exclude_enabled", "reward_exclude_roles"))
+        rewards = tuple(sorted((r["level"], r["role_id"], r["stack_role"]) for r in self.cache["rewards"]))
+        return curve, rewards
+
+    async def _reconcile_if_rewards_changed(self):
+        """In "always" sync mode, a changed curve or reward table triggers a guild-wide reconcile.
+        It only adds roles; removals need an explicit /reward_reconcile or dashboard run."""
+        fingerprint = self._compute_reward_fingerprint()
+        previous, self._reward_fingerprint = self._reward_fingerprint, fingerprint
+        if previous is None or previous == fingerprint:
+            return
+        if self.cache["settings"].get("reward_sync_mode") != "always":
+            return
+        logger.info("🎖️ Reward table or level curve changed, reconciling reward roles...")
+        self.bot.loop.create_task(self._reconcile_all_guilds(dry_run=False, removals=False))
+
+    async def _reconcile_all_guilds(self, dry_run: bool, removals: bool = True):
+        await self.bot.wait_until_ready()
+        for guild in self.bot.guilds:
+            try:
+                await rewardsync.reconcile(guild, dry_run=dry_run, removals=removals)
+            except Exception as e:
+                logger.error(f"Error reconciling reward roles for {guild.name}: {e}", exc_info=True)
+
+    async def _on_reconcile_requested(self):
+        await self._reconcile_all_guilds(dry_run=rewardsync.requested_dry_run())
+
     async def cache_refresh_task(self):
         """Periodically refresh the settings cache to stay in sync with Dashboard."""
         await self.bot.wait_until_ready()
@@ -145,6 +186,19 @@ class LevelingCog(commands.Cog):
                 ))
         await sync_server_channels(channels_data)
 
+    async def _sync_guild_profiles(self, guild) -> int:
+        """Bulk-write every member's profile, one member-list page at a time. Returns the count."""
+        total = 0
+        async for page in membercache.pages(guild):
+            users_data = [
+                (str(member.id), member.display_name, str(member.display_avatar.url))
+                for member in page if not member.bot
+            ]
+            if users_data:
+                await sync_multiple_user_profiles(users_data)
+                total += len(users_data)
+        return total
+
     async def profile_sync_task(self):
         """Perform a full member profile sweep on startup and every 24h."""
         await self.bot.wait_until_ready()
@@ -152,18 +206,9 @@ class LevelingCog(commands.Cog):
             try:
                 for guild in self.bot.guilds:
                     logger.info(f"Starting full profile sync for {guild.name}...")
-                    users_data = []
-                    for member in guild.members:
-                        if member.bot: continue
-                        users_data.append((
-                            str(member.id), 
-                            member.display_name, 
-                            str(member.display_avatar.url)
-                        ) )
-                    
-                    if users_data:
-                        await sync_multiple_user_profiles(users_data)
-                        logger.info(f"Synced {len(users_data)} member profiles for {guild.name} (Bulk).")
+                    synced = await self._sync_guild_profiles(guild)
+                    if synced:
+                        logger.info(f"Synced {synced} member profiles for {guild.name} (Bulk).")
             except Exception as e:
                 logger.error(f"Error in profile sync task: {e}")
             await asyncio.sleep(86400) # Every 24 hours
@@ -267,21 +312,23 @@ class LevelingCog(commands.Cog):
         if new_reward:
             role = member.guild.get_role(int(new_reward["role_id"]))
             if role and str(role.id) not in excluded_ids:
+                to_add = [] if role in member.roles else [role]
+
+                # Remove old reward roles if stacking is disabled
+                to_remove = []
+                if not new_reward["stack_role"]:
+                    for r in rewards:
+                        if r["level"] < level:
+                            old_role = member.guild.get_role(int(r["role_id"]))
+                            if old_role and old_role in member.roles and str(old_role.id) not in excluded_ids:
+                                to_remove.append(old_role)
+
                 try:
-                    if role not in member.roles:
-                        await member.add_roles(role, reason=f"Level {level} Reward")
-                        earned_reward = True
-                    
-                    # Remove old reward roles if stacking is disabled
-                    if not new_reward["stack_role"]:
-                        to_remove = []
-                        for r in rewards:
-                            if r["level"] < level:
-                                old_role = member.guild.get_role(int(r["role_id"]))
-                                if old_role and old_role in member.roles and str(old_role.id) not in excluded_ids:
-                                    to_remove.append(old_role)
-                        if to_remove:
-                            await member.remove_roles(*to_remove, reason="Level Role Replacement")
+                    # Grant and replacement go out as a single member edit
+                    if to_add or to_remove:
+                        reason = f"Level {level} Reward" if to_add else "Level Role Replacement"
+                        await rolequeue.update(member, add=to_add, remove=to_remove, reason=reason)
+                        earned_reward = bool(to_add)
                 except discord.Forbidden:
                     logger.warning(f"Forbidden: Cannot manage roles for {member}")
         
@@ -378,10 +425,9 @@ class LevelingCog(commands.Cog):
         needed_xp    = xp_next - xp_start
         percentage   = min(100.0, max(0.0, (progress_xp / needed_xp) * 100)) if needed_xp > 0 else 100.0
 
+        # Rank and balance both come from the in-memory rank index
         server_rank = await get_user_rank(member.id)
-
-        from database import get_balance
-        balance = await get_balance(member.id)
+        balance = (await ranks.balances.score(member.id) or (0,))[0]
 
         # Get prefs for the invoker (themes are personal)
         prefs = await get_rank_card_prefs(invoker_id)
@@ -394,11 +440,9 @@ class LevelingCog(commands.Cog):
 
         avatar_bytes = None
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as sess:
-                async with sess.get(str(member.display_avatar.with_size(256).url)) as resp:
-                    if resp.status == 200:
-                        avatar_bytes = await resp.read()
+            resp = await http_client.get("discord_cdn", str(member.display_avatar.with_size(256).url), read="bytes")
+            if resp.status == 200:
+                avatar_bytes = resp.data
         except Exception:
             pass
 
@@ -497,22 +541,44 @@ class LevelingCog(commands.Cog):
         rewards_list = await get_reward_roles()
         member_role_ids = {str(r.id) for r in member.roles}
 
-        synced = 0
+        missing = []
         for reward in rewards_list:
             if reward["level"] <= current_level and str(reward["role_id"]) not in member_role_ids:
                 role = member.guild.get_role(int(reward["role_id"]))
                 if role:
-                    try:
-                        await member.add_roles(role, reason="Manual /rolesync")
-                        synced += 1
-                    except discord.Forbidden:
-                        pass
+                    missing.append(role)
+
+        synced = 0
+        if missing:
+            try:
+                await rolequeue.add(member, *missing, reason="Manual /rolesync")
+                synced = len(missing)
+            except discord.Forbidden:
+                pass
 
         if synced:
             await interaction.followup.send(f"✅ Synced! Added {synced} missing reward role(s).", ephemeral=True)
         else:
             await interaction.followup.send("✅ Your roles are already up to date!", ephemeral=True)
 
+    @app_commands.command(name="reward_reconcile", description="[ADMIN] Bring every member's level reward roles in sync")
+    @app_commands.describe(dry_run="Only report what would change (default: on)")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def reward_reconcile(self, interaction: discord.Interaction, dry_run: bool = True):
+        await interaction.response.defer(ephemeral=True)
+
+        async def progress(done, total):
+            await interaction.edit_original_response(content=f"⏳ Reconciling reward roles... {done}/{total} members")
+
+        try:
+            report = await rewardsync.reconcile(interaction.guild, dry_run=dry_run, progress=progress)
+        except Exception as e:
+            return await interaction.edit_original_response(content=f"❌ Reconcile failed: {e}")
+
+        title = "🔍 Reward role dry run" if dry_run else "✅ Reward roles reconciled"
+        await interaction.edit_original_response(content=f"{title}\n{report.summary()}"[:2000])
+
     @app_commands.command(name="leaderboard", description="View the top 25 users")
     async def leaderboard_slash(self, interaction: discord.Interaction):
         top_users = await get_top_levels(25)
@@ -566,17 +632,7 @@ class LevelingCog(commands.Cog):
             # Sync Members
             total_count = 0
             for guild in self.bot.guilds:
-                users_data = []
-                for member in guild.members:
-                    if member.bot: continue
-                    users_data.append((
-                        str(member.id), 
-                        member.display_name, 
-                        str(member.display_avatar.url)
-                    ))
-                if users_data:
-                    await sync_multiple_user_profiles(users_data)
-                    total_count += len(users_data)
+                total_count += await self._sync_guild_profiles(guild)
             
             await interaction.followup.send(f"✅ Sync complete! Cached {total_count} members (Bulk) and updated server roles.", ephemeral=True)
         except Exception as e:
@@ -17,6 +17,9 @@ from database import (
 )
 from config import AUTHORIZED_ROLES, ROLE_ADD_QUOTE, DAILY_COMMAND_ROLE
 import tasks
+import votes
+import msgcache
+import gematria
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +76,7 @@ class QuotesCog(commands.Cog):
 
         try:
             await add_quote_to_db(quote_text)
+            gematria.index.add({"source": "quote", "text": quote_text})
             embed = discord.Embed(
                 title="✅ Quote Added",
                 description=f"{quote_text}",
@@ -293,6 +297,7 @@ class QuotesCog(commands.Cog):
                 from tasks import PV_MSG_ID_KEY
                 from database import set_setting
                 await set_setting(PV_MSG_ID_KEY, str(msg.id))
+                tasks.open_pv_ballot(msg.id, candidates)
 
                 if emperor_channel and target_channel != ctx.channel:
                     await ctx.reply(f"✅ New vote posted in {emperor_channel.mention}.", mention_author=False)
@@ -368,41 +373,34 @@ class QuotesCog(commands.Cog):
         embed.set_footer(text=f"Chosen by {ctx.author.display_name} · Posts at 10am & 6pm tomorrow")
         await target_channel.send(embed=embed)
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
-        """Listen for 1, 2, 3 reactions on the current PV message."""
-        if payload.user_id == self.bot.user.id:
-            return
-        
+    async def cog_load(self):
+        """Route PV ballot votes here and re-open the ballot for a vote still pending from before a restart."""
+        votes.register_handler("pv", self._on_pv_vote)
         from database import get_setting
         from tasks import PV_MSG_ID_KEY
         pv_msg_id = await get_setting(PV_MSG_ID_KEY)
-        if not pv_msg_id or str(payload.message_id) != pv_msg_id:
-            return
-
-        # Check if user is an admin
-        guild = self.bot.get_guild(payload.guild_id)
-        if not guild:
-            return
-        member = guild.get_member(payload.user_id)
-        if not member or not member.guild_permissions.administrator:
+        if pv_msg_id:
+            candidates = await tasks._get_pending_quotes()
+            if candidates:
+                tasks.open_pv_ballot(pv_msg_id, candidates)
+
+    async def _on_pv_vote(self, ballot, emoji_str: str, payload: discord.RawReactionActionEvent):
+        """Lock in the candidate an admin reacted with on the current PV message."""
+        # Validate against the candidates the ballot was opened with; an invalid pick leaves it open
+        candidates = ballot.meta.get("candidates", [])
+        idx = ballot.options.index(emoji_str)
+        if idx >= len(candidates):
             return
+        # Close before any await so a second admin reaction can't double-trigger
+        votes.close_ballot(ballot.message_id)
+        from tasks import PV_MSG_ID_KEY
+        member = payload.member
 
-        # Check if emoji is 1, 2, or 3
-        NUMBER_EMOJIS = ["1️⃣", "2️⃣", "3️⃣"]
-        emoji_str = str(payload.emoji)
-        if emoji_str not in NUMBER_EMOJIS:
+        # Already picked some other way (e.g. a .pv vote) since the ballot opened
+        if not await tasks._get_pending_quotes():
             return
 
         # Lock it in
-        candidates = await tasks._get_pending_quotes()
-        if not candidates:
-            return
-
-        idx = NUMBER_EMOJIS.index(emoji_str)
-        if idx >= len(candidates):
-            return
-        
         picked = candidates[idx]
         await tasks._set_tomorrow_quote(picked)
         await tasks._set_pending_quotes([])
@@ -435,7 +433,7 @@ class QuotesCog(commands.Cog):
         # --- =quote: save the replied-to message as a quote drop ---
         if content.lower() == "=quote" and message.reference and message.reference.message_id:
             try:
-                ref_msg = await message.channel.fetch_message(message.reference.message_id)
+                ref_msg = await msgcache.cache.get_reference(message)
                 if not ref_msg.content:
                     return await message.reply("❌ That message has no text to quote.", mention_author=False)
 
@@ -0,0 +1,110 @@
+"""
+Spirit Cog - Fallen angel and demon hierarchy lookups
+Commands: spirit [name], spirit search/tradition/rank/random/goetia/chart/tree/list/stats
+"""
+
+import discord
+from discord.ext import commands
+import logging
+
+import hierarchy
+
+logger = logging.getLogger(__name__)
+
+
+def _split_page(text: str):
+    """'prince of hell 2' -> ('prince of hell', 2). A trailing number is the page."""
+    words = text.split()
+    if len(words) > 1 and words[-1].isdigit():
+        return " ".join(words[:-1]), int(words[-1])
+    return text, 1
+
+
+class SpiritCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.group(name="spirit", aliases=["hierarchy"], invoke_without_command=True)
+    @commands.cooldown(1, 3, commands.BucketType.user)
+    async def spirit(self, ctx, *, name: str = None):
+        """Look up a fallen angel or demon by name (.spirit bael)"""
+        if not name:
+            embed = discord.Embed(
+                title="👿 Spirit Hierarchy",
+                description=(
+                    "`.spirit <name>` — details (typos and aliases are fine)\n"
+                    "`.spirit search <words> [page]` — ranked search\n"
+                    "`.spirit tradition <name> [page]` — e.g. goetia, enoch, vodou\n"
+                    "`.spirit rank <rank> [page]` — e.g. duke, watcher\n"
+                    "`.spirit random` • `.spirit goetia [page]` • `.spirit chart`\n"
+                    "`.spirit tree` • `.spirit list [page]` • `.spirit stats`"
+                ),
+                color=discord.Color.from_rgb(139, 0, 0),
+            )
+            return await ctx.send(embed=embed)
+
+        key = hierarchy.find_entity(name)
+        if key:
+            return await hierarchy.send_entity_details(ctx, key)
+
+        suggestions = hierarchy.suggest_entities(name)
+        hint = f" Did you mean: {', '.join(f'**{s}**' for s in suggestions)}?" if suggestions else ""
+        await ctx.send(f"❌ No entity named '{name}'.{hint} Try `.spirit search {name}`.")
+
+    @spirit.command(name="search")
+    async def spirit_search(self, ctx, *, query: str = None):
+        """Ranked search over names, aliases, domains and descriptions"""
+        if not query:
+            return await ctx.send("Usage: `.spirit search <words> [page]`")
+        query, page = _split_page(query)
+        await hierarchy.send_search_results(ctx, query, page)
+
+    @spirit.command(name="tradition")
+    async def spirit_tradition(self, ctx, *, tradition: str = None):
+        """Entities from one tradition"""
+        if not tradition:
+            return await ctx.send("Usage: `.spirit tradition <name> [page]`")
+        tradition, page = _split_page(tradition)
+        await hierarchy.send_tradition_list(ctx, tradition, page)
+
+    @spirit.command(name="rank")
+    async def spirit_rank(self, ctx, *, rank: str = None):
+        """Entities holding a rank"""
+        if not rank:
+            return await ctx.send("Usage: `.spirit rank <rank> [page]`")
+        rank, page = _split_page(rank)
+        await hierarchy.send_rank_list(ctx, rank, page)
+
+    @spirit.command(name="random")
+    async def spirit_random(self, ctx):
+        """A random entity"""
+        await hierarchy.send_entity_details(ctx, hierarchy.get_random_entity())
+
+    @spirit.command(name="goetia")
+    async def spirit_goetia(self, ctx, page: int = 1):
+        """The 72 spirits of the Ars Goetia, in order"""
+        await hierarchy.send_goetia_list(ctx, page)
+
+    @spirit.command(name="chart")
+    async def spirit_chart(self, ctx):
+        """The Goetia grouped by rank"""
+        await hierarchy.send_goetia_chart(ctx)
+
+    @spirit.command(name="tree")
+    async def spirit_tree(self, ctx):
+        """The full hierarchy chart"""
+        await hierarchy.send_hierarchy_chart(ctx)
+
+    @spirit.command(name="list")
+    async def spirit_list(self, ctx, page: int = 1):
+        """Every entity, alphabetically"""
+        await hierarchy.send_entity_list(ctx, page)
+
+    @spirit.command(name="stats")
+    async def spirit_stats(self, ctx):
+        """Database statistics"""
+        await hierarchy.send_stats(ctx)
+
+
+async def setup(bot):
+    await bot.add_cog(SpiritCog(bot))
@@ -1,6 +1,6 @@
 """
 Tarot Cog - Tarot card reading system
-Commands: tc (tarot card)
+Commands: pull/tc (tarot card), spread (3-card / Celtic cross)
 """
 
 import discord
@@ -10,10 +10,8 @@ import logging
 import time
 import random
 from datetime import datetime
-from database import get_guild_tarot_deck, set_guild_tarot_deck, get_balance, update_balance
+from database import get_balance, update_balance
 import tarot
-import rws
-import manara
 import economy
 
 logger = logging.getLogger(__name__)
@@ -21,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Usage tracking for cooldown/reinforcement
 user_usage = {}
 
+# Spread price in 💎 (admins draw free)
+SPREAD_COSTS = {"three": 3, "celtic": 10}
+
 
 class TarotCog(commands.Cog):
     tarot_group = app_commands.Group(name="tarot", description="Tarot card reading system")
@@ -30,19 +31,10 @@ class TarotCog(commands.Cog):
 
     async def _handle_draw(self, target: discord.abc.Messageable, author: discord.Member, guild: discord.Guild):
         """Unified logic for prefix and slash draws."""
-        deck_setting = await get_guild_tarot_deck(guild.id)
-        deck_name_clean = str(deck_setting).lower().strip() if deck_setting else "thoth"
-
-        if deck_name_clean == "rws":
-            deck_module = rws
-        elif deck_name_clean == "manara":
-            deck_module = manara
-        else:
-            deck_module = tarot
+        deck = await tarot.service.for_guild(guild.id)
 
         async def execute_draw():
-            card_key = deck_module.draw_card()
-            await deck_module.send_tarot_card(target, card_key=card_key)
+            await tarot.send_tarot_card(target, deck)
 
         user_id = author.id
         now = time.time()
@@ -111,6 +103,39 @@ class TarotCog(commands.Cog):
     async def slash_draw(self, interaction: discord.Interaction):
         await self._handle_draw(interaction, interaction.user, interaction.guild)
 
+    async def _handle_spread(self, target, author: discord.Member, guild: discord.Guild, spread: str):
+        """Charge for and send a multi-card spread."""
+        cost = SPREAD_COSTS[spread]
+        if not author.guild_permissions.administrator:
+            if await get_balance(author.id) < cost:
+                msg = f"❌ A spread demands {economy.format_balance(cost)}. You're flat."
+                if isinstance(target, discord.Interaction):
+                    return await target.response.send_message(msg, ephemeral=True)
+                return await target.reply(msg, mention_author=False)
+            await update_balance(author.id, -cost)
+
+        deck = await tarot.service.for_guild(guild.id)
+        if isinstance(target, discord.Interaction):
+            await target.response.defer()  # Compositing can take a moment
+        await tarot.send_spread(target, deck, spread)
+
+    @commands.command(name="spread")
+    @commands.cooldown(1, 30, commands.BucketType.user)
+    async def spread_command(self, ctx, kind: str = "three"):
+        """Draw a spread from the current deck (.spread [3|celtic])"""
+        spread = tarot.SPREAD_ALIASES.get(kind.lower())
+        if not spread:
+            return await ctx.reply("Usage: `.spread [3|celtic]`", mention_author=False)
+        await self._handle_spread(ctx, ctx.author, ctx.guild, spread)
+
+    @tarot_group.command(name="spread", description="Draw a 3-card or Celtic cross spread from the current deck")
+    @app_commands.choices(kind=[
+        app_commands.Choice(name="Past • Present • Future", value="three"),
+        app_commands.Choice(name="Celtic Cross", value="celtic"),
+    ])
+    async def slash_spread(self, interaction: discord.Interaction, kind: str = "three"):
+        await self._handle_spread(interaction, interaction.user, interaction.guild, kind)
+
 
 async def setup(bot):
     await bot.add_cog(TarotCog(bot))
@@ -6,6 +6,9 @@ import logging
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import database
+import membercache
+import votes
+import rolequeue
 from config import MOD_CHANNEL_ID
 
 logger = logging.getLogger(__name__)
@@ -13,6 +16,25 @@ logger = logging.getLogger(__name__)
 TRIAL_ROLE_ID = 1444477594698514594
 TRIAL_DURATION_DAYS = 4
 
+# 🎓 (Graduate), ⏳ (Extend), 🥾 (Kick)
+TRIAL_DECISIONS = {
+    "🎓": "graduated",
+    "⏳": "extended",
+    "🥾": "kicked"
+}
+
+
+def open_trial_ballot(message_id, user_id: str, guild_id: str):
+    """Start collecting admin decisions on a trial expiration embed."""
+    votes.open_ballot(
+        int(message_id),
+        list(TRIAL_DECISIONS),
+        kind="trial",
+        meta={"user_id": user_id, "guild_id": guild_id},
+        eligible=lambda uid, member: member is not None and member.guild_permissions.administrator,
+    )
+
+
 class TrialCog(commands.Cog):
     """Trial system for monitoring new members."""
     def __init__(self, bot):
@@ -40,54 +62,36 @@ class TrialCog(commands.Cog):
         await database.add_trial(str(member.id), str(ctx.guild.id), start_time, end_time)
         
         try:
-            await member.add_roles(trial_role, reason=f"Trial started by {ctx.author.display_name}")
+            await rolequeue.add(member, trial_role, reason=f"Trial started by {ctx.author.display_name}")
             await ctx.send(f"{member.mention} granted 4 day trial")
         except discord.Forbidden:
             return await ctx.reply("❌ Permission error: Could not assign the Trial role.", mention_author=False)
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
-        """Handle reactions on trial decision embeds in admin log."""
-        if payload.user_id == self.bot.user.id:
-            return
+    async def cog_load(self):
+        """Register the decision handler and re-open ballots for decision embeds still awaiting a pick."""
+        votes.register_handler("trial", self._on_trial_vote)
+        for user_id, guild_id, _start, _end, message_id in await database.get_active_trials():
+            if message_id:
+                open_trial_ballot(message_id, user_id, guild_id)
 
-        # Simple check for relevant emojis
-        # 🎓 (Graduate), ⏳ (Extend), 🥾 (Kick)
-        REACTION_MAP = {
-            "🎓": "graduated",
-            "⏳": "extended",
-            "🥾": "kicked"
-        }
+    async def _on_trial_vote(self, ballot, emoji_str: str, payload: discord.RawReactionActionEvent):
+        """Handle an admin's reaction on a trial decision embed in admin log."""
+        # First admin decision wins; close before any await so duplicates are dropped
+        votes.close_ballot(ballot.message_id)
 
-        emoji_str = str(payload.emoji)
-        if emoji_str not in REACTION_MAP:
-            return
-
-        # Check if the message is a trial decision message
-        # We need to check the database
-        async with database.get_db() as conn:
-            async with conn.execute(
-                "SELECT user_id, guild_id, status FROM trials WHERE message_id = ?", (str(payload.message_id),)
-            ) as cursor:
-                row = await cursor.fetchone()
-        
-        if not row:
-            return
-
-        target_user_id, guild_id, status = row
-        if status != "pending":
-            return # Already handled
+        target_user_id = ballot.meta["user_id"]
+        guild_id = ballot.meta["guild_id"]
 
         guild = self.bot.get_guild(int(guild_id))
         if not guild:
             return
 
-        member = guild.get_member(payload.user_id)
-        if not member or not member.guild_permissions.administrator:
-            return # Only admins can decide
+        member = payload.member or await membercache.cache.get(guild, payload.user_id)
+        if not member:
+            return
 
-        action = REACTION_MAP[emoji_str]
-        target_member = guild.get_member(int(target_user_id))
+        action = TRIAL_DECISIONS[emoji_str]
+        target_member = await membercache.cache.get(guild, target_user_id)
         
         admin_log_ch = guild.get_channel(int(MOD_CHANNEL_ID))
         if not admin_log_ch:
@@ -103,7 +107,7 @@ class TrialCog(commands.Cog):
             trial_role = guild.get_role(TRIAL_ROLE_ID)
             if target_member:
                 if trial_role and trial_role in target_member.roles:
-                    await target_member.remove_roles(trial_role, reason="Trial graduated.")
+                    await rolequeue.remove(target_member, trial_role, reason="Trial graduated.")
                 await admin_log_ch.send(f"🎓 **Trial Result**: {target_member.mention} has **GRADUATED**! (Decision by {member.display_name})")
             else:
                 await admin_log_ch.send(f"🎓 **Trial Result**: User `{target_user_id}` (not found in server) marked as **GRADUATED**. (Decision by {member.display_name})")
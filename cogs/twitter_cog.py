@@ -6,10 +6,8 @@ Commands:
   .x follows              — admin: view & action pending follow requests
 """
 
-import os
-import json
+import io
 import logging
-import time
 import discord
 from discord.ext import commands
 from datetime import timezone, datetime
@@ -21,7 +19,8 @@ from database import (
     get_follow_request, update_follow_request_status,
     has_pending_follow_request,
 )
-from config import TWITTER_COOKIES_FILE
+from exceptions import TwitterAccountNotFound
+import timeline
 
 logger = logging.getLogger(__name__)
 
@@ -115,43 +114,10 @@ class FollowApprovalView(discord.ui.View):
 class TwitterCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self._client = None  # Lazy-initialized twikit client
 
     async def _get_client(self):
-        """Lazily initializes and returns the twikit client using saved cookies."""
-        if self._client is not None:
-            return self._client
-
-        try:
-            from twikit import Client
-        except ImportError:
-            raise RuntimeError("twikit is not installed. Run: pip install twikit")
-
-        # If the file doesn't exist, try writing it from the TWITTER_COOKIES_JSON env var
-        # (set this in Railway with the contents of twitter_cookies.json)
-        if not os.path.exists(TWITTER_COOKIES_FILE):
-            cookies_json = os.getenv("TWITTER_COOKIES_JSON")
-            if cookies_json:
-                try:
-                    json.loads(cookies_json)
-                    os.makedirs(os.path.dirname(os.path.abspath(TWITTER_COOKIES_FILE)), exist_ok=True)
-                    with open(TWITTER_COOKIES_FILE, "w") as f:
-                        f.write(cookies_json)
-                    logger.info(f"✅ Wrote Twitter cookies from env var to {TWITTER_COOKIES_FILE}")
-                except Exception as e:
-                    raise RuntimeError(f"TWITTER_COOKIES_JSON env var is invalid: {e}")
-            else:
-                raise RuntimeError(
-                    f"Twitter cookies file not found: `{TWITTER_COOKIES_FILE}`. "
-                    "Either run setup_twitter.py locally, or set the TWITTER_COOKIES_JSON "
-                    "environment variable on Railway."
-                )
-
-        client = Client(language="en-US")
-        client.load_cookies(TWITTER_COOKIES_FILE)
-        self._client = client
-        logger.info("✅ twikit client initialized from cookies.")
-        return client
+        """The shared twikit client (see timeline.get_client)."""
+        return await timeline.get_client()
 
     # ── Main command ────────────────────────────────────────────
 
@@ -222,16 +188,12 @@ class TwitterCog(commands.Cog):
 
         async with ctx.channel.typing():
             try:
-                client = await self._get_client()
+                account = await timeline.resolve_account(username)
             except RuntimeError as e:
                 return await ctx.reply(f"❌ Twitter setup error: {e}", mention_author=False)
-
-            try:
-                user = await client.get_user_by_screen_name(username)
+            except TwitterAccountNotFound:
+                return await ctx.reply(f"❌ Account `@{username}` not found on X.", mention_author=False)
             except Exception as e:
-                err_str = str(e).lower()
-                if "not found" in err_str or "no user" in err_str or "404" in err_str:
-                    return await ctx.reply(f"❌ Account `@{username}` not found on X.", mention_author=False)
                 logger.error(f"Error fetching X user @{username}: {e}", exc_info=True)
                 return await ctx.reply(
                     f"❌ Could not fetch `@{username}`. X may be rate limiting — try again in a bit.",
@@ -239,7 +201,7 @@ class TwitterCog(commands.Cog):
                 )
 
             try:
-                raw_tweets = await client.get_user_tweets(user.id, tweet_type="Tweets", count=20)
+                _, filtered = await timeline.recent_posts(username, count)
             except Exception as e:
                 logger.error(f"Error fetching tweets for @{username}: {e}", exc_info=True)
                 return await ctx.reply(
@@ -247,37 +209,28 @@ class TwitterCog(commands.Cog):
                     mention_author=False
                 )
 
-            filtered = []
-            for tweet in raw_tweets:
-                if getattr(tweet, "in_reply_to", None):
-                    continue
-                text = getattr(tweet, "text", "") or ""
-                if text.startswith("@"):
-                    continue
-                filtered.append(tweet)
-                if len(filtered) >= count:
-                    break
-
             if not filtered:
                 return await ctx.reply(
                     f"❌ No original posts found for `@{username}` (replies and @-mentions excluded).",
                     mention_author=False
                 )
 
+            # Photos download concurrently (usually already prefetched) and go up as attachments
+            photos = await timeline.fetch_media([p.photo_url for p in filtered if p.photo_url])
+
             actual_cost = TOKENS_PER_POST * len(filtered)
             if not is_admin:
                 await update_balance(ctx.author.id, -actual_cost)
 
-            embeds = []
-            avatar_url = getattr(user, "profile_image_url", None)
-            display_name = getattr(user, "name", username)
+            embeds, files = [], []
+            avatar_url = account.avatar_url
+            display_name = account.name or username
 
-            for tweet in filtered:
-                tweet_id = getattr(tweet, "id", None)
-                tweet_url = f"https://x.com/{username}/status/{tweet_id}" if tweet_id else None
+            for post in filtered:
+                tweet_url = f"https://x.com/{username}/status/{post.id}"
 
                 timestamp = None
-                created_at = getattr(tweet, "created_at", None)
+                created_at = post.created_at
                 if created_at:
                     try:
                         from email.utils import parsedate_to_datetime
@@ -285,11 +238,11 @@ class TwitterCog(commands.Cog):
                     except Exception:
                         pass
 
-                favorite_count = getattr(tweet, "favorite_count", 0) or 0
-                retweet_count  = getattr(tweet, "retweet_count", 0) or 0
+                favorite_count = post.favorite_count
+                retweet_count  = post.retweet_count
 
                 embed = discord.Embed(
-                    description=tweet.text[:4090] if tweet.text else "*[no text]*",
+                    description=post.text[:4090] if post.text else "*[no text]*",
                     color=0x1DA1F2,
                     url=tweet_url,
                     timestamp=timestamp
@@ -308,19 +261,17 @@ class TwitterCog(commands.Cog):
                     footer += f"  •  -{economy.format_balance(TOKENS_PER_POST)} tokens"
                 embed.set_footer(text=footer)
 
-                try:
-                    media = getattr(tweet, "media", None)
-                    if media:
-                        first = media[0]
-                        media_url = getattr(first, "media_url_https", None) or getattr(first, "url", None)
-                        if media_url and first.type == "photo":
-                            embed.set_image(url=media_url)
-                except Exception:
-                    pass
+                if post.photo_url in photos:
+                    ext = post.photo_url.rsplit(".", 1)[-1].split("?")[0] or "jpg"
+                    filename = f"x_{post.id}.{ext}"
+                    files.append(discord.File(io.BytesIO(photos[post.photo_url]), filename=filename))
+                    embed.set_image(url=f"attachment://{filename}")
+                elif post.photo_url:
+                    embed.set_image(url=post.photo_url)
 
                 embeds.append(embed)
 
-            await ctx.send(embeds=embeds)
+            await ctx.send(embeds=embeds, files=files)
 
     # ── Queue a follow request (any user) ────────────────────
 
@@ -11,12 +11,13 @@ import random
 import asyncio
 import time
 import urllib.parse
-import aiohttp
 from datetime import datetime
 from zoneinfo import ZoneInfo
 import ephem
 
 import economy
+import database
+import gematria
 from database import get_balance, update_balance, get_user_timezone, set_user_timezone, increment_gif_count, get_top_gifs, get_gif_by_rank
 from helpers import (
     calculate_all_gematria,
@@ -36,6 +37,11 @@ from helpers import (
 )
 from api import urban_dictionary_lookup, google_lens_fetch_results, lookup_location
 import crypto_api
+import geocode
+import msgcache
+from exceptions import UpstreamError, UpstreamUnavailable
+from httpclient import client as http_client
+from respcache import cache as response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +67,7 @@ class UtilityCog(commands.Cog):
         )
         embed.add_field(
             name="#forum (works in both channels)",
-            value="`.beg` `.daily` `.bal` `.send` `.key` `.gem` `.moon` `.pull` `.tc` `.w` `.time` `.8ball` `.location` `.roll` `.roulette` `.ud` `.rev`",
+            value="`.beg` `.daily` `.bal` `.send` `.key` `.gem` `.moon` `.pull` `.tc` `.spirit` `.w` `.time` `.8ball` `.location` `.roll` `.roulette` `.ud` `.rev`",
             inline=False
         )
         embed.add_field(
@@ -76,7 +82,7 @@ class UtilityCog(commands.Cog):
     async def gematria_command(self, ctx, *, text: str = None):
         """Calculate gematria values for text (costs 2 tokens)"""
         if ctx.message.reference:
-            reply_msg = await ctx.channel.fetch_message(ctx.message.reference.message_id)
+            reply_msg = await msgcache.cache.get_reference(ctx.message)
             text = reply_msg.content
 
         if not text or not any(ch.isalnum() for ch in text):
@@ -115,6 +121,21 @@ class UtilityCog(commands.Cog):
             name="Reverse Sumerian", value=str(results["reverse_sumerian"]), inline=False
         )
 
+        # Stored quotes / HOF entries sharing the English value (reverse index, no per-call scan)
+        try:
+            idx = await gematria.ensure_index(database)
+            matches = [m for m in idx.lookup("english", results["english"]) if m["text"].strip() != text.strip()]
+            if matches:
+                sample = matches[0]["text"]
+                sample = sample if len(sample) <= 80 else sample[:77] + "..."
+                embed.add_field(
+                    name=f"🔗 Shares English {results['english']}",
+                    value=f"{len(matches)} stored quote(s)/HOF entries — e.g. *{sample}*\n`.gemfind {results['english']}` for more",
+                    inline=False,
+                )
+        except Exception as e:
+            logger.warning(f"Gematria index lookup failed: {e}")
+
         is_exempt = ctx.author.guild_permissions.administrator
 
         if not is_exempt:
@@ -122,6 +143,40 @@ class UtilityCog(commands.Cog):
 
         await ctx.reply(embed=embed, mention_author=False)
 
+    @commands.command(name="gemfind")
+    @commands.cooldown(1, 5, commands.BucketType.user)
+    async def gematria_find_command(self, ctx, value: int = None, cipher: str = "english"):
+        """Find stored quotes and HOF entries with a gematria value (.gemfind 93 [cipher])"""
+        if value is None:
+            names = ", ".join(f"`{n}`" for n in gematria.CIPHERS)
+            return await ctx.reply(f"Usage: `.gemfind <value> [cipher]` — ciphers: {names}", mention_author=False)
+
+        cipher_name = gematria.resolve_cipher(cipher)
+        if not cipher_name:
+            return await ctx.reply(f"❌ Unknown cipher `{cipher}`.", mention_author=False)
+
+        idx = await gematria.ensure_index(database)
+        matches = idx.lookup(cipher_name, value)
+        if not matches:
+            return await ctx.reply(f"🔍 Nothing stored equals **{value}** in {cipher_name.replace('_', ' ').title()}.", mention_author=False)
+
+        lines = []
+        for m in matches[:10]:
+            snippet = m["text"] if len(m["text"]) <= 90 else m["text"][:87] + "..."
+            if m["source"] == "hof" and m.get("jump_url"):
+                lines.append(f"🏆 [{snippet}]({m['jump_url']})")
+            else:
+                lines.append(f"📜 {snippet}")
+
+        embed = discord.Embed(
+            title=f"{cipher_name.replace('_', ' ').title()} = {value}",
+            description="\n".join(lines),
+            color=discord.Color.dark_grey(),
+        )
+        if len(matches) > 10:
+            embed.set_footer(text=f"Showing 10 of {len(matches)} matches")
+        await ctx.reply(embed=embed, mention_author=False)
+
     @commands.command(name="rev")
     @commands.cooldown(1, 30, commands.BucketType.user)
     async def reverse_command(self, ctx):
@@ -130,9 +185,7 @@ class UtilityCog(commands.Cog):
             image_url = None
             if ctx.message.reference:
                 try:
-                    replied = await ctx.channel.fetch_message(
-                        ctx.message.reference.message_id
-                    )
+                    replied = await msgcache.cache.get_reference(ctx.message)
                     image_url = await extract_image(replied)
                 except Exception as e:
                     logger.error(f"Error fetching replied message: {e}")
@@ -438,14 +491,9 @@ class UtilityCog(commands.Cog):
     @commands.command(name="w")
     async def weather_command(self, ctx, *, location: str = None):
         """Gets current weather for a location (zip code, city, neighborhood, etc.)"""
-        if self.bot.aiohttp_session is None or self.bot.aiohttp_session.closed:
-            self.bot.aiohttp_session = aiohttp.ClientSession()
-
         if ctx.message.reference and not location:
             try:
-                replied_message = await ctx.channel.fetch_message(
-                    ctx.message.reference.message_id
-                )
+                replied_message = await msgcache.cache.get_reference(ctx.message)
                 replied_user = replied_message.author
 
                 timezone_name, city = await get_user_timezone(replied_user.id)
@@ -535,64 +583,87 @@ class UtilityCog(commands.Cog):
 
         location_stripped = location.strip()
         location_parts = location_stripped.lower().split()
+        base_url = "https://api.openweathermap.org/data/2.5/weather"
+
+        # Free-text locations go through the geocode cache so weather is fetched (and cached) by coordinates
+        place = None
+        if not (location_stripped.isdigit() and len(location_stripped) == 5):
+            place = await geocode.resolve(location_stripped)
 
         if location_stripped.isdigit() and len(location_stripped) == 5:
-            url = f"https://api.openweathermap.org/data/2.5/weather?zip={location_stripped},us&appid={API_KEY}&units=metric"
+            url = f"{base_url}?zip={location_stripped},us&appid={API_KEY}&units=metric"
+            cache_key = f"zip:{location_stripped}"
+        elif place is not None and place.lat is not None:
+            url = f"{base_url}?lat={place.lat}&lon={place.lon}&appid={API_KEY}&units=metric"
+            cache_key = f"{round(place.lat, 2)},{round(place.lon, 2)}"
         elif location_parts and location_parts[-1] in us_state_abbrevs:
             state_abbrev = us_state_abbrevs[location_parts[-1]]
             city = " ".join(location_parts[:-1])
             formatted_location = f"{city},{state_abbrev},us"
             encoded_location = urllib.parse.quote(formatted_location)
-            url = f"https://api.openweathermap.org/data/2.5/weather?q={encoded_location}&appid={API_KEY}&units=metric"
+            url = f"{base_url}?q={encoded_location}&appid={API_KEY}&units=metric"
+            cache_key = formatted_location
         else:
             encoded_location = urllib.parse.quote(location_stripped)
-            url = f"https://api.openweathermap.org/data/2.5/weather?q={encoded_location}&appid={API_KEY}&units=metric"
+            url = f"{base_url}?q={encoded_location}&appid={API_KEY}&units=metric"
+            cache_key = location_stripped
 
-        try:
-            if self.bot.aiohttp_session is None or self.bot.aiohttp_session.closed:
-                self.bot.aiohttp_session = aiohttp.ClientSession()
-
-            async with self.bot.aiohttp_session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    location_name = data["name"]
-                    country = data["sys"]["country"]
-                    temp_c = data["main"]["temp"]
-                    temp_f = (temp_c * 9 / 5) + 32
-                    condition = data["weather"][0]["description"].title()
-
-                    weather_msg = f"**{location_name}, {country}**\n{condition} • {temp_f:.1f}°F / {temp_c:.1f}°C"
-                    await ctx.send(weather_msg)
-
-                elif response.status == 404:
-                    await ctx.reply(
-                        f"❌ Location '{location}' not found!", mention_author=False
-                    )
-                elif response.status == 401:
-                    await ctx.reply(
-                        "❌ Invalid API key! Check your OpenWeatherMap API key.",
-                        mention_author=False,
-                    )
-                else:
-                    await ctx.reply(
-                        f"❌ Failed to fetch weather data. Status: {response.status}",
-                        mention_author=False,
-                    )
+        failed = {}
 
-        except Exception as e:
-            await ctx.reply(f"❌ Error: {e}", mention_author=False)
+        async def fetch_weather():
+            try:
+                resp = await http_client.get("openweather", url)
+            except UpstreamError as e:
+                failed["error"] = e
+                return None
+            # Found and not-found are both answers worth caching; anything else is retried next time
+            if resp.status not in (200, 404):
+                failed["status"] = resp.status
+                return None
+            return [resp.status, resp.data]
+
+        result = await response_cache.get("weather", cache_key, fetch_weather)
+        status, data = result if result else (failed.get("status"), None)
+
+        if status == 200:
+            try:
+                location_name = data["name"]
+                country = data["sys"]["country"]
+                temp_c = data["main"]["temp"]
+                temp_f = (temp_c * 9 / 5) + 32
+                condition = data["weather"][0]["description"].title()
+            except (KeyError, IndexError, TypeError) as e:
+                return await ctx.reply(f"❌ Error: unexpected weather data ({e})", mention_author=False)
+
+            weather_msg = f"**{location_name}, {country}**\n{condition} • {temp_f:.1f}°F / {temp_c:.1f}°C"
+            await ctx.send(weather_msg)
+
+        elif status == 404:
+            await ctx.reply(
+                f"❌ Location '{location}' not found!", mention_author=False
+            )
+        elif status == 401:
+            await ctx.reply(
+                "❌ Invalid API key! Check your OpenWeatherMap API key.",
+                mention_author=False,
+            )
+        elif status:
+            await ctx.reply(
+                f"❌ Failed to fetch weather data. Status: {status}",
+                mention_author=False,
+            )
+        elif isinstance(failed.get("error"), UpstreamUnavailable):
+            await ctx.reply("❌ The weather service is down right now. Try again in a minute.", mention_author=False)
+        else:
+            await ctx.reply(f"❌ Error: {failed.get('error', 'weather lookup failed')}", mention_author=False)
 
     @commands.command(name="crypto", aliases=["btc", "eth"])
     @commands.cooldown(1, 10, commands.BucketType.user)
     async def crypto_command(self, ctx):
         """Displays real-time prices for the top 5 cryptocurrencies."""
-        if self.bot.aiohttp_session is None or self.bot.aiohttp_session.closed:
-            self.bot.aiohttp_session = aiohttp.ClientSession()
-
         loading_msg = await ctx.send("🌐 Fetching real-time crypto prices... ⏳")
 
-        crypto_data = await crypto_api.fetch_crypto_prices(self.bot.aiohttp_session, 5)
+        crypto_data = await crypto_api.fetch_crypto_prices(5)
 
         if not crypto_data:
             await loading_msg.edit(
@@ -784,9 +855,7 @@ class UtilityCog(commands.Cog):
         """Check time for a user"""
         if ctx.message.reference and not member:
             try:
-                reply_msg = await ctx.channel.fetch_message(
-                    ctx.message.reference.message_id
-                )
+                reply_msg = await msgcache.cache.get_reference(ctx.message)
                 member = reply_msg.author
             except:
                 pass
@@ -26,6 +26,8 @@ TWITTER_COOKIES_FILE = os.getenv(
 )
 GOOGLE_CREDENTIALS_PATH = os.path.join(os.path.dirname(__file__), "google_credentials.json")
 GOOGLE_CREDENTIALS_JSON = os.getenv("GOOGLE_CREDENTIALS_JSON")
+IMAGEGEN_CONCURRENCY = int(os.getenv("IMAGEGEN_CONCURRENCY", "2"))  # .img jobs generated at once
+MEMBER_CACHE_PROFILE = os.getenv("MEMBER_CACHE_PROFILE", "full").lower()  # full | lazy | minimal (see membercache.py)
 
 if os.path.exists(GOOGLE_CREDENTIALS_PATH):
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_CREDENTIALS_PATH
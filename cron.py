@@ -0,0 +1,216 @@
+"""
+Cron Scheduler
+Persistent, timezone-aware schedule for the bot's recurring jobs (daily quote,
+numerology, bulletin purge, quote drops, wealth tax). Each job's last run is
+kept in the cron_jobs table, a run missed while offline fires once on boot if
+it is still inside its grace window, and the loop sleeps until the next due job.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import database
+
+logger = logging.getLogger(__name__)
+
+PT = ZoneInfo("America/Los_Angeles")
+
+# Schedules that depend on settings are re-read this often, as a safety net for
+# settings written outside set_setting(). Not needed for correctness otherwise.
+RESYNC_INTERVAL = 900
+
+# A job whose schedule is still due right after running (e.g. it failed before
+# recording progress) waits this long instead of spinning.
+RETRY_DELAY = 60
+
+# ============================================================
+# SCHEDULES
+# ============================================================
+
+
+class Daily:
+    """Fires at hour:minute wall-clock time, optionally only on some weekdays (0 = Monday)."""
+
+    def __init__(self, hour: int, minute: int = 0, tz=PT, weekdays=None, grace: float = None):
+        self.hour = hour
+        self.minute = minute
+        self.tz = tz
+        self.weekdays = set(weekdays) if weekdays else None
+        self.grace = grace  # Max seconds late a missed run may still fire (None = always)
+
+    def next_after(self, ts: float) -> float:
+        now = datetime.fromtimestamp(ts, self.tz)
+        candidate = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        while self.weekdays and candidate.weekday() not in self.weekdays:
+            candidate += timedelta(days=1)
+        return candidate.timestamp()
+
+
+class Every:
+    """Fires a fixed interval after the last run (or after an explicit anchor time)."""
+
+    def __init__(self, seconds: float, anchor: float = None, grace: float = None):
+        self.seconds = seconds
+        self.anchor = anchor
+        self.grace = grace
+
+    def next_after(self, ts: float) -> float:
+        return (self.anchor if self.anchor is not None else ts) + self.seconds
+
+
+class Once:
+    """Fires as soon as possible; used for flags set from the dashboard."""
+    grace = None
+
+    def next_after(self, ts: float) -> float:
+        return time.time()
+
+
+# ============================================================
+# SCHEDULER
+# ============================================================
+
+
+class Job:
+    def __init__(self, name: str, handler, schedule, watch=()):
+        self.name = name
+        self.handler = handler      # async fn()
+        self.schedule = schedule    # async fn() -> Daily/Every/Once, or None when disabled
+        self.watch = set(watch)     # setting keys that change the schedule
+        self.last_run = None
+        self.next_run = None
+
+
+class CronScheduler:
+    def __init__(self):
+        self._jobs = {}
+        self._loop = None
+        self._wake = None
+        self._task = None
+        self._replan = False
+
+    def register(self, name: str, handler, schedule, watch=()):
+        """Add a job. schedule is an async callable returning the job's current spec (or None to disable it)."""
+        self._jobs[name] = Job(name, handler, schedule, watch)
+        if self._loop is not None:
+            self.refresh()
+
+    def refresh(self):
+        """Re-read every job's schedule. Safe to call from any thread."""
+        if self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._request_replan()
+        else:
+            # e.g. the dashboard thread saving a schedule setting
+            self._loop.call_soon_threadsafe(self._request_replan)
+
+    def _request_replan(self):
+        self._replan = True
+        self._wake.set()
+
+    def on_setting_changed(self, key: str):
+        if any(key in job.watch for job in self._jobs.values()):
+            self.refresh()
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def _plan(self, job: Job, now: float):
+        spec = await job.schedule()
+        if spec is None:
+            job.next_run = None
+        else:
+            # First ever run: only catch up on an occurrence inside the grace window
+            baseline = job.last_run if job.last_run else now - (spec.grace or 0)
+            due = spec.next_after(baseline)
+            if due <= now and spec.grace is not None and now - due > spec.grace:
+                logger.info(f"⏭️ Cron: skipping missed '{job.name}' run ({int(now - due)}s late, past grace).")
+                due = spec.next_after(now)
+            job.next_run = due
+        await database.set_cron_next_run(job.name, job.next_run)
+
+    async def _plan_all(self):
+        now = time.time()
+        for job in self._jobs.values():
+            try:
+                await self._plan(job, now)
+            except Exception as e:
+                job.next_run = None
+                logger.error(f"Error planning cron job '{job.name}': {e}", exc_info=True)
+
+    async def _run(self):
+        last_runs = await database.get_cron_last_runs()
+        for job in self._jobs.values():
+            job.last_run = last_runs.get(job.name)
+        await self._plan_all()
+        logger.info(f"⏰ Cron scheduler started with {len(self._jobs)} jobs.")
+
+        last_sync = time.time()
+        while True:
+            try:
+                self._wake.clear()
+                now = time.time()
+                timeout = max(0.0, RESYNC_INTERVAL - (now - last_sync))
+                upcoming = [j.next_run for j in self._jobs.values() if j.next_run is not None]
+                if upcoming:
+                    timeout = min(timeout, max(0.0, min(upcoming) - now))
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+                if self._replan or time.time() - last_sync >= RESYNC_INTERVAL:
+                    self._replan = False
+                    await self._plan_all()
+                    last_sync = time.time()
+
+                await self._run_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in cron scheduler: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def _run_due(self):
+        now = time.time()
+        due_jobs = sorted(
+            (j for j in self._jobs.values() if j.next_run is not None and j.next_run <= now),
+            key=lambda j: j.next_run,
+        )
+        for job in due_jobs:
+            due_at = job.next_run
+            started = time.time()
+            status, error = "ok", None
+            try:
+                await job.handler()
+            except Exception as e:
+                status, error = "error", str(e)[:500]
+                logger.error(f"Error in cron job '{job.name}': {e}", exc_info=True)
+            finished = time.time()
+            job.last_run = started
+            await database.record_cron_run(job.name, due_at, started, finished, status, error)
+            await self._plan(job, time.time())
+            if job.next_run is not None and job.next_run <= finished:
+                job.next_run = finished + RETRY_DELAY
+
+
+scheduler = CronScheduler()
+database.set_setting_hook(scheduler.on_setting_changed)
@@ -1,19 +1,24 @@
-import aiohttp
 import logging
 
+from exceptions import UpstreamError
+from httpclient import client
+from respcache import cache
+
 logger = logging.getLogger(__name__)
 
 COINGECKO_API_URL = "https://api.coingecko.com/api/v3/coins/markets"
 
 
-async def fetch_crypto_prices(session: aiohttp.ClientSession, limit: int = 5) -> list:
+async def fetch_crypto_prices(limit: int = 5) -> list:
     """
-    Fetches the top N cryptocurrencies sorted by market cap in USD using aiohttp.
+    Top N cryptocurrencies by market cap in USD. Shared by everyone for a minute (respcache "crypto").
     """
-    headers = {
-        "User-Agent": "ApeBot/1.0 (Discord Bot; contact: your_email@example.com)",
-        "accept": "application/json"
-    }
+    return await cache.get("crypto", limit, lambda: _fetch_crypto_prices(limit)) or []
+
+
+async def _fetch_crypto_prices(limit: int):
+    """CoinGecko call; None on failure so the cache keeps serving the last good prices."""
+    headers = {"accept": "application/json"}
 
     params = {
         "vs_currency": "usd",
@@ -25,29 +30,26 @@ async def fetch_crypto_prices(session: aiohttp.ClientSession, limit: int = 5) ->
     }
 
     try:
-        async with session.get(COINGECKO_API_URL, params=params, headers=headers, timeout=10) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                logger.error(f"CoinGecko API error: {response.status} - {error_text}")
-                return []
-            
-            data = await response.json()
-
-            results = []
-            for coin in data:
-                results.append(
-                    {
-                        "name": coin.get("name", "N/A"),
-                        "symbol": coin.get("symbol", "N/A").upper(),
-                        "price": coin.get("current_price"),
-                        "change_24h": coin.get("price_change_percentage_24h_in_currency"),
-                    }
-                )
-            return results
-
-    except aiohttp.ClientResponseError as e:
-        logger.error(f"HTTP error from CoinGecko: {e}", exc_info=True)
-        return []
+        response = await client.get("coingecko", COINGECKO_API_URL, params=params, headers=headers)
+    except UpstreamError as e:
+        logger.error(f"CoinGecko request failed: {e}")
+        return None
+    if response.status != 200:
+        logger.error(f"CoinGecko API error: {response.status} - {response.data}")
+        return None
+
+    try:
+        results = []
+        for coin in response.data:
+            results.append(
+                {
+                    "name": coin.get("name", "N/A"),
+                    "symbol": coin.get("symbol", "N/A").upper(),
+                    "price": coin.get("current_price"),
+                    "change_24h": coin.get("price_change_percentage_24h_in_currency"),
+                }
+            )
+        return results
     except Exception as e:
         logger.error(f"An unexpected error occurred during crypto fetch: {e}", exc_info=True)
-        return []
+        return None
@@ -17,6 +17,22 @@ from config import DB_FILE, GUILD_ID
 from database import calculate_level_for_xp, get_cached_roles, init_db, get_cached_channels
 from database import get_all_item_prices, set_item_price
 import database
+import exports
+import geocode
+import httpclient
+import imagegen
+import membercache
+import migrations
+import msgcache
+import purge
+import ranks
+import respcache
+import rolequeue
+import rewardsync
+import tarot
+import timeline
+import triggers
+import webhooks
 from items import ITEM_REGISTRY
 
 import logging
@@ -79,6 +95,16 @@ async def get_stats():
             "total_xp": total_xp[0] if total_xp else 0
         }
 
+@app.get("/schema/migrations")
+async def get_schema_migrations():
+    """Applied schema migrations, oldest first."""
+    return await migrations.applied()
+
+@app.get("/role-queue/stats")
+async def get_role_queue_stats():
+    """Depth and throughput of the bot's batched role edit queue."""
+    return rolequeue.stats()
+
 @app.get("/settings")
 async def get_settings():
     async with database.get_db() as db:
@@ -135,26 +161,74 @@ async def delete_reward(level: int):
 
 @app.get("/leaderboard")
 async def get_leaderboard(limit: int = 50):
-    async with aiosqlite.connect(DB_FILE) as db:
-        # Join with profile cache to get usernames
-        query = """
-            SELECT u.user_id, u.xp, u.level, p.username, p.avatar_url 
-            FROM users_xp u
-            LEFT JOIN user_profile_cache p ON u.user_id = p.user_id
-            ORDER BY u.level DESC, u.xp DESC 
-            LIMIT ?
-        """
-        async with db.execute(query, (limit,)) as cursor:
-            rows = await cursor.fetchall()
-            return [
-                {
-                    "user_id": row[0], 
-                    "xp": row[1], 
-                    "level": row[2], 
-                    "username": row[3] or f"User {row[0]}", 
-                    "avatar": row[4]
-                } for row in rows
-            ]
+    # Order comes from the in-memory rank index; only the profile rows are read
+    rows = await database.get_top_levels(limit)
+    return [
+        {
+            "user_id": row[0], 
+            "xp": row[1], 
+            "level": row[2], 
+            "username": row[3] or f"User {row[0]}", 
+            "avatar": row[4]
+        } for row in rows
+    ]
+
+@app.get("/http/stats")
+async def get_http_stats():
+    """Per-upstream circuit state, request/error/retry counts and latency percentiles."""
+    return httpclient.client.stats()
+
+@app.get("/imagegen/stats")
+async def get_imagegen_stats():
+    """.img queue depth, Google/fallback/cache outcomes and wait/generation latency."""
+    return imagegen.service.stats()
+
+@app.get("/twitter/stats")
+async def get_twitter_stats():
+    """.x account/timeline cache hits, upstream fetches and media cache size."""
+    return timeline.stats()
+
+@app.get("/messages/stats")
+async def get_message_cache_stats():
+    """Message lookups served by discord.py's cache, the LRU, or REST."""
+    return msgcache.cache.stats()
+
+@app.get("/members/stats")
+async def get_member_cache_stats():
+    """Member cache profile and lookups served by discord.py's cache, the LRU, or REST."""
+    return membercache.cache.stats()
+
+@app.get("/bulletin/purge/stats")
+async def get_bulletin_purge_stats():
+    """Bulletin purge progress: bulk/individual deletes, the old-message queue and the last run."""
+    return purge.engine.stats()
+
+@app.get("/webhooks/stats")
+async def get_webhook_stats():
+    """UwU relay webhook reuse (memory/DB/REST), merged messages and fallbacks."""
+    return webhooks.pool.stats()
+
+@app.get("/cache/stats")
+async def get_response_cache_stats():
+    """Hit/stale/miss/coalesced counts per external lookup source, plus the geocode cache."""
+    return {**respcache.cache.stats(), "geocode": geocode.stats()}
+
+@app.get("/leaderboard/stats")
+async def get_leaderboard_stats():
+    """State of the in-memory XP and balance rank index."""
+    return {"xp": ranks.xp.stats(), "balances": ranks.balances.stats()}
+
+@app.post("/rewards/reconcile")
+async def trigger_reward_reconcile(dry_run: bool = True):
+    """Ask the bot to reconcile reward roles guild-wide. Poll GET /rewards/reconcile for the report."""
+    rewardsync.request_run(dry_run)
+    if not triggers.bus.fire("reward_reconcile"):
+        raise HTTPException(status_code=503, detail="Bot is not running")
+    return {"status": "ok", "dry_run": dry_run}
+
+@app.get("/rewards/reconcile")
+async def get_reward_reconcile_status():
+    return rewardsync.status()
 
 @app.get("/roles")
 async def get_roles():
@@ -166,24 +240,37 @@ async def get_channels():
     """Returns cached server channels for resolution."""
     return await get_cached_channels()
 
+def _export_response(chunks, media_type: str, filename: str = None, gzip: bool = False):
+    """StreamingResponse for an exports.* byte stream, optionally gzipped as a .gz download."""
+    from fastapi.responses import StreamingResponse
+    headers = {}
+    if gzip:
+        media_type = "application/gzip"
+        filename = f"{filename or 'export'}.gz"
+    if filename:
+        headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return StreamingResponse(exports.maybe_gzip(chunks, gzip), media_type=media_type, headers=headers)
+
+async def _xp_pairs():
+    async for user_id, xp in exports.iter_rows("SELECT user_id, xp FROM users_xp"):
+        yield user_id, {"xp": xp}
+
+async def _settings_pairs():
+    async for key, value in exports.iter_rows("SELECT key, value FROM level_settings"):
+        yield key, value
+
+def _polaris_stream():
+    return exports.json_object_stream({"users": _xp_pairs(), "settings": _settings_pairs()})
+
 @app.get("/export")
-async def export_data():
-    """Export data in Polaris-compliant JSON format."""
-    async with aiosqlite.connect(DB_FILE) as db:
-        # Get users
-        async with db.execute("SELECT user_id, xp FROM users_xp") as cursor:
-            rows = await cursor.fetchall()
-            users_data = {row[0]: {"xp": row[1]} for row in rows}
-        
-        # Get settings
-        async with db.execute("SELECT key, value FROM level_settings") as cursor:
-            rows = await cursor.fetchall()
-            settings_data = {row[0]: row[1] for row in rows}
-            
-        return {
-            "users": users_data,
-            "settings": settings_data
-        }
+async def export_data(gzip: bool = False):
+    """Export data in Polaris-compliant JSON format (streamed)."""
+    return _export_response(_polaris_stream(), "application/json", "apeiron_export.json" if gzip else None, gzip)
+
+@app.get("/export/json")
+async def export_json(gzip: bool = False):
+    """Polaris JSON as a file download."""
+    return _export_response(_polaris_stream(), "application/json", "apeiron_export.json", gzip)
 
 @app.post("/import")
 async def import_data(jsonData: Dict[str, Any]):
@@ -258,6 +345,7 @@ async def import_data(jsonData: Dict[str, Any]):
             details.append("Server settings")
             
         await db.commit()
+    ranks.xp.invalidate()
     
     if not details:
         raise HTTPException(status_code=400, detail="No valid JSON data found!")
@@ -287,6 +375,7 @@ async def recalculate_all_levels():
             count += 1
             
         await db.commit()
+    ranks.xp.invalidate()
     return {"status": "ok", "count": count}
 
 class BatchSettingsUpdate(BaseModel):
@@ -306,6 +395,7 @@ async def clear_all_xp():
     """Reset all users' XP and level to 0."""
     async with database.get_db() as db:
         await db.execute("UPDATE users_xp SET xp = 0, level = 0")
+    ranks.xp.invalidate()
     return {"status": "ok"}
 
 @app.post("/reset-settings")
@@ -328,29 +418,36 @@ async def prune_members(req: PruneRequest):
             row = await cursor.fetchone()
             count = row[0] if row else 0
         await db.execute("DELETE FROM users_xp WHERE xp < ?", (req.threshold,))
+    ranks.xp.invalidate()
     return {"status": "ok", "deleted": count}
 
+XP_EXPORT_QUERY = "SELECT user_id, xp, level FROM users_xp ORDER BY level DESC, xp DESC"
+
 @app.get("/export/csv")
-async def export_csv():
-    """Export user XP as CSV."""
-    from fastapi.responses import PlainTextResponse
-    async with database.get_db() as db:
-        async with db.execute("SELECT user_id, xp, level FROM users_xp ORDER BY level DESC, xp DESC") as cursor:
-            rows = await cursor.fetchall()
-    lines = ["user_id,xp,level"] + [f"{r[0]},{r[1]},{r[2]}" for r in rows]
-    return PlainTextResponse("\n".join(lines), media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=apeiron_export.csv"})
+async def export_csv(gzip: bool = False):
+    """Export user XP as CSV (streamed)."""
+    rows = exports.iter_rows(XP_EXPORT_QUERY)
+    return _export_response(exports.lines_stream(rows, lambda r: f"{r[0]},{r[1]},{r[2]}", header="user_id,xp,level"),
+                            "text/csv", "apeiron_export.csv", gzip)
 
 @app.get("/export/txt")
-async def export_txt():
-    """Export user XP as plain text."""
-    from fastapi.responses import PlainTextResponse
-    async with database.get_db() as db:
-        async with db.execute("SELECT user_id, xp, level FROM users_xp ORDER BY level DESC, xp DESC") as cursor:
-            rows = await cursor.fetchall()
-    lines = [f"UserID: {r[0]} | XP: {r[1]} | Level: {r[2]}" for r in rows]
-    return PlainTextResponse("\n".join(lines), media_type="text/plain",
-        headers={"Content-Disposition": "attachment; filename=apeiron_export.txt"})
+async def export_txt(gzip: bool = False):
+    """Export user XP as plain text (streamed)."""
+    rows = exports.iter_rows(XP_EXPORT_QUERY)
+    return _export_response(exports.lines_stream(rows, lambda r: f"UserID: {r[0]} | XP: {r[1]} | Level: {r[2]}"),
+                            "text/plain", "apeiron_export.txt", gzip)
+
+@app.get("/export/economy")
+async def export_economy(gzip: bool = False):
+    """Export balances and inventories as CSV (one row per user and item, streamed)."""
+    rows = exports.iter_rows("""
+        SELECT b.user_id, b.balance, i.item_name, i.quantity
+        FROM balances b
+        LEFT JOIN user_inventory i ON i.user_id = b.user_id AND i.quantity > 0
+        ORDER BY b.balance DESC, b.user_id
+    """)
+    return _export_response(exports.csv_stream(["user_id", "balance", "item", "quantity"], rows),
+                            "text/csv", "apeiron_economy.csv", gzip)
 
 # ============================================================
 # QUOTE DROPS (Manual and Bank management)
@@ -388,16 +485,15 @@ async def send_quote_drop(req: QuoteDropSendReq):
     
     # Send via Discord REST API
     try:
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"https://discord.com/api/v10/channels/{channel_id}/messages",
-                headers={"Authorization": f"Bot {TOKEN}", "Content-Type": "application/json"},
-                json={"content": quote_text}
-            ) as resp:
-                if resp.status not in (200, 201):
-                    body = await resp.text()
-                    raise HTTPException(status_code=500, detail=f"Discord API error: {resp.status} - {body}")
+        resp = await httpclient.client.request(
+            "discord_api", "POST",
+            f"https://discord.com/api/v10/channels/{channel_id}/messages",
+            headers={"Authorization": f"Bot {TOKEN}", "Content-Type": "application/json"},
+            json={"content": quote_text},
+            read="text",
+        )
+        if resp.status not in (200, 201):
+            raise HTTPException(status_code=500, detail=f"Discord API error: {resp.status} - {resp.data}")
     except HTTPException:
         raise
     except Exception as e:
@@ -630,12 +726,17 @@ async def api_set_admin_config(data: AdminConfigUpdate):
         await set_yap_level(data.yap_level)
 
     if data.tarot_deck is not None:
-        if data.tarot_deck not in ("thoth", "rws", "manara"):
+        if data.tarot_deck not in tarot.DECK_NAMES:
             raise HTTPException(status_code=400, detail="Invalid deck name")
         await set_guild_tarot_deck(guild_id, data.tarot_deck)
 
     return {"status": "ok"}
 
+@app.get("/tarot/stats")
+async def get_tarot_stats():
+    """Which decks are loaded and how much card art is cached in memory."""
+    return tarot.service.stats()
+
 # (Redundant Quote Post Hours logic removed, consolidated at bottom)
 
 
@@ -822,6 +923,8 @@ async def api_set_color_role(data: dict):
 async def api_refresh_colors():
     """Flag for the bot to sync its dynamic color command list (added/removed roles)."""
     await database.set_setting("trigger_refresh_colors", "1")
+    # Wake the bot now; the flag alone is picked up on the next bot start
+    triggers.bus.fire("color_refresh")
     return {"status": "ok"}
 
 @app.get("/numerology/preview")
@@ -845,17 +948,58 @@ async def api_numerology_preview(date: Optional[str] = None):
         from datetime import datetime
         target = datetime.now(ZoneInfo("America/Los_Angeles")).date()
 
-    nums = num_engine.calculate_numerology(target)
-    reading = await num_engine.get_reading(target, database)
+    descs, combos = await database.get_numerology_content()
+    r = num_engine.build_reading(target, descs, combos)
     return {
         "date": target.isoformat(),
-        "primary": nums["primary"],
-        "secondary": nums["secondary"],
-        "primary_label": num_engine.format_primary_label(nums["primary"]),
-        "secondary_label": num_engine.format_secondary_label(nums["secondary"]),
-        "reading": reading,
+        "primary": r["primary"],
+        "secondary": r["secondary"],
+        "primary_label": r["primary_label"],
+        "secondary_label": r["secondary_label"],
+        "reading": num_engine.format_reading(r),
     }
 
+NUMEROLOGY_RANGE_MAX_DAYS = 366
+
+@app.get("/numerology/range")
+async def api_numerology_range(start: str, end: str, include_reading: bool = False):
+    """
+    Numerology for every date in [start, end] (YYYY-MM-DD, up to a year).
+    Served from the precomputed calendar (days outside it are computed, not kept);
+    descriptions only when include_reading is set.
+    """
+    import numerology as num_engine
+    from datetime import date as _date, timedelta
+
+    try:
+        start_d = _date.fromisoformat(start)
+        end_d = _date.fromisoformat(end)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start and end must be YYYY-MM-DD")
+    if end_d < start_d:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    if (end_d - start_d).days >= NUMEROLOGY_RANGE_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"range is limited to {NUMEROLOGY_RANGE_MAX_DAYS} days")
+
+    descs, combos = await database.get_numerology_content()
+    days = []
+    d = start_d
+    while d <= end_d:
+        r = num_engine.build_reading(d, descs, combos)
+        item = {
+            "date": d.isoformat(),
+            "primary": r["primary"],
+            "secondary": r["secondary"],
+            "primary_label": r["primary_label"],
+            "secondary_label": r["secondary_label"],
+            "has_combo": (r["primary"]["reduced"], r["secondary"]["reduced"]) in combos,
+        }
+        if include_reading:
+            item["reading"] = num_engine.format_reading(r)
+        days.append(item)
+        d += timedelta(days=1)
+    return days
+
 
 # --- Quote Drops ---
 
@@ -903,10 +1047,22 @@ async def api_set_quote_drop_config(data: dict):
 
 @app.post("/quote-drops/trigger")
 async def api_trigger_quote_drop():
-    """Manually flag for a quote drop in the next background loop turn."""
+    """Flag a manual quote drop; the bot's cron scheduler is woken by the setting write."""
     await database.set_setting("trigger_quote_drop", "1")
     return {"status": "ok"}
 
+# --- Scheduled Jobs ---
+
+@app.get("/cron/jobs")
+async def api_get_cron_jobs():
+    """State of every scheduled job: last/next run, last status and lateness."""
+    return await database.get_cron_jobs()
+
+@app.get("/cron/runs")
+async def api_get_cron_runs(job: Optional[str] = None, limit: int = 50):
+    """Recent run history, newest first, with how late each run started."""
+    return await database.get_cron_runs(job, min(max(limit, 1), 500))
+
 # --- Master Quotes (Daily Quotes) ---
 
 @app.get("/quotes")
@@ -984,8 +1140,7 @@ async def api_set_num_desc(data: dict):
     """Upsert a number description."""
     num = data.get("num")
     desc = data.get("description", "")
-    async with database.get_db() as db:
-        await db.execute("INSERT OR REPLACE INTO numerology_number_desc (num, description) VALUES (?, ?)", (num, desc))
+    await database.set_numerology_number_desc(num, desc)
     return {"status": "ok"}
 
 @app.get("/numerology/combos")
@@ -1002,8 +1157,7 @@ async def api_set_combo(data: dict):
     p = data.get("primary_num")
     s = data.get("secondary_num")
     desc = data.get("combo_desc", "")
-    async with database.get_db() as db:
-        await db.execute("INSERT OR REPLACE INTO numerology_combos (primary_num, secondary_num, combo_desc) VALUES (?, ?, ?)", (p, s, desc))
+    await database.set_numerology_combo(p, s, desc)
     return {"status": "ok"}
 
 
@@ -5,6 +5,8 @@ import random
 from contextlib import asynccontextmanager
 from config import DB_FILE
 from exceptions import InsufficientTokens, ItemNotFoundError
+import migrations
+import ranks
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,39 @@ logger = logging.getLogger(__name__)
 
 _settings_cache = {}  # key -> {"value": val, "expires": time}
 
+_expiry_hook = None  # callable(kind, due_epoch), installed by expiry.py
+
+
+def set_expiry_hook(hook):
+    """Install the callback notified whenever a new expiration deadline is written."""
+    global _expiry_hook
+    _expiry_hook = hook
+
+
+def _notify_expiry(kind: str, due: float):
+    if _expiry_hook:
+        try:
+            _expiry_hook(kind, due)
+        except Exception as e:
+            logger.error(f"Expiry hook failed for {kind}: {e}")
+
+
+_setting_hook = None  # callable(key), installed by cron.py
+
+
+def set_setting_hook(hook):
+    """Install the callback notified whenever a global setting is written."""
+    global _setting_hook
+    _setting_hook = hook
+
+
+def _notify_setting(key: str):
+    if _setting_hook:
+        try:
+            _setting_hook(key)
+        except Exception as e:
+            logger.error(f"Setting hook failed for {key}: {e}")
+
 
 @asynccontextmanager
 async def get_db():
@@ -40,557 +75,19 @@ async def get_db():
 
 async def init_db():
     """
-    Initialize ALL database tables.
-    (Quotes, Timezones, Activity, Balances, Tarot, GIF Tracker, Pink Votes, Inventory, Effects)
+    Bring the schema up to date via the numbered migrations in migrations.py.
+    Safe to call from the bot and the dashboard; after the first call it's a no-op.
     """
     try:
-        async with get_db() as conn:
-            # Persistent performance optimizations
-            await conn.execute("PRAGMA journal_mode=WAL")
-            await conn.execute("PRAGMA synchronous=NORMAL")
-
-            # Quotes Table
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS quotes (id INTEGER PRIMARY KEY AUTOINCREMENT, quote TEXT UNIQUE)"
-            )
-
-            # User Timezones Table
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS user_timezones (user_id TEXT PRIMARY KEY, timezone TEXT, city TEXT)"
-            )
-
-            # Activity Tables
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS activity_hourly (hour TEXT PRIMARY KEY, count INTEGER, last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
-            )
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS activity_users (user_id TEXT PRIMARY KEY, count INTEGER, last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
-            )
-
-            # Tarot Settings
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS tarot_settings (guild_id TEXT PRIMARY KEY, deck_name TEXT DEFAULT 'thoth')"
-            )
-
-            # .key Command — image gallery & send counts
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS key_settings (
-                    id        INTEGER PRIMARY KEY AUTOINCREMENT,
-                    image_url TEXT    NOT NULL,
-                    label     TEXT    DEFAULT '',
-                    is_active INTEGER DEFAULT 0,
-                    added_at  TEXT    DEFAULT (datetime('now'))
-                )
-                """
-            )
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS key_config (
-                    key   TEXT PRIMARY KEY,
-                    value TEXT NOT NULL
-                )
-                """
-            )
-
-            # GIF Tracker
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS gif_tracker (gif_url TEXT PRIMARY KEY, count INTEGER DEFAULT 1, last_sent_by TEXT, last_sent_at TIMESTAMP)"
-            )
-
-            # 💰 Balances Table
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS balances (user_id TEXT PRIMARY KEY, balance INTEGER DEFAULT 0)"
-            )
-
-            # 💖 Legacy Pink Votes & Roles (will be migrated)
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS pink_votes (voted_id TEXT NOT NULL, voter_id TEXT NOT NULL, timestamp REAL NOT NULL, PRIMARY KEY (voted_id, voter_id))"
-            )
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS masochist_roles (user_id TEXT PRIMARY KEY, removal_time REAL NOT NULL)"
-            )
-
-            # 🎨 Generalized Colour Roles
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS color_roles (
-                    color_name TEXT PRIMARY KEY,
-                    role_id TEXT NOT NULL,
-                    vote_threshold INTEGER NOT NULL,
-                    duration_days REAL NOT NULL
-                )
-                """
-            )
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS color_role_votes (
-                    color_name TEXT NOT NULL,
-                    voted_id TEXT NOT NULL,
-                    voter_id TEXT NOT NULL,
-                    timestamp REAL NOT NULL,
-                    PRIMARY KEY (color_name, voted_id, voter_id),
-                    FOREIGN KEY (color_name) REFERENCES color_roles(color_name) ON DELETE CASCADE
-                )
-                """
-            )
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS color_role_expirations (
-                    user_id TEXT NOT NULL,
-                    role_id TEXT NOT NULL,
-                    color_name TEXT NOT NULL,
-                    removal_time REAL NOT NULL,
-                    PRIMARY KEY (user_id, role_id),
-                    FOREIGN KEY (color_name) REFERENCES color_roles(color_name) ON DELETE CASCADE
-                )
-                """
-            )
-
-            # 🛡️ Trial System
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS trials (
-                    user_id TEXT NOT NULL,
-                    guild_id TEXT NOT NULL,
-                    start_time REAL NOT NULL,
-                    end_time REAL NOT NULL,
-                    message_id TEXT,
-                    status TEXT DEFAULT 'pending',
-                    PRIMARY KEY (user_id, guild_id)
-                )
-                """
-            )
-
-            # COMMAND USAGE TRACKING
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS command_usage (
-                    command_name TEXT PRIMARY KEY,
-                    count INTEGER DEFAULT 0
-                )
-                """
-            )
-
-            # 📦 NEW: User Inventory Table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS user_inventory (
-                    user_id TEXT NOT NULL,
-                    item_name TEXT NOT NULL,
-                    quantity INTEGER DEFAULT 0,
-                    PRIMARY KEY (user_id, item_name)
-                )
-            """
-            )
-
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS global_settings (setting_key TEXT PRIMARY KEY, setting_value TEXT)"
-            )
-            
-            # 🔄 Run Migration
-            await migrate_to_color_roles(conn)
-        
-            logger.info("✅ Database tables and migrations verified.")
-
-            # Shard Claim Tracking Table
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS last_shard_claim (user_id TEXT PRIMARY KEY, last_claim REAL)"
-            )
-
-            # 🌑 NEW: Active Effects Table (Curse/Mute)
-            # Migration check: If table exists with old column names, drop it
-            async with conn.execute("PRAGMA table_info(active_effects)") as cursor:
-                columns = [row[1] for row in await cursor.fetchall()]
-                if columns and "expires_at" not in columns:
-                    logger.info("Outdated active_effects table found. Migrating...")
-                    await conn.execute("DROP TABLE active_effects")
-
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS active_effects (
-                    user_id TEXT NOT NULL,
-                    effect_name TEXT NOT NULL,
-                    expires_at REAL NOT NULL,
-                    PRIMARY KEY (user_id, effect_name)
-                )
-            """
-            )
-
-            # ⏳ NEW: Global Cooldowns Table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS global_cooldowns (
-                    name TEXT PRIMARY KEY,
-                    expires_at REAL NOT NULL
-                )
-            """
-            )
-
-            # ⚙️ NEW: System Settings Table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS system_settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """
-            )
-
-            # 🤲 NEW: Daily Claims Table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS daily_claims (
-                    user_id TEXT NOT NULL,
-                    claim_type TEXT NOT NULL,
-                    last_claim_date TEXT NOT NULL,
-                    PRIMARY KEY (user_id, claim_type)
-                )
-            """
-            )
-
-            # 🌾 NEW: The Reaping State Table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS reaping_state (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    active INTEGER DEFAULT 0,
-                    pool_amount INTEGER DEFAULT 0,
-                    games_count INTEGER DEFAULT 0,
-                    started_at REAL,
-                    expires_at REAL
-                )
-            """
-            )
-
-            # 🌾 NEW: The Reaping Participants Table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS reaping_participants (
-                    user_id TEXT PRIMARY KEY,
-                    contribution INTEGER DEFAULT 0
-                )
-            """
-            )
-
-            # 📜 Quote Drops Table (separate from daily quotes)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS quote_drops (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    quote TEXT UNIQUE,
-                    added_by TEXT,
-                    added_at REAL
-                )
-            """
-            )
-
-            # Add indexes
-            await conn.execute("CREATE INDEX IF NOT EXISTS idx_quotes_text ON quotes(quote)")
-            await conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_user_timezones_id ON user_timezones(user_id)"
-            )
-            await conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_activity_users_count ON activity_users(count DESC)"
-            )
-            await conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_color_votes_target ON color_role_votes(color_name, voted_id)"
-            )
-            await conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_color_votes_voter ON color_role_votes(voter_id)"
-            )
-
-            # Fade stats table
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS fade_stats (
-                    user_id TEXT PRIMARY KEY,
-                    wins INTEGER DEFAULT 0,
-                    losses INTEGER DEFAULT 0
-                )
-                """
-            )
-
-            # 🐦 Twitter/X Follow Request Queue
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS follow_requests (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    requester_id TEXT NOT NULL,
-                    username TEXT NOT NULL,
-                    requested_at REAL NOT NULL,
-                    status TEXT DEFAULT 'pending'
-                )
-                """
-            )
-
-            # 🏆 Hall of Fame — Settings
-            # Migration check: add blacklisted_users if missing
-            async with conn.execute("PRAGMA table_info(hof_settings)") as cursor:
-                columns = [row[1] for row in await cursor.fetchall()]
-                if columns and "blacklisted_users" not in columns:
-                    logger.info("Adding blacklisted_users to hof_settings...")
-                    await conn.execute("ALTER TABLE hof_settings ADD COLUMN blacklisted_users TEXT DEFAULT '[]'")
-
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS hof_settings (
-                    guild_id TEXT PRIMARY KEY,
-                    channel_id TEXT,
-                    threshold INTEGER DEFAULT 3,
-                    emojis TEXT DEFAULT '["⭐"]',
-                    ignored_channels TEXT DEFAULT '[]',
-                    locked_messages TEXT DEFAULT '[]',
-                    trashed_messages TEXT DEFAULT '[]',
-                    blacklisted_users TEXT DEFAULT '[]'
-                )
-                """
-            )
-
-            # 🏆 Hall of Fame — Entries
-            # Migration: add voice_url if missing
-            async with conn.execute("PRAGMA table_info(hof_entries)") as cursor:
-                hof_cols = [row[1] for row in await cursor.fetchall()]
-                if hof_cols and "voice_url" not in hof_cols:
-                    logger.info("Adding voice_url to hof_entries...")
-                    await conn.execute("ALTER TABLE hof_entries ADD COLUMN voice_url TEXT")
-                if hof_cols and "trigger_emoji" not in hof_cols:
-                    logger.info("Adding trigger_emoji to hof_entries...")
-                    await conn.execute("ALTER TABLE hof_entries ADD COLUMN trigger_emoji TEXT")
-
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS hof_entries (
-                    orig_message_id TEXT PRIMARY KEY,
-                    orig_channel_id TEXT NOT NULL,
-                    author_id TEXT NOT NULL,
-                    hof_message_id TEXT,
-                    star_count INTEGER DEFAULT 0,
-                    content TEXT,
-                    image_url TEXT,
-                    jump_url TEXT,
-                    voice_url TEXT,
-                    trigger_emoji TEXT,
-                    created_at REAL NOT NULL
-                )
-                """
-            )
-
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS users_xp (
-                    user_id TEXT PRIMARY KEY,
-                    xp INTEGER DEFAULT 0,
-                    level INTEGER DEFAULT 0,
-                    last_xp_time REAL DEFAULT 0
-                )
-                """
-            )
-            # 🚀 Optimization: Index for Leaderboard
-            await conn.execute("CREATE INDEX IF NOT EXISTS idx_xp_leaderboard ON users_xp (level DESC, xp DESC)")
-
-            # ⚙️ Leveling System — Settings (Coefficients, Rounding, Range, etc.)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS level_settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-                """
-            )
-
-            # ✖️ Leveling System — Multipliers (Role or Channel)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS level_multipliers (
-                    target_id TEXT PRIMARY KEY,
-                    multiplier REAL DEFAULT 1.0
-                )
-                """
-            )
-
-            # 🎁 Leveling System — Reward Roles
-            # Migration check: add stack_role if missing
-            async with conn.execute("PRAGMA table_info(reward_roles)") as cursor:
-                columns = [row[1] for row in await cursor.fetchall()]
-                if columns and "stack_role" not in columns:
-                    logger.info("Adding stack_role to reward_roles...")
-                    await conn.execute("ALTER TABLE reward_roles ADD COLUMN stack_role INTEGER DEFAULT 1")
-
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS reward_roles (
-                    level INTEGER PRIMARY KEY,
-                    role_id TEXT NOT NULL,
-                    stack_role INTEGER DEFAULT 1
-                )
-                """
-            )
-
-            # 🏷️ Leveling System — Server Roles Cache (For Dashboard)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS server_roles_cache (
-                    role_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    color TEXT,
-                    position INTEGER
-                )
-                """
-            )
-
-            # 📺 Leveling System — Server Channels Cache (For Dashboard)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS server_channels_cache (
-                    channel_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    type TEXT
-                )
-                """
-            )
-
-            # 👤 Leveling System — User Profile Cache (For Dashboard)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS user_profile_cache (
-                    user_id TEXT PRIMARY KEY,
-                    username TEXT NOT NULL,
-                    avatar_url TEXT,
-                    last_updated INTEGER
-                )
-                """
-            )
-            await conn.execute("CREATE INDEX IF NOT EXISTS idx_profile_updated ON user_profile_cache (last_updated)")
-
-            # 🎨 Rank Card Preferences (per-user font + theme)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS rank_card_prefs (
-                    user_id      TEXT PRIMARY KEY,
-                    font         TEXT DEFAULT 'Avenger',
-                    theme        TEXT DEFAULT 'vampire',
-                    display_type TEXT DEFAULT 'username'
-                )
-                """
-            )
-            
-            # 🏢 Channel Assignments (Main, Spam, Admin, Error)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS channel_config (
-                    role TEXT PRIMARY KEY,
-                    channel_id TEXT
-                )
-                """
-            )
-            
-            # 🛑 Command Restrictions (Checkbox matrix)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS command_restrictions (
-                    command_name TEXT,
-                    channel_role TEXT,
-                    is_allowed INTEGER DEFAULT 0,
-                    PRIMARY KEY(command_name, channel_role)
-                )
-                """
-            )
-            # Migration: Ensure display_type column exists for users who already had the table
-            try:
-                await conn.execute("ALTER TABLE rank_card_prefs ADD COLUMN display_type TEXT DEFAULT 'username'")
-            except Exception:
-                pass # Already exists
-
-            # 🔢 NUMEROLOGY — Number Descriptions (1-9, 11, 22, 33)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS numerology_number_desc (
-                    num INTEGER PRIMARY KEY,
-                    description TEXT DEFAULT ''
-                )
-                """
-            )
-
-            # 🔢 NUMEROLOGY — Combination Readings (primary × secondary)
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS numerology_combos (
-                    primary_num INTEGER NOT NULL,
-                    secondary_num INTEGER NOT NULL,
-                    combo_desc TEXT DEFAULT '',
-                    PRIMARY KEY (primary_num, secondary_num)
-                )
-                """
-            )
-
-            # 🛒 SHOP — Item Price Overrides
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS item_prices (
-                    item_key TEXT PRIMARY KEY,
-                    price INTEGER NOT NULL
-                )
-                """
-            )
-
-            await conn.commit()
-
-        # ── ONE-TIME BACKFILL: HoF → quote_drops (REMOVE AFTER FIRST DEPLOY) ──
-        try:
-            import re as _re
-            _emoji_pat = _re.compile(
-                r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
-                r'\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251'
-                r'\U0001F900-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF'
-                r'\U00002600-\U000026FF\U0000FE0F]+'
-            )
-            async with get_db() as conn:
-                async with conn.execute("""
-                    SELECT content, author_id FROM hof_entries
-                    WHERE hof_message_id IS NOT NULL
-                      AND content IS NOT NULL AND content != ''
-                      AND (image_url IS NULL OR image_url = '')
-                      AND (voice_url IS NULL OR voice_url = '')
-                """) as cursor:
-                    hof_rows = await cursor.fetchall()
-                
-                _added = 0
-                for _content, _author in hof_rows:
-                    _text = _content.strip()
-                    _text = _re.sub(r'<a?:\w+:\d+>', '', _text)
-                    _text = _emoji_pat.sub('', _text).strip()
-                    if _re.search(r'https?://\S+', _text):
-                        continue
-                    if not _text or len(_text) > 25:
-                        continue
-                    import time as _t
-                    await conn.execute(
-                        "INSERT OR IGNORE INTO quote_drops (quote, added_by, added_at) VALUES (?, ?, ?)",
-                        (_text, _author, _t.time())
-                    )
-                    _added += 1
-                await conn.commit()
-                if _added:
-                    logger.info(f"📜 Backfilled {_added} HoF entries into quote_drops.")
-        except Exception as _e:
-            logger.warning(f"HoF backfill skipped or failed: {_e}")
-        # ── END ONE-TIME BACKFILL ──
-
-        logger.info("✅ Database tables initialized (all modules unified).")
+        version = await migrations.migrate()
+        logger.info(f"✅ Database schema at version {version}.")
     except Exception as e:
         logger.error(f"Error initializing database: {e}", exc_info=True)
 
 
 async def get_user_rank(user_id: int) -> int:
-    """Return 1-indexed server rank by XP (higher XP = lower rank number)."""
-    async with get_db() as conn:
-        async with conn.execute(
-            "SELECT COUNT(*) FROM users_xp WHERE xp > (SELECT xp FROM users_xp WHERE user_id = ?)",
-            (str(user_id),),
-        ) as cur:
-            row = await cur.fetchone()
-            return (row[0] + 1) if row else 1
+    """Return 1-indexed server rank in leaderboard order (level, then XP). Served from ranks.xp."""
+    return await ranks.xp.rank(user_id)
 
 
 async def get_rank_card_prefs(user_id: int) -> dict:
@@ -622,48 +119,6 @@ async def set_rank_card_prefs(user_id: int, font: str = None, theme: str = None,
 # COLOUR ROLE MANAGEMENT
 # ============================================================
 
-async def migrate_to_color_roles(conn):
-    """One-time migration from static pink tables to dynamic color_roles."""
-    from config import ROLE_ALIASES
-    masochist_id = str(ROLE_ALIASES.get("masochist", "1167184822129664113"))
-    vote_threshold = 10  # Historic default
-    
-    # Check if migration already ran
-    async with conn.execute("SELECT COUNT(*) FROM color_roles") as cur:
-        row = await cur.fetchone()
-        if row and row[0] > 0:
-            return
-
-    # Seed initial roles
-    await conn.execute(
-        "INSERT OR IGNORE INTO color_roles (color_name, role_id, vote_threshold, duration_days) VALUES (?, ?, ?, ?)",
-        ('pink', masochist_id, vote_threshold, 2.0)
-    )
-    await conn.execute(
-        "INSERT OR IGNORE INTO color_roles (color_name, role_id, vote_threshold, duration_days) VALUES (?, ?, ?, ?)",
-        ('green', '', 7, 2.0)
-    )
-
-    # Migrate pink votes if table exists
-    try:
-        await conn.execute(
-            "INSERT OR IGNORE INTO color_role_votes (color_name, voted_id, voter_id, timestamp) "
-            "SELECT 'pink', voted_id, voter_id, timestamp FROM pink_votes"
-        )
-    except Exception as e:
-        logger.debug(f"Migration: pink_votes table not found or already empty: {e}")
-
-    # Migrate pink expirations if table exists
-    try:
-        await conn.execute(
-            "INSERT OR IGNORE INTO color_role_expirations (user_id, role_id, color_name, removal_time) "
-            "SELECT user_id, ?, 'pink', removal_time FROM masochist_roles",
-            (masochist_id,)
-        )
-    except Exception as e:
-        logger.debug(f"Migration: masochist_roles table not found or already empty: {e}")
-
-
 async def get_color_role_configs() -> list:
     """Returns all configured color roles."""
     async with get_db() as conn:
@@ -732,6 +187,7 @@ async def add_color_role_expiration(user_id: str, role_id: str, color_name: str,
             "INSERT OR REPLACE INTO color_role_expirations (user_id, role_id, color_name, removal_time) VALUES (?, ?, ?, ?)",
             (str(user_id), str(role_id), color_name, removal_time)
         )
+    _notify_expiry("color_role", removal_time)
 
 
 async def get_pending_color_role_expirations() -> list:
@@ -745,6 +201,19 @@ async def get_pending_color_role_expirations() -> list:
             return [{"user_id": r[0], "role_id": r[1], "color_name": r[2]} for r in rows]
 
 
+async def pop_expired_color_role_expirations() -> list:
+    """Atomically fetch and delete every colour role expiration that is due."""
+    now = time.time()
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT user_id, role_id, color_name FROM color_role_expirations WHERE removal_time <= ?", (now,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        if rows:
+            await conn.execute("DELETE FROM color_role_expirations WHERE removal_time <= ?", (now,))
+        return [{"user_id": r[0], "role_id": r[1], "color_name": r[2]} for r in rows]
+
+
 async def remove_color_role_expiration(user_id: str, role_id: str):
     """Deletes a role expiration record."""
     async with get_db() as conn:
@@ -821,6 +290,7 @@ async def set_setting(key: str, value: str):
         # Invalidate cache
         if key in _settings_cache:
             del _settings_cache[key]
+    _notify_setting(key)
 
 
 async def get_admin_config():
@@ -852,14 +322,29 @@ async def has_color_voted(color_name: str, voted_id: str, voter_id: str) -> bool
 # ============================================================
 
 
+_numerology_content = None  # (descs {num: desc}, combos {(p, s): desc}); None = not loaded
+
+
+def invalidate_numerology_content():
+    """Drop the resident description/combo tables; the next reading reloads them."""
+    global _numerology_content
+    _numerology_content = None
+
+
+async def get_numerology_content() -> tuple:
+    """Returns (descs, combos) held in memory, loading both tables on first use."""
+    global _numerology_content
+    if _numerology_content is None:
+        descs = await get_all_numerology_number_descs()
+        combos = {(c["primary_num"], c["secondary_num"]): c["combo_desc"] for c in await get_all_numerology_combos()}
+        _numerology_content = (descs, combos)
+    return _numerology_content
+
+
 async def get_numerology_number_desc(num: int) -> str:
     """Get the description for a numerology number (primary or secondary)."""
-    async with get_db() as conn:
-        async with conn.execute(
-            "SELECT description FROM numerology_number_desc WHERE num = ?", (num,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else ""
+    descs, _ = await get_numerology_content()
+    return descs.get(num, "")
 
 
 async def set_numerology_number_desc(num: int, description: str):
@@ -870,17 +355,13 @@ async def set_numerology_number_desc(num: int, description: str):
             (num, description)
         )
         await conn.commit()
+    invalidate_numerology_content()
 
 
 async def get_numerology_combo(primary_num: int, secondary_num: int) -> str:
     """Get the combination reading for a primary+secondary pair."""
-    async with get_db() as conn:
-        async with conn.execute(
-            "SELECT combo_desc FROM numerology_combos WHERE primary_num = ? AND secondary_num = ?",
-            (primary_num, secondary_num)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else ""
+    _, combos = await get_numerology_content()
+    return combos.get((primary_num, secondary_num), "")
 
 
 async def set_numerology_combo(primary_num: int, secondary_num: int, combo_desc: str):
@@ -891,6 +372,7 @@ async def set_numerology_combo(primary_num: int, secondary_num: int, combo_desc:
             (primary_num, secondary_num, combo_desc)
         )
         await conn.commit()
+    invalidate_numerology_content()
 
 
 async def get_all_numerology_number_descs() -> dict:
@@ -936,39 +418,60 @@ async def seed_numerology_defaults():
                         (p, s, desc)
                     )
         await conn.commit()
+    invalidate_numerology_content()
 
 
 # ============================================================
 # SHOP PRICING
 # ============================================================
 
+_price_overrides = None  # item_key -> price; reloaded after set_item_price
+_price_version = 0       # bumped on every price change; views compiled from prices key on it
+
+
+def get_price_version() -> int:
+    return _price_version
+
+
+async def _load_price_overrides() -> dict:
+    global _price_overrides
+    overrides = _price_overrides
+    if overrides is not None:
+        return overrides
+    version = _price_version
+    async with get_db() as conn:
+        async with conn.execute("SELECT item_key, price FROM item_prices") as cursor:
+            rows = await cursor.fetchall()
+    overrides = {r[0]: r[1] for r in rows}
+    if version == _price_version:  # Don't keep a read that raced a dashboard price change
+        _price_overrides = overrides
+    return overrides
+
+
 async def get_item_price(item_key: str) -> int:
     """Get item price from DB override, fallback to ITEM_REGISTRY."""
     from items import ITEM_REGISTRY
-    async with get_db() as conn:
-        async with conn.execute("SELECT price FROM item_prices WHERE item_key = ?", (item_key,)) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return row[0]
-            
-            # Fallback
-            return ITEM_REGISTRY.get(item_key, {}).get("cost", 999999)
+    overrides = await _load_price_overrides()
+    if item_key in overrides:
+        return overrides[item_key]
+    # Fallback
+    return ITEM_REGISTRY.get(item_key, {}).get("cost", 999999)
 
 async def set_item_price(item_key: str, price: int):
     """Override an item's price in the database."""
+    global _price_overrides, _price_version
     async with get_db() as conn:
         await conn.execute(
             "INSERT OR REPLACE INTO item_prices (item_key, price) VALUES (?, ?)",
             (item_key, price)
         )
         await conn.commit()
+    _price_version += 1
+    _price_overrides = None
 
 async def get_all_item_prices() -> dict:
     """Returns all price overrides as {item_key: price}."""
-    async with get_db() as conn:
-        async with conn.execute("SELECT item_key, price FROM item_prices") as cursor:
-            rows = await cursor.fetchall()
-            return {r[0]: r[1] for r in rows}
+    return dict(await _load_price_overrides())
 
 
 # ============================================================
@@ -1046,24 +549,40 @@ async def record_shard_claim(user_id: int):
 # ============================================================
 
 
+_balance_cache = {}         # user_id -> balance; dropped by every balance write
+_balance_generation = 0    # bumped by writes so a read that raced one isn't cached
+
+
+def _invalidate_balances(*user_ids):
+    """Forget cached balances for these users (all users if none given)."""
+    global _balance_generation
+    _balance_generation += 1
+    if not user_ids:
+        _balance_cache.clear()
+    for uid in user_ids:
+        _balance_cache.pop(uid, None)
+
+
 async def get_balance(user_id: int) -> int:
     user_id_str = str(user_id)
+    cached = _balance_cache.get(user_id_str)
+    if cached is not None:
+        return cached
+    generation = _balance_generation
     async with get_db() as conn:
         async with conn.execute(
             "SELECT balance FROM balances WHERE user_id = ?", (user_id_str,)
         ) as cursor:
             result = await cursor.fetchone()
-            return result[0] if result else 0
+    balance = result[0] if result else 0
+    if generation == _balance_generation:
+        _balance_cache[user_id_str] = balance
+    return balance
 
 
 async def get_top_balances(limit: int = 20) -> list:
     """Returns a list of (user_id, balance) for the wealthiest users."""
-    async with get_db() as conn:
-        async with conn.execute(
-            "SELECT user_id, balance FROM balances ORDER BY balance DESC LIMIT ?",
-            (limit,),
-        ) as cursor:
-            return await cursor.fetchall()
+    return await ranks.balances.top(limit)
 
 
 async def cap_all_balances(max_bal: int):
@@ -1073,6 +592,8 @@ async def cap_all_balances(max_bal: int):
             "UPDATE balances SET balance = ? WHERE balance > ?",
             (max_bal, max_bal),
         )
+    ranks.balances.invalidate()
+    _invalidate_balances()
 
 
 async def clear_user_inventory(user_id: int):
@@ -1083,6 +604,7 @@ async def clear_user_inventory(user_id: int):
             "DELETE FROM user_inventory WHERE user_id = ?",
             (user_id_str,),
         )
+    _invalidate_inventory(user_id_str)
 
 
 async def apply_wealth_tax(tax_rate: float = 0.10, threshold: int = 1000):
@@ -1092,6 +614,8 @@ async def apply_wealth_tax(tax_rate: float = 0.10, threshold: int = 1000):
             "UPDATE balances SET balance = CAST(balance * (1 - ?) AS INTEGER) WHERE balance > ?",
             (tax_rate, threshold),
         )
+    ranks.balances.invalidate()
+    _invalidate_balances()
 
 
 async def update_balance(user_id: int, amount: int):
@@ -1115,14 +639,17 @@ async def update_balance(user_id: int, amount: int):
         if luck_expires and luck_expires > time.time():
             amount = int(amount * 1.5)
 
-    async with get_db() as conn:
-        await conn.execute(
-            """
-            INSERT INTO balances (user_id, balance) VALUES (?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET balance = MAX(0, balance + ?)
-        """,
-            (user_id_str, max(0, amount), amount),
-        )
+    with ranks.balances.writing():
+        async with get_db() as conn:
+            await conn.execute(
+                """
+                INSERT INTO balances (user_id, balance) VALUES (?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET balance = MAX(0, balance + ?)
+            """,
+                (user_id_str, max(0, amount), amount),
+            )
+        ranks.balances.add(user_id_str, amount, floor=0)
+    _invalidate_balances(user_id_str)
 
 async def get_blood_moon_multiplier() -> int:
     """Returns 2 if Blood Moon is active, else 1."""
@@ -1148,14 +675,17 @@ async def set_blood_moon(duration_sec: int):
 async def set_balance(user_id: int, new_balance: int):
     """Set a user's balance to an exact amount (for .baledit command)"""
     user_id_str = str(user_id)
-    async with get_db() as conn:
-        await conn.execute(
-            """
-            INSERT INTO balances (user_id, balance) VALUES (?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET balance = ?
-        """,
-            (user_id_str, new_balance, new_balance),
-        )
+    with ranks.balances.writing():
+        async with get_db() as conn:
+            await conn.execute(
+                """
+                INSERT INTO balances (user_id, balance) VALUES (?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET balance = ?
+            """,
+                (user_id_str, new_balance, new_balance),
+            )
+        ranks.balances.set(user_id_str, new_balance)
+    _invalidate_balances(user_id_str)
 
 
 async def get_potential_victims(exclude_ids: list, min_balance: int = 1):
@@ -1178,64 +708,93 @@ async def transfer_tokens(sender_id: int, recipient_id: int, amount: int) -> boo
     if amount <= 0:
         return False
     sender_id_str, recipient_id_str = str(sender_id), str(recipient_id)
-    async with get_db() as conn:
-        async with conn.execute(
-            "SELECT balance FROM balances WHERE user_id = ?", (sender_id_str,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            if not row or row[0] < amount:
-                raise InsufficientTokens(amount, row[0] if row else 0)
-        await conn.execute(
-            "UPDATE balances SET balance = balance - ? WHERE user_id = ?",
-            (amount, sender_id_str),
-        )
-        await conn.execute(
-            """
-            INSERT INTO balances (user_id, balance) VALUES (?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET balance = balance + ?
-        """,
-            (recipient_id_str, amount, amount),
-        )
-        return True
+    with ranks.balances.writing():
+        async with get_db() as conn:
+            async with conn.execute(
+                "SELECT balance FROM balances WHERE user_id = ?", (sender_id_str,)
+            ) as cursor:
+                row = await cursor.fetchone()
+                if not row or row[0] < amount:
+                    raise InsufficientTokens(amount, row[0] if row else 0)
+            await conn.execute(
+                "UPDATE balances SET balance = balance - ? WHERE user_id = ?",
+                (amount, sender_id_str),
+            )
+            await conn.execute(
+                """
+                INSERT INTO balances (user_id, balance) VALUES (?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET balance = balance + ?
+            """,
+                (recipient_id_str, amount, amount),
+            )
+        ranks.balances.add(sender_id_str, -amount)
+        ranks.balances.add(recipient_id_str, amount)
+    _invalidate_balances(sender_id_str, recipient_id_str)
+    return True
 
 
 async def atomic_purchase(user_id: int, item_name: str, cost: int, quantity: int = 1) -> bool:
     """Handles token deduction and item addition in ONE transaction."""
     user_id_str = str(user_id)
-    async with get_db() as conn:
-        async with conn.execute(
-            "SELECT balance FROM balances WHERE user_id = ?", (user_id_str,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            if not row or row[0] < cost:
-                raise InsufficientTokens(cost, row[0] if row else 0)
+    with ranks.balances.writing():
+        async with get_db() as conn:
+            async with conn.execute(
+                "SELECT balance FROM balances WHERE user_id = ?", (user_id_str,)
+            ) as cursor:
+                row = await cursor.fetchone()
+                if not row or row[0] < cost:
+                    raise InsufficientTokens(cost, row[0] if row else 0)
+
+            # Deduct balance
+            await conn.execute(
+                "UPDATE balances SET balance = balance - ? WHERE user_id = ?",
+                (cost, user_id_str),
+            )
+            # Add to inventory
+            await conn.execute(
+                """
+                INSERT INTO user_inventory (user_id, item_name, quantity) VALUES (?, ?, ?)
+                ON CONFLICT(user_id, item_name) DO UPDATE SET quantity = quantity + ?
+            """,
+                (user_id_str, item_name, quantity, quantity),
+            )
+        ranks.balances.add(user_id_str, -cost)
+    _invalidate_balances(user_id_str)
+    _invalidate_inventory(user_id_str)
+    return True
+
+
+_inventory_cache = {}       # user_id -> {item_name: quantity}; dropped by every inventory write
+_inventory_generation = 0   # bumped by writes so a read that raced one isn't cached
 
-        # Deduct balance
-        await conn.execute(
-            "UPDATE balances SET balance = balance - ? WHERE user_id = ?",
-            (cost, user_id_str),
-        )
-        # Add to inventory
-        await conn.execute(
-            """
-            INSERT INTO user_inventory (user_id, item_name, quantity) VALUES (?, ?, ?)
-            ON CONFLICT(user_id, item_name) DO UPDATE SET quantity = quantity + ?
-        """,
-            (user_id_str, item_name, quantity, quantity),
-        )
-        return True
+
+def _invalidate_inventory(*user_ids):
+    """Forget cached inventories for these users (all users if none given)."""
+    global _inventory_generation
+    _inventory_generation += 1
+    if not user_ids:
+        _inventory_cache.clear()
+    for uid in user_ids:
+        _inventory_cache.pop(uid, None)
 
 
 async def get_user_inventory(user_id: int) -> dict:
     """Retrieves all items and quantities for a user."""
     user_id_str = str(user_id)
+    cached = _inventory_cache.get(user_id_str)
+    if cached is not None:
+        return dict(cached)
+    generation = _inventory_generation
     async with get_db() as conn:
         async with conn.execute(
             "SELECT item_name, quantity FROM user_inventory WHERE user_id = ? AND quantity > 0",
             (user_id_str,),
         ) as cursor:
             rows = await cursor.fetchall()
-            return {row[0]: row[1] for row in rows}
+    inventory = {row[0]: row[1] for row in rows}
+    if generation == _inventory_generation:
+        _inventory_cache[user_id_str] = inventory
+    return dict(inventory)
 
 
 async def remove_item_from_inventory(user_id: int, item_name: str) -> bool:
@@ -1246,10 +805,12 @@ async def remove_item_from_inventory(user_id: int, item_name: str) -> bool:
             "UPDATE user_inventory SET quantity = quantity - 1 WHERE user_id = ? AND item_name = ? AND quantity > 0",
             (user_id_str, item_name),
         ) as cursor:
-            if cursor.rowcount > 0:
-                await conn.execute("DELETE FROM user_inventory WHERE quantity <= 0")
-                return True
-            return False
+            removed = cursor.rowcount > 0
+        if removed:
+            await conn.execute("DELETE FROM user_inventory WHERE quantity <= 0")
+    if removed:
+        _invalidate_inventory(user_id_str)
+    return removed
 
 
 async def update_inventory(user_id: int, item_name: str, quantity: int):
@@ -1266,6 +827,7 @@ async def update_inventory(user_id: int, item_name: str, quantity: int):
                 "INSERT OR REPLACE INTO user_inventory (user_id, item_name, quantity) VALUES (?, ?, ?)",
                 (user_id_str, item_name, quantity),
             )
+    _invalidate_inventory(user_id_str)
 
 
 async def transfer_item(sender_id: int, receiver_id: int, item_name: str) -> bool:
@@ -1293,8 +855,9 @@ async def transfer_item(sender_id: int, receiver_id: int, item_name: str) -> boo
         
         # 3. Clean up sender's empty slot
         await conn.execute("DELETE FROM user_inventory WHERE quantity <= 0")
-        
-        return True
+
+    _invalidate_inventory(sender_id_str, receiver_id_str)
+    return True
 
 
 async def reset_economy_data():
@@ -1304,6 +867,9 @@ async def reset_economy_data():
         await conn.execute("DELETE FROM user_inventory")
         # Optional: also clear daily claims if we want a fresh start
         await conn.execute("DELETE FROM daily_claims")
+    ranks.balances.invalidate()
+    _invalidate_balances()
+    _invalidate_inventory()
     logger.info("⚠️ ECONOMY RESET: All balances and inventories cleared.")
 
 
@@ -1324,6 +890,7 @@ async def add_active_effect(target_id: int, effect_name: str, duration_sec: floa
         """,
             (target_id_str, effect_name, expiration, expiration),
         )
+    _notify_expiry("effect", expiration)
 
 
 async def get_active_effect(target_id: int, effect_name: str) -> float:
@@ -1362,6 +929,49 @@ async def remove_active_effect(target_id: int, effect_name: str = None):
             await conn.execute("DELETE FROM active_effects WHERE user_id = ?", (target_id_str,))
 
 
+async def pop_expired_effects() -> list:
+    """Atomically fetch and delete every expired effect. Returns [(user_id, effect_name)]."""
+    now = time.time()
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT user_id, effect_name FROM active_effects WHERE expires_at <= ?", (now,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        if rows:
+            await conn.execute("DELETE FROM active_effects WHERE expires_at <= ?", (now,))
+        return rows
+
+
+async def get_users_with_effects(user_ids: list, effect_names: list) -> set:
+    """Of the given users, return those still holding any of effect_names."""
+    if not user_ids or not effect_names:
+        return set()
+    user_ph = ", ".join(["?"] * len(user_ids))
+    name_ph = ", ".join(["?"] * len(effect_names))
+    async with get_db() as conn:
+        async with conn.execute(
+            f"SELECT DISTINCT user_id FROM active_effects WHERE user_id IN ({user_ph}) "
+            f"AND effect_name IN ({name_ph}) AND expires_at > ?",
+            (*[str(u) for u in user_ids], *effect_names, time.time()),
+        ) as cursor:
+            return {row[0] for row in await cursor.fetchall()}
+
+
+async def get_pending_expiry_deadlines() -> list:
+    """Every future or overdue deadline the expiry scheduler tracks, as [(kind, due_epoch)]."""
+    async with get_db() as conn:
+        async with conn.execute(
+            """
+            SELECT 'effect', expires_at FROM active_effects
+            UNION ALL
+            SELECT 'color_role', removal_time FROM color_role_expirations
+            UNION ALL
+            SELECT 'trial', end_time FROM trials WHERE status = 'pending' AND message_id IS NULL
+            """
+        ) as cursor:
+            return await cursor.fetchall()
+
+
 async def get_all_expired_effects() -> list:
     """Gets list of (user_id, effect_name) whose effects have expired."""
     async with get_db() as conn:
@@ -1403,6 +1013,16 @@ async def add_quote_to_db(quote):
         raise
 
 
+async def get_hof_text_entries() -> list:
+    """(orig_message_id, author_id, content, jump_url) for every HOF entry with text."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT orig_message_id, author_id, content, jump_url FROM hof_entries "
+            "WHERE content IS NOT NULL AND content != ''"
+        ) as cursor:
+            return await cursor.fetchall()
+
+
 # ============================================================
 # QUOTE DROPS (Separate from daily quotes)
 # ============================================================
@@ -1483,20 +1103,28 @@ async def delete_quote_by_id(quote_id):
 # ============================================================
 
 
+_timezone_cache = {}  # user_id -> (timezone, city); kept in step by set_user_timezone
+
+
 async def get_user_timezone(user_id):
     """Get user's timezone settings"""
+    user_id = str(user_id)
+    cached = _timezone_cache.get(user_id)
+    if cached is not None:
+        return cached
     try:
         async with get_db() as conn:
             async with conn.execute(
                 "SELECT timezone, city FROM user_timezones WHERE user_id = ?",
-                (str(user_id),),
+                (user_id,),
             ) as cursor:
                 row = await cursor.fetchone()
-                if row:
-                    return row[0], row[1]
     except Exception as e:
         logger.error(f"Error getting user timezone: {e}")
-    return None, None
+        return None, None
+    # Users without a location are cached too; .time and .w ask about them repeatedly
+    _timezone_cache[user_id] = (row[0], row[1]) if row else (None, None)
+    return _timezone_cache[user_id]
 
 
 async def set_user_timezone(user_id, timezone_str, city):
@@ -1506,6 +1134,32 @@ async def set_user_timezone(user_id, timezone_str, city):
             "INSERT OR REPLACE INTO user_timezones (user_id, timezone, city) VALUES (?, ?, ?)",
             (str(user_id), timezone_str, city),
         )
+    _timezone_cache[str(user_id)] = (timezone_str, city)
+
+
+# ============================================================
+# GEOCODE CACHE
+# ============================================================
+
+
+async def get_geocode(query: str):
+    """(city, timezone, lat, lon, country, fetched_at) for a normalized query, or None."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT city, timezone, lat, lon, country, fetched_at FROM geocode_cache WHERE query = ?",
+            (query,),
+        ) as cursor:
+            return await cursor.fetchone()
+
+
+async def save_geocode(query: str, city, timezone, lat, lon, country):
+    """Remember a resolved place (city None = no match)."""
+    async with get_db() as conn:
+        await conn.execute(
+            "INSERT OR REPLACE INTO geocode_cache (query, city, timezone, lat, lon, country, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (query, city, timezone, lat, lon, country, time.time()),
+        )
 
 
 # ============================================================
@@ -1591,24 +1245,91 @@ async def set_key_config(send_count_user: int, send_count_admin: int):
         )
 
 
+# ============================================================
+# BULLETIN MESSAGE TRACKING
+# ============================================================
+
+
+async def track_bulletin_messages(channel_id: int, message_ids):
+    """Remember messages posted in the bulletin channel (for purges)."""
+    async with get_db() as conn:
+        await conn.executemany(
+            "INSERT OR IGNORE INTO bulletin_messages (message_id, channel_id) VALUES (?, ?)",
+            [(str(mid), str(channel_id)) for mid in message_ids],
+        )
+
+
+async def get_bulletin_message_ids(channel_id: int) -> list:
+    """Tracked message ids for a channel, as ints."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT message_id FROM bulletin_messages WHERE channel_id = ?", (str(channel_id),)
+        ) as cursor:
+            return [int(row[0]) for row in await cursor.fetchall()]
+
+
+async def untrack_bulletin_messages(message_ids):
+    async with get_db() as conn:
+        await conn.executemany(
+            "DELETE FROM bulletin_messages WHERE message_id = ?",
+            [(str(mid),) for mid in message_ids],
+        )
+
+
+# ============================================================
+# CHANNEL WEBHOOKS
+# ============================================================
+
+
+async def get_channel_webhook(channel_id: int):
+    """(webhook_id, token) for a channel's relay webhook, or None."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT webhook_id, token FROM channel_webhooks WHERE channel_id = ?", (str(channel_id),)
+        ) as cursor:
+            row = await cursor.fetchone()
+    return (int(row[0]), row[1]) if row else None
+
+
+async def save_channel_webhook(channel_id: int, webhook_id: int, token: str):
+    async with get_db() as conn:
+        await conn.execute(
+            "INSERT OR REPLACE INTO channel_webhooks (channel_id, webhook_id, token) VALUES (?, ?, ?)",
+            (str(channel_id), str(webhook_id), token),
+        )
+
+
+async def delete_channel_webhook(channel_id: int):
+    async with get_db() as conn:
+        await conn.execute("DELETE FROM channel_webhooks WHERE channel_id = ?", (str(channel_id),))
+
+
 # ============================================================
 # TAROT FUNCTIONS (EXISTING)
 # ============================================================
 
 
+_tarot_deck_cache = {}  # guild_id -> deck name; kept in step by set_guild_tarot_deck
+
+
 async def get_guild_tarot_deck(guild_id):
-    """Get the current tarot deck for a guild"""
+    """Get the current tarot deck for a guild (cached after the first read)"""
+    guild_id = str(guild_id)
+    if guild_id in _tarot_deck_cache:
+        return _tarot_deck_cache[guild_id]
     try:
         async with get_db() as conn:
             async with conn.execute(
                 "SELECT deck_name FROM tarot_settings WHERE guild_id = ?",
-                (str(guild_id),),
+                (guild_id,),
             ) as cursor:
                 result = await cursor.fetchone()
-                return result[0] if result else "thoth"
+                deck = result[0] if result else "thoth"
     except Exception as e:
         logger.error(f"Error getting tarot deck: {e}")
         return "thoth"
+    _tarot_deck_cache[guild_id] = deck
+    return deck
 
 
 async def set_guild_tarot_deck(guild_id, deck_name):
@@ -1622,6 +1343,7 @@ async def set_guild_tarot_deck(guild_id, deck_name):
             """,
                 (str(guild_id), deck_name, deck_name),
             )
+        _tarot_deck_cache[str(guild_id)] = deck_name
     except Exception as e:
         logger.error(f"Error setting tarot deck: {e}")
 
@@ -1782,17 +1504,18 @@ async def record_daily_claim(user_id: int, claim_type: str):
 # ============================================================
 
 
-async def start_reaping(duration_seconds: int = 1800):
+async def start_reaping(duration_seconds: int = 1800, channel_id: int = None):
     """Starts The Reaping event (30 minutes default)."""
     async with get_db() as conn:
         end_time = time.time() + duration_seconds
         await conn.execute(
             """
-            INSERT OR REPLACE INTO reaping_state (id, active, pool_amount, games_count, started_at, expires_at)
-            VALUES (1, 1, 0, 0, ?, ?)
+            INSERT OR REPLACE INTO reaping_state (id, active, pool_amount, games_count, started_at, expires_at, channel_id)
+            VALUES (1, 1, 0, 0, ?, ?, ?)
         """,
-            (time.time(), end_time),
+            (time.time(), end_time, str(channel_id) if channel_id else None),
         )
+        await conn.execute("DELETE FROM reaping_participants")
 
 
 async def is_reaping_active() -> bool:
@@ -1810,23 +1533,38 @@ async def is_reaping_active() -> bool:
             return False
 
 
-async def add_reaping_tithe(user_id: int, amount: int):
-    """Add tokens to the reaping pool and track participant contribution."""
-    user_id_str = str(user_id)
+async def save_reaping_checkpoint(pool: int, games_count: int, participants: dict):
+    """Persist the in-memory reaping pool and participant contributions in one transaction."""
     async with get_db() as conn:
-        # Update pool
         await conn.execute(
-            "UPDATE reaping_state SET pool_amount = pool_amount + ?, games_count = games_count + 1 WHERE id = 1",
-            (amount,),
-        )
-        # Track participant
-        await conn.execute(
-            """
-            INSERT INTO reaping_participants (user_id, contribution) VALUES (?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET contribution = contribution + ?
-        """,
-            (user_id_str, amount, amount),
+            "UPDATE reaping_state SET pool_amount = ?, games_count = ? WHERE id = 1",
+            (pool, games_count),
         )
+        if participants:
+            await conn.executemany(
+                """
+                INSERT INTO reaping_participants (user_id, contribution) VALUES (?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET contribution = excluded.contribution
+            """,
+                [(str(uid), amount) for uid, amount in participants.items()],
+            )
+
+
+async def get_reaping_snapshot():
+    """
+    Load the full reaping state for the in-memory mirror.
+    Returns (active, pool, games, started_at, expires_at, channel_id, {user_id: contribution}) or None.
+    """
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT active, pool_amount, games_count, started_at, expires_at, channel_id FROM reaping_state WHERE id = 1"
+        ) as cursor:
+            row = await cursor.fetchone()
+            if not row:
+                return None
+        async with conn.execute("SELECT user_id, contribution FROM reaping_participants") as cursor:
+            participants = {r[0]: r[1] for r in await cursor.fetchall()}
+        return (*row, participants)
 
 
 async def get_reaping_state():
@@ -1850,42 +1588,48 @@ async def get_reaping_participants():
 
 async def end_reaping():
     """End The Reaping event, split 80% pool among participants, and clear state."""
-    async with get_db() as conn:
-        # Get pool and participants
-        async with conn.execute("SELECT pool_amount FROM reaping_state WHERE id = 1") as cursor:
-            row = await cursor.fetchone()
-            pool = row[0] if row else 0
-
-        async with conn.execute("SELECT user_id FROM reaping_participants") as cursor:
-            rows = await cursor.fetchall()
-            participants = [row[0] for row in rows]
-
-        winner_count = 0
-        payout_per_person = 0
-        burned = 0
-        
-        count = len(participants)
-        if count > 0 and pool > 0:
-            total_payout = int(pool * 0.8)
-            payout_per_person = total_payout // count
-            burned = pool - (payout_per_person * count) # Remainder goes to void
-            winner_count = count
-
-            if payout_per_person > 0:
-                for uid in participants:
-                    await conn.execute(
-                        """
-                        INSERT INTO balances (user_id, balance) VALUES (?, ?) 
-                        ON CONFLICT(user_id) DO UPDATE SET balance = balance + ?
-                        """,
-                        (str(uid), payout_per_person, payout_per_person)
-                    )
+    with ranks.balances.writing():
+        async with get_db() as conn:
+            # Get pool and participants
+            async with conn.execute("SELECT pool_amount FROM reaping_state WHERE id = 1") as cursor:
+                row = await cursor.fetchone()
+                pool = row[0] if row else 0
 
-        # Cleanup
-        await conn.execute("UPDATE reaping_state SET active = 0, pool_amount = 0, games_count = 0 WHERE id = 1")
-        await conn.execute("DELETE FROM reaping_participants")
+            async with conn.execute("SELECT user_id FROM reaping_participants") as cursor:
+                rows = await cursor.fetchall()
+                participants = [row[0] for row in rows]
 
-        return winner_count, payout_per_person, burned
+            winner_count = 0
+            payout_per_person = 0
+            burned = 0
+            
+            count = len(participants)
+            if count > 0 and pool > 0:
+                total_payout = int(pool * 0.8)
+                payout_per_person = total_payout // count
+                burned = pool - (payout_per_person * count) # Remainder goes to void
+                winner_count = count
+
+                if payout_per_person > 0:
+                    for uid in participants:
+                        await conn.execute(
+                            """
+                            INSERT INTO balances (user_id, balance) VALUES (?, ?) 
+                            ON CONFLICT(user_id) DO UPDATE SET balance = balance + ?
+                            """,
+                            (str(uid), payout_per_person, payout_per_person)
+                        )
+
+            # Cleanup
+            await conn.execute("UPDATE reaping_state SET active = 0, pool_amount = 0, games_count = 0 WHERE id = 1")
+            await conn.execute("DELETE FROM reaping_participants")
+
+        if payout_per_person > 0:
+            for uid in participants:
+                ranks.balances.add(uid, payout_per_person)
+    if payout_per_person > 0:
+        _invalidate_balances(*participants)
+    return winner_count, payout_per_person, burned
 
 
 # ============================================================
@@ -2004,6 +1748,25 @@ async def has_pending_follow_request(username: str) -> bool:
         ) as cursor:
             return await cursor.fetchone() is not None
 
+
+async def get_twitter_account(screen_name: str):
+    """(user_id, name, avatar_url) for a lowercased X screen name, or None."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT user_id, name, avatar_url FROM twitter_accounts WHERE screen_name = ?",
+            (screen_name,),
+        ) as cursor:
+            return await cursor.fetchone()
+
+
+async def save_twitter_account(screen_name: str, user_id: str, name: str, avatar_url: str):
+    async with get_db() as conn:
+        await conn.execute(
+            "INSERT OR REPLACE INTO twitter_accounts (screen_name, user_id, name, avatar_url, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (screen_name, user_id, name, avatar_url, time.time()),
+        )
+
 # ============================================================
 # LEVELING SYSTEM FUNCTIONS
 # ============================================================
@@ -2023,21 +1786,30 @@ async def get_user_xp_data(user_id: int) -> dict:
             return {"xp": 0, "level": 0, "last_xp_time": 0}
 
 
+async def get_all_user_xp() -> dict:
+    """Returns {user_id_str: xp} for every tracked user in a single query."""
+    async with get_db() as conn:
+        async with conn.execute("SELECT user_id, xp FROM users_xp") as cursor:
+            return {row[0]: row[1] for row in await cursor.fetchall()}
+
+
 async def update_user_xp(user_id: int, xp: int, level: int, last_xp_time: float):
     """Updates or inserts a user's XP data."""
     user_id_str = str(user_id)
-    async with get_db() as conn:
-        await conn.execute(
-            """
-            INSERT INTO users_xp (user_id, xp, level, last_xp_time)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET 
-                xp = excluded.xp,
-                level = excluded.level,
-                last_xp_time = excluded.last_xp_time
-        """,
-            (user_id_str, xp, level, last_xp_time),
-        )
+    with ranks.xp.writing():
+        async with get_db() as conn:
+            await conn.execute(
+                """
+                INSERT INTO users_xp (user_id, xp, level, last_xp_time)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET 
+                    xp = excluded.xp,
+                    level = excluded.level,
+                    last_xp_time = excluded.last_xp_time
+            """,
+                (user_id_str, xp, level, last_xp_time),
+            )
+        ranks.xp.set(user_id_str, level, xp)
 
 
 async def get_level_settings() -> dict:
@@ -2104,17 +1876,18 @@ async def remove_reward_role(level: int):
 
 
 async def get_top_levels(limit: int = 50) -> list:
-    """Returns top users by level and XP, joining with profile cache."""
-    async with get_db() as conn:
-        query = """
-            SELECT u.user_id, u.xp, u.level, p.username, p.avatar_url 
-            FROM users_xp u
-            LEFT JOIN user_profile_cache p ON u.user_id = p.user_id
-            ORDER BY u.level DESC, u.xp DESC 
-            LIMIT ?
-        """
-        async with conn.execute(query, (limit,)) as cursor:
-            return await cursor.fetchall()
+    """Returns top users by level and XP as (user_id, xp, level, username, avatar_url)."""
+    top = await ranks.xp.top(limit)
+    if not top:
+        return []
+    placeholders = ", ".join(["?"] * len(top))
+    async with get_db() as conn:
+        async with conn.execute(
+            f"SELECT user_id, username, avatar_url FROM user_profile_cache WHERE user_id IN ({placeholders})",
+            tuple(uid for uid, _, _ in top),
+        ) as cursor:
+            profiles = {row[0]: row[1:] for row in await cursor.fetchall()}
+    return [(uid, xp, level, *profiles.get(uid, (None, None))) for uid, level, xp in top]
 
 # ============================================================
 # SERVER ROLES CACHE (For Dashboard)
@@ -2222,6 +1995,96 @@ def calculate_level_for_xp(xp: int, c3: float, c2: float, c1: float, rounding: i
     return level
 
 
+# ============================================================
+# CRON JOBS
+# ============================================================
+
+CRON_HISTORY_PER_JOB = 50
+
+
+async def get_cron_last_runs() -> dict:
+    """Returns {job_name: last_run_epoch} for every job that has run."""
+    async with get_db() as conn:
+        async with conn.execute("SELECT name, last_run FROM cron_jobs WHERE last_run IS NOT NULL") as cursor:
+            return {row[0]: row[1] for row in await cursor.fetchall()}
+
+
+async def set_cron_next_run(name: str, next_run: float = None):
+    async with get_db() as conn:
+        await conn.execute(
+            "INSERT INTO cron_jobs (name, next_run) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET next_run = excluded.next_run",
+            (name, next_run),
+        )
+
+
+async def record_cron_run(name: str, due_at: float, started_at: float, finished_at: float,
+                          status: str, error: str = None):
+    """Update the job's state row and append to its run history (trimmed per job)."""
+    lateness = max(0.0, started_at - due_at)
+    async with get_db() as conn:
+        await conn.execute(
+            """
+            INSERT INTO cron_jobs (name, last_run, last_due, last_status, last_error, last_lateness, run_count)
+            VALUES (?, ?, ?, ?, ?, ?, 1)
+            ON CONFLICT(name) DO UPDATE SET
+                last_run = excluded.last_run,
+                last_due = excluded.last_due,
+                last_status = excluded.last_status,
+                last_error = excluded.last_error,
+                last_lateness = excluded.last_lateness,
+                run_count = cron_jobs.run_count + 1
+            """,
+            (name, started_at, due_at, status, error, lateness),
+        )
+        await conn.execute(
+            "INSERT INTO cron_runs (job, due_at, started_at, finished_at, status, error) VALUES (?, ?, ?, ?, ?, ?)",
+            (name, due_at, started_at, finished_at, status, error),
+        )
+        await conn.execute(
+            """
+            DELETE FROM cron_runs WHERE job = ? AND id NOT IN (
+                SELECT id FROM cron_runs WHERE job = ? ORDER BY id DESC LIMIT ?
+            )
+            """,
+            (name, name, CRON_HISTORY_PER_JOB),
+        )
+
+
+async def get_cron_jobs() -> list:
+    """Every job's state row, for the dashboard."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT name, last_run, last_due, next_run, last_status, last_error, last_lateness, run_count "
+            "FROM cron_jobs ORDER BY name"
+        ) as cursor:
+            rows = await cursor.fetchall()
+    return [
+        {"name": r[0], "last_run": r[1], "last_due": r[2], "next_run": r[3], "last_status": r[4],
+         "last_error": r[5], "last_lateness": r[6], "run_count": r[7]}
+        for r in rows
+    ]
+
+
+async def get_cron_runs(job: str = None, limit: int = 50) -> list:
+    """Most recent runs, newest first, optionally for one job."""
+    query = "SELECT job, due_at, started_at, finished_at, status, error FROM cron_runs"
+    params = []
+    if job:
+        query += " WHERE job = ?"
+        params.append(job)
+    query += " ORDER BY id DESC LIMIT ?"
+    params.append(limit)
+    async with get_db() as conn:
+        async with conn.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+    return [
+        {"job": r[0], "due_at": r[1], "started_at": r[2], "finished_at": r[3],
+         "lateness": max(0.0, (r[2] or 0) - (r[1] or 0)), "status": r[4], "error": r[5]}
+        for r in rows
+    ]
+
+
 # ============================================================
 # COMMAND USAGE TRACKING
 # ============================================================
@@ -2259,6 +2122,7 @@ async def add_trial(user_id: str, guild_id: str, start_time: float, end_time: fl
             (user_id, guild_id, start_time, end_time)
         )
         await conn.commit()
+    _notify_expiry("trial", end_time)
 
 async def get_active_trials():
     """Get all trials that are still pending."""
@@ -2269,6 +2133,16 @@ async def get_active_trials():
             rows = await cursor.fetchall()
         return rows
 
+async def get_due_trials() -> list:
+    """Pending trials whose end time has passed and have no decision embed yet."""
+    async with get_db() as conn:
+        async with conn.execute(
+            "SELECT user_id, guild_id, start_time, end_time FROM trials "
+            "WHERE status = 'pending' AND message_id IS NULL AND end_time <= ?",
+            (time.time(),)
+        ) as cursor:
+            return await cursor.fetchall()
+
 async def update_trial_message(user_id: str, guild_id: str, message_id: str):
     """Update the message ID of the trial decision embed."""
     async with get_db() as conn:
@@ -2304,4 +2178,5 @@ async def update_trial_end_time(user_id: str, guild_id: str, end_time: float):
             (end_time, user_id, guild_id)
         )
         await conn.commit()
+    _notify_expiry("trial", end_time)
 
@@ -3,7 +3,7 @@ import discord
 import logging
 from database import (
     get_balance, update_balance, transfer_tokens, set_balance, is_economy_on,
-    transfer_item
+    transfer_item, get_all_item_prices, get_price_version
 )
 from exceptions import InsufficientTokens
 from items import ITEM_ALIASES, ITEM_REGISTRY
@@ -28,6 +28,69 @@ def format_balance(balance: int) -> str:
     return f"{balance:,} {CURRENCY_SYMBOL}"
 
 
+# ============================================================
+# SHOP & INVENTORY VIEWS
+# ============================================================
+
+_shop_embeds = {}  # show_hidden -> (price version, Embed); prices only change from the dashboard
+
+
+def _shop_field(item: str, data: dict, cost: int, prefix: str = "") -> dict:
+    price = f"{cost} 💎"
+    max_uses = data.get('max_uses')
+    if max_uses and max_uses > 1:
+        price += f" ({max_uses} charges)"
+    desc = data.get('shop_desc', data.get('feedback', 'No description.'))
+    return {"name": f"{prefix}{item.replace('_', ' ').title()} — {price}", "value": f"*{desc}*", "inline": False}
+
+
+async def get_shop_embed(show_hidden: bool = False) -> discord.Embed:
+    """The .buy menu, compiled once per price version. Callers send it as-is; don't mutate it."""
+    version = get_price_version()
+    cached = _shop_embeds.get(show_hidden)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    overrides = await get_all_item_prices()
+    embed = discord.Embed(
+        title="🎰 APEIRON EXCHANGE",
+        description="Spend your tokens and observe the fallout.",
+        color=discord.Color.gold(),
+    )
+
+    # Sort items by cost (ascending)
+    sorted_items = sorted(ITEM_REGISTRY.items(), key=lambda x: x[1]["cost"])
+
+    # 1. Show Standard Items
+    for item, data in sorted_items:
+        if not data.get('hidden'):
+            embed.add_field(**_shop_field(item, data, overrides.get(item, data.get("cost", 999999))))
+
+    # 2. Show Hidden Items for Mods
+    if show_hidden:
+        hidden_items = [i for i in sorted_items if i[1].get('hidden')]
+        if hidden_items:
+            embed.add_field(name="──────────────", value="**🌑 THE HIDDEN EXCHANGE**", inline=False)
+            for item, data in hidden_items:
+                embed.add_field(**_shop_field(item, data, overrides.get(item, data.get("cost", 999999)), prefix="👁️ "))
+
+    _shop_embeds[show_hidden] = (version, embed)
+    return embed
+
+
+def format_inventory(inventory: dict) -> list:
+    """One display line per item, showing charges for multi-use items."""
+    lines = []
+    for item, qty in inventory.items():
+        item_display = item.replace('_', ' ').title()
+        max_uses = ITEM_REGISTRY.get(item, {}).get("max_uses")
+        if max_uses and max_uses > 1:
+            lines.append(f"• **{item_display}**: {qty}/{max_uses} uses")
+        else:
+            lines.append(f"• **{item_display}**: x{qty}")
+    return lines
+
+
 # ============================================================
 # ECONOMY COMMAND LOGIC
 # ============================================================
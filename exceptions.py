@@ -47,3 +47,24 @@ class CurseError(ItemError):
 class ActiveCurseError(CurseError):
     """Raised when target already has an active curse."""
     pass
+
+class UpstreamError(ApebotError):
+    """Raised when a third-party API call fails (network error, timeout, repeated 5xx)."""
+    def __init__(self, upstream, detail=""):
+        self.upstream = upstream
+        super().__init__(f"{upstream} request failed" + (f": {detail}" if detail else ""))
+
+class UpstreamUnavailable(UpstreamError):
+    """Raised without calling out when an upstream's circuit breaker is open."""
+    def __init__(self, upstream):
+        super().__init__(upstream, "temporarily unavailable (circuit open)")
+
+class ImageQueueFull(ApebotError):
+    """Raised when an image job can't be queued (queue or the user's share of it is full)."""
+    pass
+
+class TwitterAccountNotFound(ApebotError):
+    """Raised when an X screen name doesn't resolve to an account."""
+    def __init__(self, screen_name):
+        self.screen_name = screen_name
+        super().__init__(f"Account @{screen_name} not found on X.")
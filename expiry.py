@@ -0,0 +1,129 @@
+"""
+Expiry Scheduler
+Min-heap of upcoming deadlines (curse effects, colour roles, trials). Loads
+every pending deadline once at startup, sleeps until the next one is due, and
+hands each due kind to its handler as a single batch.
+Registering a new deadline is O(log n) and wakes the loop if it's the earliest.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+
+import database
+
+logger = logging.getLogger(__name__)
+
+# Re-read deadlines from the DB this often, as a safety net for rows written
+# outside this process (manual SQL, restores). Not needed for correctness otherwise.
+RESYNC_INTERVAL = 3600
+
+
+class ExpiryScheduler:
+    def __init__(self):
+        self._heap = []        # [(due_epoch, kind)]
+        self._handlers = {}    # kind -> async fn() that processes everything due
+        self._loop = None
+        self._wake = None
+        self._task = None
+        self._loading = None   # pushes made while load() awaits the DB; re-applied after it
+
+    def register(self, kind: str, handler):
+        """Set the batch handler for a kind. It is called with no arguments and should sweep all due rows."""
+        self._handlers[kind] = handler
+
+    def schedule(self, kind: str, due: float):
+        """Register a deadline. Safe to call from any thread; a no-op until start() has run."""
+        if self._loop is None:
+            return  # Picked up by load() when the scheduler starts
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._push(kind, due)
+        else:
+            # e.g. the dashboard thread writing through database.py
+            self._loop.call_soon_threadsafe(self._push, kind, due)
+
+    def _push(self, kind: str, due: float):
+        if self._loading is not None:
+            self._loading.append((due, kind))
+        heapq.heappush(self._heap, (due, kind))
+        if self._heap[0] == (due, kind):
+            self._wake.set()
+
+    def pending(self) -> int:
+        return len(self._heap)
+
+    async def load(self):
+        """Rebuild the heap from every pending deadline in the DB."""
+        self._loading = []
+        try:
+            rows = await database.get_pending_expiry_deadlines()
+        finally:
+            pushed, self._loading = self._loading, None
+        # Deadlines pushed during the read may be missing from it; keep them
+        self._heap = [(due, kind) for kind, due in rows] + pushed
+        heapq.heapify(self._heap)
+        logger.info(f"⏳ Expiry scheduler loaded {len(self._heap)} pending deadlines.")
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self):
+        await self.load()
+        # Anything already overdue (e.g. expired while offline) is handled right away
+        last_sync = time.time()
+        while True:
+            try:
+                self._wake.clear()
+                now = time.time()
+                timeout = max(0.0, RESYNC_INTERVAL - (now - last_sync))
+                if self._heap:
+                    timeout = min(timeout, max(0.0, self._heap[0][0] - now))
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+                if time.time() - last_sync >= RESYNC_INTERVAL:
+                    await self.load()
+                    last_sync = time.time()
+
+                await self._process_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in expiry scheduler: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def _process_due(self):
+        now = time.time()
+        due_kinds = []
+        while self._heap and self._heap[0][0] <= now:
+            _, kind = heapq.heappop(self._heap)
+            if kind not in due_kinds:
+                due_kinds.append(kind)
+
+        for kind in due_kinds:
+            handler = self._handlers.get(kind)
+            if not handler:
+                continue
+            try:
+                await handler()
+            except Exception as e:
+                logger.error(f"Error processing '{kind}' expirations: {e}", exc_info=True)
+
+
+scheduler = ExpiryScheduler()
+database.set_expiry_hook(scheduler.schedule)
@@ -0,0 +1,148 @@
+"""
+Streaming Exports
+Table exports (HOF, XP, economy) read the cursor in fetchmany() chunks and emit
+encoded CSV / JSON / text pieces as they go, optionally through gzip, so memory
+stays flat however large the tables get. The dashboard wraps these generators
+in a StreamingResponse; Discord uploads spool them to a temp file first.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import zlib
+
+import aiosqlite
+
+from config import DB_FILE
+
+logger = logging.getLogger(__name__)
+
+FETCH_ROWS = 500                  # rows per fetchmany()
+FLUSH_BYTES = 64 * 1024           # emit a piece once this much output is buffered
+SPOOL_MEMORY_BYTES = 1024 * 1024  # spooled exports move to disk past this size
+BACKUP_PAGES = 256                # pages copied per step of the online backup
+
+# ============================================================
+# ROW SOURCES
+# ============================================================
+
+
+async def iter_rows(query: str, params=(), db_file: str = DB_FILE):
+    """Yield rows one at a time, fetched FETCH_ROWS at a time."""
+    async with aiosqlite.connect(db_file, timeout=20.0) as conn:
+        async with conn.execute(query, params) as cursor:
+            while True:
+                rows = await cursor.fetchmany(FETCH_ROWS)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+
+
+# ============================================================
+# ENCODERS (async iterables of bytes)
+# ============================================================
+
+
+async def csv_stream(header, rows):
+    """CSV with a header row. `rows` is an async iterable of sequences."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, quoting=csv.QUOTE_ALL)
+    writer.writerow(header)
+    async for row in rows:
+        writer.writerow(row)
+        if buf.tell() >= FLUSH_BYTES:
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+async def lines_stream(rows, fmt, header: str = None):
+    """One line per row, formatted by fmt(row), after an optional header line."""
+    parts, size = ([header + "\n"], 0) if header else ([], 0)
+    async for row in rows:
+        line = fmt(row) + "\n"
+        parts.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield "".join(parts).encode("utf-8")
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+async def json_object_stream(sections: dict):
+    """A JSON object whose values are streamed objects: {name: async iterable of (key, value)}."""
+    yield b"{"
+    for i, (name, pairs) in enumerate(sections.items()):
+        yield (("," if i else "") + json.dumps(name) + ":{").encode("utf-8")
+        parts, size, first = [], 0, True
+        async for key, value in pairs:
+            piece = ("" if first else ",") + json.dumps(str(key)) + ":" + json.dumps(value)
+            first = False
+            parts.append(piece)
+            size += len(piece)
+            if size >= FLUSH_BYTES:
+                yield "".join(parts).encode("utf-8")
+                parts, size = [], 0
+        parts.append("}")
+        yield "".join(parts).encode("utf-8")
+    yield b"}"
+
+
+async def gzip_stream(chunks):
+    """gzip-compress an async byte stream piece by piece."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    async for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def maybe_gzip(chunks, compress: bool):
+    return gzip_stream(chunks) if compress else chunks
+
+
+# ============================================================
+# SPOOLING & BACKUPS
+# ============================================================
+
+
+async def spool(chunks):
+    """Write a byte stream to a spooled temp file (RAM until SPOOL_MEMORY_BYTES, then disk).
+    Returns (file positioned at 0, size). The caller closes it."""
+    fp = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    size = 0
+    async for chunk in chunks:
+        fp.write(chunk)
+        size += len(chunk)
+    fp.seek(0)
+    return fp, size
+
+
+def backup_database(target: str, compress: bool = False, db_file: str = DB_FILE) -> int:
+    """Consistent copy of the live DB via SQLite's online backup (WAL included), a few
+    pages at a time so writers are never blocked for long. Blocking; run in an executor.
+    Returns the size of the written file."""
+    raw = f"{target}.tmp" if compress else target
+    src = sqlite3.connect(db_file, timeout=20.0)
+    dst = sqlite3.connect(raw)
+    try:
+        src.backup(dst, pages=BACKUP_PAGES)
+    finally:
+        dst.close()
+        src.close()
+    if compress:
+        with open(raw, "rb") as f_in, gzip.open(target, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, FLUSH_BYTES)
+        os.remove(raw)
+    return os.path.getsize(target)
@@ -0,0 +1,153 @@
+"""
+Gematria Engine
+Table-driven scoring for every cipher in one pass: text is normalized once
+(uppercase A-Z via bytes.translate), letters are counted, and each cipher is
+a dot product of those counts with its 26-entry table. Also keeps a reverse
+index of stored quotes and HOF entries by cipher value for `.gem`.
+"""
+
+import logging
+import time
+from operator import mul
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# CIPHER TABLES (A..Z)
+# ============================================================
+
+
+def _reduce_digit(n: int) -> int:
+    while n > 9:
+        n = n // 10 + n % 10
+    return n
+
+
+_ORDINAL = tuple(range(1, 27))
+_REVERSE = tuple(range(26, 0, -1))
+
+CIPHERS = {
+    "hebrew": (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 200, 300, 400, 406, 490, 20, 14),
+    "english": tuple(v * 6 for v in _ORDINAL),
+    "ordinal": _ORDINAL,
+    "reduction": tuple(_reduce_digit(v) for v in _ORDINAL),
+    "reverse": _REVERSE,
+    "reverse_reduction": tuple(_reduce_digit(v) for v in _REVERSE),
+    "fibonacci": (1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 233, 144, 89, 55, 34, 21, 13, 8, 5, 3, 2, 1, 1),
+    # Classical Latin order: A B C D E F G H I K L M N O P Q R S T U X Y Z J V W
+    "latin": (1, 2, 3, 4, 5, 6, 7, 8, 9, 600, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 200, 700, 900, 300, 400, 500),
+    "sumerian": tuple(v * 6 for v in _ORDINAL),
+    "reverse_sumerian": tuple(v * 6 for v in _REVERSE),
+}
+
+CIPHER_ALIASES = {
+    "heb": "hebrew", "eng": "english", "ord": "ordinal", "red": "reduction",
+    "rev": "reverse", "revred": "reverse_reduction", "fib": "fibonacci",
+    "lat": "latin", "sum": "sumerian", "revsum": "reverse_sumerian",
+}
+
+_UPPER = range(65, 91)
+_NON_LETTERS = bytes(b for b in range(256) if b not in _UPPER)
+
+# ============================================================
+# SCORING
+# ============================================================
+
+
+def normalize(text: str) -> bytes:
+    """Uppercase A-Z only. Same letters as helpers.text_to_letters(), as bytes."""
+    return text.upper().encode("ascii", "ignore").translate(None, _NON_LETTERS)
+
+
+def letter_counts(letters: bytes) -> list:
+    return [letters.count(c) for c in _UPPER]
+
+
+def score(text: str) -> dict:
+    """Every cipher's total for the text, computed from one normalization pass."""
+    counts = letter_counts(normalize(text))
+    return {name: sum(map(mul, counts, table)) for name, table in CIPHERS.items()}
+
+
+def score_many(texts) -> list:
+    """Batch API: score() for each text, in order."""
+    tables = list(CIPHERS.items())
+    out = []
+    for text in texts:
+        counts = letter_counts(normalize(text))
+        out.append({name: sum(map(mul, counts, table)) for name, table in tables})
+    return out
+
+
+def resolve_cipher(name: str):
+    """Canonical cipher name for a user-typed name or alias, or None."""
+    key = name.lower().replace(" ", "_").replace("-", "_")
+    if key in CIPHERS:
+        return key
+    return CIPHER_ALIASES.get(key.replace("_", ""))
+
+
+# ============================================================
+# REVERSE INDEX
+# ============================================================
+
+INDEX_TTL = 3600  # Rebuild from the DB at most this often
+
+
+class GematriaIndex:
+    """{cipher: {value: [entry, ...]}} over stored quotes and HOF entries."""
+
+    def __init__(self):
+        self._by_value = {}
+        self._built_at = 0.0
+        self.size = 0
+
+    def invalidate(self):
+        self._built_at = 0.0
+
+    def is_stale(self) -> bool:
+        return time.time() - self._built_at > INDEX_TTL
+
+    def build(self, entries):
+        """entries: iterable of dicts with at least a 'text' key."""
+        entries = [e for e in entries if e.get("text")]
+        by_value = {name: {} for name in CIPHERS}
+        for entry, scores in zip(entries, score_many(e["text"] for e in entries)):
+            for name, value in scores.items():
+                if value:
+                    by_value[name].setdefault(value, []).append(entry)
+        self._by_value = by_value
+        self.size = len(entries)
+        self._built_at = time.time()
+
+    def add(self, entry: dict):
+        """Index a newly stored entry without a rebuild."""
+        if not self._built_at or not entry.get("text"):
+            return
+        scores = score(entry["text"])
+        if any(e["text"] == entry["text"] and e.get("source") == entry.get("source")
+               for e in self.lookup("ordinal", scores["ordinal"])):
+            return
+        for name, value in scores.items():
+            if value:
+                self._by_value[name].setdefault(value, []).append(entry)
+        self.size += 1
+
+    def lookup(self, cipher: str, value: int) -> list:
+        return self._by_value.get(cipher, {}).get(value, [])
+
+
+index = GematriaIndex()
+
+
+async def ensure_index(db_module):
+    """Build (or refresh) the reverse index from the DB if it's missing or stale."""
+    if not index.is_stale():
+        return index
+    started = time.perf_counter()
+    entries = [{"source": "quote", "text": q} for q in await db_module.load_quotes_from_db()]
+    for msg_id, author_id, content, jump_url in await db_module.get_hof_text_entries():
+        entries.append({"source": "hof", "id": msg_id, "author_id": author_id, "text": content, "jump_url": jump_url})
+    index.build(entries)
+    logger.info(f"🔢 Gematria index built: {index.size} entries in {(time.perf_counter() - started) * 1000:.0f}ms")
+    return index
@@ -0,0 +1,129 @@
+"""
+Geocoding
+Free-text locations ("nyc", "austin tx", a user's saved city) resolved to a
+canonical city, timezone and coordinates. Lookups go memory -> geocode_cache
+table -> OpenCage; the same handful of cities recur, so OpenCage is only hit for
+genuinely new queries, and identical concurrent misses share one request.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+import database
+from config import OPENCAGE_KEY
+from exceptions import UpstreamError
+from httpclient import client
+from respcache import normalize
+
+logger = logging.getLogger(__name__)
+
+OPENCAGE_URL = "https://api.opencagedata.com/geocode/v1/json"
+MEMORY_ENTRIES = 1000
+NEGATIVE_TTL = 86400   # re-ask OpenCage about a no-match query after a day
+
+
+class Place:
+    __slots__ = ("city", "timezone", "lat", "lon", "country")
+
+    def __init__(self, city, timezone, lat, lon, country):
+        self.city = city
+        self.timezone = timezone
+        self.lat = lat
+        self.lon = lon
+        self.country = country
+
+    def __repr__(self):
+        return f"Place({self.city!r}, {self.timezone!r}, {self.lat}, {self.lon})"
+
+
+_NO_MATCH = Place(None, None, None, None, None)
+
+_memory = OrderedDict()   # normalized query -> (Place, fetched_at)
+_inflight = {}            # normalized query -> Future[Place | None]
+
+
+def _remember(key: str, place: Place, fetched_at: float):
+    _memory[key] = (place, fetched_at)
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _usable(place: Place, fetched_at: float) -> bool:
+    return place.city is not None or time.time() - fetched_at < NEGATIVE_TTL
+
+
+async def resolve(query: str):
+    """Place for a query, or None if nothing matches or OpenCage is unreachable."""
+    key = normalize(query)
+    if not key:
+        return None
+
+    hit = _memory.get(key)
+    if hit and _usable(*hit):
+        _memory.move_to_end(key)
+        return hit[0] if hit[0].city else None
+
+    row = await database.get_geocode(key)
+    if row and _usable(Place(*row[:5]), row[5]):
+        place = Place(*row[:5])
+        _remember(key, place, row[5])
+        return place if place.city else None
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    place = None
+    try:
+        place = await _opencage(query)
+        if place is not None:
+            await database.save_geocode(key, place.city, place.timezone, place.lat, place.lon, place.country)
+            _remember(key, place, time.time())
+    except Exception as e:
+        logger.error(f"Geocode failed for '{query}': {e}")
+    finally:
+        del _inflight[key]
+        result = place if place is not None and place.city else None
+        future.set_result(result)
+    return result
+
+
+async def _opencage(query: str):
+    """Place, _NO_MATCH when OpenCage has no result, or None if the request failed."""
+    try:
+        resp = await client.get("opencage", OPENCAGE_URL, params={"q": query, "key": OPENCAGE_KEY, "limit": 1})
+    except UpstreamError as e:
+        logger.error(f"OpenCage API error: {e}")
+        return None
+    if resp.status != 200:
+        logger.error(f"OpenCage API returned {resp.status}")
+        return None
+
+    results = resp.data.get("results")
+    if not results:
+        return _NO_MATCH
+    first = results[0]
+    components = first["components"]
+    city = (
+        components.get("city")
+        or components.get("town")
+        or components.get("village")
+        or components.get("state")
+        or query
+    )
+    geometry = first.get("geometry") or {}
+    return Place(
+        city,
+        first["annotations"]["timezone"]["name"],
+        geometry.get("lat"),
+        geometry.get("lng"),
+        components.get("country_code", "").upper() or None,
+    )
+
+
+def stats() -> dict:
+    return {"memory": len(_memory), "inflight": len(_inflight)}
@@ -547,29 +547,9 @@ def calculate_reverse_sumerian(text: str) -> int:
 
 
 def calculate_all_gematria(text: str):
-    """Calculate all gematria cipher values for the given text."""
-    ord_vals = ordinal_values(text)
-    red_vals = reduction_values(text)
-    rev_vals = reverse_values(text)
-    rev_red_vals = reverse_reduction_values(text)
-    heb_vals = hebrew_values(text)
-    eng_vals = english_gematria_values(text)
-    rev_sum_vals = reverse_sumerian_values(text)
-    fib_vals = fibonacci_values(text)
-    lat_vals = latin_values(text)
-
-    return {
-        "hebrew": sum(heb_vals),
-        "english": sum(eng_vals),
-        "ordinal": sum(ord_vals),
-        "reduction": sum(red_vals),
-        "reverse": sum(rev_vals),
-        "reverse_reduction": sum(rev_red_vals),
-        "fibonacci": sum(fib_vals),
-        "latin": sum(lat_vals),
-        "sumerian": sum(eng_vals),
-        "reverse_sumerian": sum(rev_sum_vals),
-    }
+    """Calculate all gematria cipher values for the given text (single pass, see gematria.py)."""
+    import gematria
+    return gematria.score(text)
 
 
 # Example usage and tests
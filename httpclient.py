@@ -0,0 +1,258 @@
+"""
+Outbound HTTP Client
+One pooled aiohttp session for every third-party call (keep-alive, per-host
+connection limits, DNS cache, standard timeouts). Each upstream has its own
+circuit breaker, retry budget and latency/error counters, so one slow API can't
+stall the others and a dead one fails fast instead of timing out per command.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+
+import aiohttp
+
+from exceptions import UpstreamError, UpstreamUnavailable
+
+logger = logging.getLogger(__name__)
+
+POOL_LIMIT = 100           # open sockets across all hosts
+POOL_LIMIT_PER_HOST = 8
+DNS_CACHE_SECONDS = 300
+KEEPALIVE_SECONDS = 60
+USER_AGENT = "ApeBot/1.0 (Discord Bot)"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+LATENCY_SAMPLES = 200      # per upstream, for p50/p95
+
+
+class Upstream:
+    """Per-service policy: timeout, retries and when to trip the breaker."""
+
+    def __init__(self, name: str, timeout: float = 10, retries: int = 1,
+                 failure_threshold: int = 5, reset_after: float = 60):
+        self.name = name
+        self.timeout = timeout
+        self.retries = retries                      # extra attempts per request, if the budget allows
+        self.failure_threshold = failure_threshold  # consecutive failures that open the circuit
+        self.reset_after = reset_after              # seconds open before a trial request
+
+
+UPSTREAMS = {u.name: u for u in (
+    Upstream("opencage", timeout=10),
+    Upstream("serpapi", timeout=30),
+    Upstream("urbandictionary", timeout=15),
+    Upstream("coingecko", timeout=10, reset_after=120),   # rate-limits hard; back off longer
+    Upstream("openweather", timeout=10),
+    Upstream("pollinations", timeout=120, retries=0, failure_threshold=8),  # has its own model failover loop
+    Upstream("discord_cdn", timeout=10, failure_threshold=10, reset_after=30),
+    Upstream("discord_api", timeout=15),   # dashboard REST calls made outside discord.py
+    Upstream("twimg", timeout=10, failure_threshold=10, reset_after=30),
+)}
+
+
+# ============================================================
+# CIRCUIT BREAKER & METRICS
+# ============================================================
+
+
+class CircuitBreaker:
+    """closed -> open after N consecutive failures -> half-open (one trial) after reset_after."""
+
+    def __init__(self, upstream: Upstream):
+        self.upstream = upstream
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.upstream.reset_after:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def release(self):
+        """A trial request ended without a verdict (cancelled); let the next call try instead."""
+        self._trial = False
+
+    def success(self):
+        if self.opened_at is not None:
+            logger.info(f"🌐 {self.upstream.name}: circuit closed")
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def failure(self):
+        self.failures += 1
+        self._trial = False
+        if self.opened_at is not None or self.failures >= self.upstream.failure_threshold:
+            if self.opened_at is None:
+                logger.warning(f"🌐 {self.upstream.name}: circuit opened after {self.failures} failures")
+            self.opened_at = time.monotonic()
+
+
+class UpstreamStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.short_circuited = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.retry_tokens = 10.0   # retry budget: each request earns 0.2, each retry spends 1
+
+    def spend_retry(self) -> bool:
+        if self.retry_tokens < 1:
+            return False
+        self.retry_tokens -= 1
+        self.retries += 1
+        return True
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.latencies)
+        pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1) if ordered else None
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "short_circuited": self.short_circuited,
+            "p50_ms": pick(0.50),
+            "p95_ms": pick(0.95),
+        }
+
+
+# ============================================================
+# CLIENT
+# ============================================================
+
+
+class Response:
+    __slots__ = ("status", "data")
+
+    def __init__(self, status: int, data):
+        self.status = status
+        self.data = data
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+class HttpClient:
+    def __init__(self):
+        self._sessions = {}   # event loop -> ClientSession (the dashboard thread runs its own loop)
+        self._breakers = {name: CircuitBreaker(u) for name, u in UPSTREAMS.items()}
+        self._stats = {name: UpstreamStats() for name in UPSTREAMS}
+
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_SECONDS,
+                keepalive_timeout=KEEPALIVE_SECONDS,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15, connect=5),
+                headers={"User-Agent": USER_AGENT},
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        """Close every loop's session on the loop that owns it (used on shutdown)."""
+        current = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                try:
+                    future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+                    await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+                except Exception as e:
+                    logger.warning(f"🌐 Could not close HTTP session on another loop: {e}")
+
+    async def request(self, upstream: str, method: str, url: str, *, read: str = "json", **kwargs) -> Response:
+        """Call an upstream. read is 'json', 'text' or 'bytes'.
+        Non-2xx responses are returned (4xx never trip the breaker); network errors, timeouts and
+        exhausted 5xx/429 retries count as failures. Raises UpstreamUnavailable while the circuit is
+        open and UpstreamError when the call couldn't complete."""
+        policy = UPSTREAMS[upstream]
+        breaker, stats = self._breakers[upstream], self._stats[upstream]
+        if not breaker.allow():
+            stats.short_circuited += 1
+            raise UpstreamUnavailable(upstream)
+        trial = breaker.state != "closed"
+
+        stats.requests += 1
+        stats.retry_tokens = min(10.0, stats.retry_tokens + 0.2)
+        timeout = aiohttp.ClientTimeout(total=policy.timeout)
+        retries = policy.retries if method == "GET" else 0
+        attempt = 0
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    async with self.session().request(method, url, timeout=timeout, **kwargs) as resp:
+                        if resp.status in RETRY_STATUSES:
+                            data = await resp.text()
+                        elif read == "json":
+                            data = await resp.json(content_type=None) if resp.status < 400 else await resp.text()
+                        elif read == "bytes":
+                            data = await resp.read()
+                        else:
+                            data = await resp.text()
+                        status = resp.status
+                    error = None
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    status, data, error = None, None, e
+                stats.latencies.append(time.monotonic() - started)
+
+                failed = error is not None or status in RETRY_STATUSES
+                if not failed:
+                    breaker.success()
+                    return Response(status, data)
+                if attempt < retries and stats.spend_retry():
+                    attempt += 1
+                    await asyncio.sleep(0.25 * 2 ** attempt * (0.5 + random.random()))
+                    continue
+
+                stats.errors += 1
+                breaker.failure()
+                if error is not None:
+                    raise UpstreamError(upstream, f"{type(error).__name__}: {error}" if str(error) else type(error).__name__)
+                return Response(status, data)
+        finally:
+            if trial:
+                # success()/failure() already cleared it unless the call was cancelled mid-flight
+                breaker.release()
+
+    async def get(self, upstream: str, url: str, **kwargs) -> Response:
+        return await self.request(upstream, "GET", url, **kwargs)
+
+    def stats(self) -> dict:
+        return {
+            name: {"state": self._breakers[name].state, **s.snapshot()}
+            for name, s in self._stats.items()
+        }
+
+
+client = HttpClient()
@@ -0,0 +1,352 @@
+"""
+Image Generation
+.img jobs go through one bounded queue served by a fixed number of workers.
+Users are served round-robin, so one person queueing prompts can't starve
+everyone else. The Imagen client (credentials + genai.Client) is built once and
+kept warm; credentials refresh when they expire and the client is only rebuilt
+after an auth failure. Google failures fall back to Pollinations, and finished
+images are cached by prompt hash so repeats come back instantly.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from api import pollinations_generate_image
+from config import GOOGLE_API_KEY, GOOGLE_CREDENTIALS_PATH, GOOGLE_CREDENTIALS_JSON, IMAGEGEN_CONCURRENCY
+from exceptions import ImageQueueFull
+from respcache import normalize
+
+logger = logging.getLogger(__name__)
+
+MAX_QUEUED = 20                     # waiting jobs across all users
+MAX_PER_USER = 2                    # waiting jobs per user
+CACHE_BYTES = 64 * 1024 * 1024      # generated images kept for repeat prompts
+LATENCY_SAMPLES = 200
+VERTEX_MODEL = "imagen-3.0-generate-001"
+STUDIO_MODEL = "imagen-3.0-generate-002"
+VERTEX_LOCATION = "us-central1"
+SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+
+# ============================================================
+# GOOGLE IMAGEN (VERTEX AI / AI STUDIO)
+# ============================================================
+
+
+class ImagenClient:
+    """Warm genai client. Blocking; called from the service's executor threads."""
+
+    def __init__(self):
+        self._client = None
+        self._model = None
+        self._creds = None
+        self._lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        return bool(GOOGLE_API_KEY or os.path.exists(GOOGLE_CREDENTIALS_PATH) or GOOGLE_CREDENTIALS_JSON)
+
+    def _build(self):
+        from google import genai
+        from google.oauth2 import service_account
+
+        creds_info = None
+        if os.path.exists(GOOGLE_CREDENTIALS_PATH):
+            logger.info(f"Loading credentials from file: {GOOGLE_CREDENTIALS_PATH}")
+            with open(GOOGLE_CREDENTIALS_PATH, 'r') as f:
+                creds_info = json.load(f)
+        elif GOOGLE_CREDENTIALS_JSON:
+            logger.info("Loading credentials from GOOGLE_CREDENTIALS_JSON environment variable.")
+            creds_info = json.loads(GOOGLE_CREDENTIALS_JSON)
+
+        if creds_info:
+            # Vertex AI Mode (Explicit Service Account Loading)
+            project_id = creds_info.get('project_id')
+            self._creds = service_account.Credentials.from_service_account_info(creds_info, scopes=SCOPES)
+            self._client = genai.Client(
+                vertexai=True,
+                project=project_id,
+                credentials=self._creds,
+                location=VERTEX_LOCATION
+            )
+            self._model = VERTEX_MODEL
+            logger.info(f"🎨 Imagen client ready via Vertex AI (Project: {project_id})")
+        else:
+            logger.warning("No Service Account found (file or env). Falling back to AI Studio (API Key).")
+            self._creds = None
+            self._client = genai.Client(api_key=GOOGLE_API_KEY)
+            self._model = STUDIO_MODEL
+
+    def _ready(self):
+        with self._lock:
+            if self._client is None:
+                self._build()
+            elif self._creds is not None and not self._creds.valid:
+                from google.auth.transport.requests import Request
+                self._creds.refresh(Request())
+            return self._client, self._model
+
+    def reset(self):
+        """Drop the client so the next call reloads credentials (after an auth error)."""
+        with self._lock:
+            self._client = None
+            self._creds = None
+
+    def generate(self, prompt: str):
+        from google.genai import types
+
+        client, model = self._ready()
+        response = client.models.generate_images(
+            model=model,
+            prompt=prompt,
+            config=types.GenerateImagesConfig(
+                number_of_images=1,
+                include_rai_reason=True,
+                output_mime_type='image/png'
+            )
+        )
+        if not response.generated_images:
+            return None
+
+        # The SDK nests image_bytes inside an 'image' object for Vertex AI
+        gen_img = response.generated_images[0]
+        if hasattr(gen_img, 'image') and hasattr(gen_img.image, 'image_bytes'):
+            return gen_img.image.image_bytes
+        return getattr(gen_img, 'image_bytes', None)
+
+
+def _describe(error: Exception) -> str:
+    err_msg = str(error)
+    if "401" in err_msg:
+        return "Google Auth Error (401). Ensure Vertex AI API is enabled in project."
+    if "403" in err_msg:
+        return "Google Permission Error (403). Check Service Account roles."
+    return f"Google Error: {err_msg}"
+
+
+# ============================================================
+# JOB QUEUE
+# ============================================================
+
+
+class Job:
+    __slots__ = ("user_id", "prompt", "key", "future", "queued_at", "started_at", "source")
+
+    def __init__(self, user_id: int, prompt: str, key: str):
+        self.user_id = user_id
+        self.prompt = prompt
+        self.key = key
+        self.future = asyncio.get_running_loop().create_future()  # -> (image bytes | None, error | None)
+        self.queued_at = time.monotonic()
+        self.started_at = None
+        self.source = None     # "cache", "google" or "pollinations" once finished
+
+
+class ImageService:
+    def __init__(self, concurrency: int):
+        self.concurrency = max(1, concurrency)
+        self.imagen = ImagenClient()
+        self._queues = OrderedDict()    # user_id -> deque[Job]; dict order is the round-robin order
+        self._queued = 0
+        self._running = 0
+        self._ready = None
+        self._workers = []
+        self._executor = None
+        self._cache = OrderedDict()     # prompt hash -> image bytes, LRU
+        self._cache_bytes = 0
+        self._waits = deque(maxlen=LATENCY_SAMPLES)
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.metrics = {
+            "submitted": 0,
+            "rejected": 0,
+            "cache_hits": 0,
+            "google": 0,
+            "fallbacks": 0,
+            "failures": 0,
+        }
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.sha256(normalize(prompt).encode("utf-8")).hexdigest()
+
+    def submit(self, user_id: int, prompt: str) -> Job:
+        """Queue a prompt. The job's future resolves to (image bytes, None) or (None, error message).
+        Raises ImageQueueFull if the queue (or this user's share of it) is full."""
+        job = Job(user_id, prompt, self._key(prompt))
+        cached = self._cache_get(job.key)
+        if cached is not None:
+            self.metrics["cache_hits"] += 1
+            job.source = "cache"
+            job.future.set_result((cached, None))
+            return job
+
+        user_queue = self._queues.get(user_id)
+        if user_queue is not None and len(user_queue) >= MAX_PER_USER:
+            self.metrics["rejected"] += 1
+            raise ImageQueueFull(f"You already have {MAX_PER_USER} images waiting.")
+        if self._queued >= MAX_QUEUED:
+            self.metrics["rejected"] += 1
+            raise ImageQueueFull("The image queue is full.")
+
+        self._ensure_workers()
+        self._queues.setdefault(user_id, deque()).append(job)
+        self._queued += 1
+        self.metrics["submitted"] += 1
+        self._ready.release()
+        return job
+
+    def position(self, job: Job) -> int:
+        """1-indexed place in line under round-robin, or 0 once the job has started."""
+        user_queue = self._queues.get(job.user_id)
+        if job.started_at is not None or user_queue is None or job not in user_queue:
+            return 0
+        depth = user_queue.index(job)  # full rounds before this job's turn
+        ahead, before = 0, True
+        for uid, q in self._queues.items():
+            if uid == job.user_id:
+                before = False
+            # Every user gets up to `depth` jobs in first; users ahead in the rotation get one more
+            ahead += min(len(q), depth) + (1 if before and len(q) > depth else 0)
+        return ahead + 1
+
+    def _next(self) -> Job:
+        user_id, user_queue = next(iter(self._queues.items()))
+        job = user_queue.popleft()
+        if user_queue:
+            self._queues.move_to_end(user_id)
+        else:
+            del self._queues[user_id]
+        self._queued -= 1
+        return job
+
+    def _ensure_workers(self):
+        if self._workers and not all(w.done() for w in self._workers):
+            return
+        self._ready = asyncio.Semaphore(0)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="imagen")
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def _worker(self):
+        while True:
+            await self._ready.acquire()
+            job = self._next()
+            job.started_at = time.monotonic()
+            self._waits.append(job.started_at - job.queued_at)
+            self._running += 1
+            try:
+                result = await self._run(job)
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.set_result((None, "Image generation was stopped."))
+                raise
+            except Exception as e:
+                logger.error(f"Error in image queue: {e}", exc_info=True)
+                result = (None, str(e))
+            finally:
+                self._running -= 1
+            self._latencies.append(time.monotonic() - job.started_at)
+            if not job.future.done():
+                job.future.set_result(result)
+
+    async def _run(self, job: Job):
+        cached = self._cache_get(job.key)  # An identical prompt may have finished while this one waited
+        if cached is not None:
+            self.metrics["cache_hits"] += 1
+            job.source = "cache"
+            return cached, None
+
+        google_error = None
+        if self.imagen.configured:
+            try:
+                image_bytes = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self.imagen.generate, job.prompt
+                )
+                if image_bytes:
+                    self.metrics["google"] += 1
+                    job.source = "google"
+                    self._cache_put(job.key, image_bytes)
+                    return image_bytes, None
+                google_error = "Google returned no image data."
+            except Exception as e:
+                logger.error(f"Imagen generation failed: {e}", exc_info=True)
+                google_error = _describe(e)
+                if "401" in str(e) or "403" in str(e):
+                    self.imagen.reset()
+        else:
+            google_error = "Google credentials (JSON file, Env Var, or API Key) are missing."
+
+        if self.imagen.configured:
+            logger.warning(f"🎨 Falling back to Pollinations: {google_error}")
+        image_bytes, error = await pollinations_generate_image(job.prompt)
+        if image_bytes:
+            self.metrics["fallbacks"] += 1
+            job.source = "pollinations"
+            self._cache_put(job.key, image_bytes)
+            return image_bytes, None
+        self.metrics["failures"] += 1
+        return None, f"{google_error} Fallback: {error}"
+
+    # --- Prompt cache ---
+
+    def _cache_get(self, key: str):
+        image_bytes = self._cache.get(key)
+        if image_bytes is not None:
+            self._cache.move_to_end(key)
+        return image_bytes
+
+    def _cache_put(self, key: str, image_bytes: bytes):
+        if len(image_bytes) > CACHE_BYTES:
+            return
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._cache_bytes -= len(old)
+        self._cache[key] = image_bytes
+        self._cache_bytes += len(image_bytes)
+        while self._cache_bytes > CACHE_BYTES:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= len(evicted)
+
+    async def close(self):
+        """Stop the workers and fail anything still waiting (used on shutdown)."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for user_queue in self._queues.values():
+            for job in user_queue:
+                if not job.future.done():
+                    job.future.set_result((None, "Image generation was stopped."))
+        self._queues.clear()
+        self._queued = 0
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """Queue depth, outcomes and wait/generation latency, for the dashboard."""
+        def pick(samples, q):
+            ordered = sorted(samples)
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2) if ordered else None
+
+        return {
+            **self.metrics,
+            "queued": self._queued,
+            "running": self._running,
+            "concurrency": self.concurrency,
+            "cached_images": len(self._cache),
+            "cache_mb": round(self._cache_bytes / (1024 * 1024), 1),
+            "wait_p50_sec": pick(self._waits, 0.50),
+            "wait_p95_sec": pick(self._waits, 0.95),
+            "gen_p50_sec": pick(self._latencies, 0.50),
+            "gen_p95_sec": pick(self._latencies, 0.95),
+        }
+
+
+service = ImageService(IMAGEGEN_CONCURRENCY)
@@ -301,6 +301,17 @@ KAOMOJI_POOL = [
 CLEAN_SUFFIXES = ["-ie", "-wie", "-y", "-wy"]
 
 
+# Precompiled once; aggressive_uwu runs on every message from a cursed user
+_URL_RE = re.compile(r"https?://[^\s]+")
+_CUSTOM_EMOJI_RE = re.compile(r"<a?:[^:]+:\d+>")
+_SIMPLE_MENTION_RE = re.compile(r"@\w+")
+_DISCORD_TOKEN_RE = re.compile(r"<(?:@[!&]?|#)\d+>")  # user, role and channel mentions
+_MEDIA_HOST_RE = re.compile(r"(tenor|giphy|imgur|cdn\.discordapp)\.[^\s]+")
+_MEDIA_EXT_RE = re.compile(r"\.(gif|png|jpg|jpeg|webp|mp4)[^\s]*", re.IGNORECASE)
+_NYA_RE = re.compile(r"n([aeiou])")
+_LR_TO_W = str.maketrans("lr", "ww")
+
+
 def aggressive_uwu(text: str) -> str:
     """
     Transforms text into a readable, high-quality UWU style.
@@ -316,18 +327,16 @@ def aggressive_uwu(text: str) -> str:
 
     # 1. LINK/MEDIA PURGE (ENHANCED)
     # Remove URLs (http/https)
-    text = re.sub(r"https?://[^\s]+", "", text)
+    text = _URL_RE.sub("", text)
 
     # Remove Discord-specific: emojis, mentions, channels, roles
-    text = re.sub(r"<a?:[^:]+:\d+>", "", text)  # Custom emojis
-    text = re.sub(r"@\w+", "", text)  # @mentions (simple)
-    text = re.sub(r"<@!?\d+>", "", text)  # User mentions (full)
-    text = re.sub(r"<@&\d+>", "", text)  # Role mentions
-    text = re.sub(r"<#\d+>", "", text)  # Channel links
+    text = _CUSTOM_EMOJI_RE.sub("", text)  # Custom emojis
+    text = _SIMPLE_MENTION_RE.sub("", text)  # @mentions (simple)
+    text = _DISCORD_TOKEN_RE.sub("", text)  # User/role mentions, channel links
 
     # Remove common image/gif hosts and file extensions
-    text = re.sub(r"(tenor|giphy|imgur|cdn\.discordapp)\.[^\s]+", "", text)
-    text = re.sub(r"\.(gif|png|jpg|jpeg|webp|mp4)[^\s]*", "", text, flags=re.IGNORECASE)
+    text = _MEDIA_HOST_RE.sub("", text)
+    text = _MEDIA_EXT_RE.sub("", text)
 
     if not text.strip():
         # User requested silent deletion for emoji/link only messages
@@ -337,10 +346,10 @@ def aggressive_uwu(text: str) -> str:
     text = text.lower()
 
     # 3. Nya-fication
-    text = re.sub(r"n([aeiou])", r"ny\1", text)
+    text = _NYA_RE.sub(r"ny\1", text)
 
     # 4. Fundamental Letter Swaps
-    text = text.replace("l", "w").replace("r", "w")
+    text = text.translate(_LR_TO_W)
 
     words = text.split()
     transformed_words = []
@@ -0,0 +1,116 @@
+"""
+Lore Datasets
+Static reference data (spirit hierarchy, tarot decks) lives in data/lore/*.json
+as one row per record. Nothing is read until a command first touches a dataset;
+rows become __slots__ records instead of per-entry dicts.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "lore")
+
+# ============================================================
+# RECORDS
+# ============================================================
+
+
+class Record:
+    """Fixed-field record. Supports entity["name"] / entity.get("alt_names", []) like the old dicts."""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, value)
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def get(self, field, default=None):
+        value = getattr(self, field, None)
+        return default if value is None else value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.__slots__[0]}={getattr(self, self.__slots__[0])!r})"
+
+
+class Entity(Record):
+    __slots__ = ("name", "alt_names", "rank", "domain", "legions", "tradition",
+                 "superior", "subordinates", "symbols", "description")
+
+
+class Card(Record):
+    __slots__ = ("name", "emojis", "attribution", "att2", "description")
+
+
+# ============================================================
+# LAZY DATASET
+# ============================================================
+
+
+class LazyDataset(Mapping):
+    """Read-only {key: record} mapping that loads its JSON file on first access."""
+
+    def __init__(self, filename: str, record_type):
+        self.filename = filename
+        self.record_type = record_type
+        self._records = None
+        self._keys = ()
+        self._lock = threading.Lock()  # The dashboard thread can get here too
+
+    @property
+    def loaded(self) -> bool:
+        return self._records is not None
+
+    def _load(self) -> dict:
+        if self._records is not None:
+            return self._records
+        with self._lock:
+            if self._records is None:
+                started = time.perf_counter()
+                with open(os.path.join(DATA_DIR, self.filename), encoding="utf-8") as f:
+                    raw = json.load(f)
+                fields = tuple(raw["fields"])
+                if fields != self.record_type.__slots__:
+                    raise ValueError(f"{self.filename}: fields {fields} don't match {self.record_type.__name__}")
+
+                make = self.record_type
+                records = {}
+                for key, *values in raw["records"]:
+                    records[key] = make(*(tuple(v) if isinstance(v, list) else v for v in values))
+                self._keys = tuple(records)
+                self._records = records
+                logger.info(f"📚 Loaded {self.filename}: {len(records)} records in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return self._records
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def key_tuple(self) -> tuple:
+        """All keys in file order (for random.choice without rebuilding a list per call)."""
+        self._load()
+        return self._keys
+
+
+HIERARCHY = LazyDataset("hierarchy.json", Entity)
+THOTH_DECK = LazyDataset("thoth.json", Card)
+RWS_DECK = LazyDataset("rws.json", Card)
+MANARA_DECK = LazyDataset("manara.json", Card)
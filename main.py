@@ -10,7 +10,6 @@ import os
 import logging
 import colorlog
 import time
-import aiohttp
 import signal
 import threading
 from datetime import datetime
@@ -23,6 +22,9 @@ from discord.ext import commands
 # --- Local Module Imports ---
 import tasks
 import battle
+import reaping
+import votes
+import rolequeue
 from items import aggressive_uwu
 from config import TOKEN, COMMAND_PREFIX, AUTHORIZED_ROLES, GUILD_ID
 from database import (
@@ -38,6 +40,13 @@ from database import (
 )
 from helpers import extract_gif_url
 import activity
+import httpclient
+import imagegen
+import membercache
+import msgcache
+import purge
+import triggers
+import webhooks
 
 # ============================================================
 # LOGGING CONFIGURATION (Colorized)
@@ -85,8 +94,14 @@ intents.message_content = True
 intents.guilds = True
 intents.members = True
 
-bot = commands.Bot(command_prefix=COMMAND_PREFIX, intents=intents, help_command=None)
-bot.aiohttp_session = None
+bot = commands.Bot(
+    command_prefix=COMMAND_PREFIX, intents=intents, help_command=None,
+    **membercache.cache_options(intents),
+)
+msgcache.cache.attach(bot)  # Before any cog registers reaction listeners
+membercache.cache.attach(bot)
+purge.engine.attach(bot)
+webhooks.pool.attach(bot)
 bot.owner_timezone = None
 bot.start_time = datetime.now()
 
@@ -132,14 +147,6 @@ async def on_ready():
 
     logger.info(f"Starting {bot.user} (ID: {bot.user.id})")
 
-    # 1. Setup external services
-    if bot.aiohttp_session is None:
-        bot.aiohttp_session = aiohttp.ClientSession()
-
-    from api import set_bot_session
-
-    set_bot_session(bot.aiohttp_session)
-
     # 2. Get owner timezone
     if bot.owner_timezone is None:
         your_user_id = 154814148054745088
@@ -148,7 +155,7 @@ async def on_ready():
 
     # 3. Initialize Database
     await init_db()
-    await battle.init_battle_db()
+    await reaping.load_state(bot)
     logger.info("✅ Database initialized")
 
     # 4. Load Cogs
@@ -158,6 +165,7 @@ async def on_ready():
         "cogs.quotes_cog",
         "cogs.games_cog",
         "cogs.tarot_cog",
+        "cogs.spirit_cog",
         "cogs.admin_cog",
         "cogs.image_cog",
         "cogs.twitter_cog",
@@ -174,6 +182,9 @@ async def on_ready():
         except Exception as e:
             logger.error(f"❌ Failed to load {cog}: {e}", exc_info=True)
 
+    # Cogs have registered their dashboard triggers; accept them from here on
+    triggers.bus.bind()
+
     # 5. Setup Background Tasks
     if not bot.guilds:
         logger.error("Bot is not in any guilds! Cannot start tasks.")
@@ -259,7 +270,7 @@ async def assign_muzzle_role(member: discord.Member):
     try:
         role = discord.utils.get(member.guild.roles, name=MUZZLE_ROLE_NAME)
         if role and role not in member.roles:
-            await member.add_roles(role, reason="Muzzle/UwU effect applied")
+            await rolequeue.add(member, role, reason="Muzzle/UwU effect applied")
     except Exception as e:
         logger.warning(f"Could not assign muzzle role to {member}: {e}")
 
@@ -269,26 +280,11 @@ async def remove_muzzle_role(member: discord.Member):
     try:
         role = discord.utils.get(member.guild.roles, name=MUZZLE_ROLE_NAME)
         if role and role in member.roles:
-            await member.remove_roles(role, reason="Muzzle/UwU effect expired/cleansed")
+            await rolequeue.remove(member, role, reason="Muzzle/UwU effect expired/cleansed")
     except Exception as e:
         logger.warning(f"Could not remove muzzle role from {member}: {e}")
 
 
-async def get_or_create_webhook(channel):
-    """Reuses existing webhook or creates one to mirror cursed users."""
-    if not isinstance(channel, discord.TextChannel):
-        return None
-    try:
-        webhooks = await channel.webhooks()
-        for wh in webhooks:
-            if wh.name == "EconomyBotProxy":
-                return wh
-        return await channel.create_webhook(name="EconomyBotProxy")
-    except Exception as e:
-        logger.error(f"Webhook error: {e}")
-        return None
-
-
 async def get_log_channel(guild):
     """Finds a log channel named 'bot-logs' or 'system-logs'."""
     if not guild: return None
@@ -316,10 +312,7 @@ async def on_message(message):
         has_dealer = any(r.name.lower() in ["dealer", "dc"] for r in message.author.roles)
         
         if not (is_admin or has_dealer or message.author.id == bot.user.id):
-            try:
-                await message.delete()
-            except Exception:
-                pass
+            purge.engine.reject(message)
             return
 
     # Check for active Muzzle or UwU effects
@@ -359,22 +352,8 @@ async def on_message(message):
             pass
 
         transformed_text = aggressive_uwu(message.content)
-        try:
-            if transformed_text:
-                webhook = await get_or_create_webhook(message.channel)
-                if webhook:
-                    await webhook.send(
-                        content=transformed_text,
-                        username=message.author.display_name,
-                        avatar_url=message.author.display_avatar.url,
-                        allowed_mentions=discord.AllowedMentions.none(),
-                    )
-                else:
-                    await message.channel.send(
-                        f"**{message.author.display_name}**: {transformed_text}"
-                    )
-        except Exception as e:
-            logger.error(f"Error in UwU webhook: {e}")
+        if transformed_text:
+            webhooks.pool.relay(message, transformed_text)
         return
 
     # Log activity
@@ -399,10 +378,12 @@ async def on_message(message):
 
 @bot.event
 async def on_raw_reaction_add(payload):
-    """Track reactions for active battles"""
+    """Record ballot votes and track reactions for active battles"""
     if payload.user_id == bot.user.id:
         return
 
+    await votes.handle_reaction(payload, added=True)
+
     channel = bot.get_channel(payload.channel_id)
     if not channel:
         return
@@ -410,6 +391,15 @@ async def on_raw_reaction_add(payload):
     await battle.on_reaction_during_battle(payload, channel)
 
 
+@bot.event
+async def on_raw_reaction_remove(payload):
+    """Withdraw ballot votes when a reaction is removed"""
+    if payload.user_id == bot.user.id:
+        return
+
+    await votes.handle_reaction(payload, added=False)
+
+
 @bot.check
 async def globally_block_commands(ctx):
     """Block all commands except in allowed channels or if muzzled/uwud."""
@@ -578,15 +568,29 @@ async def shutdown(sig, loop):
     except Exception as e:
         logger.error(f"Failed to flush activity on shutdown: {e}")
 
+    try:
+        await reaping.checkpoint()
+    except Exception as e:
+        logger.error(f"Failed to checkpoint reaping on shutdown: {e}")
+
+    try:
+        await rolequeue.queue.drain()
+    except Exception as e:
+        logger.error(f"Failed to drain role queue on shutdown: {e}")
+
     # 1. Stop the bot (disconnects from Discord)
     if not bot.is_closed():
         await bot.close()
         logger.info("📡 Discord connection closed.")
     
-    # 2. Close aiohttp session
-    if bot.aiohttp_session and not bot.aiohttp_session.closed:
-        await bot.aiohttp_session.close()
-        logger.info("🌐 HTTP session closed.")
+    try:
+        await imagegen.service.close()
+    except Exception as e:
+        logger.error(f"Failed to stop image queue on shutdown: {e}")
+
+    # 2. Close the shared HTTP session
+    await httpclient.client.close()
+    logger.info("🌐 HTTP session closed.")
     
     # 2.5 Stop dashboard (if active)
     # Threaded uvicorn doesn't always stop cleanly without force, 
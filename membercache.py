@@ -0,0 +1,172 @@
+"""
+Member Cache
+How much of each guild's member list the bot keeps in memory, chosen with
+MEMBER_CACHE_PROFILE:
+  full     every member, chunked at startup (discord.py's default; fine for small guilds)
+  lazy     no startup chunking; members are cached as they join or change
+  minimal  no member cache beyond the bot itself
+Code that needs a Member goes through MemberCache.get(): discord.py's cache, then
+a short-TTL LRU of members seen in messages or fetched over REST, then
+fetch_member (concurrent misses for one member share a request). Code that needs
+every member walks pages(), which slices the cache when the guild is chunked and
+otherwise streams the member list over REST a page at a time.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+import discord
+
+from config import MEMBER_CACHE_PROFILE
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("full", "lazy", "minimal")
+MAX_ENTRIES = 5000
+TTL = 300          # seconds a member outside discord.py's cache is trusted (roles can change unseen)
+PAGE_SIZE = 1000   # the member list endpoint's page size
+
+
+def cache_options(intents: discord.Intents, profile: str = MEMBER_CACHE_PROFILE) -> dict:
+    """commands.Bot keyword arguments for a cache profile."""
+    if profile not in PROFILES:
+        logger.warning(f"Unknown MEMBER_CACHE_PROFILE '{profile}', using 'full'")
+        profile = "full"
+    if profile == "minimal":
+        flags = discord.MemberCacheFlags.none()
+    else:
+        flags = discord.MemberCacheFlags.from_intents(intents)
+    return {"member_cache_flags": flags, "chunk_guilds_at_startup": profile == "full"}
+
+
+async def pages(guild: discord.Guild, size: int = PAGE_SIZE):
+    """Every member of the guild, in lists of up to `size`. A chunked guild is served
+    from memory; otherwise the list is streamed over REST and never held whole."""
+    if guild.chunked:
+        members = guild.members
+        for i in range(0, len(members), size):
+            yield members[i:i + size]
+        return
+
+    page = []
+    async for member in guild.fetch_members(limit=None):
+        page.append(member)
+        if len(page) >= size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+class MemberCache:
+    def __init__(self):
+        self._entries = OrderedDict()   # (guild_id, member_id) -> (Member, cached_at), LRU
+        self._inflight = {}             # (guild_id, member_id) -> Future[Member | None]
+        self.metrics = {
+            "gateway_hits": 0,
+            "hits": 0,
+            "fetches": 0,
+            "coalesced": 0,
+            "not_found": 0,
+            "expired": 0,
+            "seen": 0,
+        }
+
+    def attach(self, bot):
+        bot.add_listener(self._on_message, "on_message")
+        bot.add_listener(self._on_member_update, "on_member_update")
+        bot.add_listener(self._on_raw_member_remove, "on_raw_member_remove")
+
+    # --- Lookups ---
+
+    def peek(self, guild: discord.Guild, member_id):
+        """Member from memory only (discord.py's cache or the LRU), or None."""
+        member_id = int(member_id)
+        member = guild.get_member(member_id)
+        if member is not None:
+            self.metrics["gateway_hits"] += 1
+            return member
+
+        key = (guild.id, member_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] >= TTL:
+            del self._entries[key]
+            self.metrics["expired"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.metrics["hits"] += 1
+        return entry[0]
+
+    async def get(self, guild: discord.Guild, member_id):
+        """Like guild.get_member, but fetches on a miss. None if they aren't in the guild."""
+        member = self.peek(guild, member_id)
+        if member is not None:
+            return member
+        return await self.fetch(guild, member_id)
+
+    async def fetch(self, guild: discord.Guild, member_id):
+        """Member over REST (current roles), refreshing the LRU. None if they aren't in the guild."""
+        key = (guild.id, int(member_id))
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.metrics["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        member = None
+        try:
+            self.metrics["fetches"] += 1
+            member = await guild.fetch_member(key[1])
+            self.put(member)
+        except discord.NotFound:
+            self.metrics["not_found"] += 1
+        except discord.HTTPException as e:
+            logger.warning(f"Could not fetch member {key[1]}: {e}")
+        finally:
+            del self._inflight[key]
+            future.set_result(member)
+        return member
+
+    def put(self, member: discord.Member):
+        key = (member.guild.id, member.id)
+        self._entries[key] = (member, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, guild_id: int, member_id: int):
+        self._entries.pop((guild_id, member_id), None)
+
+    # --- Gateway events ---
+
+    async def _on_message(self, message: discord.Message):
+        # Message authors arrive with their roles; keeping them covers most lookups without REST
+        author = message.author
+        if isinstance(author, discord.Member) and message.guild.get_member(author.id) is None:
+            self.put(author)
+            self.metrics["seen"] += 1
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        if (after.guild.id, after.id) in self._entries:
+            self.put(after)
+
+    async def _on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self.invalidate(payload.guild_id, payload.user.id)
+
+    def stats(self) -> dict:
+        lookups = self.metrics["gateway_hits"] + self.metrics["hits"] + self.metrics["fetches"] + self.metrics["coalesced"]
+        served = lookups - self.metrics["fetches"]
+        return {
+            **self.metrics,
+            "profile": MEMBER_CACHE_PROFILE,
+            "entries": len(self._entries),
+            "hit_rate": round(served / lookups, 3) if lookups else None,
+        }
+
+
+cache = MemberCache()
@@ -0,0 +1,684 @@
+"""
+Schema Migrations
+Numbered, one-transaction-per-step schema changes recorded in schema_version.
+database.init_db() calls migrate(); once the schema is current a start is a
+single version check. Add new steps to the end of MIGRATIONS — never edit one
+that has shipped.
+"""
+
+import logging
+import re
+import time
+
+import aiosqlite
+
+from config import DB_FILE
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# 001 — BASELINE (everything init_db used to create)
+# ============================================================
+
+BASELINE_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS quotes (id INTEGER PRIMARY KEY AUTOINCREMENT, quote TEXT UNIQUE)",
+    "CREATE TABLE IF NOT EXISTS user_timezones (user_id TEXT PRIMARY KEY, timezone TEXT, city TEXT)",
+    "CREATE TABLE IF NOT EXISTS activity_hourly (hour TEXT PRIMARY KEY, count INTEGER, last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+    "CREATE TABLE IF NOT EXISTS activity_users (user_id TEXT PRIMARY KEY, count INTEGER, last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+    "CREATE TABLE IF NOT EXISTS tarot_settings (guild_id TEXT PRIMARY KEY, deck_name TEXT DEFAULT 'thoth')",
+    """
+    CREATE TABLE IF NOT EXISTS key_settings (
+        id        INTEGER PRIMARY KEY AUTOINCREMENT,
+        image_url TEXT    NOT NULL,
+        label     TEXT    DEFAULT '',
+        is_active INTEGER DEFAULT 0,
+        added_at  TEXT    DEFAULT (datetime('now'))
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS key_config (
+        key   TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS gif_tracker (gif_url TEXT PRIMARY KEY, count INTEGER DEFAULT 1, last_sent_by TEXT, last_sent_at TIMESTAMP)",
+    "CREATE TABLE IF NOT EXISTS balances (user_id TEXT PRIMARY KEY, balance INTEGER DEFAULT 0)",
+    "CREATE TABLE IF NOT EXISTS pink_votes (voted_id TEXT NOT NULL, voter_id TEXT NOT NULL, timestamp REAL NOT NULL, PRIMARY KEY (voted_id, voter_id))",
+    "CREATE TABLE IF NOT EXISTS masochist_roles (user_id TEXT PRIMARY KEY, removal_time REAL NOT NULL)",
+    """
+    CREATE TABLE IF NOT EXISTS color_roles (
+        color_name TEXT PRIMARY KEY,
+        role_id TEXT NOT NULL,
+        vote_threshold INTEGER NOT NULL,
+        duration_days REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS color_role_votes (
+        color_name TEXT NOT NULL,
+        voted_id TEXT NOT NULL,
+        voter_id TEXT NOT NULL,
+        timestamp REAL NOT NULL,
+        PRIMARY KEY (color_name, voted_id, voter_id),
+        FOREIGN KEY (color_name) REFERENCES color_roles(color_name) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS color_role_expirations (
+        user_id TEXT NOT NULL,
+        role_id TEXT NOT NULL,
+        color_name TEXT NOT NULL,
+        removal_time REAL NOT NULL,
+        PRIMARY KEY (user_id, role_id),
+        FOREIGN KEY (color_name) REFERENCES color_roles(color_name) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS trials (
+        user_id TEXT NOT NULL,
+        guild_id TEXT NOT NULL,
+        start_time REAL NOT NULL,
+        end_time REAL NOT NULL,
+        message_id TEXT,
+        status TEXT DEFAULT 'pending',
+        PRIMARY KEY (user_id, guild_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS command_usage (
+        command_name TEXT PRIMARY KEY,
+        count INTEGER DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_inventory (
+        user_id TEXT NOT NULL,
+        item_name TEXT NOT NULL,
+        quantity INTEGER DEFAULT 0,
+        PRIMARY KEY (user_id, item_name)
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS global_settings (setting_key TEXT PRIMARY KEY, setting_value TEXT)",
+    "CREATE TABLE IF NOT EXISTS last_shard_claim (user_id TEXT PRIMARY KEY, last_claim REAL)",
+    """
+    CREATE TABLE IF NOT EXISTS active_effects (
+        user_id TEXT NOT NULL,
+        effect_name TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (user_id, effect_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS global_cooldowns (
+        name TEXT PRIMARY KEY,
+        expires_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS system_settings (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_claims (
+        user_id TEXT NOT NULL,
+        claim_type TEXT NOT NULL,
+        last_claim_date TEXT NOT NULL,
+        PRIMARY KEY (user_id, claim_type)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS reaping_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        active INTEGER DEFAULT 0,
+        pool_amount INTEGER DEFAULT 0,
+        games_count INTEGER DEFAULT 0,
+        started_at REAL,
+        expires_at REAL,
+        channel_id TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS reaping_participants (
+        user_id TEXT PRIMARY KEY,
+        contribution INTEGER DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS quote_drops (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        quote TEXT UNIQUE,
+        added_by TEXT,
+        added_at REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_activity_users_count ON activity_users(count DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_color_votes_target ON color_role_votes(color_name, voted_id)",
+    "CREATE INDEX IF NOT EXISTS idx_color_votes_voter ON color_role_votes(voter_id)",
+    """
+    CREATE TABLE IF NOT EXISTS fade_stats (
+        user_id TEXT PRIMARY KEY,
+        wins INTEGER DEFAULT 0,
+        losses INTEGER DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS follow_requests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        requester_id TEXT NOT NULL,
+        username TEXT NOT NULL,
+        requested_at REAL NOT NULL,
+        status TEXT DEFAULT 'pending'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS hof_settings (
+        guild_id TEXT PRIMARY KEY,
+        channel_id TEXT,
+        threshold INTEGER DEFAULT 3,
+        emojis TEXT DEFAULT '["⭐"]',
+        ignored_channels TEXT DEFAULT '[]',
+        locked_messages TEXT DEFAULT '[]',
+        trashed_messages TEXT DEFAULT '[]',
+        blacklisted_users TEXT DEFAULT '[]'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS hof_entries (
+        orig_message_id TEXT PRIMARY KEY,
+        orig_channel_id TEXT NOT NULL,
+        author_id TEXT NOT NULL,
+        hof_message_id TEXT,
+        star_count INTEGER DEFAULT 0,
+        content TEXT,
+        image_url TEXT,
+        jump_url TEXT,
+        voice_url TEXT,
+        trigger_emoji TEXT,
+        created_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users_xp (
+        user_id TEXT PRIMARY KEY,
+        xp INTEGER DEFAULT 0,
+        level INTEGER DEFAULT 0,
+        last_xp_time REAL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS level_settings (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS level_multipliers (
+        target_id TEXT PRIMARY KEY,
+        multiplier REAL DEFAULT 1.0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS reward_roles (
+        level INTEGER PRIMARY KEY,
+        role_id TEXT NOT NULL,
+        stack_role INTEGER DEFAULT 1
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS server_roles_cache (
+        role_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        color TEXT,
+        position INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS server_channels_cache (
+        channel_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        type TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_profile_cache (
+        user_id TEXT PRIMARY KEY,
+        username TEXT NOT NULL,
+        avatar_url TEXT,
+        last_updated INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_profile_updated ON user_profile_cache (last_updated)",
+    """
+    CREATE TABLE IF NOT EXISTS rank_card_prefs (
+        user_id      TEXT PRIMARY KEY,
+        font         TEXT DEFAULT 'Avenger',
+        theme        TEXT DEFAULT 'vampire',
+        display_type TEXT DEFAULT 'username'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS channel_config (
+        role TEXT PRIMARY KEY,
+        channel_id TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS command_restrictions (
+        command_name TEXT,
+        channel_role TEXT,
+        is_allowed INTEGER DEFAULT 0,
+        PRIMARY KEY(command_name, channel_role)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS numerology_number_desc (
+        num INTEGER PRIMARY KEY,
+        description TEXT DEFAULT ''
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS numerology_combos (
+        primary_num INTEGER NOT NULL,
+        secondary_num INTEGER NOT NULL,
+        combo_desc TEXT DEFAULT '',
+        PRIMARY KEY (primary_num, secondary_num)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS item_prices (
+        item_key TEXT PRIMARY KEY,
+        price INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cron_jobs (
+        name TEXT PRIMARY KEY,
+        last_run REAL,
+        last_due REAL,
+        next_run REAL,
+        last_status TEXT,
+        last_error TEXT,
+        last_lateness REAL,
+        run_count INTEGER DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cron_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job TEXT NOT NULL,
+        due_at REAL,
+        started_at REAL,
+        finished_at REAL,
+        status TEXT,
+        error TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cron_runs_job ON cron_runs (job, id DESC)",
+    """
+    CREATE TABLE IF NOT EXISTS battle_stats (
+        user_id TEXT PRIMARY KEY,
+        username TEXT,
+        wins INTEGER DEFAULT 0,
+        total_reactions INTEGER DEFAULT 0
+    )
+    """,
+]
+
+# Columns added to tables after they first shipped: (table, column, declaration)
+BASELINE_COLUMNS = [
+    ("reaping_state", "channel_id", "TEXT"),
+    ("hof_settings", "blacklisted_users", "TEXT DEFAULT '[]'"),
+    ("hof_entries", "voice_url", "TEXT"),
+    ("hof_entries", "trigger_emoji", "TEXT"),
+    ("reward_roles", "stack_role", "INTEGER DEFAULT 1"),
+    ("rank_card_prefs", "display_type", "TEXT DEFAULT 'username'"),
+]
+
+
+async def _columns(conn, table: str) -> list:
+    async with conn.execute(f"PRAGMA table_info({table})") as cursor:
+        return [row[1] for row in await cursor.fetchall()]
+
+
+async def _seed_color_roles(conn):
+    """Move the static pink tables over to color_roles (skipped if colours are already configured)."""
+    from config import ROLE_ALIASES
+    masochist_id = str(ROLE_ALIASES.get("masochist", "1167184822129664113"))
+    vote_threshold = 10  # Historic default
+
+    async with conn.execute("SELECT COUNT(*) FROM color_roles") as cur:
+        row = await cur.fetchone()
+        if row and row[0] > 0:
+            return
+
+    await conn.execute(
+        "INSERT OR IGNORE INTO color_roles (color_name, role_id, vote_threshold, duration_days) VALUES (?, ?, ?, ?)",
+        ('pink', masochist_id, vote_threshold, 2.0)
+    )
+    await conn.execute(
+        "INSERT OR IGNORE INTO color_roles (color_name, role_id, vote_threshold, duration_days) VALUES (?, ?, ?, ?)",
+        ('green', '', 7, 2.0)
+    )
+    await conn.execute(
+        "INSERT OR IGNORE INTO color_role_votes (color_name, voted_id, voter_id, timestamp) "
+        "SELECT 'pink', voted_id, voter_id, timestamp FROM pink_votes"
+    )
+    await conn.execute(
+        "INSERT OR IGNORE INTO color_role_expirations (user_id, role_id, color_name, removal_time) "
+        "SELECT user_id, ?, 'pink', removal_time FROM masochist_roles",
+        (masochist_id,)
+    )
+
+
+async def m001_baseline(conn):
+    # Very old active_effects tables used different column names and are rebuilt
+    columns = await _columns(conn, "active_effects")
+    if columns and "expires_at" not in columns:
+        logger.info("Outdated active_effects table found. Migrating...")
+        await conn.execute("DROP TABLE active_effects")
+
+    for statement in BASELINE_SCHEMA:
+        await conn.execute(statement)
+
+    for table, column, decl in BASELINE_COLUMNS:
+        if column not in await _columns(conn, table):
+            logger.info(f"Adding {column} to {table}...")
+            await conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+    await _seed_color_roles(conn)
+
+
+# ============================================================
+# 002 — HOF → QUOTE DROPS BACKFILL
+# ============================================================
+
+_EMOJI_RE = re.compile(
+    r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
+    r'\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251'
+    r'\U0001F900-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF'
+    r'\U00002600-\U000026FF\U0000FE0F]+'
+)
+
+
+async def m002_backfill_hof_quote_drops(conn):
+    """Short text-only HOF entries become quote drops (used to run on every start)."""
+    async with conn.execute("""
+        SELECT content, author_id FROM hof_entries
+        WHERE hof_message_id IS NOT NULL
+          AND content IS NOT NULL AND content != ''
+          AND (image_url IS NULL OR image_url = '')
+          AND (voice_url IS NULL OR voice_url = '')
+    """) as cursor:
+        hof_rows = await cursor.fetchall()
+
+    added = 0
+    for content, author in hof_rows:
+        text = re.sub(r'<a?:\w+:\d+>', '', content.strip())
+        text = _EMOJI_RE.sub('', text).strip()
+        if re.search(r'https?://\S+', text):
+            continue
+        if not text or len(text) > 25:
+            continue
+        await conn.execute(
+            "INSERT OR IGNORE INTO quote_drops (quote, added_by, added_at) VALUES (?, ?, ?)",
+            (text, author, time.time())
+        )
+        added += 1
+    if added:
+        logger.info(f"📜 Backfilled {added} HoF entries into quote_drops.")
+
+
+# ============================================================
+# 003 — SECONDARY INDEXES
+# ============================================================
+
+
+async def m003_secondary_indexes(conn):
+    # Lookups that were full scans: HOF by author, rank by XP, effect and colour expiry sweeps
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_hof_entries_author ON hof_entries (author_id)")
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_users_xp_xp ON users_xp (xp)")
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_active_effects_expires ON active_effects (expires_at)")
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_color_expirations_time ON color_role_expirations (removal_time)")
+    # Duplicates of the UNIQUE / PRIMARY KEY autoindexes; only cost writes
+    await conn.execute("DROP INDEX IF EXISTS idx_quotes_text")
+    await conn.execute("DROP INDEX IF EXISTS idx_user_timezones_id")
+
+
+# ============================================================
+# 004 — RANK INDEXES
+# ============================================================
+
+
+async def m004_rank_indexes(conn):
+    # Covering indexes: leaderboards and the rank index load read these without touching the tables
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_users_xp_board ON users_xp (level DESC, xp DESC, user_id)")
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_balances_board ON balances (balance DESC, user_id)")
+    # Pre-migration databases have this from init_db; idx_users_xp_board supersedes it
+    await conn.execute("DROP INDEX IF EXISTS idx_xp_leaderboard")
+
+
+# ============================================================
+# 005 — HOF AUTHOR STATS
+# ============================================================
+
+HOF_DAY = 86400  # hof_author_daily buckets entries by the UTC day they were first tracked
+
+
+async def m005_hof_author_stats(conn):
+    """Per-author HOF aggregates kept in step by hof_cog._upsert_entry."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS hof_author_stats (
+            author_id  TEXT PRIMARY KEY,
+            inductions INTEGER NOT NULL DEFAULT 0,
+            stars      INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_hof_author_stats_stars ON hof_author_stats (stars DESC, author_id)")
+    # Only the last ~31 days are kept; weekly/monthly boards sum these buckets
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS hof_author_daily (
+            day        INTEGER NOT NULL,
+            author_id  TEXT NOT NULL,
+            inductions INTEGER NOT NULL DEFAULT 0,
+            stars      INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, author_id)
+        )
+    """)
+    await conn.execute("DELETE FROM hof_author_stats")
+    await conn.execute("DELETE FROM hof_author_daily")
+    await conn.execute("""
+        INSERT INTO hof_author_stats (author_id, inductions, stars)
+        SELECT author_id, COUNT(*), COALESCE(SUM(star_count), 0)
+        FROM hof_entries WHERE hof_message_id IS NOT NULL
+        GROUP BY author_id
+    """)
+    await conn.execute(f"""
+        INSERT INTO hof_author_daily (day, author_id, inductions, stars)
+        SELECT CAST(created_at / {HOF_DAY} AS INTEGER), author_id, COUNT(*), COALESCE(SUM(star_count), 0)
+        FROM hof_entries
+        WHERE hof_message_id IS NOT NULL AND created_at >= ?
+        GROUP BY 1, 2
+    """, ((int(time.time() // HOF_DAY) - 31) * HOF_DAY,))
+
+
+# ============================================================
+# 006 — RESPONSE CACHE
+# ============================================================
+
+
+async def m006_response_cache(conn):
+    """Spillover for respcache sources marked persist=True (survives restarts)."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS response_cache (
+            source      TEXT NOT NULL,
+            key         TEXT NOT NULL,
+            value       TEXT NOT NULL,
+            fetched_at  REAL NOT NULL,
+            stale_until REAL NOT NULL,
+            PRIMARY KEY (source, key)
+        )
+    """)
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_response_cache_stale ON response_cache (stale_until)")
+
+
+# ============================================================
+# 007 — GEOCODE CACHE
+# ============================================================
+
+
+async def m007_geocode_cache(conn):
+    """Resolved places by normalized query; city is NULL for a remembered no-match."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS geocode_cache (
+            query      TEXT PRIMARY KEY,
+            city       TEXT,
+            timezone   TEXT,
+            lat        REAL,
+            lon        REAL,
+            country    TEXT,
+            fetched_at REAL NOT NULL
+        )
+    """)
+    # Geocoding moved out of the generic response cache; those rows had no coordinates
+    await conn.execute("DELETE FROM response_cache WHERE source = 'geocode'")
+
+
+# ============================================================
+# 008 — TWITTER ACCOUNTS
+# ============================================================
+
+
+async def m008_twitter_accounts(conn):
+    """X screen name -> account id (ids never change), plus the last seen profile bits."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS twitter_accounts (
+            screen_name TEXT PRIMARY KEY,
+            user_id     TEXT NOT NULL,
+            name        TEXT,
+            avatar_url  TEXT,
+            fetched_at  REAL NOT NULL
+        )
+    """)
+
+
+# ============================================================
+# 009 — BULLETIN MESSAGES
+# ============================================================
+
+
+async def m009_bulletin_messages(conn):
+    """Ids of messages posted in the bulletin channel, so purges don't page history."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS bulletin_messages (
+            message_id TEXT PRIMARY KEY,
+            channel_id TEXT NOT NULL
+        )
+    """)
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_bulletin_messages_channel ON bulletin_messages (channel_id)"
+    )
+
+
+# ============================================================
+# 010 — CHANNEL WEBHOOKS
+# ============================================================
+
+
+async def m010_channel_webhooks(conn):
+    """Relay webhook per channel (id + token), so the UwU relay doesn't list/create webhooks per message."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS channel_webhooks (
+            channel_id TEXT PRIMARY KEY,
+            webhook_id TEXT NOT NULL,
+            token TEXT NOT NULL
+        )
+    """)
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+MIGRATIONS = [
+    (1, "baseline", m001_baseline),
+    (2, "backfill_hof_quote_drops", m002_backfill_hof_quote_drops),
+    (3, "secondary_indexes", m003_secondary_indexes),
+    (4, "rank_indexes", m004_rank_indexes),
+    (5, "hof_author_stats", m005_hof_author_stats),
+    (6, "response_cache", m006_response_cache),
+    (7, "geocode_cache", m007_geocode_cache),
+    (8, "twitter_accounts", m008_twitter_accounts),
+    (9, "bulletin_messages", m009_bulletin_messages),
+    (10, "channel_webhooks", m010_channel_webhooks),
+]
+
+LATEST = MIGRATIONS[-1][0]
+
+_current = False  # Set once this process has seen the schema at LATEST
+
+
+async def _version(conn) -> int:
+    async with conn.execute("SELECT MAX(version) FROM schema_version") as cursor:
+        row = await cursor.fetchone()
+        return row[0] or 0
+
+
+async def migrate(db_file: str = DB_FILE) -> int:
+    """Apply pending migrations in order, each in its own transaction. Returns the schema version."""
+    global _current
+    if _current:
+        return LATEST
+
+    async with aiosqlite.connect(db_file, timeout=20.0, isolation_level=None) as conn:
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version     INTEGER PRIMARY KEY,
+                name        TEXT NOT NULL,
+                applied_at  REAL NOT NULL,
+                duration_ms REAL
+            )
+            """
+        )
+        version = await _version(conn)
+
+        for number, name, apply in MIGRATIONS:
+            if number <= version:
+                continue
+            started = time.perf_counter()
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                # The bot and dashboard can race here; re-check under the write lock
+                if await _version(conn) >= number:
+                    await conn.execute("ROLLBACK")
+                    version = number
+                    continue
+                await apply(conn)
+                duration_ms = (time.perf_counter() - started) * 1000
+                await conn.execute(
+                    "INSERT INTO schema_version (version, name, applied_at, duration_ms) VALUES (?, ?, ?, ?)",
+                    (number, name, time.time(), duration_ms),
+                )
+                await conn.execute("COMMIT")
+            except BaseException:
+                await conn.execute("ROLLBACK")
+                logger.error(f"❌ Migration {number:03d} {name} failed; schema left at version {version}.")
+                raise
+            version = number
+            logger.info(f"🗄️ Applied migration {number:03d} {name} in {duration_ms:.0f}ms")
+
+    _current = True
+    return version
+
+
+async def applied() -> list:
+    """Migration history, for the dashboard."""
+    async with aiosqlite.connect(DB_FILE, timeout=20.0) as conn:
+        async with conn.execute(
+            "SELECT version, name, applied_at, duration_ms FROM schema_version ORDER BY version"
+        ) as cursor:
+            rows = await cursor.fetchall()
+    return [{"version": r[0], "name": r[1], "applied_at": r[2], "duration_ms": r[3]} for r in rows]
@@ -0,0 +1,155 @@
+"""
+Message Cache
+Shared lookup for messages the cogs keep re-reading: the reacted message on
+every HOF reaction and reply context for HOF, .gem, =quote and friends. Order is
+discord.py's own message cache, then a short-TTL LRU of messages fetched over
+REST, then fetch_message (concurrent misses for one id share a request).
+Edits, deletes and any reaction change drop entries, and a fetch that overlaps
+a reaction change on its message isn't cached, so reaction counts read from
+the LRU are never older than the last reaction event.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 500
+TTL = 300   # seconds a REST-fetched message is trusted
+
+
+class MessageCache:
+    def __init__(self):
+        self._bot = None
+        self._entries = OrderedDict()   # message_id -> (Message, cached_at), LRU
+        self._inflight = {}             # message_id -> Future[Message]
+        self._stale = set()             # in-flight fetches whose message changed meanwhile
+        self.metrics = {
+            "gateway_hits": 0,
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "expired": 0,
+            "invalidations": 0,
+            "uncached_fetches": 0,
+        }
+
+    def attach(self, bot):
+        """Register the gateway listeners. Called before the cogs load so a reacted
+        message is dropped before any cog's reaction handler reads it."""
+        self._bot = bot
+        bot.add_listener(self._on_raw_message_edit, "on_raw_message_edit")
+        bot.add_listener(self._on_raw_message_delete, "on_raw_message_delete")
+        bot.add_listener(self._on_raw_bulk_message_delete, "on_raw_bulk_message_delete")
+        bot.add_listener(self._on_raw_reaction_change, "on_raw_reaction_add")
+        bot.add_listener(self._on_raw_reaction_change, "on_raw_reaction_remove")
+        bot.add_listener(self._on_raw_reaction_change, "on_raw_reaction_clear")
+        bot.add_listener(self._on_raw_reaction_change, "on_raw_reaction_clear_emoji")
+
+    # --- Lookups ---
+
+    def _from_gateway(self, message_id: int):
+        if self._bot is None:
+            return None
+        return discord.utils.find(lambda m: m.id == message_id, reversed(self._bot.cached_messages))
+
+    async def get(self, channel, message_id) -> discord.Message:
+        """Like channel.fetch_message (same exceptions), but served from cache when possible."""
+        message_id = int(message_id)
+        message = self._from_gateway(message_id)
+        if message is not None:
+            self.metrics["gateway_hits"] += 1
+            return message
+
+        entry = self._entries.get(message_id)
+        if entry is not None:
+            if time.monotonic() - entry[1] < TTL:
+                self._entries.move_to_end(message_id)
+                self.metrics["hits"] += 1
+                return entry[0]
+            del self._entries[message_id]
+            self.metrics["expired"] += 1
+
+        pending = self._inflight.get(message_id)
+        if pending is not None:
+            self.metrics["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        self.metrics["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[message_id] = future
+        try:
+            message = await channel.fetch_message(message_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here so lone callers don't trigger "never retrieved" warnings
+            raise
+        else:
+            # The snapshot may predate a reaction/edit seen while it was in flight
+            if message_id in self._stale:
+                self.metrics["uncached_fetches"] += 1
+            else:
+                self.put(message)
+            future.set_result(message)
+            return message
+        finally:
+            del self._inflight[message_id]
+            self._stale.discard(message_id)
+
+    async def get_reference(self, message: discord.Message) -> discord.Message:
+        """The message `message` replies to. Raises like fetch_message (or ValueError if it isn't a reply)."""
+        ref = message.reference
+        if ref is None or not ref.message_id:
+            raise ValueError("Message is not a reply")
+        if isinstance(ref.resolved, discord.Message):
+            return ref.resolved
+        return await self.get(message.channel, ref.message_id)
+
+    def put(self, message: discord.Message):
+        self._entries[message.id] = (message, time.monotonic())
+        self._entries.move_to_end(message.id)
+        while len(self._entries) > MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, message_id):
+        message_id = int(message_id)
+        if message_id in self._inflight:
+            self._stale.add(message_id)
+        if self._entries.pop(message_id, None) is not None:
+            self.metrics["invalidations"] += 1
+
+    # --- Gateway events ---
+
+    async def _on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        self.invalidate(payload.message_id)
+
+    async def _on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self.invalidate(payload.message_id)
+
+    async def _on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for message_id in payload.message_ids:
+            self.invalidate(message_id)
+
+    async def _on_raw_reaction_change(self, payload):
+        # Counts aren't patched onto cached copies: a REST snapshot may or may not
+        # already include this reaction, so the only exact answer is a refetch
+        self.invalidate(payload.message_id)
+
+    def stats(self) -> dict:
+        lookups = self.metrics["gateway_hits"] + self.metrics["hits"] + self.metrics["misses"] + self.metrics["coalesced"]
+        served = lookups - self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": len(self._entries),
+            "hit_rate": round(served / lookups, 3) if lookups else None,
+        }
+
+
+cache = MessageCache()
@@ -1,6 +1,7 @@
 """
 Numerology Engine for ApeBot
-Calculates universal day numbers and fetches readings from the database.
+Calculates universal day numbers from a precomputed date calendar and builds
+readings from the description/combo tables held in memory by database.py.
 """
 
 from datetime import date, timedelta
@@ -59,9 +60,25 @@ DEFAULT_COMBOS = {
 }
 
 
+def _digits(n: int) -> list:
+    """Decimal digits of n, most significant first (integer arithmetic, no str())."""
+    if n == 0:
+        return [0]
+    out = []
+    while n:
+        n, r = divmod(n, 10)
+        out.append(r)
+    out.reverse()
+    return out
+
+
 def _digit_sum(n: int) -> int:
     """Sum all digits of n."""
-    return sum(int(d) for d in str(n))
+    total = 0
+    while n:
+        n, r = divmod(n, 10)
+        total += r
+    return total
 
 
 def _reduce_to_numerology(n: int) -> tuple:
@@ -101,49 +118,22 @@ def _primary_raw_sum(d: date) -> int:
     Rule: if the day number itself is a master number (11, 22, 33), add it
     as a whole rather than splitting into digits. All other components split normally.
     """
-    if d.day in MASTER_DAYS:
-        day_part = d.day
-    else:
-        day_part = sum(int(ch) for ch in str(d.day))
-
-    month_part = sum(int(ch) for ch in str(d.month))
-    year_part  = sum(int(ch) for ch in str(d.year))
-    return day_part + month_part + year_part
+    day_part = d.day if d.day in MASTER_DAYS else _digit_sum(d.day)
+    return day_part + _digit_sum(d.month) + _digit_sum(d.year)
 
 
-def calculate_primary(d: date) -> dict:
-    """
-    Primary (Universal Day) = sum of digits of day + month + year.
-    Master-number days (11, 22, 33) contribute their full value, not digit-sum.
-    Returns {reduced, unreduced}.
-    """
-    raw_sum = _primary_raw_sum(d)
-    reduced, unreduced = _reduce_to_numerology(raw_sum)
+def _compute_primary(d: date) -> dict:
+    reduced, unreduced = _reduce_to_numerology(_primary_raw_sum(d))
     return {"reduced": reduced, "unreduced": unreduced}
 
 
-def calculate_secondary(d: date) -> dict:
-    """
-    Secondary = reduce the day number.
-    Master-number days are preserved as master numbers.
-    Returns {reduced, unreduced}.
-    """
+def _compute_secondary(d: date) -> dict:
     if d.day in MASTER_DAYS:
         return {"reduced": d.day, "unreduced": d.day}
-    raw_sum = sum(int(ch) for ch in str(d.day))
-    reduced, unreduced = _reduce_to_numerology(raw_sum)
+    reduced, unreduced = _reduce_to_numerology(_digit_sum(d.day))
     return {"reduced": reduced, "unreduced": unreduced}
 
 
-def calculate_numerology(d: date) -> dict:
-    """Full numerology calculation for a given date."""
-    return {
-        "primary": calculate_primary(d),
-        "secondary": calculate_secondary(d),
-        "date_str": f"{d.month}/{d.day}/{d.year}",
-    }
-
-
 def format_primary_label(primary: dict) -> str:
     """Format like '3/21' or '11/20' or '33' (if reduced==unreduced)."""
     r, u = primary["reduced"], primary["unreduced"]
@@ -168,23 +158,17 @@ def _display_digits(n: int, keep_whole: bool = False) -> list:
     """
     if keep_whole:
         return [n]
-    return [int(ch) for ch in str(n) if ch != '0']
+    return [x for x in _digits(n) if x != 0]
 
 
-def build_digit_chain_primary(d: date) -> str:
-    """
-    Build the display digit chain for the primary number.
-    Zeros are omitted from display. Master-number days shown whole.
-    Example: Oct 22 2026 → '22 + 1 + 2 + 2 + 6\n= 33'
-    Example: Mar 26 2026 → '2 + 6 + 3 + 2 + 2 + 6\n= 21\n2 + 1\n= 3'
-    """
+def _build_chain_primary(d: date) -> str:
     is_master_day = d.day in MASTER_DAYS
 
-    day_tokens   = _display_digits(d.day, keep_whole=is_master_day)
-    month_tokens = _display_digits(d.month)
-    year_tokens  = _display_digits(d.year)
-
-    all_tokens = day_tokens + month_tokens + year_tokens
+    all_tokens = (
+        _display_digits(d.day, keep_whole=is_master_day)
+        + _display_digits(d.month)
+        + _display_digits(d.year)
+    )
     raw_sum = _primary_raw_sum(d)
     reduced, _ = _reduce_to_numerology(raw_sum)
 
@@ -192,13 +176,13 @@ def build_digit_chain_primary(d: date) -> str:
 
     if raw_sum in SPECIAL_MASTER_MAP:
         master = SPECIAL_MASTER_MAP[raw_sum]
-        r_digits = [int(ch) for ch in str(raw_sum) if ch != '0']
+        r_digits = _display_digits(raw_sum)
         if r_digits:
             lines.append(" + ".join(str(x) for x in r_digits))
         lines.append(f"= {master}")
         lines.append(f"{raw_sum} is a special case of {master} number")
     elif raw_sum not in MASTER_NUMBERS and raw_sum > 9:
-        r_digits = [int(ch) for ch in str(raw_sum) if ch != '0']
+        r_digits = _display_digits(raw_sum)
         if r_digits:
             lines.append(" + ".join(str(x) for x in r_digits))
         lines.append(f"= {reduced}")
@@ -206,26 +190,116 @@ def build_digit_chain_primary(d: date) -> str:
     return "\n".join(lines)
 
 
-def build_digit_chain_secondary(d: date) -> str:
-    """
-    Build the display digit chain for the secondary (day) number.
-    """
+def _build_chain_secondary(d: date) -> str:
     if d.day in MASTER_DAYS:
         return f"{d.day}\n= {d.day}"
 
-    digits = [int(ch) for ch in str(d.day) if ch != '0']
-    raw_sum = sum(int(ch) for ch in str(d.day))
+    digits = _display_digits(d.day)
+    raw_sum = _digit_sum(d.day)
     reduced, _ = _reduce_to_numerology(raw_sum)
 
     lines = [" + ".join(str(x) for x in digits), f"= {raw_sum}"]
     if raw_sum != reduced:
-        r_digits = [int(ch) for ch in str(raw_sum) if ch != '0']
+        r_digits = _display_digits(raw_sum)
         if r_digits:
             lines.append(" + ".join(str(x) for x in r_digits))
         lines.append(f"= {reduced}")
     return "\n".join(lines)
 
 
+# ============================================================
+# PRECOMPUTED CALENDAR
+# ============================================================
+
+CALENDAR_YEARS_BACK = 1
+CALENDAR_YEARS_AHEAD = 5
+
+# date -> {"primary", "secondary", "date_str", "chain_primary", "chain_secondary"}
+_calendar = {}
+
+
+def _compute_day(d: date) -> dict:
+    return {
+        "primary": _compute_primary(d),
+        "secondary": _compute_secondary(d),
+        "date_str": f"{d.month}/{d.day}/{d.year}",
+        "chain_primary": _build_chain_primary(d),
+        "chain_secondary": _build_chain_secondary(d),
+    }
+
+
+def build_calendar(start: date = None, end: date = None) -> int:
+    """Precompute every day in [start, end]. Defaults to a multi-year window around today."""
+    today = date.today()
+    start = start or date(today.year - CALENDAR_YEARS_BACK, 1, 1)
+    end = end or date(today.year + CALENDAR_YEARS_AHEAD, 12, 31)
+    d = start
+    one_day = timedelta(days=1)
+    while d <= end:
+        if d not in _calendar:
+            _calendar[d] = _compute_day(d)
+        d += one_day
+    return len(_calendar)
+
+
+def calendar_day(d: date) -> dict:
+    """Calendar entry for a date. Dates outside the precomputed window are computed
+    per call and not kept, so arbitrary range queries can't grow the calendar."""
+    entry = _calendar.get(d)
+    if entry is None:
+        if not _calendar:
+            build_calendar()
+            entry = _calendar.get(d)
+        if entry is None:
+            entry = _compute_day(d)
+    return entry
+
+
+def calculate_primary(d: date) -> dict:
+    """
+    Primary (Universal Day) = sum of digits of day + month + year.
+    Master-number days (11, 22, 33) contribute their full value, not digit-sum.
+    Returns {reduced, unreduced}.
+    """
+    return dict(calendar_day(d)["primary"])
+
+
+def calculate_secondary(d: date) -> dict:
+    """
+    Secondary = reduce the day number.
+    Master-number days are preserved as master numbers.
+    Returns {reduced, unreduced}.
+    """
+    return dict(calendar_day(d)["secondary"])
+
+
+def calculate_numerology(d: date) -> dict:
+    """Full numerology calculation for a given date."""
+    entry = calendar_day(d)
+    return {
+        "primary": dict(entry["primary"]),
+        "secondary": dict(entry["secondary"]),
+        "date_str": entry["date_str"],
+    }
+
+
+def build_digit_chain_primary(d: date) -> str:
+    """
+    Build the display digit chain for the primary number.
+    Zeros are omitted from display. Master-number days shown whole.
+    Example: Oct 22 2026 → '22 + 1 + 2 + 2 + 6\n= 33'
+    Example: Mar 26 2026 → '2 + 6 + 3 + 2 + 2 + 6\n= 21\n2 + 1\n= 3'
+    """
+    return calendar_day(d)["chain_primary"]
+
+
+def build_digit_chain_secondary(d: date) -> str:
+    """
+    Build the display digit chain for the secondary (day) number.
+    """
+    return calendar_day(d)["chain_secondary"]
+
+
 # Single brand color for all numerology embeds — red/orange blend
 NUMEROLOGY_COLOR = 0xE8490F
 
@@ -237,6 +311,35 @@ def _truncate(text: str, limit: int = 1024) -> str:
     return text[:limit - 3] + "..."
 
 
+def build_reading(d: date, descs: dict, combos: dict, combo_fallback: str = None) -> dict:
+    """
+    Assemble a reading from the calendar and resident content tables. Pure lookup, no I/O.
+    descs: {num: description}; combos: {(primary, secondary): combo_desc}.
+    """
+    entry = calendar_day(d)
+    p = entry["primary"]["reduced"]
+    s = entry["secondary"]["reduced"]
+
+    p_desc = descs.get(p) or DEFAULT_NUMBER_DESCS.get(p, f"*(No description set for {p} yet)*")
+    s_desc = descs.get(s) or DEFAULT_NUMBER_DESCS.get(s, f"*(No description set for {s} yet)*")
+    combo_desc = combos.get((p, s)) or DEFAULT_COMBOS.get(
+        (p, s), combo_fallback or f"*(No combination reading set for {p}+{s} yet)*"
+    )
+
+    return {
+        "date_str": entry["date_str"],
+        "primary": entry["primary"],
+        "secondary": entry["secondary"],
+        "primary_label": format_primary_label(entry["primary"]),
+        "secondary_label": format_secondary_label(entry["secondary"]),
+        "chain_primary": entry["chain_primary"],
+        "chain_secondary": entry["chain_secondary"],
+        "primary_desc": p_desc,
+        "secondary_desc": s_desc,
+        "combo_desc": combo_desc,
+    }
+
+
 async def get_embed(d: date, db_module, label: str = "") -> "discord.Embed":
     """
     Build a rich discord.Embed for the numerology reading of a given date.
@@ -244,27 +347,8 @@ async def get_embed(d: date, db_module, label: str = "") -> "discord.Embed":
     """
     import discord as _discord  # imported here so numerology.py stays bot-independent
 
-    nums = calculate_numerology(d)
-    p = nums["primary"]["reduced"]
-    s = nums["secondary"]["reduced"]
-    p_full = format_primary_label(nums["primary"])
-    s_full = format_secondary_label(nums["secondary"])
-    date_str = nums["date_str"]
-
-    chain_p = build_digit_chain_primary(d)
-    chain_s = build_digit_chain_secondary(d)
-
-    p_desc = await db_module.get_numerology_number_desc(p)
-    if not p_desc:
-        p_desc = DEFAULT_NUMBER_DESCS.get(p, f"*(No description set for {p} yet)*")
-
-    s_desc = await db_module.get_numerology_number_desc(s)
-    if not s_desc:
-        s_desc = DEFAULT_NUMBER_DESCS.get(s, f"*(No description set for {s} yet)*")
-
-    combo_desc = await db_module.get_numerology_combo(p, s)
-    if not combo_desc:
-        combo_desc = DEFAULT_COMBOS.get((p, s), "*(No combination reading yet — add it in the dashboard)*")
+    descs, combos = await db_module.get_numerology_content()
+    r = build_reading(d, descs, combos, "*(No combination reading yet — add it in the dashboard)*")
 
     color = NUMEROLOGY_COLOR
 
@@ -272,76 +356,60 @@ async def get_embed(d: date, db_module, label: str = "") -> "discord.Embed":
     title_prefix = "TOMORROW" if is_tomorrow else "TODAY"
 
     embed = _discord.Embed(
-        title=f"{title_prefix}: {date_str}",
+        title=f"{title_prefix}: {r['date_str']}",
         color=color,
     )
 
     # Primary number block
     embed.add_field(
-        name=f"Universal Day: **{p_full}**",
-        value=f"```\n{chain_p}\n```{_truncate(p_desc, 800)}\n\u200b",
+        name=f"Universal Day: **{r['primary_label']}**",
+        value=f"```\n{r['chain_primary']}\n```{_truncate(r['primary_desc'], 800)}\n\u200b",
         inline=False,
     )
 
     # Secondary number block
     embed.add_field(
-        name=f"Secondary: **{s_full}**",
-        value=f"```\n{chain_s}\n```{_truncate(s_desc, 800)}\n\u200b",
+        name=f"Secondary: **{r['secondary_label']}**",
+        value=f"```\n{r['chain_secondary']}\n```{_truncate(r['secondary_desc'], 800)}\n\u200b",
         inline=False,
     )
 
     # Combination
     embed.add_field(
         name="Combination",
-        value=_truncate(combo_desc, 1024),
+        value=_truncate(r["combo_desc"], 1024),
         inline=False,
     )
 
     return embed
 
 
-async def get_reading(d: date, db_module) -> str:
-    """
-    Plain-text version of the reading (used by the dashboard preview API).
-    """
-    nums = calculate_numerology(d)
-    p = nums["primary"]["reduced"]
-    s = nums["secondary"]["reduced"]
-    p_full = format_primary_label(nums["primary"])
-    s_full = format_secondary_label(nums["secondary"])
-    date_str = nums["date_str"]
-
-    chain_p = build_digit_chain_primary(d)
-    chain_s = build_digit_chain_secondary(d)
-
-    p_desc = await db_module.get_numerology_number_desc(p)
-    if not p_desc:
-        p_desc = DEFAULT_NUMBER_DESCS.get(p, f"*(No description set for {p} yet)*")
-
-    s_desc = await db_module.get_numerology_number_desc(s)
-    if not s_desc:
-        s_desc = DEFAULT_NUMBER_DESCS.get(s, f"*(No description set for {s} yet)*")
-
-    combo_desc = await db_module.get_numerology_combo(p, s)
-    if not combo_desc:
-        combo_desc = DEFAULT_COMBOS.get((p, s), f"*(No combination reading set for {p}+{s} yet)*")
-
+def format_reading(r: dict) -> str:
+    """Plain-text rendering of a build_reading() result."""
     return "\n".join([
-        f"**{date_str}**",
+        f"**{r['date_str']}**",
         "",
-        f"Universal Day: **{p_full}**",
-        f"```\n{chain_p}\n{p_full}\n```",
-        p_desc,
+        f"Universal Day: **{r['primary_label']}**",
+        f"```\n{r['chain_primary']}\n{r['primary_label']}\n```",
+        r["primary_desc"],
         "",
-        f"Secondary: **{s_full}**",
-        f"```\n{chain_s}\n{s_full}\n```",
-        s_desc,
+        f"Secondary: **{r['secondary_label']}**",
+        f"```\n{r['chain_secondary']}\n{r['secondary_label']}\n```",
+        r["secondary_desc"],
         "",
         "**Combination:**",
-        combo_desc,
+        r["combo_desc"],
     ])
 
 
+async def get_reading(d: date, db_module) -> str:
+    """
+    Plain-text version of the reading (used by the dashboard preview API).
+    """
+    descs, combos = await db_module.get_numerology_content()
+    return format_reading(build_reading(d, descs, combos))
+
+
 if __name__ == "__main__":
     tests = [
         (date(2026, 3, 26),  "3/21",  "8"),   # primary=3, secondary=8
@@ -0,0 +1,277 @@
+"""
+Bulletin Purge
+Messages posted in the bulletin channel are tracked by id as they arrive (and
+forgotten when deleted). A per-channel checkpoint follows live tracking, so
+history is only read for the gap while the bot was disconnected: once on
+connect, and for any remainder before a purge. The whole channel is never paged.
+Tracked ids younger than Discord's 14-day bulk-delete window go out 100 per
+request; older ones are handed to a paced worker that deletes them one at a time
+and backs off on rate limits and server errors. Messages the bulletin
+restriction rejects are collected for a moment and bulk-deleted together.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+import discord
+
+import database
+
+logger = logging.getLogger(__name__)
+
+BULLETIN_CHANNEL_KEY = "bulletin_channel_id"
+CHECKPOINT_KEY = "bulletin_purge_checkpoint_{}"  # per channel: snowflake history was last read up to
+BULK_LIMIT = 100                    # ids per bulk-delete request
+BULK_MAX_AGE = 14 * 86400 - 3600    # bulk delete rejects messages older than 14 days; keep an hour's margin
+SINGLE_DELETE_INTERVAL = 1.0        # seconds between individual deletes of old messages
+REJECT_BATCH_DELAY = 1.0            # seconds rejected messages are collected before deleting
+SEED_HISTORY_LIMIT = 1000           # first run with no checkpoint; matches the old purge's reach
+MAX_RETRIES = 4
+BASE_BACKOFF = 2.0
+UNTRACK_BATCH = 25                  # worker deletes recorded per DB write
+
+
+def _age(message_id: int) -> float:
+    return time.time() - discord.utils.snowflake_time(message_id).timestamp()
+
+
+def _chunks(ids, size):
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+class PurgeEngine:
+    def __init__(self):
+        self._old = deque()             # (channel, message_id) awaiting an individual delete
+        self._old_ids = set()
+        self._worker = None
+        self._rejected = {}             # channel_id -> (channel, [message_id])
+        self._reject_task = None
+        self._bot = None
+        self._run = None                # progress of the current / last scheduled purge
+        self._live = set()              # channel ids caught up this session; live tracking moves their checkpoint
+        self._checkpoints = {}          # channel_id -> checkpoint snowflake (mirror of the setting)
+        self.metrics = {
+            "tracked": 0,
+            "bulk_requests": 0,
+            "bulk_deleted": 0,
+            "single_deleted": 0,
+            "already_gone": 0,
+            "rejected_deleted": 0,
+            "retries": 0,
+            "failures": 0,
+        }
+
+    def attach(self, bot):
+        bot.add_listener(self._on_message, "on_message")
+        bot.add_listener(self._on_raw_message_delete, "on_raw_message_delete")
+        bot.add_listener(self._on_raw_bulk_message_delete, "on_raw_bulk_message_delete")
+        bot.add_listener(self._on_ready, "on_ready")
+        bot.add_listener(self._on_disconnect, "on_disconnect")
+        self._bot = bot
+
+    async def _is_bulletin(self, channel_id: int) -> bool:
+        bulletin_id = await database.get_setting(BULLETIN_CHANNEL_KEY, "")
+        return bool(bulletin_id) and str(channel_id) == bulletin_id
+
+    # --- Tracking ---
+
+    async def _on_message(self, message: discord.Message):
+        if message.guild is None or not await self._is_bulletin(message.channel.id):
+            return
+        try:
+            await database.track_bulletin_messages(message.channel.id, [message.id])
+            self.metrics["tracked"] += 1
+            if message.channel.id in self._live:
+                await self._advance(message.channel.id, message.id)
+        except Exception as e:
+            logger.error(f"Failed to track bulletin message {message.id}: {e}")
+
+    async def _on_ready(self):
+        # A new session (start-up or a reconnect that couldn't resume) may have missed messages
+        bulletin_id = await database.get_setting(BULLETIN_CHANNEL_KEY, "")
+        channel = self._bot.get_channel(int(bulletin_id)) if bulletin_id else None
+        if channel is None:
+            return
+        try:
+            await self._catch_up(channel)
+        except discord.HTTPException as e:
+            logger.warning(f"Bulletin catch-up on connect failed, retrying before the next purge: {e}")
+
+    async def _on_disconnect(self):
+        # A resumed session replays what it missed; until then nothing moves the checkpoints
+        self._live.clear()
+
+    async def _on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if await self._is_bulletin(payload.channel_id):
+            await database.untrack_bulletin_messages([payload.message_id])
+
+    async def _on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        if await self._is_bulletin(payload.channel_id):
+            await database.untrack_bulletin_messages(payload.message_ids)
+
+    async def _checkpoint(self, channel_id: int) -> int:
+        if channel_id not in self._checkpoints:
+            value = await database.get_setting(CHECKPOINT_KEY.format(channel_id), "0")
+            self._checkpoints[channel_id] = int(value or 0)
+        return self._checkpoints[channel_id]
+
+    async def _advance(self, channel_id: int, snowflake: int):
+        """Move the checkpoint forward; everything up to `snowflake` is tracked."""
+        if snowflake > await self._checkpoint(channel_id):
+            self._checkpoints[channel_id] = snowflake
+            await database.set_setting(CHECKPOINT_KEY.format(channel_id), str(snowflake))
+
+    async def _catch_up(self, channel):
+        """Track messages posted while the listener wasn't running (bot offline or
+        reconnecting), reading history only from the checkpoint forward."""
+        checkpoint = await self._checkpoint(channel.id)
+        started = discord.utils.time_snowflake(discord.utils.utcnow())
+        if checkpoint:
+            history = channel.history(limit=None, after=discord.Object(id=checkpoint), oldest_first=True)
+        else:
+            history = channel.history(limit=SEED_HISTORY_LIMIT)
+        ids = [m.id async for m in history]
+        if ids:
+            await database.track_bulletin_messages(channel.id, ids)
+            logger.info(f"🧹 Caught up bulletin tracking for #{channel.name}: {len(ids)} messages missed while offline")
+        # Anything newer than the scan's start arrives through the listener from here on
+        await self._advance(channel.id, started)
+        self._live.add(channel.id)
+
+    # --- Deleting ---
+
+    async def _bulk_delete(self, channel, ids, reason=None):
+        """Delete up to 100 young messages in one request and stop tracking them."""
+        if len(ids) == 1:
+            try:
+                await channel.get_partial_message(ids[0]).delete()
+            except discord.NotFound:
+                self.metrics["already_gone"] += 1
+        else:
+            await channel.delete_messages([discord.Object(id=i) for i in ids], reason=reason)
+        self.metrics["bulk_requests"] += 1
+        await database.untrack_bulletin_messages(ids)
+
+    def reject(self, message: discord.Message):
+        """Delete a message the bulletin restriction doesn't allow. A burst of them
+        (raids, spam) is deleted with one bulk request instead of one call each."""
+        pending = self._rejected.setdefault(message.channel.id, (message.channel, []))
+        pending[1].append(message.id)
+        if self._reject_task is None or self._reject_task.done():
+            self._reject_task = asyncio.create_task(self._flush_rejected())
+
+    async def _flush_rejected(self):
+        while self._rejected:
+            await asyncio.sleep(REJECT_BATCH_DELAY)
+            batches, self._rejected = self._rejected, {}
+            for channel, ids in batches.values():
+                for chunk in _chunks(ids, BULK_LIMIT):
+                    try:
+                        await self._bulk_delete(channel, chunk, reason="Bulletin channel restriction")
+                        self.metrics["rejected_deleted"] += len(chunk)
+                    except Exception as e:
+                        self.metrics["failures"] += 1
+                        logger.warning(f"Failed to delete {len(chunk)} restricted bulletin messages: {e}")
+
+    async def purge_channel(self, channel, reason=None) -> dict:
+        """Delete every tracked message in the channel. Young ones are bulk-deleted
+        before returning; old ones are queued for the paced worker. Returns the run's progress."""
+        await self._catch_up(channel)
+        ids = await database.get_bulletin_message_ids(channel.id)
+        young = sorted(i for i in ids if _age(i) < BULK_MAX_AGE)
+        old = [i for i in ids if _age(i) >= BULK_MAX_AGE]
+        run = self._run = {
+            "channel_id": channel.id,
+            "started_at": time.time(),
+            "finished_at": None,
+            "total": len(ids),
+            "bulk_deleted": 0,
+            "old_queued": 0,
+            "old_deleted": 0,
+        }
+
+        for chunk in _chunks(young, BULK_LIMIT):
+            try:
+                await self._bulk_delete(channel, chunk, reason=reason)
+                self.metrics["bulk_deleted"] += len(chunk)
+                run["bulk_deleted"] += len(chunk)
+            except discord.HTTPException as e:
+                # Usually an id that's already gone; the worker handles those one by one
+                logger.warning(f"Bulk delete of {len(chunk)} bulletin messages failed, deleting individually: {e}")
+                old.extend(chunk)
+
+        for message_id in old:
+            if message_id not in self._old_ids:
+                self._old_ids.add(message_id)
+                self._old.append((channel, message_id))
+                run["old_queued"] += 1
+        if self._old:
+            self._ensure_worker()
+        else:
+            run["finished_at"] = time.time()
+        logger.info(
+            f"🧹 Bulletin purge: {run['bulk_deleted']} bulk-deleted, "
+            f"{run['old_queued']} older messages queued for individual deletion"
+        )
+        return run
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain_old())
+
+    async def _drain_old(self):
+        done = []
+        try:
+            while self._old:
+                channel, message_id = self._old.popleft()
+                if await self._delete_one(channel, message_id):
+                    done.append(message_id)
+                    if self._run is not None:
+                        self._run["old_deleted"] += 1
+                self._old_ids.discard(message_id)
+                if len(done) >= UNTRACK_BATCH:
+                    await database.untrack_bulletin_messages(done)
+                    done = []
+                await asyncio.sleep(SINGLE_DELETE_INTERVAL)
+        finally:
+            if done:
+                await database.untrack_bulletin_messages(done)
+            if self._run is not None and not self._old:
+                self._run["finished_at"] = time.time()
+
+    async def _delete_one(self, channel, message_id: int) -> bool:
+        """True once the message is gone (deleted now or already missing)."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                await channel.get_partial_message(message_id).delete()
+                self.metrics["single_deleted"] += 1
+                return True
+            except discord.NotFound:
+                self.metrics["already_gone"] += 1
+                return True
+            except discord.Forbidden as e:
+                logger.warning(f"Missing permission to delete bulletin message {message_id}: {e}")
+                break
+            except discord.HTTPException as e:
+                if attempt == MAX_RETRIES or not (e.status == 429 or e.status >= 500):
+                    logger.warning(f"Failed to delete bulletin message {message_id}: {e}")
+                    break
+                # discord.py already waits out 429s it sees; this covers the ones it gives up on
+                self.metrics["retries"] += 1
+                await asyncio.sleep(BASE_BACKOFF * (2 ** attempt))
+        self.metrics["failures"] += 1
+        return False
+
+    def stats(self) -> dict:
+        return {
+            **self.metrics,
+            "old_queue": len(self._old),
+            "rejected_pending": sum(len(ids) for _, ids in self._rejected.values()),
+            "run": dict(self._run) if self._run else None,
+        }
+
+
+engine = PurgeEngine()
@@ -0,0 +1,143 @@
+"""
+Rank Index
+In-memory order statistics for the XP and balance leaderboards. Each board is a
+sorted array of (negated score, user_id) loaded from SQLite on first use and
+then kept in step by the write paths in database.py, so rank-of-user and top-N
+are a bisect / slice instead of a table scan. Bulk rewrites (wealth tax, caps,
+dashboard imports) just invalidate the board; the next read reloads it.
+Writers wrap the DB write and its hook in writing(); a load whose SELECT
+overlapped one is answered from but never installed, so the hook can't apply a
+delta the SELECT already saw.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import aiosqlite
+
+from config import DB_FILE
+
+logger = logging.getLogger(__name__)
+
+
+class Leaderboard:
+    """Users ordered by a score tuple, highest first. Ties break on user_id."""
+
+    def __init__(self, name: str, query: str):
+        self.name = name
+        self.query = query              # SELECT user_id, <score columns...>
+        self._scores = None             # user_id -> score tuple (None = not loaded)
+        self._order = []                # sorted [(negated score, user_id)]
+        self._generation = 0            # bumped by writes/invalidations racing a load
+        self._writes = 0                # writes between their DB statement and their hook
+        self._lock = threading.Lock()   # The dashboard thread writes through database.py too
+
+    @staticmethod
+    def _entry(user_id: str, score: tuple) -> tuple:
+        return tuple(-s for s in score), user_id
+
+    @property
+    def loaded(self) -> bool:
+        return self._scores is not None
+
+    async def _board(self):
+        """(scores, order), loading from the DB if the board isn't in memory."""
+        with self._lock:
+            if self._scores is not None:
+                return self._scores, self._order
+            generation = self._generation
+            quiet = self._writes == 0
+        started = time.perf_counter()
+        async with aiosqlite.connect(DB_FILE, timeout=20.0) as conn:
+            async with conn.execute(self.query) as cursor:
+                rows = await cursor.fetchall()
+        scores = {str(row[0]): tuple(v or 0 for v in row[1:]) for row in rows}
+        order = sorted(self._entry(uid, score) for uid, score in scores.items())
+        with self._lock:
+            if not quiet or self._generation != generation:
+                return scores, order  # A write overlapped the load; answer from this read, reload next time
+            self._scores, self._order = scores, order
+        logger.info(f"🏆 Loaded {self.name} leaderboard: {len(scores)} users in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return scores, order
+
+    # --- Writes (called by database.py after the row is committed) ---
+
+    @contextmanager
+    def writing(self):
+        """Wrap a DB write and its set()/add() hook; loads overlapping it aren't installed."""
+        with self._lock:
+            self._writes += 1
+            self._generation += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._writes -= 1
+                self._generation += 1
+
+    def _place(self, user_id: str, score: tuple):
+        old = self._scores.get(user_id)
+        if old is not None:
+            i = bisect.bisect_left(self._order, self._entry(user_id, old))
+            del self._order[i]
+        self._scores[user_id] = score
+        bisect.insort(self._order, self._entry(user_id, score))
+
+    def set(self, user_id, *score):
+        """Record a user's new absolute score."""
+        with self._lock:
+            if self._scores is None:
+                self._generation += 1
+                return
+            self._place(str(user_id), tuple(score))
+
+    def add(self, user_id, delta: int, floor: int = None):
+        """Apply a delta to a single-column score, clamped like MAX(floor, balance + delta)."""
+        user_id = str(user_id)
+        with self._lock:
+            if self._scores is None:
+                self._generation += 1
+                return
+            value = self._scores.get(user_id, (0,))[0] + delta
+            if floor is not None:
+                value = max(floor, value)
+            self._place(user_id, (value,))
+
+    def invalidate(self):
+        """Drop the board after a bulk rewrite; the next read reloads it."""
+        with self._lock:
+            self._scores = None
+            self._order = []
+            self._generation += 1
+
+    # --- Reads ---
+
+    async def rank(self, user_id) -> int:
+        """1-indexed position: users with a strictly higher score + 1. Unknown users score zero."""
+        scores, order = await self._board()
+        score = scores.get(str(user_id))
+        if score is None:
+            score = (0,) * (len(order[0][0]) if order else 1)
+        return bisect.bisect_left(order, (tuple(-s for s in score),)) + 1
+
+    async def top(self, limit: int) -> list:
+        """[(user_id, *score)] for the top `limit` users."""
+        _, order = await self._board()
+        return [(uid, *(-s for s in neg)) for neg, uid in order[:max(0, limit)]]
+
+    async def score(self, user_id):
+        """The user's score tuple, or None if they have no row."""
+        scores, _ = await self._board()
+        return scores.get(str(user_id))
+
+    def stats(self) -> dict:
+        return {"loaded": self.loaded, "users": len(self._scores or ())}
+
+
+# Ordered like the leaderboards always were: level, then XP within the level.
+# Loads walk the covering indexes from migration 004 in board order, so the sort is a single pass
+xp = Leaderboard("xp", "SELECT user_id, level, xp FROM users_xp ORDER BY level DESC, xp DESC, user_id")
+balances = Leaderboard("balance", "SELECT user_id, balance FROM balances ORDER BY balance DESC, user_id")
@@ -0,0 +1,225 @@
+"""
+The Reaping — In-Memory Event State
+Holds the active reaping (pool, games, participants) in memory so gambling
+commands pay no DB I/O when no reaping is running. State is loaded at startup,
+checkpointed periodically, and expiry fires from a scheduled callback.
+"""
+
+import asyncio
+import logging
+import time
+
+import database
+import economy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DURATION = 1800  # 30 minutes
+TITHE_RATE = 0.04
+ANNOUNCE_EVERY = 4  # Announce pool size every N games
+FINAL_FLUSH_ATTEMPTS = 3
+FINISH_RETRY_DELAY = 60  # seconds before retrying an end whose final flush failed
+
+# ============================================================
+# STATE
+# ============================================================
+
+
+class ReapingEvent:
+    """Mirror of the reaping_state / reaping_participants tables."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.active = False
+        self.pool = 0
+        self.games = 0
+        self.started_at = None
+        self.expires_at = None
+        self.channel_id = None
+        self.participants = {}  # {user_id_str: contribution}
+        self.dirty = False
+
+    def is_live(self) -> bool:
+        return self.active and self.expires_at is not None and time.time() < self.expires_at
+
+
+state = ReapingEvent()
+_bot = None
+_loaded = False
+_expiry_handle = None
+_tasks = set()  # expiry tasks (kept referenced)
+_lock = asyncio.Lock()
+
+
+# ============================================================
+# LIFECYCLE
+# ============================================================
+
+
+async def load_state(bot):
+    """Restore the reaping from the DB on startup and arm its expiry."""
+    global _bot, _loaded
+    _bot = bot
+    # on_ready re-fires on reconnect; memory is authoritative after the first load
+    if _loaded:
+        return
+    _loaded = True
+    snapshot = await database.get_reaping_snapshot()
+    state.reset()
+    if snapshot:
+        active, pool, games, started_at, expires_at, channel_id, participants = snapshot
+        state.active = bool(active)
+        state.pool = pool or 0
+        state.games = games or 0
+        state.started_at = started_at
+        state.expires_at = expires_at
+        state.channel_id = int(channel_id) if channel_id else None
+        state.participants = participants
+
+    if state.active:
+        logger.info(f"🌾 Reaping restored: pool {state.pool}, {state.games} games, {len(state.participants)} souls.")
+        _arm_expiry()
+
+
+def is_active() -> bool:
+    """Zero-I/O check used by every gambling command."""
+    return state.is_live()
+
+
+async def start(bot, channel_id: int = None, duration_seconds: int = DEFAULT_DURATION):
+    """Begin a new reaping, persist it, and schedule its end."""
+    global _bot
+    _bot = bot
+    await database.start_reaping(duration_seconds, channel_id)
+    state.reset()
+    state.active = True
+    state.started_at = time.time()
+    state.expires_at = state.started_at + duration_seconds
+    state.channel_id = channel_id
+    _arm_expiry()
+
+
+async def collect_tithe(user_id: int, amount: int):
+    """
+    Debit a game's tithe from the player, then add it to the in-memory pool.
+    Returns (games_count, pool) after the increment, or None if no reaping is live.
+    Holds the lock so the reaping can't end between the debit and the credit;
+    if the debit fails nothing is credited.
+    """
+    async with _lock:
+        if not state.is_live():
+            return None
+        if amount > 0:
+            await database.update_balance(user_id, -amount)
+        uid = str(user_id)
+        state.pool += amount
+        state.games += 1
+        state.participants[uid] = state.participants.get(uid, 0) + amount
+        state.dirty = True
+        return state.games, state.pool
+
+
+async def checkpoint():
+    """Write the in-memory pool and participants to the DB if they changed."""
+    if not state.dirty:
+        return
+    # Capture before awaiting so increments made during the write stay dirty
+    state.dirty = False
+    pool, games, participants = state.pool, state.games, dict(state.participants)
+    try:
+        await database.save_reaping_checkpoint(pool, games, participants)
+    except Exception as e:
+        state.dirty = True
+        logger.error(f"Error checkpointing reaping: {e}", exc_info=True)
+
+
+async def finish():
+    """
+    End the reaping: flush, pay out via the DB, and clear memory. Returns end_reaping()'s
+    tuple, or None if the final flush failed (the reaping stays active and retries later).
+    """
+    global _expiry_handle
+    async with _lock:
+        if _expiry_handle:
+            _expiry_handle.cancel()
+            _expiry_handle = None
+        if not state.active:
+            return 0, 0, 0
+        # Stop accepting tithes before the final flush
+        state.active = False
+        state.dirty = True
+        for attempt in range(FINAL_FLUSH_ATTEMPTS):
+            await checkpoint()
+            if not state.dirty:
+                break
+            await asyncio.sleep(2 ** attempt)
+        else:
+            # Paying out from the DB now would drop the unflushed tithes
+            state.active = True
+            logger.error(f"❌ Reaping final flush failed; retrying the end in {FINISH_RETRY_DELAY}s.")
+            _arm_expiry(FINISH_RETRY_DELAY)
+            return None
+        result = await database.end_reaping()
+        state.reset()
+        return result
+
+
+# ============================================================
+# EXPIRY SCHEDULING
+# ============================================================
+
+
+def _arm_expiry(delay: float = None):
+    """Schedule _expire() at expires_at (immediately if already past), or after `delay`."""
+    global _expiry_handle
+    if _expiry_handle:
+        _expiry_handle.cancel()
+    if delay is None:
+        delay = max(0.0, (state.expires_at or 0) - time.time())
+    loop = asyncio.get_running_loop()
+    _expiry_handle = loop.call_later(delay, _spawn_expire)
+    logger.info(f"⏳ Reaping expiry scheduled in {int(delay)}s.")
+
+
+def _spawn_expire():
+    task = asyncio.create_task(_expire())
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def _resolve_channel():
+    if not _bot:
+        return None
+    if state.channel_id:
+        channel = _bot.get_channel(state.channel_id)
+        if channel:
+            return channel
+    assigns = await database.get_channel_assigns()
+    main_ch_id = assigns.get("main")
+    return _bot.get_channel(int(main_ch_id)) if main_ch_id else None
+
+
+async def _expire():
+    try:
+        channel = await _resolve_channel()
+        result = await finish()
+        if result is None:
+            return
+        winner_count, payout_per_person, burned = result
+        logger.info(f"🌾 Reaping ended: {winner_count} winners, {payout_per_person} each, {burned} burned.")
+        if not channel:
+            return
+        if winner_count > 0:
+            await channel.send(
+                f"🌾 **THE HARVEST IS COMPLETE.**\n"
+                f"The gathered souls have been judged.\n\n"
+                f"👥 **Participants:** {winner_count}\n"
+                f"💰 **Payout:** {economy.format_balance(payout_per_person)} each\n"
+                f"🔥 **Burned:** {economy.format_balance(burned)}"
+            )
+        else:
+            await channel.send("🌾 **The Harvest Ends.** No souls were claimed.")
+    except Exception as e:
+        logger.error(f"Error ending reaping: {e}", exc_info=True)
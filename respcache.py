@@ -0,0 +1,175 @@
+"""
+Response Cache
+Results of external lookups (crypto prices, weather, Urban Dictionary)
+keyed by source + normalized request. Fresh entries are served directly; stale
+ones are served immediately while one background refresh runs; identical
+concurrent misses share a single upstream call. Memory is an LRU bounded by
+entry count; sources marked persist=True also spill to SQLite and survive restarts.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+
+import database
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 2000       # across all sources
+PRUNE_EVERY = 200        # persisted writes between sweeps of expired rows
+
+
+class Source:
+    """ttl: seconds an entry is fresh. stale: extra seconds it may be served while refreshing."""
+
+    def __init__(self, name: str, ttl: float, stale: float, persist: bool = False):
+        self.name = name
+        self.ttl = ttl
+        self.stale = stale
+        self.persist = persist
+
+
+SOURCES = {s.name: s for s in (
+    Source("crypto", ttl=60, stale=300),
+    Source("weather", ttl=600, stale=1800),
+    Source("urban", ttl=86400, stale=7 * 86400, persist=True),
+)}
+
+
+def normalize(key) -> str:
+    """'  New   York ' -> 'new york'; tuples/dicts become stable JSON."""
+    if isinstance(key, str):
+        return " ".join(key.lower().split())
+    return json.dumps(key, sort_keys=True, default=str)
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value, fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class ResponseCache:
+    def __init__(self):
+        self._entries = OrderedDict()   # (source, key) -> _Entry, LRU order
+        self._inflight = {}             # (source, key) -> Future shared by concurrent callers
+        self._refreshing = set()        # background refresh tasks (kept referenced)
+        self._persist_writes = 0
+        self._stats = {name: {"hits": 0, "stale": 0, "misses": 0, "coalesced": 0, "fetches": 0, "failures": 0}
+                       for name in SOURCES}
+
+    async def get(self, source: str, key, fetch):
+        """Cached value for (source, key), calling `await fetch()` on a miss.
+        fetch() returns a JSON-serializable value, or None for "failed, don't cache"."""
+        policy = SOURCES[source]
+        ck = (source, normalize(key))
+        stats = self._stats[source]
+        now = time.time()
+
+        entry = self._entries.get(ck)
+        if entry is None and policy.persist:
+            entry = await self._load(ck)
+        if entry is not None:
+            age = now - entry.fetched_at
+            if age < policy.ttl:
+                self._entries.move_to_end(ck)
+                stats["hits"] += 1
+                return entry.value
+            if age < policy.ttl + policy.stale:
+                self._entries.move_to_end(ck)
+                stats["stale"] += 1
+                if ck not in self._inflight:
+                    task = asyncio.create_task(self._fetch(ck, policy, fetch))
+                    self._refreshing.add(task)
+                    task.add_done_callback(self._refreshing.discard)
+                return entry.value
+
+        stats["misses"] += 1
+        return await self._fetch(ck, policy, fetch)
+
+    async def _fetch(self, ck, policy: Source, fetch):
+        """Run fetch() once per key at a time; everyone else awaits the same result."""
+        pending = self._inflight.get(ck)
+        if pending is not None:
+            self._stats[policy.name]["coalesced"] += 1
+            value = await asyncio.shield(pending)
+            if value is None and ck in self._entries:
+                return self._entries[ck].value
+            return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[ck] = future
+        value = None
+        try:
+            self._stats[policy.name]["fetches"] += 1
+            value = await fetch()
+        except Exception as e:
+            logger.error(f"Response cache fetch failed for {ck[0]}:{ck[1]}: {e}")
+        finally:
+            del self._inflight[ck]
+            future.set_result(value)
+
+        if value is None:
+            self._stats[policy.name]["failures"] += 1
+            stale = self._entries.get(ck)
+            return stale.value if stale else None
+        await self._store(ck, policy, value)
+        return value
+
+    async def _store(self, ck, policy: Source, value):
+        now = time.time()
+        self._entries[ck] = _Entry(value, now)
+        self._entries.move_to_end(ck)
+        while len(self._entries) > MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        if not policy.persist:
+            return
+        try:
+            async with database.get_db() as conn:
+                await conn.execute(
+                    "INSERT OR REPLACE INTO response_cache (source, key, value, fetched_at, stale_until) VALUES (?, ?, ?, ?, ?)",
+                    (ck[0], ck[1], json.dumps(value), now, now + policy.ttl + policy.stale),
+                )
+                self._persist_writes += 1
+                if self._persist_writes % PRUNE_EVERY == 0:
+                    await conn.execute("DELETE FROM response_cache WHERE stale_until < ?", (now,))
+        except Exception as e:
+            logger.error(f"Response cache spill failed for {ck[0]}: {e}")
+
+    async def _load(self, ck):
+        """Promote a persisted entry into memory, or None."""
+        try:
+            async with database.get_db() as conn:
+                async with conn.execute(
+                    "SELECT value, fetched_at FROM response_cache WHERE source = ? AND key = ? AND stale_until > ?",
+                    (ck[0], ck[1], time.time()),
+                ) as cursor:
+                    row = await cursor.fetchone()
+        except Exception as e:
+            logger.error(f"Response cache load failed for {ck[0]}: {e}")
+            return None
+        if not row:
+            return None
+        entry = _Entry(json.loads(row[0]), row[1])
+        self._entries[ck] = entry
+        while len(self._entries) > MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, source: str, key=None):
+        """Drop one key, or a whole source, from memory (persisted rows just age out)."""
+        if key is not None:
+            self._entries.pop((source, normalize(key)), None)
+            return
+        for ck in [ck for ck in self._entries if ck[0] == source]:
+            del self._entries[ck]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "inflight": len(self._inflight), "sources": self._stats}
+
+
+cache = ResponseCache()
@@ -0,0 +1,252 @@
+"""
+Reward Role Reconciliation
+Brings every member's level reward roles in line with the current XP curve
+and reward table. XP for the whole server is read in one query, each level
+maps to a precomputed target role set, and only members whose cached roles
+differ get an edit (through the role queue, with bounded concurrency).
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+
+import database
+import membercache
+import rolequeue
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+PROGRESS_EVERY = 25   # Report progress after this many edits
+SAMPLE_SIZE = 20      # Changes listed in a dry-run report
+
+# ============================================================
+# LEVEL -> ROLES TABLE
+# ============================================================
+
+
+class RewardTable:
+    """Precomputed XP thresholds and the reward role set held at each reward level."""
+
+    def __init__(self, settings: dict, rewards: list):
+        c3 = float(settings.get("c3", 1))
+        c2 = float(settings.get("c2", 50))
+        c1 = float(settings.get("c1", 100))
+        rounding = int(settings.get("rounding", 100))
+
+        self.excluded = set()
+        if settings.get("reward_exclude_enabled") == "1":
+            raw = settings.get("reward_exclude_roles", "")
+            self.excluded = {int(rid.strip()) for rid in raw.split(",") if rid.strip().isdigit()}
+
+        rewards = sorted(rewards, key=lambda r: r["level"])
+        max_level = rewards[-1]["level"] if rewards else 0
+
+        # thresholds[i] is the XP needed for level i + 1 (same formula as calculate_level_for_xp)
+        self.thresholds = []
+        for L in range(1, max_level + 1):
+            req = c3 * (L**3) + c2 * (L**2) + c1 * L
+            if rounding > 0:
+                req = round(req / rounding) * rounding
+            self.thresholds.append(req)
+
+        # Walk rewards in order: a non-stacking reward replaces everything below it
+        self.reward_role_ids = set()
+        self._levels = []
+        self._targets = []
+        held = set()
+        for r in rewards:
+            role_id = int(r["role_id"])
+            self.reward_role_ids.add(role_id)
+            if not r["stack_role"]:
+                held = set()
+            held.add(role_id)
+            self._levels.append(r["level"])
+            self._targets.append(frozenset(held))
+
+    def level_for_xp(self, xp: int) -> int:
+        """Level for an XP total, capped at the highest reward level (all that matters here)."""
+        if xp <= 0:
+            return 0
+        return bisect.bisect_right(self.thresholds, xp)
+
+    def target_for_level(self, level: int) -> frozenset:
+        idx = bisect.bisect_right(self._levels, level)
+        return self._targets[idx - 1] if idx else frozenset()
+
+
+async def load_table() -> RewardTable:
+    settings = await database.get_level_settings()
+    rewards = await database.get_reward_roles()
+    return RewardTable(settings, rewards)
+
+
+# ============================================================
+# RECONCILIATION
+# ============================================================
+
+
+class ReconcileReport:
+    def __init__(self, guild_name: str, dry_run: bool, removals: bool = True):
+        self.guild_name = guild_name
+        self.dry_run = dry_run
+        self.removals = removals
+        self.scanned = 0
+        self.in_sync = 0
+        self.no_xp = 0      # members without an XP row, left alone
+        self.changes = []   # [(member, add_roles, remove_roles)]
+        self.applied = 0
+        self.failed = 0
+        self.started_at = time.time()
+        self.finished_at = None
+
+    @property
+    def roles_added(self) -> int:
+        return sum(len(add) for _, add, _ in self.changes)
+
+    @property
+    def roles_removed(self) -> int:
+        return sum(len(remove) for _, _, remove in self.changes)
+
+    def summary(self) -> str:
+        verb = "would change" if self.dry_run else "changed"
+        lines = [
+            f"**{self.guild_name}** — scanned {self.scanned} members, {self.in_sync} already in sync, "
+            f"{self.no_xp} without XP skipped.",
+            f"{len(self.changes)} members {verb}: +{self.roles_added} / -{self.roles_removed} roles.",
+        ]
+        if not self.dry_run:
+            lines.append(f"Applied {self.applied}, failed {self.failed}.")
+        if self.dry_run and self.changes:
+            for member, add, remove in self.changes[:SAMPLE_SIZE]:
+                parts = [f"+{r.name}" for r in add] + [f"-{r.name}" for r in remove]
+                lines.append(f"• {member.display_name}: {' '.join(parts)}")
+            if len(self.changes) > SAMPLE_SIZE:
+                lines.append(f"…and {len(self.changes) - SAMPLE_SIZE} more.")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "guild": self.guild_name,
+            "dry_run": self.dry_run,
+            "scanned": self.scanned,
+            "in_sync": self.in_sync,
+            "no_xp": self.no_xp,
+            "removals": self.removals,
+            "to_change": len(self.changes),
+            "roles_added": self.roles_added,
+            "roles_removed": self.roles_removed,
+            "applied": self.applied,
+            "failed": self.failed,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "sample": [
+                {"user_id": str(m.id), "name": m.display_name,
+                 "add": [r.name for r in add], "remove": [r.name for r in remove]}
+                for m, add, remove in self.changes[:SAMPLE_SIZE]
+            ],
+        }
+
+
+_lock = asyncio.Lock()
+_progress = {"running": False, "done": 0, "total": 0}
+_last_report = None
+
+
+def plan(guild, members, table: RewardTable, xp_by_user: dict, report: ReconcileReport):
+    """Diff each member's reward roles against their target set. Pure in-memory.
+    Members with no XP row are skipped: their reward roles were granted by hand or
+    outlived a prune, and there's no XP to judge them by."""
+    managed = table.reward_role_ids - table.excluded
+    for member in members:
+        if member.bot:
+            continue
+        report.scanned += 1
+        xp = xp_by_user.get(str(member.id))
+        if xp is None:
+            report.no_xp += 1
+            continue
+        level = table.level_for_xp(xp)
+        target = table.target_for_level(level) & managed
+        current = {r.id for r in member.roles} & managed
+
+        add = [guild.get_role(rid) for rid in target - current]
+        add = [r for r in add if r]
+        remove = [r for r in member.roles if r.id in current - target] if report.removals else []
+        if add or remove:
+            report.changes.append((member, add, remove))
+        else:
+            report.in_sync += 1
+
+
+async def reconcile(guild, dry_run: bool = False, removals: bool = True,
+                    concurrency: int = DEFAULT_CONCURRENCY, progress=None) -> ReconcileReport:
+    """
+    Reconcile reward roles for a whole guild.
+    removals=False only adds missing roles (used when a reconcile starts on its own).
+    progress, if given, is awaited as progress(done, total) while edits are applied.
+    """
+    global _last_report
+    async with _lock:
+        table = await load_table()
+        xp_by_user = await database.get_all_user_xp()
+        report = ReconcileReport(guild.name, dry_run, removals)
+        async for page in membercache.pages(guild):
+            plan(guild, page, table, xp_by_user, report)
+
+        if not dry_run and report.changes:
+            _progress.update(running=True, done=0, total=len(report.changes))
+            sem = asyncio.Semaphore(concurrency)
+
+            async def apply(member, add, remove):
+                async with sem:
+                    try:
+                        await rolequeue.update(member, add=add, remove=remove, reason="Reward role reconciliation")
+                        report.applied += 1
+                    except Exception as e:
+                        report.failed += 1
+                        logger.warning(f"Reward reconcile failed for {member}: {e}")
+                    _progress["done"] += 1
+                    if progress and _progress["done"] % PROGRESS_EVERY == 0:
+                        try:
+                            await progress(_progress["done"], _progress["total"])
+                        except Exception:
+                            pass
+
+            try:
+                await asyncio.gather(*(apply(*change) for change in report.changes))
+            finally:
+                _progress["running"] = False
+
+        report.finished_at = time.time()
+        _last_report = report
+        logger.info(
+            f"🎖️ Reward reconcile{' (dry run)' if dry_run else ''} for {guild.name}: "
+            f"{len(report.changes)}/{report.scanned} members out of sync, applied {report.applied}, failed {report.failed}."
+        )
+        return report
+
+
+def status() -> dict:
+    """Live progress and the last report, for the dashboard."""
+    return {
+        **_progress,
+        "last_report": _last_report.to_dict() if _last_report else None,
+    }
+
+
+# ============================================================
+# DASHBOARD TRIGGER
+# ============================================================
+
+_requested = {"dry_run": True}
+
+
+def request_run(dry_run: bool):
+    """Called from the dashboard thread; the bot picks it up via the reward_reconcile trigger."""
+    _requested["dry_run"] = dry_run
+
+
+def requested_dry_run() -> bool:
+    return _requested["dry_run"]
@@ -0,0 +1,269 @@
+"""
+Role Mutation Queue
+Collects role adds/removes per member and applies them as a single
+member.edit(roles=...) call. Bursts (mass expiries, /rolesync, colour swaps)
+collapse into one request per member, edits are paced per guild to stay
+under Discord's member-update bucket, and transient failures retry with backoff.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+import discord
+
+import membercache
+
+logger = logging.getLogger(__name__)
+
+COALESCE_DELAY = 0.25   # Let a burst of operations land before flushing
+EDITS_PER_WINDOW = 10   # PATCH /guilds/{id}/members/{id} bucket, per guild
+RATE_WINDOW = 10.0
+MAX_RETRIES = 4
+BASE_BACKOFF = 1.0
+THROUGHPUT_WINDOW = 60.0
+MAX_REASON_LEN = 512    # Audit log reason limit
+
+
+# ============================================================
+# INTERNALS
+# ============================================================
+
+
+class _Pending:
+    """Merged operations for one member waiting to be applied."""
+    __slots__ = ("guild", "member_id", "adds", "removes", "reasons", "waiters", "queued_at")
+
+    def __init__(self, guild, member_id: int):
+        self.guild = guild
+        self.member_id = member_id
+        self.adds = {}        # role_id -> Role
+        self.removes = set()  # role_id
+        self.reasons = []
+        self.waiters = []
+        self.queued_at = time.time()
+
+    def merge(self, add, remove, reason):
+        # Later operations win over earlier ones for the same role
+        for role in add:
+            self.adds[role.id] = role
+            self.removes.discard(role.id)
+        for role in remove:
+            self.removes.add(role.id)
+            self.adds.pop(role.id, None)
+        if reason and reason not in self.reasons:
+            self.reasons.append(reason)
+
+
+class _GuildBucket:
+    """Sliding-window limiter for member edits in one guild."""
+
+    def __init__(self):
+        self.sent = deque()
+        self.blocked_until = 0.0
+
+    async def acquire(self) -> bool:
+        """Wait for a free slot. Returns True if the caller had to wait."""
+        waited = False
+        while True:
+            now = time.monotonic()
+            while self.sent and now - self.sent[0] >= RATE_WINDOW:
+                self.sent.popleft()
+            delay = self.blocked_until - now
+            if len(self.sent) >= EDITS_PER_WINDOW:
+                delay = max(delay, RATE_WINDOW - (now - self.sent[0]))
+            if delay <= 0:
+                self.sent.append(now)
+                return waited
+            waited = True
+            await asyncio.sleep(delay)
+
+    def back_off(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+# ============================================================
+# QUEUE
+# ============================================================
+
+
+class RoleQueue:
+    def __init__(self):
+        self._pending = {}      # (guild_id, member_id) -> _Pending
+        self._order = deque()   # keys in arrival order
+        self._buckets = {}      # guild_id -> _GuildBucket
+        self._wake = None
+        self._task = None
+        self._idle = None
+        self._edit_times = deque()
+        self.metrics = {
+            "ops_submitted": 0,
+            "ops_merged": 0,
+            "edits": 0,
+            "noops": 0,
+            "retries": 0,
+            "failures": 0,
+            "rate_limit_waits": 0,
+        }
+
+    def submit(self, member: discord.Member, add=(), remove=(), reason: str = None, wait: bool = True):
+        """
+        Queue role changes for a member. Returns a future resolving to True once
+        applied (False if the member left), or raising the Discord error.
+        With wait=False nothing is returned and failures are only logged.
+        """
+        self._ensure_worker()
+        key = (member.guild.id, member.id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _Pending(member.guild, member.id)
+            self._pending[key] = pending
+            self._order.append(key)
+        else:
+            self.metrics["ops_merged"] += 1
+        self.metrics["ops_submitted"] += 1
+        pending.merge(add, remove, reason)
+        self._idle.clear()
+        self._wake.set()
+
+        if not wait:
+            return None
+        fut = asyncio.get_running_loop().create_future()
+        pending.waiters.append(fut)
+        return fut
+
+    def _ensure_worker(self):
+        if self._task and not self._task.done():
+            return
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def drain(self, timeout: float = 10.0):
+        """Wait for everything queued so far to be applied (used on shutdown)."""
+        if not self._idle or not self._pending:
+            return
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Role queue drain timed out with {len(self._pending)} members pending.")
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            await asyncio.sleep(COALESCE_DELAY)
+            self._wake.clear()
+            while self._order:
+                key = self._order.popleft()
+                pending = self._pending.pop(key, None)
+                if pending is None:
+                    continue
+                try:
+                    await self._apply(pending)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in role queue: {e}", exc_info=True)
+            if not self._order:
+                self._idle.set()
+
+    async def _apply(self, pending: _Pending):
+        # The edit replaces the whole role list, so it must start from current roles:
+        # discord.py's cache is kept live by the gateway, anything else is refetched
+        member = pending.guild.get_member(pending.member_id)
+        if member is None:
+            member = await membercache.cache.fetch(pending.guild, pending.member_id)
+        if member is None:
+            self._resolve(pending, result=False)
+            return
+
+        current = {r.id: r for r in member.roles if not r.is_default()}
+        target = dict(current)
+        for role_id in pending.removes:
+            target.pop(role_id, None)
+        target.update(pending.adds)
+        if target.keys() == current.keys():
+            self.metrics["noops"] += 1
+            self._resolve(pending, result=True)
+            return
+
+        reason = "; ".join(pending.reasons)[:MAX_REASON_LEN] or None
+        bucket = self._buckets.setdefault(pending.guild.id, _GuildBucket())
+        attempt = 0
+        while True:
+            if await bucket.acquire():
+                self.metrics["rate_limit_waits"] += 1
+            try:
+                await member.edit(roles=list(target.values()), reason=reason)
+                break
+            except (discord.Forbidden, discord.NotFound) as e:
+                self._fail(pending, member, e)
+                return
+            except discord.HTTPException as e:
+                if (e.status == 429 or e.status >= 500) and attempt < MAX_RETRIES:
+                    delay = BASE_BACKOFF * (2 ** attempt)
+                    attempt += 1
+                    self.metrics["retries"] += 1
+                    bucket.back_off(delay)
+                    logger.warning(f"⏳ Role edit for {member} got {e.status}, retrying in {delay:.0f}s ({attempt}/{MAX_RETRIES})")
+                    continue
+                self._fail(pending, member, e)
+                return
+
+        membercache.cache.invalidate(pending.guild.id, pending.member_id)
+        self.metrics["edits"] += 1
+        self._edit_times.append(time.monotonic())
+        self._resolve(pending, result=True)
+
+    def _fail(self, pending: _Pending, member, error: Exception):
+        self.metrics["failures"] += 1
+        if not pending.waiters:
+            logger.warning(f"Could not update roles for {member}: {error}")
+        for fut in pending.waiters:
+            if not fut.done():
+                fut.set_exception(error)
+
+    def _resolve(self, pending: _Pending, result: bool):
+        for fut in pending.waiters:
+            if not fut.done():
+                fut.set_result(result)
+
+    def stats(self) -> dict:
+        """Queue depth and throughput, for the dashboard."""
+        now = time.monotonic()
+        while self._edit_times and now - self._edit_times[0] > THROUGHPUT_WINDOW:
+            self._edit_times.popleft()
+        oldest = min((p.queued_at for p in self._pending.values()), default=None)
+        return {
+            **self.metrics,
+            "depth": len(self._pending),
+            "oldest_wait_sec": round(time.time() - oldest, 2) if oldest else 0,
+            "edits_last_minute": len(self._edit_times),
+        }
+
+
+queue = RoleQueue()
+
+
+# ============================================================
+# PUBLIC HELPERS
+# ============================================================
+
+
+async def update(member: discord.Member, add=(), remove=(), reason: str = None) -> bool:
+    """Apply adds and removes for a member in one edit. Raises discord errors like add_roles would."""
+    return await queue.submit(member, add=add, remove=remove, reason=reason)
+
+
+async def add(member: discord.Member, *roles, reason: str = None) -> bool:
+    return await update(member, add=roles, reason=reason)
+
+
+async def remove(member: discord.Member, *roles, reason: str = None) -> bool:
+    return await update(member, remove=roles, reason=reason)
+
+
+def stats() -> dict:
+    return queue.stats()
@@ -0,0 +1,73 @@
+"""
+Benchmark: legacy per-cipher gematria (helpers.*_values) vs the table-driven
+engine in gematria.py. Also checks both produce identical totals.
+
+Usage: python scripts/bench_gematria.py [phrases]
+"""
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gematria
+import helpers
+
+
+def legacy_all(text: str) -> dict:
+    """calculate_all_gematria as it was before gematria.py: nine filtered passes."""
+    eng_vals = helpers.english_gematria_values(text)
+    return {
+        "hebrew": sum(helpers.hebrew_values(text)),
+        "english": sum(eng_vals),
+        "ordinal": sum(helpers.ordinal_values(text)),
+        "reduction": sum(helpers.reduction_values(text)),
+        "reverse": sum(helpers.reverse_values(text)),
+        "reverse_reduction": sum(helpers.reverse_reduction_values(text)),
+        "fibonacci": sum(helpers.fibonacci_values(text)),
+        "latin": sum(helpers.latin_values(text)),
+        "sumerian": sum(eng_vals),
+        "reverse_sumerian": sum(helpers.reverse_sumerian_values(text)),
+    }
+
+
+def make_phrases(n: int) -> list:
+    rng = random.Random(42)
+    alphabet = string.ascii_letters + "     .,!?'0123456789éß"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(5, 120))) for _ in range(n)]
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    phrases = make_phrases(n)
+
+    for p in phrases[:2000]:
+        assert legacy_all(p) == gematria.score(p), p
+    print(f"✅ Legacy and engine agree on {min(n, 2000)} phrases")
+
+    t_legacy = timed(lambda: [legacy_all(p) for p in phrases])
+    t_single = timed(lambda: [gematria.score(p) for p in phrases])
+    t_batch = timed(gematria.score_many, phrases)
+
+    print(f"{n} phrases")
+    print(f"  legacy helpers      {t_legacy * 1000:8.1f} ms  ({t_legacy / n * 1e6:6.1f} µs/phrase)")
+    print(f"  gematria.score      {t_single * 1000:8.1f} ms  ({t_single / n * 1e6:6.1f} µs/phrase)  x{t_legacy / t_single:.1f}")
+    print(f"  gematria.score_many {t_batch * 1000:8.1f} ms  ({t_batch / n * 1e6:6.1f} µs/phrase)  x{t_legacy / t_batch:.1f}")
+
+    idx = gematria.GematriaIndex()
+    t_build = timed(idx.build, [{"source": "quote", "text": p} for p in phrases])
+    value = gematria.score(phrases[0])["english"]
+    t_lookup = timed(idx.lookup, "english", value)
+    print(f"  reverse index build {t_build * 1000:8.1f} ms, lookup {t_lookup * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
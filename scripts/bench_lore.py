@@ -0,0 +1,99 @@
+"""
+Benchmark: import time and resident memory of the lore datasets as module-level
+dict literals (how hierarchy/tarot/rws/manara used to ship them) vs lore.py's
+lazy JSON datasets. Each measurement runs in a fresh interpreter.
+
+Usage: python scripts/bench_lore.py [runs]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lore
+
+DATASETS = {
+    "HIERARCHY_DB": lore.HIERARCHY,
+    "THOTH_DECK": lore.THOTH_DECK,
+    "RWS_DECK": lore.RWS_DECK,
+    "MANARA_DECK": lore.MANARA_DECK,
+}
+
+# Stdlib modules the bot has loaded long before any dataset, kept out of the numbers
+PROBE = """
+import gc, sys, time
+import json, logging, os, threading, collections.abc
+sys.path[:0] = {paths!r}
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+gc.collect()
+base = rss_kb()
+t0 = time.perf_counter()
+{stmt}
+t1 = time.perf_counter()
+gc.collect()
+print(round((t1 - t0) * 1000, 2), rss_kb() - base)
+"""
+
+
+def write_legacy_module(directory: str) -> str:
+    """Recreate the old layout: every dataset as a dict-of-dicts literal in a .py file."""
+    lines = []
+    for name, dataset in DATASETS.items():
+        records = {
+            key: {f: list(record[f]) if isinstance(record[f], tuple) else record[f] for f in record.__slots__}
+            for key, record in dataset.items()
+        }
+        lines.append(f"{name} = {json.dumps(records, ensure_ascii=False, indent=4)}\n")
+    path = os.path.join(directory, "legacy_lore.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+def probe(stmt: str, paths, runs: int):
+    """Median (ms, rss_kb) over fresh interpreters."""
+    code = PROBE.format(paths=list(paths), stmt=stmt)
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout.split()
+        samples.append((float(out[0]), int(out[1])))
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    if not os.path.exists("/proc/self/status"):
+        sys.exit("Needs Linux /proc for RSS readings.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_legacy_module(tmp)
+        cases = [
+            ("before: dict literals, cold (compile)", "import legacy_lore", [tmp], "cold"),
+            ("before: dict literals, warm (.pyc)", "import legacy_lore", [tmp], "warm"),
+            ("after: import lore (nothing loaded)", "import lore", [ROOT], "warm"),
+            ("after: lore + first use of all four", "import lore\nfor d in (lore.HIERARCHY, lore.THOTH_DECK, lore.RWS_DECK, lore.MANARA_DECK): len(d)", [ROOT], "warm"),
+        ]
+        print(f"median of {runs} fresh interpreters")
+        for label, stmt, paths, mode in cases:
+            if mode == "cold":
+                ms, kb = probe(f"import sys; sys.dont_write_bytecode = True\n{stmt}", paths, runs)
+            else:
+                probe(stmt, paths, 1)  # write .pyc first
+                ms, kb = probe(stmt, paths, runs)
+            print(f"  {label:<40} {ms:8.2f} ms  {kb / 1024:6.2f} MB RSS")
+
+
+if __name__ == "__main__":
+    main()
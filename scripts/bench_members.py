@@ -0,0 +1,103 @@
+"""
+Benchmark: startup member load and resident memory for each MEMBER_CACHE_PROFILE
+on a synthetic guild. "full" decodes and caches every member the way discord.py
+handles GUILD_MEMBERS_CHUNK at startup; "lazy" and "minimal" load nothing at
+startup and are measured once the member LRU is full (members seen in messages
+or fetched on a miss). Each measurement runs in a fresh interpreter.
+
+Usage: python scripts/bench_members.py [members] [runs]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import gc, json, os, sys, time
+sys.path[:0] = {paths!r}
+os.environ.setdefault("DISCORD_TOKEN", "bench")
+os.environ.setdefault("OPENCAGE_KEY", "bench")
+os.environ.setdefault("SERPAPI_KEY", "bench")
+os.environ.setdefault("CHANNEL_ID", "0")
+import discord
+from discord.state import ConnectionState
+import membercache
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+MEMBERS, PROFILE, CHUNK = {members}, {profile!r}, 1000
+ROLE_IDS = [str(2 * 10**17 + r) for r in range(9)]
+
+def role(i, rid):
+    return {{"id": rid, "name": f"role{{i}}", "permissions": "0", "position": i, "color": 0,
+            "hoist": False, "managed": False, "mentionable": False, "flags": 0}}
+
+def member(i):
+    return {{
+        "user": {{"id": str(10**17 + i), "username": f"user{{i}}", "global_name": f"User {{i}}",
+                 "discriminator": "0", "avatar": "%032x" % i, "bot": False}},
+        "roles": [ROLE_IDS[1 + i % 8]], "joined_at": "2024-01-01T00:00:00+00:00",
+        "nick": None, "deaf": False, "mute": False, "flags": 0,
+    }}
+
+intents = discord.Intents.default()
+intents.members = True
+intents.message_content = True
+state = ConnectionState(dispatch=lambda *a, **k: None, handlers={{}}, hooks={{}}, http=None,
+                        intents=intents, **membercache.cache_options(intents, PROFILE))
+guild = discord.Guild(data={{"id": "1", "name": "bench", "member_count": MEMBERS,
+                            "roles": [role(0, "1")] + [role(i, rid) for i, rid in enumerate(ROLE_IDS[1:], 1)]}},
+                      state=state)
+
+gc.collect()
+base = rss_kb()
+load_ms = 0.0
+if state._chunk_guilds:
+    # GUILD_MEMBERS_CHUNK: decode each 1000-member payload, build Members, cache them
+    for start in range(0, MEMBERS, CHUNK):
+        raw = json.dumps({{"members": [member(i) for i in range(start, min(start + CHUNK, MEMBERS))]}})
+        t0 = time.perf_counter()
+        for data in json.loads(raw)["members"]:
+            guild._add_member(discord.Member(data=data, guild=guild, state=state))
+        load_ms += (time.perf_counter() - t0) * 1000
+        del raw
+else:
+    # Steady state: the LRU holds the most recently seen / fetched members
+    for i in range(min(MEMBERS, membercache.MAX_ENTRIES)):
+        membercache.cache.put(discord.Member(data=member(i), guild=guild, state=state))
+gc.collect()
+cached = len(guild._members) + len(membercache.cache._entries)
+print(round(load_ms, 1), rss_kb() - base, cached)
+"""
+
+
+def probe(profile: str, members: int, runs: int):
+    """Median (startup ms, rss_kb, members held) over fresh interpreters."""
+    code = PROBE.format(paths=[ROOT], members=members, profile=profile)
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+        samples.append((float(out[0]), int(out[1]), int(out[2])))
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    if not os.path.exists("/proc/self/status"):
+        sys.exit("Needs Linux /proc for RSS readings.")
+
+    print(f"{members:,} members, median of {runs} fresh interpreters")
+    for profile in ("full", "lazy", "minimal"):
+        ms, kb, held = probe(profile, members, runs)
+        print(f"  {profile:<8} startup member load {ms:9.1f} ms  {kb / 1024:8.2f} MB RSS  {held:>8,} members held")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,677 +1,296 @@
+"""
+Tarot Deck Service
+One place for every deck (Thoth, Rider-Waite-Smith, Manara): card keys, embed
+templates and image bytes are loaded once per deck, the per-guild deck choice
+is cached by database.get_guild_tarot_deck, and multi-card spreads are
+composited into a single image. Card art is read on first draw and kept in a
+small LRU, so repeat draws of recent cards do no filesystem I/O.
+"""
+
+import asyncio
+import io
+import logging
+import os
 import random
+from collections import OrderedDict
+
 import discord
-import os
-import asyncio  # New: Required for run_in_executor
-import logging  # New: Good practice for error reporting
 
-# NOTE: Assuming TAROT_DECK is defined here as a dictionary like in your original file.
+import database
+import lore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DECK = "thoth"
+
+# Image bytes kept in memory across all decks (LRU): about three Celtic cross
+# spreads of the heaviest deck (Thoth, ~420KB a card), not whole decks.
+IMAGE_CACHE_BYTES = 12 * 1024 * 1024
+
+# Spread compositing: each card is scaled to this height
+SPREAD_CARD_HEIGHT = 420
+SPREAD_GAP = 16
+SPREAD_BACKGROUND = (18, 12, 24)
+
+SPREADS = {
+    "three": ("Past", "Present", "Future"),
+    "celtic": (
+        "Present", "Challenge", "Foundation", "Recent Past", "Crown", "Near Future",
+        "Self", "Environment", "Hopes & Fears", "Outcome",
+    ),
+}
+SPREAD_ALIASES = {"3": "three", "three": "three", "ppf": "three", "celtic": "celtic", "cross": "celtic", "10": "celtic"}
+
 # ============================================================
-# TAROT DECK DATA - Aleister Crowley Thoth Tarot
+# DECKS
 # ============================================================
 
-# Replace '...' with your actual Thoth deck data
-TAROT_DECK = {
-    # MAJOR ARCANA (0-21)
-    "00-the-fool": {
-        "name": "The Fool",
-        "emojis": "💨 🌈 🃏 ⚡ 🎭",
-        "attribution": "Air • Aleph",
-        "att2": "",
-        "description": "Original potential, creative chaos, carefree, new beginnings, starting off into the unknown, jester's license, foolhardiness",
-    },
-    "01-the-magus": {
-        "name": "The Magus",
-        "emojis": "☿️ 🪄 🎪 📜 🐒",
-        "attribution": "Mercury • Beth",
-        "att2": "",
-        "description": "Primer, activity, resolution, willpower, concentration, vital force, mastery, self-realization, assertion, skillfulness, trickiness",
-    },
-    "02-the-priestess": {
-        "name": "The Priestess",
-        "emojis": "🌙 🏹 👸 🔮 ✨",
-        "attribution": "Moon • Gimel",
-        "att2": "",
-        "description": "Inner guidance, wisdom, female intuition, visions, fantasies, secrets, waiting willingness to be guided",
-    },
-    "03-the-empress": {
-        "name": "The Empress",
-        "emojis": "♀️ 🌹 👑 🦢 🦅",
-        "attribution": "Venus • Daleth",
-        "att2": "",
-        "description": "Growth, creative potential, intuitive power, renewal, pregnancy, birth, consideration",
-    },
-    "04-the-emperor": {
-        "name": "The Emperor",
-        "emojis": "♈ 🐏 👑 ⚔️ 🦅",
-        "attribution": "Aries • Tzaddi",
-        "att2": "",
-        "description": "Sense of reality, willingness to take responsibility, initiative, sense of security, continuity, strength of leadership, uprightness, pragmatism",
-    },
-    "05-the-hierophant": {
-        "name": "The Hierophant",
-        "emojis": "♉ 🐘 ⭐ 🕊️ 📿",
-        "attribution": "Taurus • Vau",
-        "att2": "",
-        "description": "Trust, search for truth, experience of meaning, power of conviction, virtue, expansion of consciousness, strength of faith",
-    },
-    "06-the-lovers": {
-        "name": "The Lovers",
-        "emojis": "♊ 💑 🗡️ 🥚 🦅",
-        "attribution": "Gemini • Zain",
-        "att2": "",
-        "description": "Union, love, heartfelt actions, decisions of the heart, overcoming opposites, collecting details",
-    },
-    "07-the-chariot": {
-        "name": "The Chariot",
-        "emojis": "♋ 🏺 🦁 🐂 🌊",
-        "attribution": "Cancer • Cheth",
-        "att2": "",
-        "description": "Mood of departure, thirst for adventure, boldness, conscious of goal, assertive will",
-    },
-    "08-adjustment": {
-        "name": "Adjustment",
-        "emojis": "♎ ⚖️ 🗡️ 👑 💎",
-        "attribution": "Libra • Lamed",
-        "att2": "",
-        "description": "Objectivity, clarity, balance, justice, karma, sober perception, personal responsibility, self-criticism",
-    },
-    "09-the-hermit": {
-        "name": "The Hermit",
-        "emojis": "♍ 🪔 🥚 🐍 🌾",
-        "attribution": "Virgo • Yod",
-        "att2": "",
-        "description": "Contemplating what is essential, defining one's position, seclusion, seriousness, retreat, getting to the bottom of things, life experience",
-    },
-    "10-fortune": {
-        "name": "Fortune",
-        "emojis": "♃ 🎡 🦁 🐒 🐍",
-        "attribution": "Jupiter • Kaph",
-        "att2": "",
-        "description": "Changes, shift, new beginning, happiness, fateful events, task in life",
-    },
-    "11-lust": {
-        "name": "Lust",
-        "emojis": "♌ 🦁 👸 🏺 🔥",
-        "attribution": "Leo • Teth",
-        "att2": "",
-        "description": "Courage, vitality, love of life, strength, passion, intrepidity",
-    },
-    "12-the-hanged-man": {
-        "name": "The Hanged Man",
-        "emojis": "🌊 ☠️ 🐍 ⚓ 🔺",
-        "attribution": "Water • Mem",
-        "att2": "",
-        "description": "Being worn down between two opposites, dilemma, test of patience, powerlessness, dead-end street, involuntary learning processes, crisis in life, forced break, having to make a sacrifice",
-    },
-    "13-death": {
-        "name": "Death",
-        "emojis": "♏ 🦂 💀 🦅 🐟",
-        "attribution": "Scorpio • Nun",
-        "att2": "",
-        "description": "Parting, natural end, fear of life, futile clinging, being forced to let go, renunciation",
-    },
-    "14-art": {
-        "name": "Art",
-        "emojis": "♐ 🌈 ⚗️ 🦅 🦁",
-        "attribution": "Sagittarius • Samech",
-        "att2": "",
-        "description": "Finding the right proportions, balance of powers, harmony, relaxation, overcoming differences, healing",
-    },
-    "15-the-devil": {
-        "name": "The Devil",
-        "emojis": "♑ 🐐 👁️ 🍇 🪐",
-        "attribution": "Capricorn • Ayin",
-        "att2": "",
-        "description": "Shadows, instinctiveness, lack of moderation, greed, thirst for power, temptation, unconscious forces",
-    },
-    "16-the-tower": {
-        "name": "The Tower",
-        "emojis": "♂️ ⚡ 🗼 👁️ 🕊️",
-        "attribution": "Mars • Peh",
-        "att2": "",
-        "description": "Sudden perception, upheaval, breakthrough, liberation, blow of fate",
-    },
-    "17-the-star": {
-        "name": "The Star",
-        "emojis": "♒ ⭐ 🌊 🌊 🌀",
-        "attribution": "Aquarius • Heh",
-        "att2": "",
-        "description": "Good prospects, hope, trust in the future, harmony, higher guidance",
-    },
-    "18-the-moon": {
-        "name": "The Moon",
-        "emojis": "♓ 🌙 🦂 🐺 🌊",
-        "attribution": "Pisces • Qoph",
-        "att2": "",
-        "description": "Fear of the threshold before an important step, feelings of insecurity, nightmares, stage fright, threatening memories, dark premonitions",
-    },
-    "19-the-sun": {
-        "name": "The Sun",
-        "emojis": "☀️ 👶 🦋 🌹 ✨",
-        "attribution": "Sun • Resh",
-        "att2": "",
-        "description": "Happiness, enjoying the sunny side of life, new birth, high spirits, success, self-development, steering toward a culminating point",
-    },
-    "20-the-aeon": {
-        "name": "The Aeon",
-        "emojis": "🔥 👶 🌟 🐍 ✨",
-        "attribution": "Fire • Shin",
-        "att2": "",
-        "description": "Transformation, new beginning, hope, self-discovery, spiritual development",
-    },
-    "21-the-universe": {
-        "name": "The Universe",
-        "emojis": "🪐 🌍 💃 🐍 ♄",
-        "attribution": "Saturn • Earth • Tau",
-        "att2": "",
-        "description": "Completion, joy of living, being at the right place at the right time, resting in one's center, fulfillment, return home, reconciliation",
-    },
-    # WANDS - Fire
-    "wands-01": {
-        "name": "Ace of Wands",
-        "emojis": "🔥 🌳 ⚡ 💫 🔆",
-        "attribution": "Root of Fire",
-        "att2": "Initiative (♈), joy of life (♌), growth (♐)",
-        "description": "Hopeful new beginning, initiative, willpower, decisiveness, electrifying idea, surge of creativity, opportunity for self-development, becoming inflamed about something",
-    },
-    "wands-02": {
-        "name": "Two of Wands - Dominion",
-        "emojis": "♂️ ♈ 🔥 ⚔️ 👑",
-        "attribution": "Mars in Aries • Chokmah",
-        "att2": "Forces of the ego, energy (♂) spirit of departure (♈)",
-        "description": "Eagerness to fight, courage, willingness to take risks, willpower, becoming inflamed about something, spontaneous assertion, violent forging ahead, inconsideration",
-    },
-    "wands-03": {
-        "name": "Three of Wands - Virtue",
-        "emojis": "☀️ ♈ 🌺 👑 ✨",
-        "attribution": "Sun in Aries • Binah",
-        "att2": "Self-confidence, being centered, vitality (☉) in connection with a pioneering spirit and an urge to move forward (♈)",
-        "description": "Healthy basis, confidence, success, initiative, vitality",
-    },
-    "wands-04": {
-        "name": "Four of Wands - Completion",
-        "emojis": "♀️ ♈ 🐏 🕊️ 🏰",
-        "attribution": "Venus in Aries • Chesed",
-        "att2": "Charm and accommodation (♀) in balanced combination with a fighting spirit and desire to conquer (♈)",
-        "description": "Order and harmony, balanced dynamics, self-assurance, equilibrium",
-    },
-    "wands-05": {
-        "name": "Five of Wands - Strife",
-        "emojis": "♄ ♌ ⚔️ 🔥 💥",
-        "attribution": "Saturn in Leo • Geburah",
-        "att2": "Courage (♌) to be responsible (♄) and persistent (♄) self-development (♌)",
-        "description": "Comparison of strength, ambition, aggressiveness, challenge, overstepping bounds",
-    },
-    "wands-06": {
-        "name": "Six of Wands - Victory",
-        "emojis": "♃ ♌ 🏆 🌟 ⚡",
-        "attribution": "Jupiter in Leo • Tiphareth",
-        "att2": "Abundance, wealth, success (♃) in connection with self-assurance, self-fulfillment, strength, triumph (♌)",
-        "description": "Reward for accomplished effort, good news, optimism, victory",
-    },
-    "wands-07": {
-        "name": "Seven of Wands - Valour",
-        "emojis": "♂️ ♌ ⚔️ 🛡️ 🔥",
-        "attribution": "Mars in Leo • Netzach",
-        "att2": "Courage, decisiveness, and willingness to engage in conflict (♂) in connection with self-confidence certain of success (♌)",
-        "description": "Risking a single-handed effort, growing beyond one's own limitations, struggling with difficulties, taking a risk",
-    },
-    "wands-08": {
-        "name": "Eight of Wands - Swiftness",
-        "emojis": "☿️ ♐ ⚡ 🌈 💬",
-        "attribution": "Mercury in Sagittarius • Hod",
-        "att2": "Confident, farsighted, hopeful (♐) thinking and perceiving (☿)",
-        "description": "'Aha' experience, sudden solution to problems, flashes of inspiration, being a 'live wire'",
-    },
-    "wands-09": {
-        "name": "Nine of Wands - Strength",
-        "emojis": "🌙 ♐ 🏹 💪 ☀️",
-        "attribution": "Moon in Sagittarius • Yesod",
-        "att2": "Confidence and urge to develop (♐) rising from the unconscious (☽)",
-        "description": "Drawing on abundant resources, experiencing a flow of energy, anticipation, inspiration",
-    },
-    "wands-10": {
-        "name": "Ten of Wands - Oppression",
-        "emojis": "♄ ♐ ⚔️ 🔥 💔",
-        "attribution": "Saturn in Sagittarius • Malkuth",
-        "att2": "Blockage, inhibition, suppression (♄) of enthusiasm, power of conviction, life philosophy, expansion (♐)",
-        "description": "Blocked development, problems with authority, frustration, fear of life, 'straitjacket'",
-    },
-    "wands-princess": {
-        "name": "Princess of Wands",
-        "emojis": "🔥 🌍 ☀️ 💃 ⚡",
-        "attribution": "Earthy part of Fire",
-        "att2": "",
-        "description": "Young, dynamic, impulsive, zestful woman; amazon, primer, impetuous new beginning, enthusiasm, desire for adventure, impatience",
-    },
-    "wands-prince": {
-        "name": "Prince of Wands",
-        "emojis": "🔥 💨 🦅 🐉 ⚡",
-        "attribution": "Airy part of Fire",
-        "att2": "",
-        "description": "Daredevil, conqueror, hero, sprinter, hothead, new momentum, initiative, enthusiasm",
-    },
-    "wands-queen": {
-        "name": "Queen of Wands",
-        "emojis": "🔥 🌊 👑 🐆 🔥",
-        "attribution": "Watery part of Fire",
-        "att2": "",
-        "description": "Healthy sense of self-assurance, iniative, openness, impulsiveness, independence, self-fulfillment; high-spirited, charismatic, generous woman who is mature in terms of human experience",
-    },
-    "wands-knight": {
-        "name": "Knight of Wands",
-        "emojis": "🔥 🔥 🏇 ⚡ 👑",
-        "attribution": "Fiery part of Fire",
-        "att2": "",
-        "description": "Self-confidence, courage, striving for ideals, strong enterprising spirit; strong-willed, dynamic mature man; exemplary personality, leader nature",
-    },
-    # CUPS - Water
-    "cups-01": {
-        "name": "Ace of Cups",
-        "emojis": "🌊 🏺 🌊 💖 🌹",
-        "attribution": "Root of Water",
-        "att2": "Emotional depth (♋), emotional strength (♏), devotion and empathy (♓)",
-        "description": "Bliss, inner wealth, openness, harmony, opportunity to find fulfillment",
-    },
-    "cups-02": {
-        "name": "Two of Cups - Love",
-        "emojis": "♀️ ♋ 💑 🐬 🌺",
-        "attribution": "Venus in Cancer • Chokmah",
-        "att2": "Loving, delightful (♀) devotion and feelings (♋) of emotional (♋) connection (♀)",
-        "description": "Happy relationship, cooperation, reconciliation, joyful encounter",
-    },
-    "cups-03": {
-        "name": "Three of Cups - Abundance",
-        "emojis": "☿️ ♋ 🍇 🌺 🎉",
-        "attribution": "Mercury in Cancer • Binah",
-        "att2": "Emotional (♋) exchange (☿), emotional (♋) intelligence (☿)",
-        "description": "Fulfillment, joy, fertile exchange, gratitude, well-being, rich harvest",
-    },
-    "cups-04": {
-        "name": "Four of Cups - Luxury",
-        "emojis": "🌙 ♋ 🏺 🌊 💔",
-        "attribution": "Moon in Cancer • Chesed",
-        "att2": "Caring, motherly, devoted (♋) feelings (☽)",
-        "description": "Reveling, enjoying life, emotional security, sense of security",
-    },
-    "cups-05": {
-        "name": "Five of Cups - Disappointment",
-        "emojis": "♂️ ♏ 💔 🌧️ 😢",
-        "attribution": "Mars in Scorpio • Geburah",
-        "att2": "Power (♂) growing from decay (♏)",
-        "description": "Disappointed expectations, faded hope, melancholy, painful perceptions, transformational crisis",
-    },
-    "cups-06": {
-        "name": "Six of Cups - Pleasure",
-        "emojis": "☀️ ♏ 🌺 💖 ✨",
-        "attribution": "Sun in Scorpio • Tiphareth",
-        "att2": "Deep, self-renewing (♏) joy of life (☉)",
-        "description": "Reawakening spirits, drawing from the depths, finding fulfillment, emotional recovery, well-being",
-    },
-    "cups-07": {
-        "name": "Seven of Cups - Debauch",
-        "emojis": "♀️ ♏ 🍷 💀 😵",
-        "attribution": "Venus in Scorpio • Netzach",
-        "att2": "Depths (♏) of desire (♀), pleasure (♀) that leads to dependence (♏)",
-        "description": "Disaster, dangerous temptation, addictions, deception, threatening calamity",
-    },
-    "cups-08": {
-        "name": "Eight of Cups - Indolence",
-        "emojis": "♄ ♓ 🌊 💤 🥀",
-        "attribution": "Saturn in Pisces • Hod",
-        "att2": "Hardened, dead (♄) feelings (♓)",
-        "description": "Weakness, broken hopes, disheartenment, resignation, necessity of changing one's ways, stagnation, depression",
-    },
-    "cups-09": {
-        "name": "Nine of Cups - Happiness",
-        "emojis": "♃ ♓ 🎉 💖 ✨",
-        "attribution": "Jupiter in Pisces • Yesod",
-        "att2": "Happiness, growth, trust (♃) in spirituality and all-encompassing love (♓)",
-        "description": "Bliss, optimism, meaningful experience, charity, trust in God, quiet happiness",
-    },
-    "cups-10": {
-        "name": "Ten of Cups - Satiety",
-        "emojis": "♂️ ♓ 🏺 🌊 🌹",
-        "attribution": "Mars in Pisces • Malkuth",
-        "att2": "Fulfillment (♓) and a new beginning (♂), emotional (♓) strength (♂)",
-        "description": "Fulfillment, culmination, completion, gratitude, sociableness",
-    },
-    "cups-princess": {
-        "name": "Princess of Cups",
-        "emojis": "🌊 🌍 🦢 🐢 🐬",
-        "attribution": "Earthy part of Water",
-        "att2": "",
-        "description": "Sensitive young woman, enchanting seductress, dreamer, muse, longing for union, romance, deep feelings, daydreaming, quiet joy",
-    },
-    "cups-prince": {
-        "name": "Prince of Cups",
-        "emojis": "🌊 💨 🦅 🐍 🌊",
-        "attribution": "Airy part of Water",
-        "att2": "",
-        "description": "Tender, romantic man; seducer, charmer, warm personality, gushing enthusiasm",
-    },
-    "cups-queen": {
-        "name": "Queen of Cups",
-        "emojis": "🌊 🌊 🦢 🌊 🔮",
-        "attribution": "Watery part of Water",
-        "att2": "",
-        "description": "Sensitivity, devotion, inspiration, depth of feeling, receptivity, mercy; intuition, maturity, an artistic woman",
-    },
-    "cups-knight": {
-        "name": "Knight of Cups",
-        "emojis": "🌊 🔥 🏇 🦚 ♋️",
-        "attribution": "Fiery part of Water",
-        "att2": "",
-        "description": "Emotional depth, artistic talent, medial abilities, imagination, sensitivity; mature, helpful, sensitive man; intuitive advisor",
-    },
-    # SWORDS - Air
-    "swords-01": {
-        "name": "Ace of Swords",
-        "emojis": "💨 🗡️ 👑 ⚡ ⚖️",
-        "attribution": "Root of Air",
-        "att2": "Curiosity (♊), sociability (♎), intellect (♒)",
-        "description": "Intellectual interests, thirst for knowledge, the power of reason, good opportunity to clarify something, making sensible and clear decisions",
-    },
-    "swords-02": {
-        "name": "Two of Swords - Peace",
-        "emojis": "🌙 ♎ 🗡️ 🌹 ⚖️",
-        "attribution": "Moon in Libra • Chokmah",
-        "att2": "Balanced, peaceful (♎) feelings (☽), need (☽) for harmony (♐)",
-        "description": "State of balance, relaxation, serenity, thoughtfulness, fairness, compromise",
-    },
-    "swords-03": {
-        "name": "Three of Swords - Sorrow",
-        "emojis": "♄ ♎ 💔 😢 🗡️",
-        "attribution": "Saturn in Libra • Binah",
-        "att2": "Blockage/end (♄) of peace and harmony (♎)",
-        "description": "Bad news, disappointment, weakness, sorrow, helplessness, chaos, disillusionment, renunciation, loss",
-    },
-    "swords-04": {
-        "name": "Four of Swords - Truce",
-        "emojis": "♃ ♎ 🗡️ 🌹 ✝️",
-        "attribution": "Jupiter in Libra • Chesed",
-        "att2": "Faith/hope (♃) for peace and justice (♎)",
-        "description": "Sham peace, temporary retreat, calm before the storm, cowardice, forced break, isolation, building up one's strength",
-    },
-    "swords-05": {
-        "name": "Five of Swords - Defeat",
-        "emojis": "♀️ ♒ 💔 🗡️ 😞",
-        "attribution": "Venus in Aquarius • Geburah",
-        "att2": "Willful, unpredictable, frosty (♒) conduct in relationship (♀)",
-        "description": "Capitulation, betrayal, humiliation, suffering 'shipwreck,' vileness",
-    },
-    "swords-06": {
-        "name": "Six of Swords - Science",
-        "emojis": "☿️ ♒ 🗡️ 🌹 ✝️",
-        "attribution": "Mercury in Aquarius • Tiphareth",
-        "att2": "Innovative (♒) thinking (☿) and philosophical, scientific (♒) perceiving (☿)",
-        "description": "Perception, progress, openness, insight, objectivity, intelligence",
-    },
-    "swords-07": {
-        "name": "Seven of Swords - Futility",
-        "emojis": "🌙 ♒ 🗡️ 🌙 😔",
-        "attribution": "Moon in Aquarius • Netzach",
-        "att2": "Changeable, moody (☽) theories and concepts (♒)",
-        "description": "Unexpected obstacles, impairment, self-deception, fraud, cowardice",
-    },
-    "swords-08": {
-        "name": "Eight of Swords - Interference",
-        "emojis": "♃ ♊ 🗡️ ⚔️ 🔗",
-        "attribution": "Jupiter in Gemini • Hod",
-        "att2": "High goals (♃) that are threatened by doubts and inner conflicts (♊)",
-        "description": "Difficult progress because of distractions, inner conflicts, doubt, absentmindedness, slip-ups, flightiness",
-    },
-    "swords-09": {
-        "name": "Nine of Swords - Cruelty",
-        "emojis": "♂️ ♊ 🗡️ 😭 💀",
-        "attribution": "Mars in Gemini • Yesod",
-        "att2": "Merciless harshness (♂) and heartless calculating attitude (♊)",
-        "description": "Adversity, powerlessness, failure, feelings of guilt, worries, panic",
-    },
-    "swords-10": {
-        "name": "Ten of Swords - Ruin",
-        "emojis": "☀️ ♊ 🗡️ 💀 ☠️",
-        "attribution": "Sun in Gemini • Malkuth",
-        "att2": "Fragmentation (♊) of vital force (☉)",
-        "description": "Random end, making a clean sweep, putting a stop to something, breakdown, out-of-control destructive energies",
-    },
-    "swords-princess": {
-        "name": "Princess of Swords",
-        "emojis": "💨 🌍 🗡️ ⚔️ 👸",
-        "attribution": "Earthy part of Air",
-        "att2": "",
-        "description": "Young, intellectual woman; female rebel who is nimble-minded and knowledgeable; esprit, clarity, mental renewal, provocation, restlessness, quarrelsome nature",
-    },
-    "swords-prince": {
-        "name": "Prince of Swords",
-        "emojis": "💨 💨 🗡️ 🧚 ⚡",
-        "attribution": "Airy part of Air",
-        "att2": "",
-        "description": "The intellectual, the eloquent individual, the technocrat, the position-changer, independence, aimlessness, lightness, slyness, cynicism",
-    },
-    "swords-queen": {
-        "name": "Queen of Swords",
-        "emojis": "💨 🌊 👑 🗡️ 💀",
-        "attribution": "Watery part of Air",
-        "att2": "",
-        "description": "Wealth of ideas, presence of mind, independence, quick-wittedness; rationally oriented, cultivated, emancipated, critical, clever woman; female individualist",
-    },
-    "swords-knight": {
-        "name": "Knight of Swords",
-        "emojis": "💨 🔥 🏇 🗡️ 🌪️",
-        "attribution": "Fiery part of Air",
-        "att2": "",
-        "description": "Versatility, discernment, flexibility, intelligence, objectivity, too much emphasis on rational mind, calculation; clever, eloquent, brilliant, goal-oriented man; experienced advisor",
-    },
-    # DISKS - Earth
-    "disks-01": {
-        "name": "Ace of Disks",
-        "emojis": "🌍 💎 🪙 🌱 ✨",
-        "attribution": "Root of Earth",
-        "att2": "Enjoyment (♉), sense of reality (♍), and stability (♑)",
-        "description": "Affluence, material happiness, health, inner and outer strength, stability, opportunity for lasting success, sensuality",
-    },
-    "disks-02": {
-        "name": "Two of Disks - Change",
-        "emojis": "♃ ♑ ☯️ 🐍 🔄",
-        "attribution": "Jupiter in Capricorn • Chokmah",
-        "att2": "Expansion (♃) and concentration (♑)",
-        "description": "Change, flexible exchange, mutual fructification, variety",
-    },
-    "disks-03": {
-        "name": "Three of Disks - Works",
-        "emojis": "♂️ ♑ 🔺 ⚙️ 🏗️",
-        "attribution": "Mars in Capricorn • Binah",
-        "att2": "Forming and processing (♂) matter and reality (♑) with strength (♂) and consistent staying power (♑)",
-        "description": "Taking concrete steps, translating ideas into reality, building structures, slow but continuous progress, perseverance, consolidation",
-    },
-    "disks-04": {
-        "name": "Four of Disks - Power",
-        "emojis": "☀️ ♑ 🏰 👑 🛡️",
-        "attribution": "Sun in Capricorn • Chesed",
-        "att2": "Self-fulfillment and vitality (☉) through security, structure, and order (♑)",
-        "description": "Stability, safeguarding, sense of reality, control, structuring",
-    },
-    "disks-05": {
-        "name": "Five of Disks - Worry",
-        "emojis": "☿️ ♉ 💰 😰 ⭐",
-        "attribution": "Mercury in Taurus • Geburah",
-        "att2": "Bogged-down, obstinate (♉) thinking (☿)",
-        "description": "Helplessness, fear of loss, constriction, drudgery without results, frustration at nothing working out",
-    },
-    "disks-06": {
-        "name": "Six of Disks - Success",
-        "emojis": "🌙 ♉ 💰 ⚖️ ✨",
-        "attribution": "Moon in Taurus • Tiphareth",
-        "att2": "Fertility (☽) and growth (♉), feelings (☽) of abundance and enjoyment (♉)",
-        "description": "Increase, material gain, favorable interplay of the forces, welcome development",
-    },
-    "disks-07": {
-        "name": "Seven of Disks - Failure",
-        "emojis": "♄ ♉ 🌾 😞 💔",
-        "attribution": "Saturn in Taurus • Netzach",
-        "att2": "Blockade, end, departure (♄) from possessions and stability (♉)",
-        "description": "Destroyed hope, bad circumstances, bad luck, unhappiness, pessimism, loss",
-    },
-    "disks-08": {
-        "name": "Eight of Disks - Prudence",
-        "emojis": "☀️ ♍ 🌳 ⚙️ 💰",
-        "attribution": "Sun in Virgo • Hod",
-        "att2": "Mindful, worldly-wise, prudent (♍) nature (☉)",
-        "description": "Cautious new beginning, moderation, skillfulness, care, patience",
-    },
-    "disks-09": {
-        "name": "Nine of Disks - Gain",
-        "emojis": "♀️ ♍ 💎 🌟 🏆",
-        "attribution": "Venus in Virgo • Yesod",
-        "att2": "Fortuna (♀) brings in the harvest (♍)",
-        "description": "Change for the better, well-being, stroke of luck, material increase",
-    },
-    "disks-10": {
-        "name": "Ten of Disks - Wealth",
-        "emojis": "☿️ ♍ 💰 🪙 🏛️",
-        "attribution": "Mercury in Virgo • Malkuth",
-        "att2": "Cleverness and skill (☿) in business area (♍)",
-        "description": "Solid success, wealth, secure circumstances, having achieved the goal",
-    },
-    "disks-princess": {
-        "name": "Princess of Disks",
-        "emojis": "🌍 🌍 🐏 💎 🌾",
-        "attribution": "Earthy part of Earth",
-        "att2": "",
-        "description": "Young, sensual, fertile woman; naturalness, creativity, growth, pregnancy",
-    },
-    "disks-prince": {
-        "name": "Prince of Disks",
-        "emojis": "🌍 💨 🐂 🌾 ⚙️",
-        "attribution": "Airy part of Earth",
-        "att2": "",
-        "description": "Energetic young man, prime mover, person with imperturbable staying power ('steamroller'), sense of reality, persistence, endurance, concentration, initiative",
-    },
-    "disks-queen": {
-        "name": "Queen of Disks",
-        "emojis": "🌍 🌊 🐐 🌹 👑",
-        "attribution": "Watery part of Earth",
-        "att2": "",
-        "description": "Fertility, sense of security, sensuality, serenity, endurance; a mature, experienced woman; being calm, patient, stable, trustworthy",
-    },
-    "disks-knight": {
-        "name": "Knight of Disks",
-        "emojis": "🌍 🔥 🏇 🐴 🌾",
-        "attribution": "Fiery part of Earth",
-        "att2": "",
-        "description": "Firmness, sobriety, perseverance, stable values, reliability, straightforwardness; mature, sensual man; realist, pragmatist, guarantee of security",
-    },
-}
 
+class Deck:
+    """One tarot deck: its card records, image folder and embed style."""
 
-logger = logging.getLogger(__name__)
+    def __init__(self, name: str, label: str, cards, image_dir: str, color: discord.Color):
+        self.name = name
+        self.label = label
+        self.cards = cards              # lore.LazyDataset of lore.Card
+        self.image_dir = image_dir
+        self.color = color
+        self._keys = None
+        self._templates = None          # key -> (title, description)
+        self._has_image = None          # keys with an image on disk
+
+    def _load(self):
+        if self._keys is not None:
+            return
+        self._templates = {
+            key: (card.name, f"\n{card.emojis}  \n*({card.attribution})*\n*{card.att2}*\n\n{card.description}")
+            for key, card in self.cards.items()
+        }
+        try:
+            on_disk = {e.name[:-4] for e in os.scandir(self.image_dir) if e.name.endswith(".jpg")}
+        except FileNotFoundError:
+            on_disk = set()
+        self._has_image = on_disk & self._templates.keys()
+        self._keys = self.cards.key_tuple()
+        missing = len(self._keys) - len(self._has_image)
+        if missing:
+            logger.warning(f"⚠️ Tarot deck '{self.name}': {missing} cards have no image in {self.image_dir}")
+
+    @property
+    def keys(self) -> tuple:
+        self._load()
+        return self._keys
+
+    def draw(self, n: int = 1) -> list:
+        """n distinct random card keys (no reversals)."""
+        return random.sample(self.keys, n)
+
+    def search(self, keyword: str):
+        """First card whose name contains the keyword, or None."""
+        keyword_lower = keyword.lower()
+        for key in self.keys:
+            if keyword_lower in self.cards[key].name.lower():
+                return key
+        return None
+
+    def has_image(self, key: str) -> bool:
+        self._load()
+        return key in self._has_image
+
+    def image_path(self, key: str) -> str:
+        return os.path.join(self.image_dir, f"{key}.jpg")
+
+    def embed(self, key: str) -> discord.Embed:
+        self._load()
+        title, description = self._templates[key]
+        return discord.Embed(title=title, description=description, color=self.color)
 
 
 # ============================================================
-# HELPER FUNCTIONS (Optimized)
+# SERVICE
 # ============================================================
 
 
-def get_image_path(card_key):
-    """Get the file path for a card image using platform-independent path joining"""
-    # Optimized: Use os.path.join for robustness
-    return os.path.join("images", "tarot", f"{card_key}.jpg")
+class DeckService:
+    def __init__(self):
+        self._decks = {}
+        self._images = OrderedDict()   # (deck, key) -> bytes
+        self._image_bytes = 0
 
+    def register(self, deck: Deck):
+        self._decks[deck.name] = deck
 
-def draw_card():
-    """Draw a random card (no reversals)"""
-    card_key = random.choice(list(TAROT_DECK.keys()))
-    return card_key
+    @property
+    def names(self) -> tuple:
+        return tuple(self._decks)
 
+    def get(self, name: str) -> Deck:
+        """Deck by name; unknown names fall back to the default deck."""
+        name = str(name).lower().strip() if name else DEFAULT_DECK
+        return self._decks.get(name) or self._decks[DEFAULT_DECK]
 
-def search_card(keyword):
-    """Search for a card by name or keyword"""
-    keyword_lower = keyword.lower()
-    for card_key, card_data in TAROT_DECK.items():
-        if keyword_lower in card_data["name"].lower():
-            return card_key
-    return None
+    async def for_guild(self, guild_id) -> Deck:
+        return self.get(await database.get_guild_tarot_deck(guild_id))
 
+    # --- Images ---
 
-# --- CRITICAL OPTIMIZATION: NON-BLOCKING FILE READ ---
+    def _remember(self, cache_key, data: bytes):
+        self._images[cache_key] = data
+        self._image_bytes += len(data)
+        while self._image_bytes > IMAGE_CACHE_BYTES and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self._image_bytes -= len(evicted)
 
+    async def image(self, deck: Deck, key: str):
+        """Card image bytes, read from disk only the first time. None if the card has no image."""
+        cache_key = (deck.name, key)
+        data = self._images.get(cache_key)
+        if data is not None:
+            self._images.move_to_end(cache_key)
+            return data
+        if not deck.has_image(key):
+            return None
 
-async def read_card_image(card_key):
-    """
-    Reads the image file in a separate thread pool.
-    CRITICAL: Prevents bot lag on disk access.
-    """
-    image_path = get_image_path(card_key)
-    loop = asyncio.get_event_loop()
+        def read():
+            with open(deck.image_path(key), "rb") as f:
+                return f.read()
 
-    def blocking_file_op():
-        """Synchronous operation run in a thread."""
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Thoth image not found at: {image_path}")
+        data = await asyncio.get_running_loop().run_in_executor(None, read)
+        self._remember(cache_key, data)
+        return data
 
-        # discord.File reads the disk synchronously upon creation,
-        # so we run this in the thread pool.
-        return discord.File(image_path, filename=f"{card_key}.jpg")
+    def stats(self) -> dict:
+        return {
+            "decks": {name: {"loaded": d._keys is not None, "cards": len(d._keys or ())} for name, d in self._decks.items()},
+            "images_cached": len(self._images),
+            "image_cache_mb": round(self._image_bytes / 1048576, 1),
+        }
 
-    # Run the blocking operation in the default thread pool executor
-    return await loop.run_in_executor(None, blocking_file_op)
+    # --- Spreads ---
 
+    async def compose_spread(self, deck: Deck, keys: list):
+        """One JPEG with the spread's cards laid out, or None if an image is missing."""
+        images = [await self.image(deck, key) for key in keys]
+        if any(data is None for data in images):
+            return None
+        return await asyncio.get_running_loop().run_in_executor(None, _compose, images)
+
+
+def _compose(images: list) -> bytes:
+    """Lay out 3 cards in a row, or 10 as a Celtic cross (cross + staff)."""
+    from PIL import Image
+
+    cards = []
+    for data in images:
+        im = Image.open(io.BytesIO(data)).convert("RGB")
+        width = round(im.width * SPREAD_CARD_HEIGHT / im.height)
+        cards.append(im.resize((width, SPREAD_CARD_HEIGHT), Image.LANCZOS))
+    w = max(c.width for c in cards)
+    h, gap = SPREAD_CARD_HEIGHT, SPREAD_GAP
+
+    if len(cards) == 10:
+        # Columns: Recent Past | Present/Challenge (Crown above, Foundation below) | Near Future | staff.
+        # The middle column is padded so the sideways Challenge card clears its neighbours.
+        side = gap + max(0, h - w) // 2
+        cols = [gap, gap + w + side, gap + 2 * (w + side), gap * 3 + 3 * w + 2 * side]
+        rows = [gap, gap * 2 + h, gap * 3 + h * 2]
+        canvas = Image.new("RGB", (cols[3] + w + gap, rows[2] + h + gap), SPREAD_BACKGROUND)
+        cross = [(1, 1), None, (1, 2), (0, 1), (1, 0), (2, 1)]
+        for i, pos in enumerate(cross):
+            if pos:
+                canvas.paste(cards[i], (cols[pos[0]], rows[pos[1]]))
+        challenge = cards[1].rotate(90, expand=True)
+        canvas.paste(challenge, (cols[1] + (w - challenge.width) // 2, rows[1] + (h - challenge.height) // 2))
+        staff_h = (canvas.height - gap * 5) // 4
+        for i, card in enumerate(cards[6:]):
+            small = card.resize((round(card.width * staff_h / card.height), staff_h), Image.LANCZOS)
+            canvas.paste(small, (cols[3], canvas.height - gap - staff_h - i * (staff_h + gap)))
+    else:
+        canvas = Image.new("RGB", (gap + len(cards) * (w + gap), h + gap * 2), SPREAD_BACKGROUND)
+        for i, card in enumerate(cards):
+            canvas.paste(card, (gap + i * (w + gap), gap))
+
+    out = io.BytesIO()
+    canvas.save(out, format="JPEG", quality=85)
+    return out.getvalue()
+
+
+service = DeckService()
+service.register(Deck("thoth", "Thoth", lore.THOTH_DECK, os.path.join("images", "tarot"), discord.Color.purple()))
+service.register(Deck("rws", "Rider-Waite-Smith", lore.RWS_DECK, os.path.join("images", "rws"), discord.Color.purple()))
+service.register(Deck("manara", "Manara", lore.MANARA_DECK, os.path.join("images", "manara"), discord.Color.red()))
+
+DECK_NAMES = service.names
 
 # ============================================================
-# DISCORD EMBED FUNCTION (Optimized I/O, Original Style)
+# DISCORD SENDING
 # ============================================================
 
 
-async def send_tarot_card(ctx, card_key=None):
-    """Send a tarot card to Discord channel"""
+def _author(target):
+    return getattr(target, "author", None) or getattr(target, "user", None)
 
-    # If no card specified, draw random
-    if card_key is None:
-        card_key = draw_card()
 
-    # Get card data
-    card = TAROT_DECK[card_key]
-    card_name = card["name"]
-    emojis = card["emojis"]
-    attribution = card["attribution"]
-    description = card["description"]
-    att2 = card["att2"]
+async def _send(target, **kwargs):
+    """Send to a context/channel or answer an interaction."""
+    if isinstance(target, discord.Interaction):
+        if target.response.is_done():
+            return await target.followup.send(**kwargs)
+        return await target.response.send_message(**kwargs)
+    return await target.send(**kwargs)
 
-    # Create embed (Original Style Restored)
-    embed = discord.Embed(
-        title=card_name,
-        description=f"\n{emojis}  \n*({attribution})*\n*{att2}*\n\n{description}",
-        color=discord.Color.purple(),
-    )
 
-    # 1. Load File using Non-Blocking Utility
-    file = None
+def _sign(embed: discord.Embed, target):
+    """Footer with the drawer's name (skipped for admins)."""
+    author = _author(target)
+    if isinstance(author, discord.Member) and not author.guild_permissions.administrator:
+        embed.set_footer(text=f"{author.name}")
+
+
+async def send_tarot_card(target, deck: Deck = None, card_key: str = None):
+    """Send one card from a deck (default deck if none given)."""
+    deck = deck or service.get(DEFAULT_DECK)
+    card_key = card_key or deck.draw()[0]
+    embed = deck.embed(card_key)
+    _sign(embed, target)
+
     try:
-        # Await the file read which runs in a separate thread
-        file = await read_card_image(card_key)
-    except FileNotFoundError:
-        embed.set_footer(text="⚠️ The image is lost in the void.")
-        await ctx.send(embed=embed)
-        return
+        data = await service.image(deck, card_key)
     except Exception as e:
-        logger.error(f"Error loading Thoth image {card_key}: {e}", exc_info=True)
-        embed.set_footer(
-            text="❌ The spirits blocked the image. Error."
-        )
-        await ctx.send(embed=embed)
-        return
-
-    # 2. Add Image Attachment and URL
+        logger.error(f"Error loading {deck.name} image {card_key}: {e}", exc_info=True)
+        data = None
+        embed.set_footer(text="❌ The spirits blocked the image. Error.")
+    else:
+        if data is None:
+            embed.set_footer(text="⚠️ The image is lost in the void.")
+
+    if data is None:
+        return await _send(target, embed=embed)
     embed.set_image(url=f"attachment://{card_key}.jpg")
+    await _send(target, embed=embed, file=discord.File(io.BytesIO(data), filename=f"{card_key}.jpg"))
+
+
+async def send_spread(target, deck: Deck, spread: str):
+    """Draw and send a spread ('three' or 'celtic') as one composited image."""
+    positions = SPREADS[spread]
+    keys = deck.draw(len(positions))
 
-    # 3. Add username in smallest text (skip for admins or specific role) (Original Logic Restored)
-    EXEMPT_ROLE_ID = None  # Replace with your role ID / load from config
-    if hasattr(ctx, "author"):
-        if not ctx.author.guild_permissions.administrator and not discord.utils.get(
-            ctx.author.roles, id=EXEMPT_ROLE_ID
-        ):
-            embed.set_footer(text=f"{ctx.author.name}")  # Set original footer
+    embed = discord.Embed(
+        title="🔮 Past • Present • Future" if spread == "three" else "🔮 Celtic Cross",
+        color=deck.color,
+    )
+    for i, (position, key) in enumerate(zip(positions, keys), 1):
+        card = deck.cards[key]
+        embed.add_field(name=f"{i}. {position}", value=f"**{card.name}**\n{card.description}"[:1024], inline=spread == "three")
+    _sign(embed, target)
+
+    try:
+        data = await service.compose_spread(deck, keys)
+    except Exception as e:
+        logger.error(f"Error composing {spread} spread ({deck.name}): {e}", exc_info=True)
+        data = None
 
-    # Send to Discord
-    await ctx.send(file=file, embed=embed)
+    if data is None:
+        return await _send(target, embed=embed)
+    embed.set_image(url="attachment://spread.jpg")
+    await _send(target, embed=embed, file=discord.File(io.BytesIO(data), filename="spread.jpg"))
@@ -18,6 +18,13 @@ from config import CHANNEL_ID, TEST_CHANNEL_ID, GUILD_ID
 
 import activity as activity_tracker
 import database
+import cron
+import expiry
+import membercache
+import reaping
+import votes
+import purge
+import rolequeue
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +114,18 @@ async def _set_candidates_sent_date(date_str: str):
     await database.set_setting(CANDIDATES_SENT_KEY, date_str)
 
 
+def open_pv_ballot(message_id, candidates: list):
+    """Collect admin picks on a tomorrow's-quote candidate message (replaces any older one)."""
+    votes.close_ballots_of_kind("pv")
+    votes.open_ballot(
+        int(message_id),
+        votes.NUMBER_EMOJIS[:len(candidates)],
+        kind="pv",
+        meta={"candidates": list(candidates)},
+        eligible=lambda uid, member: member is not None and member.guild_permissions.administrator,
+    )
+
+
 # Public accessors for quotes_cog
 async def get_daily_quote_async():
     quote_text, quote_date = await _load_quote_state()
@@ -244,6 +263,7 @@ async def _send_candidates(bot, emperor_channel, today_quote):
             await msg.add_reaction(emoji)
             
         await database.set_setting(PV_MSG_ID_KEY, str(msg.id))
+        open_pv_ballot(msg.id, candidates)
         logger.info("✅ Quote candidates sent to #emperor with reactions.")
     except Exception as e:
         logger.error(f"Error sending quote candidates: {e}", exc_info=True)
@@ -257,19 +277,14 @@ async def _send_candidates(bot, emperor_channel, today_quote):
 def setup_tasks(bot, guild_id: int):
     """Initialize and start scheduled tasks."""
 
-    # --- 1. Daily Activity Cleanup Task (24 hours) ---
-    @tasks.loop(hours=24)
+    # --- 1. Daily Activity Cleanup (cron, every 24h) ---
     async def cleanup_activity_daily():
-        try:
-            await activity_tracker.cleanup_old_activity(30)
-        except Exception as e:
-            logger.error(f"Error in activity cleanup: {e}", exc_info=True)
+        await activity_tracker.cleanup_old_activity(30)
 
-    @cleanup_activity_daily.before_loop
-    async def before_cleanup_activity():
-        await bot.wait_until_ready()
+    async def cleanup_activity_schedule():
+        return cron.Every(86400)
 
-    cleanup_activity_daily.start()
+    cron.scheduler.register("activity_cleanup", cleanup_activity_daily, cleanup_activity_schedule)
 
     # --- 2. Activity Flushing Task (5 minutes) ---
     @tasks.loop(minutes=5)
@@ -285,147 +300,119 @@ def setup_tasks(bot, guild_id: int):
 
     flush_activity_frequent.start()
 
-    # --- 3. Daily Quote Task ---
+    # --- 2b. Reaping Checkpoint (1 minute, no-op unless a reaping changed) ---
     @tasks.loop(minutes=1)
-    async def daily_quote():
-        """
-        Runs every minute. Fires quote events at exact times.
-        Uses DB-persisted state so reboots don't break the schedule.
-
-        Schedule (America/Los_Angeles):
-          10:00  — pick & post morning quote to #forum + #emperor
-          18:00  — repost evening quote + send 3 candidates to #emperor
-          19:00  — reset state for next day
-        """
-        global _cached_quote
-
+    async def checkpoint_reaping():
         try:
-            now_pt = datetime.now(ZoneInfo("America/Los_Angeles"))
-            hour, minute = now_pt.hour, now_pt.minute
-
-            # Early exit: nothing fires on non-zero minutes — saves all DB reads
-            if minute != 0:
-                return
+            await reaping.checkpoint()
+        except Exception as e:
+            logger.error(f"Error in reaping checkpoint: {e}", exc_info=True)
 
-            today_str = now_pt.date().isoformat()
+    @checkpoint_reaping.before_loop
+    async def before_checkpoint_reaping():
+        await bot.wait_until_ready()
 
-            guild = bot.get_guild(guild_id)
-            if not guild:
-                return
+    checkpoint_reaping.start()
+
+    # --- 3. Daily Quote (cron) ---
+    # Schedule (America/Los_Angeles):
+    #   [quote_morning_hour]:00  — pick & post morning quote to #forum + #emperor (+ main)
+    #   00:00                    — reset in-memory state for the next day
+    # A missed morning is caught up by the scheduler's grace window until
+    # [quote_evening_hour]. Rebooting after that sends the evening repost and the
+    # 3 candidates once at startup; there is no scheduled evening send. The
+    # DB-persisted quote date keeps each step from firing twice in a day.
+    def _quote_channels(guild, assigns):
+        forum_channel   = discord.utils.get(guild.text_channels, name="forum")
+        emperor_channel = discord.utils.get(guild.text_channels, name="emperor")
+        target_channels = [ch for ch in [forum_channel, emperor_channel] if ch]
+
+        main_ch_id = assigns.get("main")
+        if main_ch_id:
+            main_ch = guild.get_channel(int(main_ch_id))
+            if main_ch and main_ch not in target_channels:
+                target_channels.append(main_ch)
+        return target_channels, emperor_channel
+
+    async def quote_morning():
+        global _cached_quote
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
+        target_channels, _ = _quote_channels(guild, await database.get_channel_assigns())
+        if not target_channels:
+            return
 
-            from database import get_channel_assigns
-            assigns = await database.get_channel_assigns()
-            main_ch_id = assigns.get("main")
-            
-            forum_channel    = discord.utils.get(guild.text_channels, name="forum")
-            emperor_channel  = discord.utils.get(guild.text_channels, name="emperor")
-            target_channels  = [ch for ch in [forum_channel, emperor_channel] if ch]
-            
-            if main_ch_id:
-                main_ch = guild.get_channel(int(main_ch_id))
-                if main_ch and main_ch not in target_channels:
-                    target_channels.append(main_ch)
+        today_str = datetime.now(cron.PT).date().isoformat()
+        quote_text, quote_date = await _load_quote_state()
+        if quote_date == today_str and quote_text:
+            return
 
-            if not target_channels:
-                return
+        quote = await _send_morning_quote(bot, guild, target_channels)
+        _cached_quote = quote
+        logger.info("🌅 Morning Daily Quote sent.")
 
-            quote_text, quote_date = await _load_quote_state()
-            today_quote_exists = (quote_date == today_str and quote_text)
-
-            # Read configurable hours (defaults: 10am morning, 6pm evening)
-            q_morning = int(await database.get_setting(QUOTE_MORNING_HOUR_KEY, "10"))
-            q_evening = int(await database.get_setting(QUOTE_EVENING_HOUR_KEY, "18"))
-
-            # ── Morning quote ──────────────────────────────────────────
-            if hour == q_morning and not today_quote_exists:
-                quote = await _send_morning_quote(bot, guild, target_channels)
-                _cached_quote = quote
-                logger.info("🌅 Morning Daily Quote sent.")
-
-            # ── 12:00 AM — reset for next day ────────────────────────────
-            elif hour == 0:
-                _cached_quote = None
-                bot.pending_quotes = []
-                bot.tomorrow_quote = None
-                # Clear DB state so morning fires fresh tomorrow at [q_morning]
-                await database.set_setting(QUOTE_DATE_KEY, "")
-                await database.set_setting(QUOTE_TEXT_KEY, "")
+    async def quote_evening_catch_up():
+        """Startup only: after a reboot past the evening hour, send what the day missed."""
+        global _cached_quote
+        q_evening = int(await database.get_setting(QUOTE_EVENING_HOUR_KEY, "18"))
+        if datetime.now(cron.PT).hour < q_evening:
+            return
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
+        target_channels, emperor_channel = _quote_channels(guild, await database.get_channel_assigns())
+
+        today_str = datetime.now(cron.PT).date().isoformat()
+        quote_text, quote_date = await _load_quote_state()
+
+        if quote_date == today_str and quote_text:
+            if await _get_candidates_sent_date() != today_str and emperor_channel:
+                await _send_evening_quote(bot, guild, target_channels, emperor_channel, quote_text)
+                logger.info("🌇 Evening Daily Quote sent.")
+        elif target_channels:
+            # Missed the whole day (e.g. offline all morning) — send quote and candidates now
+            logger.info("Catch-up: missed morning quote, sending quote and candidates now.")
+            quote = await _send_morning_quote(bot, guild, target_channels)
+            _cached_quote = quote
+            if quote and emperor_channel:
+                await _send_candidates(bot, emperor_channel, quote)
+
+    async def quote_reset():
+        global _cached_quote
+        _cached_quote = None
+        bot.pending_quotes = []
+        bot.tomorrow_quote = None
+        # Clear DB state so morning fires fresh at [q_morning]
+        await database.set_setting(QUOTE_DATE_KEY, "")
+        await database.set_setting(QUOTE_TEXT_KEY, "")
 
-        except Exception as e:
-            logger.error(f"Error in daily_quote task: {e}", exc_info=True)
+    async def quote_morning_schedule():
+        q_morning = int(await database.get_setting(QUOTE_MORNING_HOUR_KEY, "10"))
+        q_evening = int(await database.get_setting(QUOTE_EVENING_HOUR_KEY, "18"))
+        return cron.Daily(q_morning, grace=max(0, q_evening - q_morning) * 3600)
 
-    @daily_quote.before_loop
-    async def before_daily_quote():
-        await bot.wait_until_ready()
+    async def quote_reset_schedule():
+        # Only worth catching up shortly after midnight; after that the stale date already resets it
+        return cron.Daily(0, grace=3600)
 
-        # ── STARTUP CATCH-UP ─────────────────────────────────────────
-        # If the bot rebooted during the day, check what we missed.
+    async def restore_quote_state():
+        """Reload today's quote and pending candidates after a reboot."""
+        global _cached_quote
         try:
-            now_pt = datetime.now(ZoneInfo("America/Los_Angeles"))
-            today_str = now_pt.date().isoformat()
-            hour = now_pt.hour
-
-            guild = bot.get_guild(guild_id)
-            if not guild:
-                return
-
-            from database import get_channel_assigns
-            assigns = await database.get_channel_assigns()
-            main_ch_id = assigns.get("main")
-            
-            forum_channel   = discord.utils.get(guild.text_channels, name="forum")
-            emperor_channel = discord.utils.get(guild.text_channels, name="emperor")
-            target_channels = [ch for ch in [forum_channel, emperor_channel] if ch]
-            
-            if main_ch_id:
-                main_ch = guild.get_channel(int(main_ch_id))
-                if main_ch and main_ch not in target_channels:
-                    target_channels.append(main_ch)
-
+            today_str = datetime.now(cron.PT).date().isoformat()
             quote_text, quote_date = await _load_quote_state()
-            today_quote_exists = (quote_date == today_str and quote_text)
-
-            # Rebooted between 10am–6pm: morning quote already sent, nothing to catch up
-            if 10 <= hour < 18 and today_quote_exists:
-                global _cached_quote
+            if quote_date == today_str and quote_text:
                 _cached_quote = quote_text
                 bot.pending_quotes = await _get_pending_quotes()
                 bot.tomorrow_quote = await _get_tomorrow_quote() or None
                 logger.info(f"✅ Quote state restored from DB: '{quote_text[:50]}...'")
-
-            # Rebooted between 10am–6pm but no morning quote at all — send it now
-            elif 10 <= hour < 18 and not today_quote_exists and target_channels:
-                logger.info("Catch-up: missed 10am quote, sending now.")
-                quote = await _send_morning_quote(bot, guild, target_channels)
-                _cached_quote = quote
-
-            # Rebooted after 6pm: check if candidates were sent already
-            elif hour >= 18 and today_quote_exists:
-                _cached_quote = quote_text
-                bot.pending_quotes = await _get_pending_quotes()
-                bot.tomorrow_quote = await _get_tomorrow_quote() or None
-
-                last_sent = await _get_candidates_sent_date()
-                if last_sent != today_str and emperor_channel:
-                    logger.info("Catch-up: missed 6pm candidate send, sending now.")
-                    await _send_evening_quote(
-                        bot, guild, target_channels, emperor_channel, quote_text
-                    )
-
-            # Rebooted after 6pm but no morning quote: pick + send both morning style
-            elif hour >= 18 and not today_quote_exists and target_channels:
-                logger.info("Catch-up: missed entire day — sending quote and candidates now.")
-                quote = await _send_morning_quote(bot, guild, target_channels)
-                _cached_quote = quote
-                if quote and emperor_channel:
-                    await _send_candidates(bot, emperor_channel, quote)
-
         except Exception as e:
-            logger.error(f"Startup catch-up error: {e}", exc_info=True)
+            logger.error(f"Error restoring quote state: {e}", exc_info=True)
 
-        logger.info("⏳ Daily quote task started (every minute, exact-time triggers)")
-
-    daily_quote.start()
+    quote_watch = (QUOTE_MORNING_HOUR_KEY, QUOTE_EVENING_HOUR_KEY)
+    cron.scheduler.register("quote_morning", quote_morning, quote_morning_schedule, watch=quote_watch)
+    cron.scheduler.register("quote_reset", quote_reset, quote_reset_schedule)
 
     # --- Numerology Task ---
     async def _send_numerology_reading(bot, guild, target_date, label: str):
@@ -468,352 +455,297 @@ def setup_tasks(bot, guild_id: int):
         except Exception as e:
             logger.error(f"Error sending numerology reading: {e}", exc_info=True)
 
-    @tasks.loop(minutes=1)
-    async def daily_numerology():
-        """
-        Runs every minute. Fires numerology posts at configurable times.
-        Schedule (America/Los_Angeles):
-          [morning_hour]:00  — post today's reading
-          [evening_hour]:00  — post tomorrow's preview
-        """
-        try:
-            now_pt = datetime.now(ZoneInfo("America/Los_Angeles"))
-            hour, minute = now_pt.hour, now_pt.minute
-
-            # Early exit: nothing fires on non-zero minutes — saves all DB reads
-            if minute != 0:
-                return
-
-            today_str = now_pt.date().isoformat()
-
-            guild = bot.get_guild(guild_id)
-            if not guild:
-                return
-
-            morning_hour = int(await database.get_setting(NUMEROLOGY_MORNING_HOUR_KEY, "7"))
-            evening_hour = int(await database.get_setting(NUMEROLOGY_EVENING_HOUR_KEY, "22"))
-
-            # ── Morning: today's reading ────────────────────────────────────
-            if hour == morning_hour:
-                already_sent = await database.get_setting(NUMEROLOGY_TODAY_DATE_KEY, "")
-                if already_sent != today_str:
-                    from datetime import date as _date
-                    await _send_numerology_reading(bot, guild, now_pt.date(), "Daily Numerology Reading 🌅")
-                    await database.set_setting(NUMEROLOGY_TODAY_DATE_KEY, today_str)
-
-            # ── Evening: tomorrow's preview ───────────────────────────────
-            elif hour == evening_hour:
-                already_sent = await database.get_setting(NUMEROLOGY_TOMORROW_DATE_KEY, "")
-                if already_sent != today_str:
-                    from datetime import date as _date, timedelta as _td
-                    tomorrow = now_pt.date() + _td(days=1)
-                    await _send_numerology_reading(bot, guild, tomorrow, "Tomorrow's Numerology Preview 🌙")
-                    await database.set_setting(NUMEROLOGY_TOMORROW_DATE_KEY, today_str)
-
-        except Exception as e:
-            logger.error(f"Error in daily_numerology task: {e}", exc_info=True)
-
-    @daily_numerology.before_loop
-    async def before_daily_numerology():
-        await bot.wait_until_ready()
-
-        # ── STARTUP CATCH-UP ─────────────────────────────────────────
-        try:
-            import numerology as num_engine
-            now_pt = datetime.now(ZoneInfo("America/Los_Angeles"))
-            today_str = now_pt.date().isoformat()
-            hour = now_pt.hour
-
-            guild = bot.get_guild(guild_id)
-            if not guild:
-                return
-
-            morning_hour = int(await database.get_setting(NUMEROLOGY_MORNING_HOUR_KEY, "7"))
-            evening_hour = int(await database.get_setting(NUMEROLOGY_EVENING_HOUR_KEY, "22"))
-
-            already_today = await database.get_setting(NUMEROLOGY_TODAY_DATE_KEY, "")
-            already_tomorrow = await database.get_setting(NUMEROLOGY_TOMORROW_DATE_KEY, "")
-
-            # Rebooted between morning and evening: check if morning was missed
-            if morning_hour <= hour < evening_hour and already_today != today_str:
-                logger.info("Numerology catch-up: missed morning reading, sending now.")
-                await _send_numerology_reading(bot, guild, now_pt.date(), "Daily Numerology Reading 🌅")
-                await database.set_setting(NUMEROLOGY_TODAY_DATE_KEY, today_str)
+    # Schedule (America/Los_Angeles):
+    #   [morning_hour]:00  — post today's reading
+    #   [evening_hour]:00  — post tomorrow's preview
+    async def numerology_morning():
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
+        now_pt = datetime.now(cron.PT)
+        today_str = now_pt.date().isoformat()
+        already_sent = await database.get_setting(NUMEROLOGY_TODAY_DATE_KEY, "")
+        if already_sent != today_str:
+            await _send_numerology_reading(bot, guild, now_pt.date(), "Daily Numerology Reading 🌅")
+            await database.set_setting(NUMEROLOGY_TODAY_DATE_KEY, today_str)
+
+    async def numerology_evening():
+        from datetime import timedelta as _td
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
+        now_pt = datetime.now(cron.PT)
+        today_str = now_pt.date().isoformat()
+        already_sent = await database.get_setting(NUMEROLOGY_TOMORROW_DATE_KEY, "")
+        if already_sent != today_str:
+            tomorrow = now_pt.date() + _td(days=1)
+            await _send_numerology_reading(bot, guild, tomorrow, "Tomorrow's Numerology Preview 🌙")
+            await database.set_setting(NUMEROLOGY_TOMORROW_DATE_KEY, today_str)
 
-            # Rebooted after evening: check if evening preview was missed
-            elif hour >= evening_hour and already_tomorrow != today_str:
-                from datetime import timedelta as _td
-                tomorrow = now_pt.date() + _td(days=1)
-                logger.info("Numerology catch-up: missed evening preview, sending now.")
-                await _send_numerology_reading(bot, guild, tomorrow, "Tomorrow's Numerology Preview 🌙")
-                await database.set_setting(NUMEROLOGY_TOMORROW_DATE_KEY, today_str)
+    async def numerology_morning_schedule():
+        morning_hour = int(await database.get_setting(NUMEROLOGY_MORNING_HOUR_KEY, "7"))
+        evening_hour = int(await database.get_setting(NUMEROLOGY_EVENING_HOUR_KEY, "22"))
+        return cron.Daily(morning_hour, grace=max(0, evening_hour - morning_hour) * 3600)
 
-        except Exception as e:
-            logger.error(f"Numerology startup catch-up error: {e}", exc_info=True)
+    async def numerology_evening_schedule():
+        evening_hour = int(await database.get_setting(NUMEROLOGY_EVENING_HOUR_KEY, "22"))
+        return cron.Daily(evening_hour, grace=(24 - evening_hour) * 3600)
 
-        logger.info("⏳ Daily numerology task started (every minute, exact-time triggers)")
+    numerology_watch = (NUMEROLOGY_MORNING_HOUR_KEY, NUMEROLOGY_EVENING_HOUR_KEY)
+    cron.scheduler.register("numerology_morning", numerology_morning, numerology_morning_schedule, watch=numerology_watch)
+    cron.scheduler.register("numerology_evening", numerology_evening, numerology_evening_schedule, watch=numerology_watch)
 
-    daily_numerology.start()
 
     MUZZLE_EFFECTS = {"muzzle", "uwu"}
 
     async def handle_curse_expirations():
         from main import remove_muzzle_role
         try:
-            expired_curses = await database.get_all_expired_effects()
+            # One bulk DELETE for everything due
+            expired_curses = await database.pop_expired_effects()
+            if not expired_curses:
+                return
             guild = bot.get_guild(guild_id)
-            for user_id, effect_name in expired_curses:
-                await database.remove_active_effect(int(user_id), effect_name)
-                # If the expired effect held the hexed role, strip it now
-                if effect_name in MUZZLE_EFFECTS and guild:
-                    # Only remove the role if the user has no OTHER active muzzle-type effects
-                    remaining = await database.get_all_active_effects(int(user_id))
-                    still_muzzled = any(e[0] in MUZZLE_EFFECTS for e in remaining)
-                    if not still_muzzled:
-                        member = guild.get_member(int(user_id))
-                        if member:
-                            await remove_muzzle_role(member)
-                            logger.info(f"🔓 Hexed role removed from {member.display_name} (effect '{effect_name}' expired)")
+            muzzle_users = {user_id for user_id, effect_name in expired_curses if effect_name in MUZZLE_EFFECTS}
+            if not muzzle_users or not guild:
+                return
+            # Only remove the role from users with no OTHER active muzzle-type effects
+            still_muzzled = await database.get_users_with_effects(list(muzzle_users), list(MUZZLE_EFFECTS))
+            members = await asyncio.gather(*(membercache.cache.get(guild, uid) for uid in muzzle_users - still_muzzled))
+            members = [m for m in members if m]
+            # Issued concurrently so the role queue can pace them as one batch
+            await asyncio.gather(*(remove_muzzle_role(m) for m in members))
+            for member in members:
+                logger.info(f"🔓 Hexed role removed from {member.display_name} (effect expired)")
         except Exception as e:
             logger.error(f"Error in curse cleanup: {e}")
 
-    async def handle_role_expirations(guild):
+    async def handle_role_expirations():
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
         try:
-            pending_expirations = await database.get_pending_color_role_expirations()
+            # Records are deleted up front: once the removal time has passed they're done either way
+            pending_expirations = await database.pop_expired_color_role_expirations()
+
+            async def expire_role(member, role, color_name):
+                try:
+                    await rolequeue.remove(member, role, reason=f"{color_name} role expired.")
+                    try:
+                        await member.send(f"Your **{role.name}** role has expired!")
+                    except discord.Forbidden:
+                        pass
+                    logger.info(f"🔓 {color_name} role removed from {member.display_name} (expired)")
+                except Exception as e:
+                    logger.error(f"Error removing role {role.id} for {member.id}: {e}")
+
+            removals = []
             for exp in pending_expirations:
                 user_id = int(exp["user_id"])
                 role_id_str = exp["role_id"]
                 color_name = exp["color_name"]
                 
                 if not role_id_str:
-                    await database.remove_color_role_expiration(str(user_id), "")
                     continue
                     
                 role_id = int(role_id_str)
-                member = guild.get_member(user_id)
+                member = await membercache.cache.get(guild, user_id)
                 role = guild.get_role(role_id)
                 
                 if member and role and role in member.roles:
-                    try:
-                        await member.remove_roles(role, reason=f"{color_name} role expired.")
-                        try:
-                            await member.send(f"Your **{role.name}** role has expired!")
-                        except discord.Forbidden:
-                            pass
-                        logger.info(f"🔓 {color_name} role removed from {member.display_name} (expired)")
-                    except Exception as e:
-                        logger.error(f"Error removing role {role_id} for {user_id}: {e}")
-                
-                # Always remove the record if the removal time has passed
-                await database.remove_color_role_expiration(str(user_id), role_id_str)
+                    removals.append(expire_role(member, role, color_name))
+
+            # Queued together so several expiries for one member merge into one edit
+            if removals:
+                await asyncio.gather(*removals)
         except Exception as e:
             logger.error(f"Error in handle_role_expirations: {e}")
-            logger.error(f"Error in role removal: {e}")
 
-    async def handle_trial_expirations(guild):
+    async def handle_trial_expirations():
+        from cogs.trial_cog import TRIAL_DECISIONS, open_trial_ballot
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
         try:
-            active_trials = await database.get_active_trials()
-            now = time.time()
+            due_trials = await database.get_due_trials()
+            if not due_trials:
+                return
             admin_log_ch = guild.get_channel(int(MOD_CHANNEL_ID))
             if not admin_log_ch:
                 return
 
-            for user_id, guild_id, start_time, end_time, message_id in active_trials:
-                if now >= end_time and not message_id:
-                    # Trial expired, send decision embed to admin log
-                    target_member = guild.get_member(int(user_id))
-                    mention = target_member.mention if target_member else f"User `{user_id}`"
-                    
-                    embed = discord.Embed(
-                        title="⚖️ Trial Expiration: Decision Required",
-                        description=f"The 4-day trial for {mention} has expired.\n\nPlease select an action below:",
-                        color=discord.Color.orange(),
-                        timestamp=datetime.now()
-                    )
-                    embed.add_field(name="Start Time", value=f"<t:{int(start_time)}:F>", inline=True)
-                    embed.add_field(name="End Time", value=f"<t:{int(end_time)}:F>", inline=True)
-                    embed.set_footer(text="🎓 Graduate | ⏳ Extend (4d) | 🥾 Kick")
-                    
-                    msg = await admin_log_ch.send(embed=embed)
-                    await msg.add_reaction("🎓")
-                    await msg.add_reaction("⏳")
-                    await msg.add_reaction("🥾")
-                    
-                    await database.update_trial_message(user_id, guild_id, str(msg.id))
-                    logger.info(f"⚖️ Trial expired for {user_id}, sent decision embed.")
+            for user_id, trial_guild_id, start_time, end_time in due_trials:
+                # Trial expired, send decision embed to admin log
+                target_member = guild.get_member(int(user_id))
+                mention = target_member.mention if target_member else f"User `{user_id}`"
+                
+                embed = discord.Embed(
+                    title="⚖️ Trial Expiration: Decision Required",
+                    description=f"The 4-day trial for {mention} has expired.\n\nPlease select an action below:",
+                    color=discord.Color.orange(),
+                    timestamp=datetime.now()
+                )
+                embed.add_field(name="Start Time", value=f"<t:{int(start_time)}:F>", inline=True)
+                embed.add_field(name="End Time", value=f"<t:{int(end_time)}:F>", inline=True)
+                embed.set_footer(text="🎓 Graduate | ⏳ Extend (4d) | 🥾 Kick")
+                
+                msg = await admin_log_ch.send(embed=embed)
+                open_trial_ballot(msg.id, user_id, trial_guild_id)
+                for emoji in TRIAL_DECISIONS:
+                    await msg.add_reaction(emoji)
+                
+                await database.update_trial_message(user_id, trial_guild_id, str(msg.id))
+                logger.info(f"⚖️ Trial expired for {user_id}, sent decision embed.")
         except Exception as e:
             logger.error(f"Error in trial cleanup: {e}", exc_info=True)
 
-    # --- 4. Unified Expiration Task (Roles & Item Curses) ---
-    @tasks.loop(minutes=5.0)
-    async def unified_cleanup_loop():
-        guild = bot.get_guild(guild_id)
-        if not guild:
-            return
-        await handle_curse_expirations()
-        await handle_role_expirations(guild)
-        await handle_trial_expirations(guild)
-
-    @unified_cleanup_loop.before_loop
-    async def before_unified_cleanup_loop():
-        await bot.wait_until_ready()
-
-    unified_cleanup_loop.start()
+    # --- 4. Expiry Scheduler (Roles, Item Curses & Trials) ---
+    # Sleeps until the next deadline instead of polling every 5 minutes.
+    expiry.scheduler.register("effect", handle_curse_expirations)
+    expiry.scheduler.register("color_role", handle_role_expirations)
+    expiry.scheduler.register("trial", handle_trial_expirations)
+    expiry.scheduler.start()
 
-    # --- 5. Daily Wealth Tax (24 hours) ---
-    @tasks.loop(hours=24)
-    async def wealth_tax_loop():
-        try:
-            await database.apply_wealth_tax(0.10, 1000)
-            logger.info("💸 Wealth tax applied.")
-        except Exception as e:
-            logger.error(f"Error in wealth tax task: {e}", exc_info=True)
+    # --- 5. Daily Wealth Tax (cron, every 24h) ---
+    async def wealth_tax():
+        await database.apply_wealth_tax(0.10, 1000)
+        logger.info("💸 Wealth tax applied.")
 
-    @wealth_tax_loop.before_loop
-    async def before_wealth_tax():
-        await bot.wait_until_ready()
+    async def wealth_tax_schedule():
+        return cron.Every(86400)
 
-    wealth_tax_loop.start()
+    cron.scheduler.register("wealth_tax", wealth_tax, wealth_tax_schedule)
 
-    # --- 6. Automated Quote Drops (Every X hours) ---
-    @tasks.loop(seconds=30.0)
-    async def quote_drop_loop():
+    # --- 6. Automated Quote Drops (cron, every X hours) ---
+    async def _send_quote_drop(manual_trigger: bool):
         """
-        Sends a random quote from the 'quote_drops' table at configurable intervals.
-        Only fires if someone has chatted within the last 30 minutes. 
-        If no activity, it skips the 'turn' and waits for the next interval.
-        Also checks for manual trigger from dashboard.
+        Sends a random quote from the 'quote_drops' table.
+        Automated drops only fire if someone has chatted within the last 30 minutes;
+        if not, the turn is skipped and the next one is a full interval away.
         """
-        try:
-            # Batch both early-exit reads together — skip all further work if
-            # neither enabled nor manually triggered
-            manual_trigger = await database.get_setting("trigger_quote_drop", "0") == "1"
-            if not manual_trigger:
-                enabled = await database.get_setting(QUOTE_DROPS_ENABLED_KEY, "0") == "1"
-                if not enabled:
-                    return
+        now = time.time()
 
-            # Default to 8 hours if unset
-            interval_hours_str = await database.get_setting(QUOTE_DROPS_INTERVAL_KEY, "8")
-            try:
-                interval_hours = float(interval_hours_str)
-            except ValueError:
-                interval_hours = 8.0
-
-            last_drop_str = await database.get_setting(LAST_QUOTE_DROP_TIME_KEY, "0")
-            try:
-                last_drop_time = float(last_drop_str)
-            except ValueError:
-                last_drop_time = 0.0
-
-            now = time.time()
-            
-            # Fire if manual trigger OR interval reached
-            should_fire = manual_trigger or (now - last_drop_time >= (interval_hours * 3600))
-            if not should_fire:
+        # Skip activity check for manual drops
+        if manual_trigger or await activity_tracker.has_recent_activity(30):
+            guild = bot.get_guild(guild_id)
+            if not guild:
                 return
 
-            # Window triggered: Check for activity in the last 30 minutes (skip activity check for manual)
-            if manual_trigger or await activity_tracker.has_recent_activity(30):
-                guild = bot.get_guild(guild_id)
-                if not guild:
-                    return
-
-                # Get target channel (main)
-                from database import get_channel_assigns, get_random_quote_drop
-                assigns = await get_channel_assigns()
-                channel_id = assigns.get("main") # Should be mapped in dashboard
-                
-                if not channel_id:
-                    # Fallback to forum if main not set
-                    forum = discord.utils.get(guild.text_channels, name="forum")
-                    channel = forum
-                    if not forum:
-                        logger.warning("Quote drop loop: No 'main' channel or 'forum' found. Skipping.")
-                        if manual_trigger: await database.set_setting("trigger_quote_drop", "0")
-                        return
-                else:
-                    channel = guild.get_channel(int(channel_id))
-                
+            # Get target channel (main)
+            from database import get_channel_assigns, get_random_quote_drop
+            assigns = await get_channel_assigns()
+            channel_id = assigns.get("main") # Should be mapped in dashboard
+            
+            if not channel_id:
+                # Fallback to forum if main not set
+                channel = discord.utils.get(guild.text_channels, name="forum")
                 if not channel:
-                    if manual_trigger: await database.set_setting("trigger_quote_drop", "0")
+                    logger.warning("Quote drop: No 'main' channel or 'forum' found. Skipping.")
                     return
+            else:
+                channel = guild.get_channel(int(channel_id))
+            
+            if not channel:
+                return
 
-                # Pick quote (manual or random)
-                manual_id = await database.get_setting("manual_quote_id", "")
-                if manual_id:
-                    from database import get_quote_drop_by_id
-                    quote = await get_quote_drop_by_id(manual_id)
-                    await database.set_setting("manual_quote_id", "") # Clear it
-                else:
-                    quote = await get_random_quote_drop()
-
-                if not quote:
-                    logger.warning("Quote drop loop: No quote found.")
-                    if manual_trigger: await database.set_setting("trigger_quote_drop", "0")
-                    return
+            # Pick quote (manual or random)
+            manual_id = await database.get_setting("manual_quote_id", "")
+            if manual_id:
+                from database import get_quote_drop_by_id
+                quote = await get_quote_drop_by_id(manual_id)
+                await database.set_setting("manual_quote_id", "") # Clear it
+            else:
+                quote = await get_random_quote_drop()
 
-                # Send
-                await channel.send(quote)
-                
-                if manual_trigger:
-                    await database.set_setting("trigger_quote_drop", "0")
-                    logger.info(f"🚀 Manual quote drop triggered and sent to {channel.name}")
-                else:
-                    await database.set_setting(LAST_QUOTE_DROP_TIME_KEY, str(now))
-                    logger.info(f"🚀 Automated quote drop sent to {channel.name}: {quote[:50]}...")
+            if not quote:
+                logger.warning("Quote drop: No quote found.")
+                return
+
+            # Send
+            await channel.send(quote)
+            
+            if manual_trigger:
+                logger.info(f"🚀 Manual quote drop triggered and sent to {channel.name}")
             else:
-                # SKIP TURN (only for automated): Advance 'last_drop_time' so we wait a full interval before trying again
                 await database.set_setting(LAST_QUOTE_DROP_TIME_KEY, str(now))
-                logger.info("💤 Quote drop loop: Skipping turn due to inactivity (last 30m).")
+                logger.info(f"🚀 Automated quote drop sent to {channel.name}: {quote[:50]}...")
+        else:
+            # SKIP TURN (only for automated): Advance 'last_drop_time' so we wait a full interval before trying again
+            await database.set_setting(LAST_QUOTE_DROP_TIME_KEY, str(now))
+            logger.info("💤 Quote drop: Skipping turn due to inactivity (last 30m).")
 
-        except Exception as e:
-            logger.error(f"Error in quote_drop_loop: {e}", exc_info=True)
+    async def quote_drop():
+        await _send_quote_drop(manual_trigger=False)
 
-    @quote_drop_loop.before_loop
-    async def before_quote_drop_loop():
-        await bot.wait_until_ready()
+    async def quote_drop_manual():
+        try:
+            await _send_quote_drop(manual_trigger=True)
+        finally:
+            # Always clear, or the job would keep re-firing
+            await database.set_setting("trigger_quote_drop", "0")
+
+    async def quote_drop_schedule():
+        if await database.get_setting(QUOTE_DROPS_ENABLED_KEY, "0") != "1":
+            return None
+        # Default to 8 hours if unset
+        try:
+            interval_hours = float(await database.get_setting(QUOTE_DROPS_INTERVAL_KEY, "8"))
+        except ValueError:
+            interval_hours = 8.0
+        try:
+            last_drop_time = float(await database.get_setting(LAST_QUOTE_DROP_TIME_KEY, "0"))
+        except ValueError:
+            last_drop_time = 0.0
+        return cron.Every(interval_hours * 3600, anchor=last_drop_time)
+
+    async def quote_drop_manual_schedule():
+        # Set by the dashboard; the setting hook wakes the scheduler immediately
+        if await database.get_setting("trigger_quote_drop", "0") == "1":
+            return cron.Once()
+        return None
 
-    quote_drop_loop.start()
+    cron.scheduler.register(
+        "quote_drop", quote_drop, quote_drop_schedule,
+        watch=(QUOTE_DROPS_ENABLED_KEY, QUOTE_DROPS_INTERVAL_KEY),
+    )
+    cron.scheduler.register("quote_drop_manual", quote_drop_manual, quote_drop_manual_schedule, watch=("trigger_quote_drop",))
 
     # --- 7. Daily Tarot Task (Daily TC) - REMOVED per user request ---
     # @tasks.loop(seconds=10)
     # async def daily_tc_task():
     #     ...
 
-    # --- 8. Weekly Bulletin Purge ---
-    @tasks.loop(hours=1)
-    async def weekly_bulletin_purge():
-        """Sunday at 11:59 PM (23:59)"""
-        try:
-            enabled = await database.get_setting(WEEKLY_PURGE_ENABLED_KEY, "0") == "1"
-            if not enabled:
-                return
-
-            now_pt = datetime.now(ZoneInfo("America/Los_Angeles"))
-            purge_interval = await database.get_setting("bulletin_purge_interval", "weekly")
-            
-            # Condition for purge: 5:00 AM PT
-            do_purge = False
-            if purge_interval == "daily" and now_pt.hour == 5:
-                do_purge = True
-            elif purge_interval == "weekly" and now_pt.weekday() == 6 and now_pt.hour == 5:
-                do_purge = True
-
-            if do_purge:
-                bulletin_id = await database.get_setting(BULLETIN_CHANNEL_KEY, "")
-                if bulletin_id:
-                    guild = bot.get_guild(guild_id)
-                    channel = guild.get_channel(int(bulletin_id))
-                    if channel:
-                        logger.info(f"🧹 Starting {purge_interval} bulletin purge...")
-                        await channel.purge(limit=1000, reason=f"{purge_interval.capitalize()} scheduled purge")
-
-        except Exception as e:
-            logger.error(f"Error in bulletin purge: {e}", exc_info=True)
+    # --- 8. Bulletin Purge (cron, 5:00 AM PT daily or Sundays) ---
+    async def bulletin_purge():
+        purge_interval = await database.get_setting("bulletin_purge_interval", "weekly")
+        bulletin_id = await database.get_setting(BULLETIN_CHANNEL_KEY, "")
+        if bulletin_id:
+            guild = bot.get_guild(guild_id)
+            channel = guild.get_channel(int(bulletin_id)) if guild else None
+            if channel:
+                logger.info(f"🧹 Starting {purge_interval} bulletin purge...")
+                await purge.engine.purge_channel(channel, reason=f"{purge_interval.capitalize()} scheduled purge")
+
+    async def bulletin_purge_schedule():
+        if await database.get_setting(WEEKLY_PURGE_ENABLED_KEY, "0") != "1":
+            return None
+        purge_interval = await database.get_setting("bulletin_purge_interval", "weekly")
+        weekdays = None if purge_interval == "daily" else {6}
+        return cron.Daily(5, weekdays=weekdays, grace=3600)
+
+    cron.scheduler.register(
+        "bulletin_purge", bulletin_purge, bulletin_purge_schedule,
+        watch=(WEEKLY_PURGE_ENABLED_KEY, "bulletin_purge_interval"),
+    )
 
-    @weekly_bulletin_purge.before_loop
-    async def before_weekly_purge():
+    # --- 9. Start the cron scheduler once everything is registered ---
+    async def start_cron():
         await bot.wait_until_ready()
+        await restore_quote_state()
+        try:
+            await quote_evening_catch_up()
+        except Exception as e:
+            logger.error(f"Error in evening quote catch-up: {e}", exc_info=True)
+        cron.scheduler.start()
 
-    weekly_bulletin_purge.start()
+    bot.loop.create_task(start_cron())
@@ -0,0 +1,347 @@
+"""
+X (Twitter) Timelines
+Cached account lookups and recent posts for `.x`. Screen name -> account id is
+remembered in SQLite and never expires (ids don't change); each account's
+original posts are kept in memory for a short TTL and refreshed incrementally,
+merging only what's newer than the cached head. Simultaneous requests for the
+same account share one upstream call, and photo media for the newest posts is
+downloaded concurrently into a small byte cache so embeds attach instantly.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+
+import database
+from config import TWITTER_COOKIES_FILE
+from exceptions import TwitterAccountNotFound, UpstreamError
+from httpclient import client as http_client
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_TTL = 120                  # seconds an account's posts are served without asking X
+INITIAL_COUNT = 20                  # tweets requested on a cold fetch (replies get filtered out)
+REFRESH_COUNT = 10                  # tweets requested when topping up a cached timeline
+KEEP_POSTS = 20                     # original posts kept per account
+MAX_ACCOUNTS = 200                  # timelines kept in memory, LRU
+PREFETCH_POSTS = 5                  # newest posts whose photos are downloaded ahead of time
+MEDIA_CACHE_BYTES = 32 * 1024 * 1024
+
+
+# ============================================================
+# TWIKIT CLIENT
+# ============================================================
+
+_client = None
+
+
+async def get_client():
+    """Lazily initializes and returns the twikit client using saved cookies."""
+    global _client
+    if _client is not None:
+        return _client
+
+    try:
+        from twikit import Client
+    except ImportError:
+        raise RuntimeError("twikit is not installed. Run: pip install twikit")
+
+    # If the file doesn't exist, try writing it from the TWITTER_COOKIES_JSON env var
+    # (set this in Railway with the contents of twitter_cookies.json)
+    if not os.path.exists(TWITTER_COOKIES_FILE):
+        cookies_json = os.getenv("TWITTER_COOKIES_JSON")
+        if cookies_json:
+            try:
+                json.loads(cookies_json)
+                os.makedirs(os.path.dirname(os.path.abspath(TWITTER_COOKIES_FILE)), exist_ok=True)
+                with open(TWITTER_COOKIES_FILE, "w") as f:
+                    f.write(cookies_json)
+                logger.info(f"✅ Wrote Twitter cookies from env var to {TWITTER_COOKIES_FILE}")
+            except Exception as e:
+                raise RuntimeError(f"TWITTER_COOKIES_JSON env var is invalid: {e}")
+        else:
+            raise RuntimeError(
+                f"Twitter cookies file not found: `{TWITTER_COOKIES_FILE}`. "
+                "Either run setup_twitter.py locally, or set the TWITTER_COOKIES_JSON "
+                "environment variable on Railway."
+            )
+
+    client = Client(language="en-US")
+    client.load_cookies(TWITTER_COOKIES_FILE)
+    _client = client
+    logger.info("✅ twikit client initialized from cookies.")
+    return client
+
+
+# ============================================================
+# MODELS
+# ============================================================
+
+
+class Account:
+    __slots__ = ("user_id", "screen_name", "name", "avatar_url")
+
+    def __init__(self, user_id: str, screen_name: str, name: str, avatar_url: str):
+        self.user_id = user_id
+        self.screen_name = screen_name
+        self.name = name
+        self.avatar_url = avatar_url
+
+
+class Post:
+    """The parts of a tweet the embeds use, detached from twikit objects."""
+    __slots__ = ("id", "text", "created_at", "favorite_count", "retweet_count", "photo_url")
+
+    def __init__(self, tweet):
+        self.id = str(tweet.id)
+        self.text = getattr(tweet, "text", "") or ""
+        self.created_at = getattr(tweet, "created_at", None)
+        self.favorite_count = getattr(tweet, "favorite_count", 0) or 0
+        self.retweet_count = getattr(tweet, "retweet_count", 0) or 0
+        self.photo_url = None
+        try:
+            media = getattr(tweet, "media", None)
+            if media:
+                first = media[0]
+                media_url = getattr(first, "media_url_https", None) or getattr(first, "url", None)
+                if media_url and first.type == "photo":
+                    self.photo_url = media_url
+        except Exception:
+            pass
+
+
+def _is_original(tweet) -> bool:
+    """Replies and @-mention posts are never shown."""
+    if getattr(tweet, "in_reply_to", None):
+        return False
+    return not (getattr(tweet, "text", "") or "").startswith("@")
+
+
+class _Timeline:
+    __slots__ = ("posts", "head_id", "fetched_at")
+
+    def __init__(self):
+        self.posts = []        # original posts, newest first
+        self.head_id = 0       # newest tweet id seen (including filtered-out replies)
+        self.fetched_at = 0.0
+
+
+# ============================================================
+# CACHE
+# ============================================================
+
+_accounts = {}                  # lowercased screen name -> Account
+_timelines = OrderedDict()      # user_id -> _Timeline, LRU
+_inflight = {}                  # ("account" | "timeline" | "media", key) -> Future
+_media = OrderedDict()          # url -> bytes, LRU
+_media_bytes = 0
+_background = set()             # prefetch / profile-save tasks (kept referenced)
+_stats = {
+    "account_hits": 0,
+    "account_lookups": 0,
+    "timeline_hits": 0,
+    "timeline_fetches": 0,
+    "incremental_refreshes": 0,
+    "stale_served": 0,
+    "coalesced": 0,
+    "media_hits": 0,
+    "media_fetches": 0,
+}
+
+
+async def _coalesced(key, factory):
+    """Run factory() once per key at a time; concurrent callers await the same result."""
+    pending = _inflight.get(key)
+    if pending is not None:
+        _stats["coalesced"] += 1
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Retrieved here so lone callers don't trigger "never retrieved" warnings
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+
+async def resolve_account(screen_name: str) -> Account:
+    """Account for a screen name: memory, then the twitter_accounts table, then X.
+    Raises TwitterAccountNotFound, or the twikit error if X couldn't be reached."""
+    key = screen_name.lower()
+    account = _accounts.get(key)
+    if account is not None:
+        _stats["account_hits"] += 1
+        return account
+
+    async def lookup():
+        row = await database.get_twitter_account(key)
+        if row:
+            return Account(row[0], screen_name, row[1], row[2])
+        client = await get_client()
+        _stats["account_lookups"] += 1
+        try:
+            user = await client.get_user_by_screen_name(screen_name)
+        except Exception as e:
+            err_str = str(e).lower()
+            if "not found" in err_str or "no user" in err_str or "404" in err_str:
+                raise TwitterAccountNotFound(screen_name) from e
+            raise
+        found = Account(str(user.id), screen_name, getattr(user, "name", screen_name),
+                        getattr(user, "profile_image_url", None))
+        await database.save_twitter_account(key, found.user_id, found.name, found.avatar_url)
+        return found
+
+    account = await _coalesced(("account", key), lookup)
+    _accounts[key] = account
+    return account
+
+
+async def recent_posts(screen_name: str, count: int):
+    """(Account, up to `count` newest original posts). A failed refresh serves the
+    cached posts if there are any; otherwise the error propagates."""
+    account = await resolve_account(screen_name)
+    timeline = _timelines.get(account.user_id)
+    if timeline is not None and time.time() - timeline.fetched_at < TIMELINE_TTL:
+        _timelines.move_to_end(account.user_id)
+        _stats["timeline_hits"] += 1
+        return account, timeline.posts[:count]
+
+    try:
+        timeline = await _coalesced(("timeline", account.user_id), lambda: _refresh(account))
+    except Exception as e:
+        if timeline is None or not timeline.posts:
+            raise
+        logger.warning(f"Serving cached posts for @{screen_name} after refresh failed: {e}")
+        _stats["stale_served"] += 1
+    return account, timeline.posts[:count]
+
+
+async def _refresh(account: Account) -> _Timeline:
+    """Fetch the newest page and merge it into the cached timeline.
+    twikit has no since_id parameter, so a warm refresh asks for a smaller page and
+    keeps only what is newer than the cached head (or overlaps it)."""
+    timeline = _timelines.get(account.user_id)
+    warm = timeline is not None and timeline.head_id
+    client = await get_client()
+    _stats["timeline_fetches"] += 1
+    raw_tweets = await client.get_user_tweets(
+        account.user_id, tweet_type="Tweets", count=REFRESH_COUNT if warm else INITIAL_COUNT
+    )
+
+    fresh, head_id, overlaps = {}, 0, False
+    for tweet in raw_tweets:
+        tweet_id = int(tweet.id)
+        head_id = max(head_id, tweet_id)
+        if warm and tweet_id <= timeline.head_id:
+            overlaps = True
+        if _is_original(tweet):
+            fresh[str(tweet.id)] = Post(tweet)
+        author = getattr(tweet, "user", None)
+        if author is not None and str(getattr(author, "id", "")) == account.user_id:
+            _update_profile(account, author)
+
+    merged = _Timeline()
+    if warm and overlaps:
+        # Fresh copies win so engagement counts stay current; older cached posts fill the rest
+        _stats["incremental_refreshes"] += 1
+        posts = dict(fresh)
+        for post in timeline.posts:
+            posts.setdefault(post.id, post)
+        merged.head_id = max(head_id, timeline.head_id)
+    else:
+        posts = fresh
+        merged.head_id = head_id
+    merged.posts = sorted(posts.values(), key=lambda p: int(p.id), reverse=True)[:KEEP_POSTS]
+    merged.fetched_at = time.time()
+
+    _timelines[account.user_id] = merged
+    _timelines.move_to_end(account.user_id)
+    while len(_timelines) > MAX_ACCOUNTS:
+        _timelines.popitem(last=False)
+
+    urls = [p.photo_url for p in merged.posts[:PREFETCH_POSTS] if p.photo_url and p.photo_url not in _media]
+    if urls:
+        task = asyncio.create_task(fetch_media(urls))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+    return merged
+
+
+def _update_profile(account: Account, user):
+    """Keep the display name/avatar current from tweet authors; the DB row follows lazily."""
+    name = getattr(user, "name", None) or account.name
+    avatar_url = getattr(user, "profile_image_url", None) or account.avatar_url
+    if (name, avatar_url) == (account.name, account.avatar_url):
+        return
+    account.name, account.avatar_url = name, avatar_url
+    task = asyncio.create_task(database.save_twitter_account(
+        account.screen_name.lower(), account.user_id, name, avatar_url
+    ))
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+# ============================================================
+# MEDIA
+# ============================================================
+
+
+async def _download(url: str):
+    try:
+        resp = await http_client.get("twimg", url, read="bytes")
+    except UpstreamError as e:
+        logger.warning(f"Media download failed for {url}: {e}")
+        return None
+    return resp.data if resp.ok and resp.data else None
+
+
+async def fetch_media(urls) -> dict:
+    """{url: bytes} for the photos that could be downloaded; misses are fetched concurrently."""
+    global _media_bytes
+    found, missing = {}, []
+    for url in dict.fromkeys(urls):
+        data = _media.get(url)
+        if data is not None:
+            _media.move_to_end(url)
+            _stats["media_hits"] += 1
+            found[url] = data
+        else:
+            missing.append(url)
+
+    if missing:
+        _stats["media_fetches"] += len(missing)
+        results = await asyncio.gather(*[_coalesced(("media", url), lambda url=url: _download(url)) for url in missing])
+        for url, data in zip(missing, results):
+            if data is None:
+                continue
+            found[url] = data
+            if url not in _media and len(data) <= MEDIA_CACHE_BYTES:
+                _media[url] = data
+                _media_bytes += len(data)
+        while _media_bytes > MEDIA_CACHE_BYTES:
+            _, evicted = _media.popitem(last=False)
+            _media_bytes -= len(evicted)
+    return found
+
+
+def stats() -> dict:
+    return {
+        **_stats,
+        "accounts": len(_accounts),
+        "timelines": len(_timelines),
+        "media_cached": len(_media),
+        "media_mb": round(_media_bytes / (1024 * 1024), 1),
+    }
@@ -0,0 +1,54 @@
+"""
+Dashboard Triggers
+The dashboard runs on its own thread and event loop. When it needs the bot to
+act now (refresh colour commands, reconcile reward roles) it fires a named
+trigger, which is handed to the bot's loop with call_soon_threadsafe and run as
+a task there. Nothing is persisted: a trigger fired while the bot is offline is
+dropped, so handlers that must survive a restart keep their own DB flag.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TriggerBus:
+    def __init__(self):
+        self._handlers = {}    # name -> async fn()
+        self._loop = None
+        self._tasks = set()    # running handlers (kept referenced)
+
+    def register(self, name: str, handler):
+        self._handlers[name] = handler
+
+    def bind(self):
+        """Attach to the bot's running loop; triggers fired before this are dropped."""
+        self._loop = asyncio.get_running_loop()
+
+    def fire(self, name: str) -> bool:
+        """Run the trigger's handler on the bot loop. Safe to call from any thread.
+        False if the bot isn't running to receive it."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return False
+        loop.call_soon_threadsafe(self._dispatch, name)
+        return True
+
+    def _dispatch(self, name: str):
+        handler = self._handlers.get(name)
+        if handler is None:
+            logger.warning(f"No handler registered for trigger '{name}'")
+            return
+        task = asyncio.create_task(self._run(name, handler))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, name: str, handler):
+        try:
+            await handler()
+        except Exception as e:
+            logger.error(f"Error handling trigger '{name}': {e}", exc_info=True)
+
+
+bus = TriggerBus()
@@ -0,0 +1,108 @@
+"""
+Reaction Vote Collection
+Records votes live from raw reaction gateway events into in-memory ballots
+keyed by message ID, so resolving a vote needs no REST calls.
+Used by the Silencer, trial decisions, and the tomorrow's-quote pick.
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+NUMBER_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+
+# ============================================================
+# BALLOTS
+# ============================================================
+
+
+class Ballot:
+    """Live tally for one message. voters[emoji] is the set of user IDs currently reacting with it."""
+
+    def __init__(self, message_id: int, options: list, kind: str = None, meta: dict = None,
+                 exclude=(), eligible=None):
+        self.message_id = message_id
+        self.options = list(options)
+        self.kind = kind
+        self.meta = meta or {}
+        self.exclude = {int(uid) for uid in exclude}
+        self.eligible = eligible  # callable(user_id, member) -> bool, or None for everyone
+        self.voters = {emoji: set() for emoji in self.options}
+        self.opened_at = time.time()
+
+    def counts(self) -> list:
+        """Vote count per option, in option order."""
+        return [len(self.voters[emoji]) for emoji in self.options]
+
+    def total(self) -> int:
+        return sum(self.counts())
+
+
+_ballots = {}   # message_id -> Ballot
+_handlers = {}  # kind -> async fn(ballot, emoji, payload)
+
+
+def open_ballot(message_id: int, options: list, kind: str = None, meta: dict = None,
+                exclude=(), eligible=None) -> Ballot:
+    """Start collecting votes on a message. Replaces any ballot already open on it."""
+    ballot = Ballot(int(message_id), options, kind, meta, exclude, eligible)
+    _ballots[ballot.message_id] = ballot
+    return ballot
+
+
+def close_ballot(message_id: int):
+    """Stop collecting and return the final ballot (or None if it wasn't open)."""
+    return _ballots.pop(int(message_id), None)
+
+
+def get_ballot(message_id: int):
+    return _ballots.get(int(message_id))
+
+
+def close_ballots_of_kind(kind: str):
+    """Drop every open ballot of a kind (e.g. before re-posting a replacement)."""
+    for mid in [mid for mid, b in _ballots.items() if b.kind == kind]:
+        del _ballots[mid]
+
+
+def register_handler(kind: str, handler):
+    """Route accepted votes on ballots of this kind to handler(ballot, emoji, payload)."""
+    _handlers[kind] = handler
+
+
+# ============================================================
+# GATEWAY EVENT INTAKE
+# ============================================================
+
+
+async def handle_reaction(payload, added: bool):
+    """Feed a RawReactionActionEvent into its ballot. Cheap no-op for untracked messages."""
+    ballot = _ballots.get(payload.message_id)
+    if not ballot:
+        return
+
+    emoji = str(payload.emoji)
+    if emoji not in ballot.voters:
+        return
+
+    if not added:
+        ballot.voters[emoji].discard(payload.user_id)
+        return
+
+    member = payload.member
+    if member is not None and member.bot:
+        return
+    if payload.user_id in ballot.exclude:
+        return
+    if ballot.eligible and not ballot.eligible(payload.user_id, member):
+        return
+
+    ballot.voters[emoji].add(payload.user_id)
+
+    handler = _handlers.get(ballot.kind)
+    if handler:
+        try:
+            await handler(ballot, emoji, payload)
+        except Exception as e:
+            logger.error(f"Error in {ballot.kind} vote handler: {e}", exc_info=True)
@@ -0,0 +1,178 @@
+"""
+Webhook Relay
+Messages from UwU-cursed users are reposted through one "EconomyBotProxy"
+webhook per channel. The webhook's id and token are kept in memory and in
+SQLite, so the channel's webhooks are only listed (or one created) the first
+time a channel is used or after the stored webhook turns out to be deleted.
+Sends go through a per-channel queue; rapid consecutive messages from the same
+user are merged into a single webhook post.
+"""
+
+import asyncio
+import logging
+from collections import deque
+
+import discord
+
+import database
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_NAME = "EconomyBotProxy"
+MERGE_WINDOW = 0.75      # seconds a post waits for more messages from the same user
+MAX_CONTENT = 2000       # Discord message limit; merges stop here
+
+
+class _Post:
+    __slots__ = ("user_id", "username", "avatar_url", "parts", "size")
+
+    def __init__(self, author: discord.Member, text: str):
+        self.user_id = author.id
+        self.username = author.display_name
+        self.avatar_url = author.display_avatar.url
+        self.parts = [text]
+        self.size = len(text)
+
+
+class WebhookPool:
+    def __init__(self):
+        self._bot = None
+        self._hooks = {}        # channel_id -> discord.Webhook (partial, built from id + token)
+        self._inflight = {}     # channel_id -> Future[Webhook | None]
+        self._queues = {}       # channel_id -> deque[_Post]
+        self._workers = {}      # channel_id -> Task
+        self.metrics = {
+            "hits": 0,
+            "db_hits": 0,
+            "rest_lookups": 0,
+            "created": 0,
+            "invalidated": 0,
+            "sent": 0,
+            "merged": 0,
+            "fallbacks": 0,
+            "failures": 0,
+        }
+
+    def attach(self, bot):
+        self._bot = bot
+
+    # --- Webhooks ---
+
+    def _partial(self, webhook_id: int, token: str) -> discord.Webhook:
+        return discord.Webhook.partial(webhook_id, token, client=self._bot)
+
+    async def get(self, channel):
+        """The channel's relay webhook, or None if the channel can't have one."""
+        if not isinstance(channel, discord.TextChannel):
+            return None
+        webhook = self._hooks.get(channel.id)
+        if webhook is not None:
+            self.metrics["hits"] += 1
+            return webhook
+
+        pending = self._inflight.get(channel.id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[channel.id] = future
+        webhook = None
+        try:
+            webhook = await self._load(channel)
+            if webhook is not None:
+                self._hooks[channel.id] = webhook
+        except Exception as e:
+            logger.error(f"Webhook error: {e}")
+        finally:
+            del self._inflight[channel.id]
+            future.set_result(webhook)
+        return webhook
+
+    async def _load(self, channel):
+        row = await database.get_channel_webhook(channel.id)
+        if row:
+            # Not validated here; a deleted webhook shows up as NotFound on the next send
+            self.metrics["db_hits"] += 1
+            return self._partial(*row)
+
+        self.metrics["rest_lookups"] += 1
+        webhook = None
+        for wh in await channel.webhooks():
+            if wh.name == WEBHOOK_NAME and wh.token:
+                webhook = wh
+                break
+        if webhook is None:
+            webhook = await channel.create_webhook(name=WEBHOOK_NAME)
+            self.metrics["created"] += 1
+        await database.save_channel_webhook(channel.id, webhook.id, webhook.token)
+        return self._partial(webhook.id, webhook.token)
+
+    async def invalidate(self, channel_id: int):
+        self._hooks.pop(channel_id, None)
+        await database.delete_channel_webhook(channel_id)
+        self.metrics["invalidated"] += 1
+
+    # --- Relay queue ---
+
+    def relay(self, message: discord.Message, text: str):
+        """Repost `text` as the message's author. Consecutive messages from the same
+        author that arrive before the post goes out are sent together."""
+        queue = self._queues.setdefault(message.channel.id, deque())
+        last = queue[-1] if queue else None
+        if last is not None and last.user_id == message.author.id and last.size + 1 + len(text) <= MAX_CONTENT:
+            last.parts.append(text)
+            last.size += 1 + len(text)
+            self.metrics["merged"] += 1
+        else:
+            queue.append(_Post(message.author, text))
+
+        worker = self._workers.get(message.channel.id)
+        if worker is None or worker.done():
+            self._workers[message.channel.id] = asyncio.create_task(self._drain(message.channel, queue))
+
+    async def _drain(self, channel, queue: deque):
+        try:
+            while queue:
+                if len(queue) == 1:
+                    # Only the newest post can still absorb messages; give it a moment
+                    await asyncio.sleep(MERGE_WINDOW)
+                post = queue.popleft()
+                try:
+                    await self._send(channel, post)
+                except Exception as e:
+                    self.metrics["failures"] += 1
+                    logger.error(f"Error in UwU webhook: {e}")
+        finally:
+            if not queue:
+                self._queues.pop(channel.id, None)
+
+    async def _send(self, channel, post: _Post):
+        content = "\n".join(post.parts)
+        for attempt in range(2):
+            webhook = await self.get(channel)
+            if webhook is None:
+                break
+            try:
+                await webhook.send(
+                    content=content,
+                    username=post.username,
+                    avatar_url=post.avatar_url,
+                    allowed_mentions=discord.AllowedMentions.none(),
+                )
+                self.metrics["sent"] += 1
+                return
+            except discord.NotFound:
+                # Webhook was deleted from the channel; forget it and make a new one once
+                await self.invalidate(channel.id)
+
+        self.metrics["fallbacks"] += 1
+        await channel.send(f"**{post.username}**: {content}", allowed_mentions=discord.AllowedMentions.none())
+
+    def stats(self) -> dict:
+        return {
+            **self.metrics,
+            "channels": len(self._hooks),
+            "queued": sum(len(q) for q in self._queues.values()),
+        }
+
+
+pool = WebhookPool()